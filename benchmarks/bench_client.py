@@ -0,0 +1,248 @@
+"""Measure client throughput, per-request overhead, parse cost and crawl memory against the local mock API
+
+Run with ``python benchmarks/bench_client.py [--output results.json]``. Requests are answered in-process by
+``congress_gov_api_client.mock``, so the numbers cover the client (building requests, the httpx stack, decoding and model
+parsing) and not the network. Results are printed as JSON so that runs of different releases can be compared. Each crawl
+runs in its own process so that peak RSS is measured independently. The cold-start import time of the package is measured
+with ``bench_import``, and ``--max-import-ms`` makes the run fail when it exceeds a budget, to catch import regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from types import ModuleType
+from typing import Any
+
+import httpx
+from bench_import import SCENARIOS, measure
+
+from congress_gov_api_client.api.bill import bill_details, bill_list_all
+from congress_gov_api_client.api.member import member_list
+from congress_gov_api_client.api.summaries import bill_summaries_all
+from congress_gov_api_client.decoding import orjson
+from congress_gov_api_client.mock import BASE_URL, MockAPI, mock_client
+from congress_gov_api_client.pagination import MAX_LIMIT, apaginate, paginate
+
+IMPORTS = ("package", "one_endpoint")
+"""The ``bench_import`` scenarios a client run reports and checks against ``--max-import-ms``"""
+
+CRAWLS: dict[str, ModuleType] = {
+    "bill_list_all": bill_list_all,
+    "member_list": member_list,
+    "bill_summaries_all": bill_summaries_all,
+}
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_us": round(cuts[49] * 1e6, 1),
+        "p99_us": round(cuts[98] * 1e6, 1),
+        "mean_us": round(statistics.fmean(samples) * 1e6, 1),
+    }
+
+
+def throughput(requests: int, concurrency: int, latency: float) -> dict[str, Any]:
+    """Requests/sec of ``bill_details`` with ``concurrency`` threads against as many async tasks"""
+    results: dict[str, Any] = {"requests": requests, "concurrency": concurrency, "latency_ms": latency * 1e3}
+
+    client = mock_client(MockAPI(latency=latency))
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        list(pool.map(lambda number: bill_details.sync_detailed(117, "hr", number, client=client), range(requests)))
+        results["sync_req_per_sec"] = round(requests / (time.perf_counter() - start))
+
+    async def crawl() -> float:
+        client = mock_client(MockAPI(latency=latency))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(number: int) -> None:
+            async with semaphore:
+                await bill_details.asyncio_detailed(117, "hr", number, client=client)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch(number) for number in range(requests)))
+        return time.perf_counter() - start
+
+    results["async_req_per_sec"] = round(requests / asyncio.run(crawl()))
+    return results
+
+
+def overhead(requests: int) -> dict[str, Any]:
+    """Latency percentiles of ``sync_detailed``/``asyncio_detailed`` against a bare httpx request to the same mock"""
+    api = MockAPI()
+    url = f"{BASE_URL}/bill/117/hr/3076"
+
+    def timed(call: Any) -> list[float]:
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    with httpx.Client(transport=api.transport()) as raw:
+        raw_samples = timed(lambda: raw.get(url, params={"format": "json"}))
+    client = mock_client(api)
+    sync_samples = timed(lambda: bill_details.sync_detailed(117, "hr", 3076, client=client))
+
+    async def atimed() -> tuple[list[float], list[float]]:
+        raw_samples, samples = [], []
+        async with httpx.AsyncClient(transport=api.transport()) as raw:
+            for _ in range(requests):
+                start = time.perf_counter()
+                await raw.get(url, params={"format": "json"})
+                raw_samples.append(time.perf_counter() - start)
+        client = mock_client(api)
+        for _ in range(requests):
+            start = time.perf_counter()
+            await bill_details.asyncio_detailed(117, "hr", 3076, client=client)
+            samples.append(time.perf_counter() - start)
+        return raw_samples, samples
+
+    async_raw_samples, async_samples = asyncio.run(atimed())
+    return {
+        "requests": requests,
+        "sync_httpx": _percentiles(raw_samples),
+        "sync_detailed": _percentiles(sync_samples),
+        "async_httpx": _percentiles(async_raw_samples),
+        "asyncio_detailed": _percentiles(async_samples),
+    }
+
+
+def parse_cost(pages: int) -> dict[str, Any]:
+    """Time spent turning a full page (``limit=250``) into a ``Response`` with parsed models, per endpoint"""
+    api = MockAPI(dataset_size=MAX_LIMIT)
+    client = mock_client(api)
+    results = {}
+    for name, endpoint in CRAWLS.items():
+        with httpx.Client(transport=api.transport()) as raw:
+            path = endpoint._get_kwargs()["url"]
+            response = raw.get(f"{BASE_URL}{path}", params={"limit": MAX_LIMIT})
+        samples = []
+        for _ in range(pages):
+            start = time.perf_counter()
+            endpoint._build_response(client=client, response=response)
+            samples.append(time.perf_counter() - start)
+        results[name] = {"page_bytes": len(response.content), **_percentiles(samples)}
+    return results
+
+
+def crawl(name: str, records: int) -> dict[str, Any]:
+    """Peak RSS of paginating ``records`` records of one endpoint, keeping only a running count"""
+    client = mock_client(MockAPI(dataset_size=records))
+    baseline = _peak_rss_mib()
+    start = time.perf_counter()
+    count = sum(1 for _ in paginate(CRAWLS[name], client=client))
+    elapsed = time.perf_counter() - start
+    return {
+        "records": count,
+        "records_per_sec": round(count / elapsed),
+        "peak_rss_mib": round(_peak_rss_mib(), 1),
+        "rss_growth_mib": round(_peak_rss_mib() - baseline, 1),
+    }
+
+
+def acrawl(name: str, records: int, concurrency: int) -> dict[str, Any]:
+    """The async counterpart of ``crawl``, fetching ``concurrency`` pages at a time"""
+
+    async def run() -> int:
+        client = mock_client(MockAPI(dataset_size=records))
+        count = 0
+        async for _ in apaginate(CRAWLS[name], client=client, concurrency=concurrency):
+            count += 1
+        return count
+
+    baseline = _peak_rss_mib()
+    start = time.perf_counter()
+    count = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    return {
+        "records": count,
+        "records_per_sec": round(count / elapsed),
+        "peak_rss_mib": round(_peak_rss_mib(), 1),
+        "rss_growth_mib": round(_peak_rss_mib() - baseline, 1),
+    }
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        package = version("congress_gov_api_client")
+    except PackageNotFoundError:
+        package = None
+    return {
+        "package_version": package,
+        "python": platform.python_version(),
+        "httpx": httpx.__version__,
+        "decoder": "orjson" if orjson is not None else "json",
+        "platform": platform.platform(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per throughput and overhead run")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.005, help="Mock latency in seconds for throughput runs")
+    parser.add_argument("--pages", type=int, default=50, help="Pages parsed per endpoint")
+    parser.add_argument("--records", type=int, default=50_000, help="Records per crawl")
+    parser.add_argument("--import-runs", type=int, default=10, help="Fresh interpreters per import scenario")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if an import scenario's fastest run exceeds this")
+    parser.add_argument("--output", help="Also write the results to this file")
+    parser.add_argument("--crawl", choices=CRAWLS, help=argparse.SUPPRESS)
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.crawl:
+        if args.mode == "sync":
+            print(json.dumps(crawl(args.crawl, args.records)))
+        else:
+            print(json.dumps(acrawl(args.crawl, args.records, args.concurrency)))
+        return
+
+    crawls: dict[str, Any] = {}
+    for name in CRAWLS:
+        for mode in ("sync", "async"):
+            command = [sys.executable, __file__, "--crawl", name, "--mode", mode, "--records", str(args.records)]
+            command += ["--concurrency", str(args.concurrency)]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            crawls.setdefault(name, {})[mode] = json.loads(output)
+    results = {
+        "environment": _environment(),
+        "throughput": {
+            "no_latency": throughput(args.requests, args.concurrency, 0.0),
+            "with_latency": throughput(args.requests, args.concurrency, args.latency),
+        },
+        "overhead": overhead(args.requests),
+        "parse": parse_cost(args.pages),
+        "crawl": crawls,
+        "imports": {name: measure(SCENARIOS[name], args.import_runs, []) for name in IMPORTS},
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    if args.max_import_ms is not None:
+        # The fastest run is the least affected by other load on the machine
+        slow = {name: result["min_ms"] for name, result in results["imports"].items()}
+        slow = {name: ms for name, ms in slow.items() if ms > args.max_import_ms}
+        if slow:
+            sys.exit(f"Import time over the {args.max_import_ms} ms budget: {slow}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure how the worker pool of ``aggregate_congress`` and a metadata cache affect a committee dashboard refresh
+
+Run with ``python benchmarks/bench_committees.py [--output results.json]``. Requests go to the local mock API with
+``--latency`` added to each. One worker with one request in flight is the sequential baseline. Each configuration
+refreshes twice, the second time with the ``committee_details`` records the first one cached. Results are printed as
+JSON.
+"""
+
+import argparse
+import json
+import time
+from typing import Any
+
+from congress_gov_api_client.committees import CommitteeMetadataCache, aggregate_congress
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def run(workers: int, concurrency: int, listed: int, latency: float) -> dict[str, Any]:
+    api = MockAPI(dataset_size=listed, latency=latency)
+    client = mock_client(api)
+    metadata = CommitteeMetadataCache()
+    refreshes = []
+    for _ in range(2):
+        api.reset()
+        start = time.perf_counter()
+        committees = sum(
+            1
+            for _ in aggregate_congress(
+                118, client=client, subcommittees=True, metadata=metadata, workers=workers, concurrency=concurrency
+            )
+        )
+        refreshes.append(
+            {
+                "committees": committees,
+                "requests": api.stats().requests,
+                "seconds": round(time.perf_counter() - start, 2),
+            }
+        )
+    return {"cold": refreshes[0], "cached_metadata": refreshes[1]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listed", type=int, default=1, help="Committees listed; the mock adds 15 subcommittees each")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mock latency in seconds")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"latency_ms": args.latency * 1e3, "runs": {}}
+    for workers, concurrency in ((1, 1), (4, 16), (8, 32)):
+        results["runs"][f"{workers}x{concurrency}"] = run(workers, concurrency, args.listed, args.latency)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compare the requests and time the date-range iterators need against requesting every day of the range
+
+Run with ``python benchmarks/bench_daterange.py [--output results.json]``. Requests go to the local mock API with
+``--latency`` added to each. The naive baseline requests
+``bound_congressional_record_list_by_year_and_month_and_day`` once per calendar day with the same concurrency. The
+mock lists the same few sitting days whatever the year, so the drill-down is smaller than against the real API, which
+sits on roughly 150 days a year. Results are printed as JSON.
+"""
+
+import argparse
+import datetime
+import json
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from congress_gov_api_client.api.bound_congressional_record import (
+    bound_congressional_record_list_by_year_and_month_and_day,
+)
+from congress_gov_api_client.client import AuthenticatedClient
+from congress_gov_api_client.daterange import bound_record_range, congressional_record_range, plan_windows
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def naive(start: datetime.date, end: datetime.date, *, client: AuthenticatedClient, concurrency: int) -> Iterator[Any]:
+    days = [start + datetime.timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+    def fetch(day: datetime.date) -> Any:
+        return bound_congressional_record_list_by_year_and_month_and_day.sync_detailed(
+            str(day.year), str(day.month), str(day.day), client=client
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        yield from pool.map(fetch, days)
+
+
+def run(
+    iterate: Callable[..., Iterator[Any]], start: datetime.date, end: datetime.date, latency: float, concurrency: int
+) -> dict[str, Any]:
+    api = MockAPI(latency=latency)
+    began = time.perf_counter()
+    results = sum(1 for _ in iterate(start, end, client=mock_client(api), concurrency=concurrency))
+    return {
+        "results": results,
+        "requests": api.stats().requests,
+        "seconds": round(time.perf_counter() - began, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start", default="1990-03-15", help="First day of the range")
+    parser.add_argument("--end", default="2022-08-31", help="Last day of the range")
+    parser.add_argument("--latency", type=float, default=0.005, help="Mock latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    start = datetime.date.fromisoformat(args.start)
+    end = datetime.date.fromisoformat(args.end)
+    results: dict[str, Any] = {
+        "latency_ms": args.latency * 1e3,
+        "days": (end - start).days + 1,
+        "windows": len(plan_windows(start, end)),
+        "runs": {
+            "naive_per_day": run(naive, start, end, args.latency, args.concurrency),
+            "bound_record_range": run(bound_record_range, start, end, args.latency, args.concurrency),
+            "congressional_record_range": run(congressional_record_range, start, end, args.latency, args.concurrency),
+        },
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
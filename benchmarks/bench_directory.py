@@ -0,0 +1,94 @@
+"""Measure how fast ``MemberDirectory`` starts and answers lookups, compared with asking the API
+
+Run with ``python benchmarks/bench_directory.py [--output results.json]``. The directory holds ``--members``
+synthetic members, about as many as have ever served. It is started three ways: by a full ``refresh`` against the mock
+API with ``--latency`` added, from plain records, and by opening a saved snapshot. The lookup of a member through the
+API is made against the same mock. Results are printed as JSON.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from congress_gov_api_client.api.member import member_details
+from congress_gov_api_client.directory import STATE_CODES, MemberDirectory
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def _timings(call: Any, runs: int) -> dict[str, float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "p50_us": round(statistics.median(samples) * 1e6, 1),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 1),
+    }
+
+
+def _record(number: int) -> dict[str, Any]:
+    """A ``member_list`` record, as a dict, that the mock does not produce"""
+    states = sorted(STATE_CODES)
+    start = 1900 + number % 120
+    return {
+        "bioguideId": f"Z{number:06d}",
+        "name": f"Member, Number {number}",
+        "partyName": "Independent",
+        "state": states[number % len(states)],
+        "district": number % 40 + 1 if number % 4 else None,
+        "terms": {"item": [{"chamber": "House of Representatives", "startYear": start, "endYear": start + 6}]},
+        "updateDate": "2024-01-01T00:00:00Z",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=12_500, help="Members in the directory")
+    parser.add_argument("--runs", type=int, default=2_000, help="Lookups timed")
+    parser.add_argument("--latency", type=float, default=0.05, help="Latency of API requests in seconds")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"members": args.members, "startup_ms": {}, "lookup": {}}
+    slow = mock_client(MockAPI(dataset_size=args.members, latency=args.latency))
+    start = time.perf_counter()
+    MemberDirectory().refresh(client=slow)
+    results["startup_ms"]["refresh_from_api"] = round((time.perf_counter() - start) * 1e3, 1)
+
+    records = [_record(number) for number in range(args.members)]
+    start = time.perf_counter()
+    directory = MemberDirectory()
+    directory.upsert(records)
+    results["startup_ms"]["from_records"] = round((time.perf_counter() - start) * 1e3, 1)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "members.snapshot")
+        directory.save(path)
+        start = time.perf_counter()
+        snapshot = MemberDirectory.open(path)
+        results["startup_ms"]["open_snapshot"] = round((time.perf_counter() - start) * 1e3, 1)
+        results["snapshot_bytes"] = os.path.getsize(path)
+
+        results["lookup"]["member"] = _timings(lambda: directory.member("Z000123"), args.runs)
+        results["lookup"]["member_from_snapshot"] = _timings(lambda: snapshot.member("Z000123"), args.runs)
+        results["lookup"]["by_district"] = _timings(lambda: directory.by_district("CA", 12), args.runs)
+        results["lookup"]["by_congress_state"] = _timings(lambda: directory.by_congress(80, state="Ohio"), args.runs)
+        results["lookup"]["api_member"] = _timings(
+            lambda: member_details.sync_detailed("Z000123", client=slow), max(args.runs // 100, 10)
+        )
+        snapshot.close()
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
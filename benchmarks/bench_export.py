@@ -0,0 +1,116 @@
+"""Measure rows/sec and peak RSS of the Parquet exporter against materializing every record before writing
+
+Run with ``python benchmarks/bench_export.py``. Pages of ``bill_list_all`` records are served by an in-process
+``httpx.MockTransport``, so the numbers cover parsing, column extraction, encoding and file I/O but not the network.
+Each mode runs in its own process so that peak RSS is measured independently.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+import httpx
+
+from congress_gov_api_client import AuthenticatedClient
+from congress_gov_api_client.api.bill import bill_list_all
+from congress_gov_api_client.export import BILLS, export
+from congress_gov_api_client.pagination import paginate
+
+MODES = ("export", "materialize")
+
+
+def _bill(index: int) -> dict[str, Any]:
+    return {
+        "congress": 110 + index % 8,
+        "latestAction": {"actionDate": "2022-04-06", "text": "Became Public Law No: 117-108."},
+        "number": str(index),
+        "originChamber": "House",
+        "originChamberCode": "H",
+        "title": "Postal Service Reform Act of 2022",
+        "type": "HR",
+        "updateDate": "2022-09-29",
+        # Older records carry only a date here, as in the ``bill_list_all`` example
+        "updateDateIncludingText": "2022-09-29" if index % 4 == 0 else "2022-09-29T03:27:05Z",
+        "url": f"https://api.congress.gov/v3/bill/117/hr/{index}?format=json",
+    }
+
+
+def _transport(total: int) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 250))
+        end = min(offset + limit, total)
+        next_url = None
+        if end < total:
+            next_url = f"https://api.congress.gov/v3/bill?offset={end}&limit={limit}&format=json"
+        body = {
+            "bills": [_bill(index) for index in range(offset, end)],
+            "pagination": {"count": total, "next": next_url},
+        }
+        return httpx.Response(200, content=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+
+    return httpx.MockTransport(handler)
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run(mode: str, rows: int, row_group_size: int) -> dict[str, Any]:
+    import pyarrow
+    import pyarrow.parquet
+
+    client = AuthenticatedClient(
+        base_url="https://api.congress.gov/v3", token="benchmark", httpx_args={"transport": _transport(rows)}
+    )
+    baseline = _peak_rss_mib()
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        if mode == "export":
+            written = export(bill_list_all, client=client, root=root, schema=BILLS, row_group_size=row_group_size).rows
+        else:
+            records = [
+                {column.name: column.value(record) for column in BILLS.columns}
+                for record in paginate(bill_list_all, client=client)
+            ]
+            table = pyarrow.Table.from_pylist(records)
+            pyarrow.parquet.write_table(table, f"{root}/bills.parquet", row_group_size=row_group_size)
+            written = table.num_rows
+        elapsed = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "rows": written,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(written / elapsed),
+        "peak_rss_mib": round(_peak_rss_mib(), 1),
+        "rss_growth_mib": round(_peak_rss_mib() - baseline, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--row-group-size", type=int, default=50_000)
+    parser.add_argument("--mode", choices=MODES, help="Run a single mode in this process")
+    args = parser.parse_args()
+    if args.mode:
+        print(json.dumps(run(args.mode, args.rows, args.row_group_size)))
+        return
+    for mode in MODES:
+        command = [sys.executable, __file__, "--mode", mode, "--rows", str(args.rows)]
+        command += ["--row-group-size", str(args.row_group_size)]
+        result = json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout)
+        print(
+            f"{result['mode']:>12}: {result['rows']} rows in {result['seconds']:.2f}s = {result['rows_per_sec']:>8} "
+            f"rows/s, peak RSS {result['peak_rss_mib']:.1f} MiB (+{result['rss_growth_mib']:.1f} MiB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure the memory, build time and query speed of ``SponsorshipGraph``, and how ``workers`` affects ingestion
+
+Run with ``python benchmarks/bench_graph.py [--output results.json]``. The graph is filled with ``--edges`` synthetic
+edges and compared with the same edges held as a set of string tuples, the shape a DataFrame of the raw records
+reduces to. Ingestion from the local mock API, with ``--latency`` added to each request, is timed for several worker
+counts. Results are printed as JSON.
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Any
+
+from congress_gov_api_client.graph import SponsorshipGraph, bill_key
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def _edges(count: int, members: int, bills: int) -> list[tuple[str, str, int]]:
+    generator = random.Random(0)
+    return [
+        (
+            f"Z{generator.randrange(members):06d}",
+            bill_key(118, "hr", generator.randrange(bills)),
+            generator.randrange(2),
+        )
+        for _ in range(count)
+    ]
+
+
+def _measure(build: Any) -> tuple[Any, float, float]:
+    """What ``build`` returns, the seconds it takes, and the MiB it holds, measured in a second traced run"""
+    start = time.perf_counter()
+    built = build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    traced = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del traced
+    return built, elapsed, size / 2**20
+
+
+def _tuples(edges: list[tuple[str, str, int]]) -> set[tuple[str, str, int]]:
+    # Copies of the strings, as decoding each record would produce
+    return {(member.encode().decode(), bill.encode().decode(), kind) for member, bill, kind in edges}
+
+
+def _graph(edges: list[tuple[str, str, int]]) -> SponsorshipGraph:
+    graph = SponsorshipGraph()
+    for member, bill, kind in edges:
+        graph.add(member, bill, kind)
+    graph.csr()
+    return graph
+
+
+def _ingest(workers: int, members: int, latency: float) -> dict[str, Any]:
+    api = MockAPI(dataset_size=40, latency=latency)
+    graph = SponsorshipGraph()
+    start = time.perf_counter()
+    graph.build(client=mock_client(api), members=[f"Z{number:06d}" for number in range(members)], workers=workers)
+    return {"seconds": round(time.perf_counter() - start, 2), "requests": api.stats().requests}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=500_000, help="Synthetic edges")
+    parser.add_argument("--members", type=int, default=2_000, help="Members among the synthetic edges")
+    parser.add_argument("--bills", type=int, default=60_000, help="Bills among the synthetic edges")
+    parser.add_argument("--ingest-members", type=int, default=50, help="Members ingested from the mock API")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock latency in seconds")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    edges = _edges(args.edges, args.members, args.bills)
+    graph, seconds, graph_mib = _measure(lambda: _graph(edges))
+    _, _, tuples_mib = _measure(lambda: _tuples(edges))
+    member = edges[0][0]
+    start = time.perf_counter()
+    for member_id, _, _ in edges[:10_000]:
+        graph.member_degree(member_id)
+    degree_us = (time.perf_counter() - start) / 10_000 * 1e6
+    start = time.perf_counter()
+    graph.collaborators(member, limit=10)
+    collaborators_ms = (time.perf_counter() - start) * 1e3
+    results: dict[str, Any] = {
+        "edges": graph.edge_count,
+        "build_seconds": round(seconds, 2),
+        "graph_mib": round(graph_mib, 1),
+        "string_tuples_mib": round(tuples_mib, 1),
+        "member_degree_us": round(degree_us, 1),
+        "collaborators_ms": round(collaborators_ms, 2),
+        "ingest": {str(workers): _ingest(workers, args.ingest_members, args.latency) for workers in (1, 8, 32)},
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
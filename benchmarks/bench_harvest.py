@@ -0,0 +1,67 @@
+"""Measure how the worker count of ``DailyRecordHarvester`` affects the time to harvest a range of volumes
+
+Run with ``python benchmarks/bench_harvest.py [--output results.json]``. Requests go to the local mock API with
+``--latency`` added to each, so the measurements show how much of the round-trip time the pipeline hides; one worker
+is the strictly sequential tree walk. Results are printed as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+from congress_gov_api_client.harvest import DailyRecordHarvester, HarvestCheckpoints
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def run(workers: int, volumes: range, latency: float, asynchronous: bool) -> dict[str, Any]:
+    api = MockAPI(latency=latency)
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoints = HarvestCheckpoints(os.path.join(directory, "harvest.db"))
+        harvester = DailyRecordHarvester(mock_client(api), checkpoints, workers=workers)
+        start = time.perf_counter()
+        if asynchronous:
+
+            async def harvest() -> int:
+                return sum([1 async for _ in harvester.aharvest(volumes)])
+
+            issues = asyncio.run(harvest())
+        else:
+            issues = sum(1 for _ in harvester.harvest(volumes))
+        elapsed = time.perf_counter() - start
+        checkpoints.close()
+    return {
+        "issues": issues,
+        "requests": api.stats().requests,
+        "seconds": round(elapsed, 2),
+        "issues_per_sec": round(issues / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--volumes", type=int, default=20, help="Number of volumes harvested")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock latency in seconds")
+    parser.add_argument("--workers", type=int, action="append", help="Worker counts; default 1, 4 and 16")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    volumes = range(170 - args.volumes, 170)
+    results: dict[str, Any] = {"latency_ms": args.latency * 1e3, "volumes": args.volumes, "runs": {}}
+    for workers in args.workers or [1, 4, 16]:
+        results["runs"][str(workers)] = {
+            "threads": run(workers, volumes, args.latency, asynchronous=False),
+            "async": run(workers, volumes, args.latency, asynchronous=True),
+        }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure the cold-start import time of the package with ``python -X importtime``
+
+Run with ``python benchmarks/bench_import.py``. Each scenario is imported ``--runs`` times in a fresh interpreter, after a
+first run that writes the bytecode cache, and the median cumulative time of its top-level import is reported along with
+the number of package modules it loaded and the slowest of them.
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+SCENARIOS = {
+    "package": "import congress_gov_api_client",
+    "one_endpoint": "from congress_gov_api_client.api.bill import bill_details",
+    "one_model": "from congress_gov_api_client.models import Bill",
+    "api_namespace": "import congress_gov_api_client.api as api; api.member.member_details",
+    "every_endpoint": (
+        "import importlib, pkgutil, congress_gov_api_client.api as api\n"
+        "for module in pkgutil.walk_packages(api.__path__, api.__name__ + '.'):\n"
+        "    importlib.import_module(module.name)"
+    ),
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+_PACKAGE = "congress_gov_api_client"
+
+
+def _importtime(statement: str, flags: list[str]) -> list[tuple[str, int, int, int]]:
+    """The ``(module, self µs, cumulative µs, depth)`` of every import made by ``statement``"""
+    command = [sys.executable, *flags, "-X", "importtime", "-c", statement]
+    stderr = subprocess.run(command, check=True, capture_output=True, text=True).stderr
+    imports = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            own, cumulative, indent, module = match.groups()
+            imports.append((module, int(own), int(cumulative), len(indent) // 2))
+    return imports
+
+
+def measure(statement: str, runs: int, flags: list[str]) -> dict[str, Any]:
+    _importtime(statement, flags)
+    totals = []
+    imports: list[tuple[str, int, int, int]] = []
+    for _ in range(runs):
+        imports = _importtime(statement, flags)
+        totals.append(sum(cumulative for _, _, cumulative, depth in imports if depth == 0))
+    package = [(module, own) for module, own, _, _ in imports if module.startswith(_PACKAGE)]
+    slowest = sorted(package, key=lambda item: item[1], reverse=True)[:5]
+    return {
+        "median_ms": round(statistics.median(totals) / 1e3, 1),
+        "min_ms": round(min(totals) / 1e3, 1),
+        "modules": len(imports),
+        "package_modules": len(package),
+        "package_self_ms": round(sum(own for _, own in package) / 1e3, 1),
+        "slowest": {module: round(own / 1e3, 2) for module, own in slowest},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="Run only these scenarios")
+    parser.add_argument("--optimize", action="store_true", help="Run with -OO, which drops docstrings")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    flags = ["-OO"] if args.optimize else []
+    results = {
+        "python": sys.version.split()[0],
+        "flags": flags,
+        "scenarios": {name: measure(SCENARIOS[name], args.runs, flags) for name in args.scenario or SCENARIOS},
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
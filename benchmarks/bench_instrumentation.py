@@ -0,0 +1,66 @@
+"""Measure the per-request cost of ``Instrumentation``, with and without an exporter
+
+Run with ``python benchmarks/bench_instrumentation.py [--output results.json]``. Requests go to the local mock API
+without latency, so the difference between the scenarios is the overhead of the instrumentation transports. The
+fastest of ``--repeats`` interleaved rounds is reported for each scenario. Results
+are printed as JSON.
+"""
+
+import argparse
+import json
+import time
+from typing import Any
+
+from congress_gov_api_client.api.bill import bill_details
+from congress_gov_api_client.instrumentation import Instrumentation, RequestEvent
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def _discard(event: RequestEvent) -> None:
+    pass
+
+
+SCENARIOS: dict[str, Any] = {
+    "disabled": lambda: None,
+    "enabled": lambda: Instrumentation(),
+    "enabled_with_exporter": lambda: Instrumentation(exporters=[_discard]),
+}
+
+
+def measure(instrumentation: Any, requests: int) -> float:
+    """The time per request of ``requests`` requests, in microseconds"""
+    client = mock_client(MockAPI(), instrumentation=instrumentation)
+    start = time.perf_counter()
+    for number in range(requests):
+        bill_details.sync_detailed(117, "hr", number % 500 + 1, client=client)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    # Scenarios take turns so that drift in machine load affects them alike; the fastest round is the least disturbed
+    timings: dict[str, list[float]] = {name: [] for name in SCENARIOS}
+    for _ in range(args.repeats):
+        for name, factory in SCENARIOS.items():
+            timings[name].append(measure(factory(), args.requests))
+    per_request = {name: min(values) for name, values in timings.items()}
+    results = {
+        "us_per_request": {name: round(value, 1) for name, value in per_request.items()},
+        "overhead_us": {
+            name: round(value - per_request["disabled"], 1) for name, value in per_request.items() if name != "disabled"
+        },
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
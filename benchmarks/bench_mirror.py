@@ -0,0 +1,93 @@
+"""Measure how fast ``Mirror`` writes records and answers lookups, compared with asking the API
+
+Run with ``python benchmarks/bench_mirror.py [--output results.json]``. Records come from the local mock API; the
+lookup of a bill through the API is made against the mock with ``--latency`` added, as a stand-in for api.congress.gov.
+Results are printed as JSON.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from congress_gov_api_client.api.bill import bill_details
+from congress_gov_api_client.mirror import Mirror
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def _timings(call: Any, runs: int) -> dict[str, float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "p50_us": round(statistics.median(samples) * 1e6, 1),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000, help="Records synced per table")
+    parser.add_argument("--runs", type=int, default=2_000, help="Lookups timed")
+    parser.add_argument("--latency", type=float, default=0.05, help="Latency of API lookups in seconds")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"records": args.records, "sync": {}, "lookup": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        mirror = Mirror(os.path.join(directory, "mirror.db"))
+        client = mock_client(MockAPI(dataset_size=args.records))
+        for table in ("bills", "nominations"):
+            start = time.perf_counter()
+            stats = mirror.sync(table, client=client)
+            elapsed = time.perf_counter() - start
+            records = [_record(table, number) for number in range(args.records)]
+            start = time.perf_counter()
+            mirror.upsert(table, records)
+            upsert = time.perf_counter() - start
+            results["sync"][table] = {
+                "rows": stats.rows,
+                "sync_rows_per_sec": round(stats.rows / elapsed),
+                "upsert_rows_per_sec": round(args.records / upsert),
+            }
+        bill = mirror.query("SELECT congress, type, number FROM bills LIMIT 1")[0]
+        results["lookup"]["mirror_bill"] = _timings(
+            lambda: mirror.bill(bill["congress"], bill["type"], int(bill["number"])), args.runs
+        )
+        slow = mock_client(MockAPI(latency=args.latency))
+        results["lookup"]["api_bill"] = _timings(
+            lambda: bill_details.sync_detailed(
+                bill["congress"], bill["type"].lower(), int(bill["number"]), client=slow
+            ),
+            max(args.runs // 100, 10),
+        )
+        mirror.close()
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+def _record(table: str, number: int) -> dict[str, Any]:
+    """A record of the table's endpoint, as a dict, that the mock does not produce"""
+    latest_action = {"actionDate": "2024-01-01", "text": "Introduced"}
+    if table == "bills":
+        return {"congress": 999, "type": "HR", "number": str(number), "title": "A bill", "latestAction": latest_action}
+    return {
+        "congress": 999,
+        "number": number,
+        "partNumber": "00",
+        "citation": f"PN{number}",
+        "latestAction": latest_action,
+    }
+
+
+if __name__ == "__main__":
+    main()
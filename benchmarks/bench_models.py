@@ -0,0 +1,109 @@
+"""Compare typed model parsing against plain dict access on large list pages
+
+Run with ``python benchmarks/bench_models.py``. Each page holds ``--limit`` items (250 is the API maximum) built from
+the ``bill_list_all`` and ``bill_summaries_all`` example responses.
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable
+
+from congress_gov_api_client.decoding import loads, orjson
+from congress_gov_api_client.models import BillListResponse, SummaryListResponse
+
+BILL = {
+    "congress": 117,
+    "latestAction": {"actionDate": "2022-04-06", "text": "Became Public Law No: 117-108."},
+    "number": "3076",
+    "originChamber": "House",
+    "originChamberCode": "H",
+    "title": "Postal Service Reform Act of 2022",
+    "type": "HR",
+    "updateDate": "2022-09-29",
+    "updateDateIncludingText": "2022-09-29T03:27:05Z",
+    "url": "https://api.congress.gov/v3/bill/117/hr/3076?format=json",
+}
+
+SUMMARY = {
+    "actionDate": "2021-02-04",
+    "actionDesc": "Introduced in Senate",
+    "bill": {
+        "congress": 117,
+        "number": "225",
+        "originChamber": "Senate",
+        "originChamberCode": "S",
+        "title": "Competition and Antitrust Law Enforcement Reform Act of 2021",
+        "type": "S",
+        "updateDateIncludingText": "2022-09-29T03:41:41Z",
+        "url": "https://api.congress.gov/v3/bill/117/s/225?format=json",
+    },
+    "currentChamber": "Senate",
+    "currentChamberCode": "S",
+    "lastSummaryUpdateDate": "2022-03-31T15:20:50Z",
+    "text": " <p><strong>Competition and Antitrust Law Enforcement Reform Act of 2021 </strong></p>" * 20,
+    "updateDate": "2022-04-01T03:31:17Z",
+    "versionCode": "00",
+}
+
+
+def _page(key: str, item: dict[str, Any], limit: int) -> bytes:
+    items = [dict(item, number=str(i)) for i in range(limit)]
+    page = {key: items, "pagination": {"count": 300000, "next": "https://api.congress.gov/v3/bill?offset=250"}}
+    return json.dumps(page).encode()
+
+
+def _bills_as_dicts(content: bytes) -> int:
+    total = 0
+    for bill in json.loads(content)["bills"]:
+        total += bill["congress"] + len(bill["latestAction"]["text"]) + len(bill["number"])
+    return total
+
+
+def _bills_as_models(content: bytes) -> int:
+    total = 0
+    for bill in BillListResponse.from_dict(loads(content)).bills:
+        total += bill.congress + len(bill.latest_action.text) + len(bill.number)
+    return total
+
+
+def _summaries_as_dicts(content: bytes) -> int:
+    total = 0
+    for summary in json.loads(content)["summaries"]:
+        total += summary["bill"]["congress"] + len(summary["text"]) + len(summary["versionCode"])
+    return total
+
+
+def _summaries_as_models(content: bytes) -> int:
+    total = 0
+    for summary in SummaryListResponse.from_dict(loads(content)).summaries:
+        total += summary.bill.congress + len(summary.text) + len(summary.version_code)
+    return total
+
+
+def _measure(func: Callable[[bytes], int], content: bytes, number: int) -> float:
+    return min(timeit.repeat(lambda: func(content), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=250)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"decoder: {'orjson' if orjson is not None else 'json'}")
+    cases = [
+        ("bill_list_all", _page("bills", BILL, args.limit), _bills_as_dicts, _bills_as_models),
+        ("bill_summaries_all", _page("summaries", SUMMARY, args.limit), _summaries_as_dicts, _summaries_as_models),
+    ]
+    for name, content, as_dicts, as_models in cases:
+        dicts = _measure(as_dicts, content, args.number)
+        models = _measure(as_models, content, args.number)
+        print(
+            f"{name:<20} {len(content) / 1024:8.1f} KiB  dicts {dicts * 1e3:7.3f} ms/page  "
+            f"models {models * 1e3:7.3f} ms/page  ratio {models / dicts:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
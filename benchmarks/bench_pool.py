@@ -0,0 +1,81 @@
+"""Measure connections opened and throughput of concurrent async crawls under different connection-pool settings
+
+Run with ``python benchmarks/bench_pool.py [--output results.json]``. Requests go over real sockets to a ``MockServer``
+on localhost, so every connection the pool opens is a TCP handshake the server counts; against api.congress.gov each
+would also be a TLS handshake. Requests are sent in bursts of ``--concurrency`` tasks separated by ``--pause`` seconds,
+the pattern of a crawler waiting on its rate limiter. The server runs in the same process, so absolute throughput is
+bounded by the GIL; compare configurations with each other. Results are printed as JSON.
+
+The mock server speaks HTTP/1.1 only, so HTTP/2 cannot be measured here: over plain HTTP httpx does not negotiate it.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from congress_gov_api_client import AuthenticatedClient
+from congress_gov_api_client.api.bill import bill_details
+from congress_gov_api_client.mock import MockAPI, MockServer
+
+CONFIGS: dict[str, dict[str, Any]] = {
+    "defaults": {},
+    "keepalive_all": {"max_keepalive_connections": None},
+    "keepalive_expiry_30s": {"keepalive_expiry": 30.0},
+    "max_connections_32": {"max_connections": 32, "max_keepalive_connections": 32},
+}
+
+
+async def _crawl(client: AuthenticatedClient, bursts: int, concurrency: int, pause: float) -> int:
+    async def fetch(number: int) -> int:
+        response = await bill_details.asyncio_detailed(117, "hr", number, client=client)
+        return response.status_code
+
+    statuses = []
+    for burst in range(bursts):
+        statuses += await asyncio.gather(*(fetch(burst * concurrency + task) for task in range(concurrency)))
+        await asyncio.sleep(pause)
+    await client.get_async_httpx_client().aclose()
+    return sum(1 for status in statuses if status == 200)
+
+
+def run(server: MockServer, config: dict[str, Any], bursts: int, concurrency: int, pause: float) -> dict[str, Any]:
+    server.reset()
+    client = AuthenticatedClient(base_url=server.url, token="benchmark", http2=False, **config)
+    start = time.perf_counter()
+    ok = asyncio.run(_crawl(client, bursts, concurrency, pause))
+    elapsed = time.perf_counter() - start - bursts * pause
+    return {
+        "requests": server.requests,
+        "ok": ok,
+        "connections": server.connections,
+        "connections_per_1000_requests": round(server.connections * 1000 / max(server.requests, 1), 1),
+        "req_per_sec": round(server.requests / elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, action="append", help="Concurrent tasks; default 64 and 128")
+    parser.add_argument("--bursts", type=int, default=20)
+    parser.add_argument("--pause", type=float, default=0.05, help="Seconds between bursts")
+    parser.add_argument("--latency", type=float, default=0.01, help="Mock latency in seconds")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"latency_ms": args.latency * 1e3, "bursts": args.bursts, "runs": {}}
+    with MockServer(MockAPI(latency=args.latency, jitter=args.latency)) as server:
+        for concurrency in args.concurrency or [64, 128]:
+            results["runs"][str(concurrency)] = {
+                name: run(server, config, args.bursts, concurrency, args.pause) for name, config in CONFIGS.items()
+            }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure indexing throughput and query latency of ``SearchIndex`` over a large synthetic corpus
+
+Run with ``python benchmarks/bench_search.py [--documents 1000000] [--output results.json]``. Summaries are generated
+from the words of the example summaries of the API spec, so term frequencies are skewed the way real summaries are.
+A linear scan with ``re`` over the same texts, the approach the index replaces, is timed for comparison on a sample.
+Results are printed as JSON.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from congress_gov_api_client.mock.server import load_examples
+from congress_gov_api_client.search import SearchIndex, strip_html
+
+QUERIES = [
+    "antitrust",
+    "merger*",
+    '"monetary penalties"',
+    "competition AND employers",
+    "title: reform",
+    "NEAR(bill law)",
+]
+
+
+def _vocabulary() -> list[str]:
+    texts = [summary.get("text") for summary in load_examples()["/summaries"]["summaries"]]
+    return re.findall(r"\w+", strip_html(" ".join(text for text in texts if text)).lower())
+
+
+def _summaries(count: int, words: list[str], rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {
+            "bill": {
+                "congress": 100 + index % 19,
+                "type": "HR",
+                "number": str(index),
+                "title": " ".join(rng.choices(words, k=8)),
+            },
+            "versionCode": "00",
+            "text": "<p>" + " ".join(rng.choices(words, k=120)) + "</p>",
+            "updateDate": "2024-01-01T00:00:00Z",
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200_000)
+    parser.add_argument("--runs", type=int, default=50, help="Times each query is run")
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = _vocabulary()
+    results: dict[str, Any] = {"documents": args.documents, "queries": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        index = SearchIndex(os.path.join(directory, "search.db"))
+        elapsed = 0.0
+        sample: list[str] = []
+        for start in range(0, args.documents, 10_000):
+            batch = _summaries(min(10_000, args.documents - start), words, rng)
+            sample = [summary["text"] for summary in batch]
+            began = time.perf_counter()
+            index.add_summaries(batch)
+            elapsed += time.perf_counter() - began
+        began = time.perf_counter()
+        index.optimize()
+        results["index_docs_per_sec"] = round(args.documents / elapsed)
+        results["optimize_sec"] = round(time.perf_counter() - began, 2)
+        results["database_mb"] = round(os.path.getsize(os.path.join(directory, "search.db")) / 2**20)
+        for query in QUERIES:
+            samples = []
+            for _ in range(args.runs):
+                began = time.perf_counter()
+                index.search(query, limit=20)
+                samples.append(time.perf_counter() - began)
+            results["queries"][query] = {
+                "p50_ms": round(statistics.median(samples) * 1e3, 2),
+                "max_ms": round(max(samples) * 1e3, 2),
+            }
+        pattern = re.compile(r"\bantitrust\b", re.IGNORECASE)
+        began = time.perf_counter()
+        matches = sum(1 for text in sample if pattern.search(strip_html(text)))
+        scan = time.perf_counter() - began
+        results["linear_scan_ms_per_million"] = round(scan / len(sample) * 1e9)
+        results["linear_scan_sample_matches"] = matches
+        index.close()
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
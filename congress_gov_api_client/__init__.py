@@ -1,8 +1,17 @@
 """A client library for accessing Congress.gov API"""
 
+from typing import TYPE_CHECKING
+
 from .client import AuthenticatedClient, Client
+from .lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .facade import CongressAPI
 
 __all__ = (
     "AuthenticatedClient",
     "Client",
+    "CongressAPI",
 )
+
+__getattr__, __dir__ = lazy_attributes(__name__, {"CongressAPI": "facade"})
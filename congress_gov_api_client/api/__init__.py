@@ -1 +1,52 @@
 """Contains methods for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        amendments,
+        bill,
+        bound_congressional_record,
+        committee,
+        committee_meeting,
+        committee_print,
+        committee_report,
+        congress,
+        congressional_record,
+        crsreport,
+        daily_congressional_record,
+        hearing,
+        house_communication,
+        house_requirement,
+        member,
+        nomination,
+        senate_communication,
+        summaries,
+        treaty,
+    )
+
+__all__ = (
+    "amendments",
+    "bill",
+    "bound_congressional_record",
+    "committee",
+    "committee_meeting",
+    "committee_print",
+    "committee_report",
+    "congress",
+    "congressional_record",
+    "crsreport",
+    "daily_congressional_record",
+    "hearing",
+    "house_communication",
+    "house_requirement",
+    "member",
+    "nomination",
+    "senate_communication",
+    "summaries",
+    "treaty",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
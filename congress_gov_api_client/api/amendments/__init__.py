@@ -1 +1,30 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        amendment,
+        amendmentactions,
+        amendmentamendments,
+        amendmentcongress,
+        amendmentcosponsors,
+        amendmentdetails,
+        amendmentlist,
+        amendments_text,
+    )
+
+__all__ = (
+    "amendment",
+    "amendmentactions",
+    "amendmentamendments",
+    "amendmentcongress",
+    "amendmentcosponsors",
+    "amendmentdetails",
+    "amendmentlist",
+    "amendments_text",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
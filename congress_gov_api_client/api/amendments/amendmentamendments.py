@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.amendment_list_response import AmendmentListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -36,9 +38,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[AmendmentListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = AmendmentListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -47,7 +56,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[AmendmentListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -65,7 +76,7 @@ def sync_detailed(
     format_: Union[Unset, str] = UNSET,
     offset: Union[Unset, int] = UNSET,
     limit: Union[Unset, int] = UNSET,
-) -> Response[Any]:
+) -> Response[AmendmentListResponse]:
     r"""Returns the list of amendments to a specified amendment.
 
      GET /amendment/:congress/:amendmentType/:amendmentNumber/amendments
@@ -113,7 +124,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[AmendmentListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -141,7 +152,7 @@ async def asyncio_detailed(
     format_: Union[Unset, str] = UNSET,
     offset: Union[Unset, int] = UNSET,
     limit: Union[Unset, int] = UNSET,
-) -> Response[Any]:
+) -> Response[AmendmentListResponse]:
     r"""Returns the list of amendments to a specified amendment.
 
      GET /amendment/:congress/:amendmentType/:amendmentNumber/amendments
@@ -189,7 +200,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[AmendmentListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.amendment_response import AmendmentResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -30,9 +32,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[AmendmentResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = AmendmentResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -41,7 +50,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[AmendmentResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -57,7 +68,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[AmendmentResponse]:
     r"""Returns detailed information for a specified amendment.
 
      GET /amendment/:congress/:amendmentType/:amendmentNumber
@@ -131,7 +142,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[AmendmentResponse]
     """
 
     kwargs = _get_kwargs(
@@ -155,7 +166,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[AmendmentResponse]:
     r"""Returns detailed information for a specified amendment.
 
      GET /amendment/:congress/:amendmentType/:amendmentNumber
@@ -229,7 +240,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[AmendmentResponse]
     """
 
     kwargs = _get_kwargs(
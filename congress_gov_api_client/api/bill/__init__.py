@@ -1 +1,46 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        bill_actions,
+        bill_amendments,
+        bill_committees,
+        bill_cosponsors,
+        bill_details,
+        bill_list_all,
+        bill_list_by_congress,
+        bill_list_by_type,
+        bill_relatedbills,
+        bill_subjects,
+        bill_summaries,
+        bill_text,
+        bill_titles,
+        law_list_by_congress,
+        law_list_by_congress_and_law_type,
+        law_list_by_congress_law_type_and_law_number,
+    )
+
+__all__ = (
+    "bill_actions",
+    "bill_amendments",
+    "bill_committees",
+    "bill_cosponsors",
+    "bill_details",
+    "bill_list_all",
+    "bill_list_by_congress",
+    "bill_list_by_type",
+    "bill_relatedbills",
+    "bill_subjects",
+    "bill_summaries",
+    "bill_text",
+    "bill_titles",
+    "law_list_by_congress",
+    "law_list_by_congress_and_law_type",
+    "law_list_by_congress_law_type_and_law_number",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
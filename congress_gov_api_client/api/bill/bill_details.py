@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.bill_response import BillResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -30,9 +32,14 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[BillResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = BillResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -41,7 +48,7 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[BillResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -57,7 +64,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[BillResponse]:
     r"""Returns detailed information for a specified bill.
 
      GET /bill/:congress/:billType/:billNumber
@@ -190,7 +197,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[BillResponse]
     """
 
     kwargs = _get_kwargs(
@@ -214,7 +221,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[BillResponse]:
     r"""Returns detailed information for a specified bill.
 
      GET /bill/:congress/:billType/:billNumber
@@ -347,7 +354,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[BillResponse]
     """
 
     kwargs = _get_kwargs(
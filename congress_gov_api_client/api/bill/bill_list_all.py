@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.bill_list_response import BillListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -42,9 +44,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[BillListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = BillListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -53,7 +62,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[BillListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -71,7 +82,7 @@ def sync_detailed(
     from_date_time: Union[Unset, str] = UNSET,
     to_date_time: Union[Unset, str] = UNSET,
     sort: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[BillListResponse]:
     r"""Returns a list of bills sorted by date of latest action.
 
      GET /bill
@@ -131,7 +142,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[BillListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -159,7 +170,7 @@ async def asyncio_detailed(
     from_date_time: Union[Unset, str] = UNSET,
     to_date_time: Union[Unset, str] = UNSET,
     sort: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[BillListResponse]:
     r"""Returns a list of bills sorted by date of latest action.
 
      GET /bill
@@ -219,7 +230,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[BillListResponse]
     """
 
     kwargs = _get_kwargs(
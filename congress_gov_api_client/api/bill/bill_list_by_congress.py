@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.bill_list_response import BillListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -43,9 +45,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[BillListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = BillListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -54,7 +63,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[BillListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -73,7 +84,7 @@ def sync_detailed(
     from_date_time: Union[Unset, str] = UNSET,
     to_date_time: Union[Unset, str] = UNSET,
     sort: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[BillListResponse]:
     r"""Returns a list of bills filtered by the specified congress, sorted by date of latest action.
 
      GET /bill/:congress
@@ -135,7 +146,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[BillListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -165,7 +176,7 @@ async def asyncio_detailed(
     from_date_time: Union[Unset, str] = UNSET,
     to_date_time: Union[Unset, str] = UNSET,
     sort: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[BillListResponse]:
     r"""Returns a list of bills filtered by the specified congress, sorted by date of latest action.
 
      GET /bill/:congress
@@ -227,7 +238,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[BillListResponse]
     """
 
     kwargs = _get_kwargs(
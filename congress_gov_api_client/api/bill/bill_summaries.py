@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.summary_list_response import SummaryListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -36,9 +38,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[SummaryListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = SummaryListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -47,7 +56,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[SummaryListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -65,7 +76,7 @@ def sync_detailed(
     format_: Union[Unset, str] = UNSET,
     offset: Union[Unset, int] = UNSET,
     limit: Union[Unset, int] = UNSET,
-) -> Response[Any]:
+) -> Response[SummaryListResponse]:
     r"""Returns the list of summaries for a specified bill.
 
      GET /bill/:congress/:billType/:billNumber/summaries
@@ -138,7 +149,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[SummaryListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -166,7 +177,7 @@ async def asyncio_detailed(
     format_: Union[Unset, str] = UNSET,
     offset: Union[Unset, int] = UNSET,
     limit: Union[Unset, int] = UNSET,
-) -> Response[Any]:
+) -> Response[SummaryListResponse]:
     r"""Returns the list of summaries for a specified bill.
 
      GET /bill/:congress/:billType/:billNumber/summaries
@@ -239,7 +250,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[SummaryListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -1 +1,22 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        bound_congressional_record_list,
+        bound_congressional_record_list_by_year,
+        bound_congressional_record_list_by_year_and_month,
+        bound_congressional_record_list_by_year_and_month_and_day,
+    )
+
+__all__ = (
+    "bound_congressional_record_list",
+    "bound_congressional_record_list_by_year",
+    "bound_congressional_record_list_by_year_and_month",
+    "bound_congressional_record_list_by_year_and_month_and_day",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,34 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        committee_bills_list,
+        committee_details,
+        committee_list,
+        committee_list_by_chamber,
+        committee_list_by_congress,
+        committee_list_by_congress_chamber,
+        committee_reports_by_committee,
+        house_communications_by_committee,
+        nomination_by_committee,
+        senate_communications_by_committee,
+    )
+
+__all__ = (
+    "committee_bills_list",
+    "committee_details",
+    "committee_list",
+    "committee_list_by_chamber",
+    "committee_list_by_congress",
+    "committee_list_by_congress_chamber",
+    "committee_reports_by_committee",
+    "house_communications_by_committee",
+    "nomination_by_committee",
+    "senate_communications_by_committee",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
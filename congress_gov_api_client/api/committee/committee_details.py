@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.committee_response import CommitteeResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -29,9 +31,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[CommitteeResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = CommitteeResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -40,7 +49,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[CommitteeResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -55,7 +66,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[CommitteeResponse]:
     r"""Returns detailed information for a specified congressional committee.
 
      GET /committee/:chamber/:committeeCode
@@ -199,7 +210,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[CommitteeResponse]
     """
 
     kwargs = _get_kwargs(
@@ -221,7 +232,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[CommitteeResponse]:
     r"""Returns detailed information for a specified congressional committee.
 
      GET /committee/:chamber/:committeeCode
@@ -365,7 +376,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[CommitteeResponse]
     """
 
     kwargs = _get_kwargs(
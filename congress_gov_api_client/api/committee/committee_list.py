@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.committee_list_response import CommitteeListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -39,9 +41,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[CommitteeListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = CommitteeListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -50,7 +59,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[CommitteeListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -67,7 +78,7 @@ def sync_detailed(
     limit: Union[Unset, int] = UNSET,
     from_date_time: Union[Unset, str] = UNSET,
     to_date_time: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[CommitteeListResponse]:
     r"""Returns a list of congressional committees.
 
      GET /committee
@@ -184,7 +195,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[CommitteeListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -210,7 +221,7 @@ async def asyncio_detailed(
     limit: Union[Unset, int] = UNSET,
     from_date_time: Union[Unset, str] = UNSET,
     to_date_time: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[CommitteeListResponse]:
     r"""Returns a list of congressional committees.
 
      GET /committee
@@ -327,7 +338,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[CommitteeListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -1 +1,22 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        committee_meeting_congress,
+        committee_meeting_congress_chamber,
+        committee_meeting_detail,
+        committee_meeting_list,
+    )
+
+__all__ = (
+    "committee_meeting_congress",
+    "committee_meeting_congress_chamber",
+    "committee_meeting_detail",
+    "committee_meeting_list",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
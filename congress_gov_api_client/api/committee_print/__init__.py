@@ -1 +1,24 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        committee_print_detail,
+        committee_print_list,
+        committee_print_text,
+        committee_prints_by_congress,
+        committee_prints_by_congress_chamber,
+    )
+
+__all__ = (
+    "committee_print_detail",
+    "committee_print_list",
+    "committee_print_text",
+    "committee_prints_by_congress",
+    "committee_prints_by_congress_chamber",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
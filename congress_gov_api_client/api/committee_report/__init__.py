@@ -1 +1,24 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        committee_report_details,
+        committee_report_id_text,
+        committee_reports,
+        committee_reports_by_congress,
+        committee_reports_by_congress_rpt_type,
+    )
+
+__all__ = (
+    "committee_report_details",
+    "committee_report_id_text",
+    "committee_reports",
+    "committee_reports_by_congress",
+    "committee_reports_by_congress_rpt_type",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,20 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        congress_current_list,
+        congress_details,
+        congress_list,
+    )
+
+__all__ = (
+    "congress_current_list",
+    "congress_details",
+    "congress_list",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,14 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        congressional_record_list,
+    )
+
+__all__ = ("congressional_record_list",)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
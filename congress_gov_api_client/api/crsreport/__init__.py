@@ -1 +1,18 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        crsreport,
+        crsreport_details,
+    )
+
+__all__ = (
+    "crsreport",
+    "crsreport_details",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,22 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        daily_congressional_record_list,
+        daily_congressional_record_list_by_article,
+        daily_congressional_record_list_by_volume,
+        daily_congressional_record_list_by_volume_and_issue,
+    )
+
+__all__ = (
+    "daily_congressional_record_list",
+    "daily_congressional_record_list_by_article",
+    "daily_congressional_record_list_by_volume",
+    "daily_congressional_record_list_by_volume_and_issue",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
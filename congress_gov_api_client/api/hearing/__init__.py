@@ -1 +1,22 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        hearing_detail,
+        hearing_list,
+        hearing_list_by_congress,
+        hearing_list_by_congress_chamber,
+    )
+
+__all__ = (
+    "hearing_detail",
+    "hearing_list",
+    "hearing_list_by_congress",
+    "hearing_list_by_congress_chamber",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
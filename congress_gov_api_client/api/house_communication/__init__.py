@@ -1 +1,22 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        house_communication,
+        house_communication_congress,
+        house_communication_detail,
+        house_communication_list,
+    )
+
+__all__ = (
+    "house_communication",
+    "house_communication_congress",
+    "house_communication_detail",
+    "house_communication_list",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,20 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        house_requirement,
+        house_requirement_communication_list,
+        house_requirement_detail,
+    )
+
+__all__ = (
+    "house_requirement",
+    "house_requirement_communication_list",
+    "house_requirement_detail",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,30 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        congress_list,
+        cosponsorship_list,
+        member_details,
+        member_list,
+        member_list_by_congress_state_district,
+        member_list_by_state,
+        member_list_by_state_and_district,
+        sponsorship_list,
+    )
+
+__all__ = (
+    "congress_list",
+    "cosponsorship_list",
+    "member_details",
+    "member_list",
+    "member_list_by_congress_state_district",
+    "member_list_by_state",
+    "member_list_by_state_and_district",
+    "sponsorship_list",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.member_list_response import MemberListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -37,9 +39,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[MemberListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = MemberListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -48,7 +57,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[MemberListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -65,7 +76,7 @@ def sync_detailed(
     offset: Union[Unset, int] = UNSET,
     limit: Union[Unset, int] = UNSET,
     current_member: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[MemberListResponse]:
     r"""Returns the list of members specified by Congress
 
      GET /member/congress/:congress
@@ -138,7 +149,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[MemberListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -164,7 +175,7 @@ async def asyncio_detailed(
     offset: Union[Unset, int] = UNSET,
     limit: Union[Unset, int] = UNSET,
     current_member: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[MemberListResponse]:
     r"""Returns the list of members specified by Congress
 
      GET /member/congress/:congress
@@ -237,7 +248,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[MemberListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.member_response import MemberResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -28,9 +30,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[MemberResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = MemberResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -39,7 +48,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[MemberResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -53,7 +64,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[MemberResponse]:
     r"""Returns detailed information for a specified congressional member.
 
      GET /member/:bioguideId
@@ -149,7 +160,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[MemberResponse]
     """
 
     kwargs = _get_kwargs(
@@ -169,7 +180,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[MemberResponse]:
     r"""Returns detailed information for a specified congressional member.
 
      GET /member/:bioguideId
@@ -265,7 +276,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[MemberResponse]
     """
 
     kwargs = _get_kwargs(
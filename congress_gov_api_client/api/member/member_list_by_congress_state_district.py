@@ -5,6 +5,8 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
+from ...decoding import decode_json
+from ...models.member_list_response import MemberListResponse
 from ...types import UNSET, Response, Unset
 
 
@@ -33,9 +35,16 @@ def _get_kwargs(
     return _kwargs
 
 
-def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Any]:
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[MemberListResponse]:
     if response.status_code == 200:
-        return None
+        data = decode_json(response.content)
+        if data is None:
+            return None
+        response_200 = MemberListResponse.from_dict(data)
+
+        return response_200
     if response.status_code == 400:
         return None
     if client.raise_on_unexpected_status:
@@ -44,7 +53,9 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         return None
 
 
-def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Any]:
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[MemberListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -61,7 +72,7 @@ def sync_detailed(
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
     current_member: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[MemberListResponse]:
     r"""Returns a list of members filtered by congress, state and district.
 
      GET /member/congress/:congress/:stateCode/:district
@@ -114,7 +125,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[MemberListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -140,7 +151,7 @@ async def asyncio_detailed(
     client: AuthenticatedClient,
     format_: Union[Unset, str] = UNSET,
     current_member: Union[Unset, str] = UNSET,
-) -> Response[Any]:
+) -> Response[MemberListResponse]:
     r"""Returns a list of members filtered by congress, state and district.
 
      GET /member/congress/:congress/:stateCode/:district
@@ -193,7 +204,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any]
+        Response[MemberListResponse]
     """
 
     kwargs = _get_kwargs(
@@ -1 +1,28 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        nomination_actions,
+        nomination_committees,
+        nomination_detail,
+        nomination_hearings,
+        nomination_list,
+        nomination_list_by_congress,
+        nominees,
+    )
+
+__all__ = (
+    "nomination_actions",
+    "nomination_committees",
+    "nomination_detail",
+    "nomination_hearings",
+    "nomination_list",
+    "nomination_list_by_congress",
+    "nominees",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1 +1,22 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        senate_communication,
+        senate_communication_congress,
+        senate_communication_detail,
+        senate_communication_list,
+    )
+
+__all__ = (
+    "senate_communication",
+    "senate_communication_congress",
+    "senate_communication_detail",
+    "senate_communication_list",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
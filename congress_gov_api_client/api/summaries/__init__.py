@@ -1 +1,20 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        bill_summaries_all,
+        bill_summaries_by_congress,
+        bill_summaries_by_type,
+    )
+
+__all__ = (
+    "bill_summaries_all",
+    "bill_summaries_by_congress",
+    "bill_summaries_by_type",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
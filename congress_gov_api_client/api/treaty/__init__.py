@@ -1 +1,28 @@
 """Contains endpoint functions for accessing the API"""
+
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import (
+        treaty_action,
+        treaty_actions,
+        treaty_committee,
+        treaty_detail,
+        treaty_details,
+        treaty_list,
+        treaty_list_by_congress,
+    )
+
+__all__ = (
+    "treaty_action",
+    "treaty_actions",
+    "treaty_committee",
+    "treaty_detail",
+    "treaty_details",
+    "treaty_list",
+    "treaty_list_by_congress",
+)
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,219 @@
+"""Contains httpx authentication flows and transports for the ``api_key`` query parameter declared by the API"""
+
+import threading
+import time
+from collections.abc import Generator
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+from .client import API_KEY_PARAM
+from .ratelimit import HOURLY_QUOTA, REMAINING_HEADER, TokenBucket
+
+ROUND_ROBIN = "round_robin"
+LEAST_USED = "least_used"
+
+_WINDOW = 3600.0
+
+
+@define
+class KeyUsage:
+    """Quota tracking for one key of a ``KeyPool``
+
+    Attributes:
+        key: The API key
+        used: The number of requests sent with this key in the current hour
+        remaining: The last ``X-RateLimit-Remaining`` reported for this key, if any
+        window_start: When the current hour started, as a ``time.monotonic`` value
+    """
+
+    key: str
+    used: int = 0
+    remaining: Optional[int] = None
+    window_start: float = field(factory=time.monotonic)
+
+    def quota_left(self, hourly_quota: int) -> int:
+        """The number of requests this key can still send in the current hour"""
+        left = hourly_quota - self.used
+        if self.remaining is not None:
+            left = min(left, self.remaining)
+        return left
+
+
+@define
+class KeyPool:
+    """Rotates requests across several API keys so that throughput scales with the number of keys
+
+    Attributes:
+        keys: The API keys to rotate through
+        strategy: ``"round_robin"`` to take keys in turn, or ``"least_used"`` to take the key with the most quota left.
+            Either way keys that have run out of quota for the hour are skipped while any other key has quota left.
+        hourly_quota: The number of requests each key may send per hour
+    """
+
+    keys: list[str]
+    strategy: str = ROUND_ROBIN
+    hourly_quota: int = HOURLY_QUOTA
+    _usage: dict[str, KeyUsage] = field(init=False, factory=dict)
+    _next: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        if not self.keys:
+            raise ValueError("KeyPool needs at least one key")
+        if self.strategy not in (ROUND_ROBIN, LEAST_USED):
+            raise ValueError(f"Unknown key rotation strategy: {self.strategy!r}")
+        self._usage = {key: KeyUsage(key=key) for key in self.keys}
+
+    def acquire(self) -> str:
+        """Pick the key for the next request and count the request against it"""
+        with self._lock:
+            now = time.monotonic()
+            for usage in self._usage.values():
+                if now - usage.window_start >= _WINDOW:
+                    usage.used, usage.remaining, usage.window_start = 0, None, now
+            usage = self._pick()
+            usage.used += 1
+            if usage.remaining is not None:
+                usage.remaining -= 1
+            return usage.key
+
+    def _pick(self) -> KeyUsage:
+        if self.strategy == ROUND_ROBIN:
+            for step in range(len(self.keys)):
+                usage = self._usage[self.keys[(self._next + step) % len(self.keys)]]
+                if usage.quota_left(self.hourly_quota) > 0:
+                    self._next = (self._next + step + 1) % len(self.keys)
+                    return usage
+        return max(self._usage.values(), key=lambda usage: (usage.quota_left(self.hourly_quota), -usage.used))
+
+    def observe(self, key: str, response: httpx.Response) -> None:
+        """Record the quota the server reports for ``key``"""
+        value = response.headers.get(REMAINING_HEADER)
+        with self._lock:
+            usage = self._usage[key]
+            if response.status_code == 429:
+                usage.remaining = 0
+            elif value is not None and value.isdigit():
+                usage.remaining = int(value)
+
+    def available(self) -> bool:
+        """Whether any key has quota left in the current hour"""
+        with self._lock:
+            return any(usage.quota_left(self.hourly_quota) > 0 for usage in self._usage.values())
+
+    def usage(self) -> list[KeyUsage]:
+        """A snapshot of the quota tracking for every key"""
+        with self._lock:
+            return [KeyUsage(u.key, u.used, u.remaining, u.window_start) for u in self._usage.values()]
+
+    def rate_limiter(self, capacity: float = 10.0) -> TokenBucket:
+        """A ``TokenBucket`` pacing requests at the combined hourly quota of every key in the pool"""
+        return TokenBucket.per_hour(self.hourly_quota * len(self.keys), capacity=capacity)
+
+
+class APIKeyAuth(httpx.Auth):
+    """Sends a single API key as the ``api_key`` query parameter"""
+
+    def __init__(self, key: str, param_name: str = API_KEY_PARAM) -> None:
+        self._key = key
+        self._param_name = param_name
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.url = request.url.copy_set_param(self._param_name, self._key)
+        yield request
+
+
+class KeyPoolAuth(httpx.Auth):
+    """Sends a key taken from a ``KeyPool`` as the ``api_key`` query parameter of each request
+
+    The key is chosen once per request, before any transport sees it, so retries made by transports reuse it. Clients
+    given a ``key_pool`` use ``KeyPoolTransport`` instead, which chooses a key for every attempt.
+    """
+
+    def __init__(self, pool: KeyPool, param_name: str = API_KEY_PARAM) -> None:
+        self._pool = pool
+        self._param_name = param_name
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        key = self._pool.acquire()
+        request.url = request.url.copy_set_param(self._param_name, key)
+        response = yield request
+        self._pool.observe(key, response)
+
+
+class KeyPoolTransport(httpx.BaseTransport):
+    """Wraps an ``httpx.BaseTransport``, sending every attempt with a key taken from a ``KeyPool``
+
+    A 429 marks its key as exhausted and the request is sent again at once with another key, for as long as one has
+    quota left. Only when every key is exhausted is the 429 returned, e.g. to a ``retry.RetryTransport``, whose retries
+    come back through here and so also rotate keys.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, pool: KeyPool, param_name: str = API_KEY_PARAM) -> None:
+        self._transport = transport
+        self._pool = pool
+        self._param_name = param_name
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._send(request)
+        rotations = len(self._pool.keys) - 1
+        while response.status_code == 429 and rotations and self._pool.available():
+            response.read()
+            response.close()
+            rotations -= 1
+            response = self._send(request)
+        return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        key = self._pool.acquire()
+        request.url = request.url.copy_set_param(self._param_name, key)
+        response = self._transport.handle_request(request)
+        self._pool.observe(key, response)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncKeyPoolTransport(httpx.AsyncBaseTransport):
+    """Wraps an ``httpx.AsyncBaseTransport``, sending every attempt with a key taken from a ``KeyPool``, like
+    ``KeyPoolTransport``
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, pool: KeyPool, param_name: str = API_KEY_PARAM) -> None:
+        self._transport = transport
+        self._pool = pool
+        self._param_name = param_name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._send(request)
+        rotations = len(self._pool.keys) - 1
+        while response.status_code == 429 and rotations and self._pool.available():
+            await response.aread()
+            await response.aclose()
+            rotations -= 1
+            response = await self._send(request)
+        return response
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        key = self._pool.acquire()
+        request.url = request.url.copy_set_param(self._param_name, key)
+        response = await self._transport.handle_async_request(request)
+        self._pool.observe(key, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "API_KEY_PARAM",
+    "APIKeyAuth",
+    "AsyncKeyPoolTransport",
+    "KeyPool",
+    "KeyPoolAuth",
+    "KeyPoolTransport",
+    "KeyUsage",
+]
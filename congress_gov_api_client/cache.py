@@ -0,0 +1,329 @@
+"""Contains a persistent HTTP response cache backed by SQLite"""
+
+import asyncio
+import datetime
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+from .auth import API_KEY_PARAM
+
+_CONGRESS_FAMILIES = frozenset(
+    {
+        "amendment",
+        "bill",
+        "committee",
+        "committee-meeting",
+        "committee-print",
+        "committee-report",
+        "congress",
+        "hearing",
+        "house-communication",
+        "law",
+        "nomination",
+        "senate-communication",
+        "summaries",
+        "treaty",
+    }
+)
+
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL
+)
+"""
+
+
+def current_congress(today: Optional[datetime.date] = None) -> int:
+    """The number of the congress in session on ``today``; each congress starts in an odd-numbered year"""
+    today = today or datetime.date.today()
+    return (today.year - 1789) // 2 + 1
+
+
+def cache_key(request: httpx.Request) -> str:
+    """The cache key of a request: its method and URL with sorted query parameters, excluding ``api_key``"""
+    params = sorted((name, value) for name, value in request.url.params.multi_items() if name != API_KEY_PARAM)
+    url = request.url.copy_with(query=None, fragment=None)
+    return hashlib.sha256(f"{request.method} {url} {params}".encode()).hexdigest()
+
+
+def _path_segments(url: httpx.URL) -> list[str]:
+    segments = [segment for segment in url.path.split("/") if segment]
+    if segments and segments[0][:1] == "v" and segments[0][1:].isdigit():
+        segments = segments[1:]
+    return segments
+
+
+@define
+class CachePolicy:
+    """Decides how long a response stays fresh, by endpoint family
+
+    A family is the first path segment after the API version, e.g. ``bill`` or ``member``. Records addressed by a
+    congress older than the current one rarely change, so they get ``historic_ttl``; the current congress changes
+    throughout the day and gets ``current_ttl``.
+
+    Attributes:
+        current_ttl: Seconds a response about the current congress stays fresh
+        historic_ttl: Seconds a response about an earlier congress stays fresh, or ``None`` to never expire
+        default_ttl: Seconds any other response stays fresh
+        family_ttls: Overrides of ``default_ttl`` by family, e.g. ``{"member": 7 * 86400}``
+        current_congress: The number of the current congress
+    """
+
+    current_ttl: float = 3600.0
+    historic_ttl: Optional[float] = None
+    default_ttl: float = 86400.0
+    family_ttls: dict[str, float] = field(factory=dict)
+    current_congress: int = field(factory=current_congress)
+
+    def ttl(self, url: httpx.URL) -> Optional[float]:
+        """The number of seconds a response for ``url`` stays fresh, or ``None`` if it never expires"""
+        segments = _path_segments(url)
+        if not segments:
+            return self.default_ttl
+        family = segments[0]
+        congress: Optional[str] = None
+        if family in _CONGRESS_FAMILIES and len(segments) > 1:
+            congress = segments[1]
+        elif family == "member" and len(segments) > 2 and segments[1] == "congress":
+            congress = segments[2]
+        if congress is not None and congress.isdigit():
+            return self.historic_ttl if int(congress) < self.current_congress else self.current_ttl
+        return self.family_ttls.get(family, self.default_ttl)
+
+
+@define
+class CacheEntry:
+    """A cached response
+
+    Attributes:
+        status: The HTTP status code
+        headers: The response headers, without transfer-related headers
+        content: The decoded response body
+        etag: The ``ETag`` header, used to revalidate the entry
+        last_modified: The ``Last-Modified`` header, used to revalidate the entry
+        expires_at: When the entry goes stale, as a ``time.time`` value, or ``None`` if it never does
+    """
+
+    status: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: Optional[float] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, ttl: Optional[float]) -> "CacheEntry":
+        """Capture a response that has been read, to be replayed for ``ttl`` seconds (or forever if ``None``)"""
+        return cls(
+            status=response.status_code,
+            headers=[(name, value) for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS],
+            content=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            expires_at=None if ttl is None else time.time() + ttl,
+        )
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        response = httpx.Response(self.status, headers=self.headers, content=self.content, request=request)
+        response.extensions["from_cache"] = True
+        return response
+
+
+@define
+class SQLiteCache:
+    """Stores responses in a SQLite database so they are shared between runs and processes
+
+    Bodies are stored zlib-compressed. The database runs in WAL mode so that several processes can read and write it
+    concurrently.
+
+    Attributes:
+        path: The path of the database file
+        policy: The ``CachePolicy`` deciding how long entries stay fresh
+        compression_level: The zlib compression level for stored bodies
+    """
+
+    path: str
+    policy: CachePolicy = field(factory=CachePolicy)
+    compression_level: int = 6
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, headers, body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, last_modified, expires_at = row
+        return CacheEntry(
+            status=status,
+            headers=[tuple(header) for header in json.loads(headers)],
+            content=zlib.decompress(body),
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+        )
+
+    def set(self, key: str, url: httpx.URL, response: httpx.Response) -> CacheEntry:
+        """Store a response that has been read, returning the stored entry"""
+        entry = CacheEntry.from_response(response, self.policy.ttl(url))
+        body = zlib.compress(entry.content, self.compression_level)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status,
+                    json.dumps(entry.headers),
+                    body,
+                    entry.etag,
+                    entry.last_modified,
+                    time.time(),
+                    entry.expires_at,
+                ),
+            )
+            self._connection.commit()
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, url: httpx.URL) -> None:
+        """Mark an entry fresh again after the server confirmed it with a 304"""
+        ttl = self.policy.ttl(url)
+        entry.expires_at = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._connection.execute("UPDATE responses SET expires_at = ? WHERE key = ?", (entry.expires_at, key))
+            self._connection.commit()
+
+    def purge_expired(self) -> int:
+        """Delete stale entries that cannot be revalidated, returning how many were deleted"""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE expires_at < ? AND etag IS NULL AND last_modified IS NULL", (time.time(),)
+            )
+            self._connection.commit()
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _conditional(request: httpx.Request, entry: CacheEntry) -> httpx.Request:
+    headers = request.headers.copy()
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return httpx.Request(request.method, request.url, headers=headers, extensions=request.extensions)
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Wraps an ``httpx.BaseTransport`` and answers GET requests from ``cache`` while entries are fresh
+
+    Stale entries with an ``ETag`` or ``Last-Modified`` header are revalidated with a conditional request.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, cache: SQLiteCache) -> None:
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return self._transport.handle_request(request)
+        key = cache_key(request)
+        entry = self._cache.get(key)
+        if entry is not None and entry.is_fresh:
+            return entry.to_response(request)
+        revalidating = entry is not None and bool(entry.etag or entry.last_modified)
+        response = self._transport.handle_request(_conditional(request, entry) if revalidating else request)
+        if entry is not None and revalidating and response.status_code == 304:
+            response.close()
+            self._cache.refresh(key, entry, request.url)
+            return entry.to_response(request)
+        if response.status_code != 200:
+            return response
+        response.read()
+        response.close()
+        return self._cache.set(key, request.url, response).to_response(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Wraps an ``httpx.AsyncBaseTransport`` and answers GET requests from ``cache`` while entries are fresh
+
+    Stale entries with an ``ETag`` or ``Last-Modified`` header are revalidated with a conditional request. Database
+    access runs in a worker thread so it does not block the event loop.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: SQLiteCache) -> None:
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+        key = cache_key(request)
+        entry = await asyncio.to_thread(self._cache.get, key)
+        if entry is not None and entry.is_fresh:
+            return entry.to_response(request)
+        revalidating = entry is not None and bool(entry.etag or entry.last_modified)
+        response = await self._transport.handle_async_request(_conditional(request, entry) if revalidating else request)
+        if entry is not None and revalidating and response.status_code == 304:
+            await response.aclose()
+            await asyncio.to_thread(self._cache.refresh, key, entry, request.url)
+            return entry.to_response(request)
+        if response.status_code != 200:
+            return response
+        await response.aread()
+        await response.aclose()
+        entry = await asyncio.to_thread(self._cache.set, key, request.url, response)
+        return entry.to_response(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "AsyncCacheTransport",
+    "CacheEntry",
+    "CachePolicy",
+    "CacheTransport",
+    "SQLiteCache",
+    "cache_key",
+    "current_congress",
+]
@@ -1,9 +1,27 @@
+import functools
 import ssl
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
 from attrs import define, evolve, field
 
+if TYPE_CHECKING:
+    from .auth import KeyPool
+    from .cache import SQLiteCache
+    from .instrumentation import Instrumentation
+    from .lru import LRUCache
+    from .ratelimit import TokenBucket
+    from .retry import RetryPolicy
+
+API_KEY_PARAM = "api_key"
+"""The query parameter the API reads its key from"""
+
+_TRANSPORT_ARGS = ("cert", "http1", "http2", "limits")
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
 
 @define
 class Client:
@@ -27,6 +45,32 @@ class Client:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``rate_limiter``: A ``ratelimit.TokenBucket`` every request must acquire a token from before it is sent. The same
+        bucket can be shared by several clients, sync and async, to keep their combined rate under the hourly quota.
+
+        ``retry``: A ``retry.RetryPolicy`` for retrying 429s, 5xx responses and timeouts with exponential backoff.
+
+        ``cache``: A ``cache.SQLiteCache`` to answer GET requests from disk while they are fresh, revalidating stale
+        entries with conditional requests.
+
+        ``memory_cache``: An ``lru.LRUCache`` to answer GET requests from memory, in front of ``cache``. Concurrent
+        identical requests share a single round-trip.
+
+        ``http2``: Whether to negotiate HTTP/2, multiplexing concurrent requests over one connection. By default it is
+        enabled when the ``h2`` package is installed (``pip install congress-gov-api-client[http2]``).
+
+        ``max_connections``: The maximum number of connections to the API, or ``None`` for no limit. Default 100.
+
+        ``max_keepalive_connections``: The maximum number of idle connections kept open for reuse, or ``None`` for no
+        limit. Default 20.
+
+        ``keepalive_expiry``: Seconds an idle connection is kept open for reuse, or ``None`` to keep it open. Default 5.
+
+        The pool settings configure the default transport; ``limits`` or ``http2`` in ``httpx_args`` take precedence.
+
+        ``instrumentation``: An ``instrumentation.Instrumentation`` collecting latency histograms, status codes, bytes,
+        retries and cache hits by ``operationId``. Several clients can share one.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
@@ -42,6 +86,17 @@ class Client:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _rate_limiter: Optional["TokenBucket"] = field(default=None, kw_only=True, alias="rate_limiter")
+    _retry: Optional["RetryPolicy"] = field(default=None, kw_only=True, alias="retry")
+    _cache: Optional["SQLiteCache"] = field(default=None, kw_only=True, alias="cache")
+    _memory_cache: Optional["LRUCache"] = field(default=None, kw_only=True, alias="memory_cache")
+    _http2: Optional[bool] = field(default=None, kw_only=True, alias="http2")
+    _max_connections: Optional[int] = field(default=DEFAULT_MAX_CONNECTIONS, kw_only=True, alias="max_connections")
+    _max_keepalive_connections: Optional[int] = field(
+        default=DEFAULT_MAX_KEEPALIVE_CONNECTIONS, kw_only=True, alias="max_keepalive_connections"
+    )
+    _keepalive_expiry: Optional[float] = field(default=DEFAULT_KEEPALIVE_EXPIRY, kw_only=True, alias="keepalive_expiry")
+    _instrumentation: Optional["Instrumentation"] = field(default=None, kw_only=True, alias="instrumentation")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
 
@@ -87,7 +142,7 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_sync_httpx_args(self),
             )
         return self._client
 
@@ -118,7 +173,7 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_async_httpx_args(self),
             )
         return self._async_client
 
@@ -154,6 +209,32 @@ class AuthenticatedClient:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``rate_limiter``: A ``ratelimit.TokenBucket`` every request must acquire a token from before it is sent. The same
+        bucket can be shared by several clients, sync and async, to keep their combined rate under the hourly quota.
+
+        ``retry``: A ``retry.RetryPolicy`` for retrying 429s, 5xx responses and timeouts with exponential backoff.
+
+        ``cache``: A ``cache.SQLiteCache`` to answer GET requests from disk while they are fresh, revalidating stale
+        entries with conditional requests.
+
+        ``memory_cache``: An ``lru.LRUCache`` to answer GET requests from memory, in front of ``cache``. Concurrent
+        identical requests share a single round-trip.
+
+        ``http2``: Whether to negotiate HTTP/2, multiplexing concurrent requests over one connection. By default it is
+        enabled when the ``h2`` package is installed (``pip install congress-gov-api-client[http2]``).
+
+        ``max_connections``: The maximum number of connections to the API, or ``None`` for no limit. Default 100.
+
+        ``max_keepalive_connections``: The maximum number of idle connections kept open for reuse, or ``None`` for no
+        limit. Default 20.
+
+        ``keepalive_expiry``: Seconds an idle connection is kept open for reuse, or ``None`` to keep it open. Default 5.
+
+        The pool settings configure the default transport; ``limits`` or ``http2`` in ``httpx_args`` take precedence.
+
+        ``instrumentation``: An ``instrumentation.Instrumentation`` collecting latency histograms, status codes, bytes,
+        retries and cache hits by ``operationId``. Several clients can share one.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
@@ -162,6 +243,11 @@ class AuthenticatedClient:
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
+        auth_location: Where to send the token, either ``"header"`` or ``"query"``. The API declares its key as the
+            ``api_key`` query parameter.
+        auth_query_name: The name of the query parameter used when ``auth_location`` is ``"query"``
+        key_pool: An ``auth.KeyPool`` to rotate through instead of ``token``; its keys are sent as query parameters.
+            A key is chosen for every attempt, beneath any retries, and a 429 is sent again at once with another key.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
@@ -172,12 +258,26 @@ class AuthenticatedClient:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _rate_limiter: Optional["TokenBucket"] = field(default=None, kw_only=True, alias="rate_limiter")
+    _retry: Optional["RetryPolicy"] = field(default=None, kw_only=True, alias="retry")
+    _cache: Optional["SQLiteCache"] = field(default=None, kw_only=True, alias="cache")
+    _memory_cache: Optional["LRUCache"] = field(default=None, kw_only=True, alias="memory_cache")
+    _http2: Optional[bool] = field(default=None, kw_only=True, alias="http2")
+    _max_connections: Optional[int] = field(default=DEFAULT_MAX_CONNECTIONS, kw_only=True, alias="max_connections")
+    _max_keepalive_connections: Optional[int] = field(
+        default=DEFAULT_MAX_KEEPALIVE_CONNECTIONS, kw_only=True, alias="max_keepalive_connections"
+    )
+    _keepalive_expiry: Optional[float] = field(default=DEFAULT_KEEPALIVE_EXPIRY, kw_only=True, alias="keepalive_expiry")
+    _instrumentation: Optional["Instrumentation"] = field(default=None, kw_only=True, alias="instrumentation")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
 
     token: str
     prefix: str = "Bearer"
     auth_header_name: str = "Authorization"
+    auth_location: str = "header"
+    auth_query_name: str = API_KEY_PARAM
+    key_pool: Optional["KeyPool"] = None
 
     def with_headers(self, headers: dict[str, str]) -> "AuthenticatedClient":
         """Get a new client matching this one with additional headers"""
@@ -214,7 +314,7 @@ class AuthenticatedClient:
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
-            self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
+            httpx_args = self._with_auth(_sync_httpx_args(self))
             self._client = httpx.Client(
                 base_url=self._base_url,
                 cookies=self._cookies,
@@ -222,10 +322,22 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **httpx_args,
             )
         return self._client
 
+    def _with_auth(self, httpx_args: dict[str, Any]) -> dict[str, Any]:
+        """Add the token to the headers, or an ``httpx.Auth`` sending it as a query parameter to ``httpx_args``"""
+        if self.key_pool is not None:
+            # Keys are set by ``KeyPoolTransport``, for every attempt
+            return httpx_args
+        if self.auth_location == "query":
+            from .auth import APIKeyAuth
+
+            return {**httpx_args, "auth": APIKeyAuth(self.token, self.auth_query_name)}
+        self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
+        return httpx_args
+
     def __enter__(self) -> "AuthenticatedClient":
         """Enter a context manager for self.client—you cannot enter twice (see httpx docs)"""
         self.get_httpx_client().__enter__()
@@ -246,7 +358,7 @@ class AuthenticatedClient:
     def get_async_httpx_client(self) -> httpx.AsyncClient:
         """Get the underlying httpx.AsyncClient, constructing a new one if not previously set"""
         if self._async_client is None:
-            self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
+            httpx_args = self._with_auth(_async_httpx_args(self))
             self._async_client = httpx.AsyncClient(
                 base_url=self._base_url,
                 cookies=self._cookies,
@@ -254,7 +366,7 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **httpx_args,
             )
         return self._async_client
 
@@ -266,3 +378,114 @@ class AuthenticatedClient:
     async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
         """Exit a context manager for underlying httpx.AsyncClient (see httpx docs)"""
         await self.get_async_httpx_client().__aexit__(*args, **kwargs)
+
+
+@functools.cache
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _pool_args(client: Union[Client, AuthenticatedClient]) -> dict[str, Any]:
+    """The ``http2`` and ``limits`` arguments of the default transport, from the pool settings of ``client``"""
+    limits = httpx.Limits(
+        max_connections=client._max_connections,
+        max_keepalive_connections=client._max_keepalive_connections,
+        keepalive_expiry=client._keepalive_expiry,
+    )
+    return {"http2": _http2_available() if client._http2 is None else client._http2, "limits": limits}
+
+
+def _transport_args(client: Union[Client, AuthenticatedClient]) -> dict[str, Any]:
+    """The ``httpx_args`` that configure the connection pool, for building the innermost transport ourselves"""
+    args = {key: client._httpx_args[key] for key in _TRANSPORT_ARGS if key in client._httpx_args}
+    return {"verify": client._verify_ssl, **_pool_args(client), **args}
+
+
+def _key_pool(client: Union[Client, AuthenticatedClient]) -> Optional["KeyPool"]:
+    return client.key_pool if isinstance(client, AuthenticatedClient) else None
+
+
+def _has_layers(client: Union[Client, AuthenticatedClient]) -> bool:
+    layers = (client._rate_limiter, client._retry, client._cache, client._memory_cache, client._instrumentation)
+    return any(layer is not None for layer in layers) or _key_pool(client) is not None
+
+
+def _sync_httpx_args(client: Union[Client, AuthenticatedClient]) -> dict[str, Any]:
+    """Wrap the transport of ``httpx_args`` in the client-side layers that are enabled on ``client``
+
+    Each layer's module is only imported when the layer is enabled, so clients without them import nothing extra.
+    """
+    if not _has_layers(client):
+        return {**_pool_args(client), **client._httpx_args}
+    args = {key: value for key, value in client._httpx_args.items() if key not in _TRANSPORT_ARGS}
+    transport: httpx.BaseTransport = args.get("transport") or httpx.HTTPTransport(**_transport_args(client))
+    if client._instrumentation is not None:
+        from .instrumentation import AttemptTransport
+
+        transport = AttemptTransport(transport)
+    if client._rate_limiter is not None:
+        from .ratelimit import RateLimitedTransport
+
+        transport = RateLimitedTransport(transport, client._rate_limiter)
+    if (key_pool := _key_pool(client)) is not None:
+        from .auth import KeyPoolTransport
+
+        transport = KeyPoolTransport(transport, key_pool, client.auth_query_name)
+    if client._retry is not None:
+        from .retry import RetryTransport
+
+        transport = RetryTransport(transport, client._retry)
+    if client._cache is not None:
+        from .cache import CacheTransport
+
+        transport = CacheTransport(transport, client._cache)
+    if client._memory_cache is not None:
+        from .lru import CoalescingTransport
+
+        transport = CoalescingTransport(transport, client._memory_cache)
+    if client._instrumentation is not None:
+        from .instrumentation import InstrumentedTransport
+
+        transport = InstrumentedTransport(transport, client._instrumentation)
+    return {**args, "transport": transport}
+
+
+def _async_httpx_args(client: Union[Client, AuthenticatedClient]) -> dict[str, Any]:
+    """The async counterpart of ``_sync_httpx_args``"""
+    if not _has_layers(client):
+        return {**_pool_args(client), **client._httpx_args}
+    args = {key: value for key, value in client._httpx_args.items() if key not in _TRANSPORT_ARGS}
+    transport: httpx.AsyncBaseTransport = args.get("transport") or httpx.AsyncHTTPTransport(**_transport_args(client))
+    if client._instrumentation is not None:
+        from .instrumentation import AsyncAttemptTransport
+
+        transport = AsyncAttemptTransport(transport)
+    if client._rate_limiter is not None:
+        from .ratelimit import AsyncRateLimitedTransport
+
+        transport = AsyncRateLimitedTransport(transport, client._rate_limiter)
+    if (key_pool := _key_pool(client)) is not None:
+        from .auth import AsyncKeyPoolTransport
+
+        transport = AsyncKeyPoolTransport(transport, key_pool, client.auth_query_name)
+    if client._retry is not None:
+        from .retry import AsyncRetryTransport
+
+        transport = AsyncRetryTransport(transport, client._retry)
+    if client._cache is not None:
+        from .cache import AsyncCacheTransport
+
+        transport = AsyncCacheTransport(transport, client._cache)
+    if client._memory_cache is not None:
+        from .lru import AsyncCoalescingTransport
+
+        transport = AsyncCoalescingTransport(transport, client._memory_cache)
+    if client._instrumentation is not None:
+        from .instrumentation import AsyncInstrumentedTransport
+
+        transport = AsyncInstrumentedTransport(transport, client._instrumentation)
+    return {**args, "transport": transport}
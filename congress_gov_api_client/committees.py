@@ -0,0 +1,440 @@
+"""Contains functions that assemble the activity of a committee from ``committee_details`` and every committee feed"""
+
+import asyncio
+import datetime
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from attrs import define, field
+
+from . import errors
+from .api.committee import (
+    committee_bills_list,
+    committee_details,
+    committee_list_by_congress,
+    committee_list_by_congress_chamber,
+    committee_reports_by_committee,
+    house_communications_by_committee,
+    nomination_by_committee,
+    senate_communications_by_committee,
+)
+from .client import AuthenticatedClient
+from .incremental import format_datetime, record_field
+from .models import Committee, ResourceCount
+from .pagination import MAX_LIMIT, Page, apaginate, paginate
+from .types import Response, Unset
+
+FEEDS: dict[str, ModuleType] = {
+    "bills": committee_bills_list,
+    "reports": committee_reports_by_committee,
+    "house_communications": house_communications_by_committee,
+    "senate_communications": senate_communications_by_committee,
+    "nominations": nomination_by_committee,
+}
+"""The list endpoint of each committee feed, keyed by the ``CommitteeActivity`` attribute holding its records"""
+
+_COUNTS: dict[str, tuple[str, Optional[str]]] = {
+    "bills": ("bills", None),
+    "reports": ("reports", None),
+    "house_communications": ("communications", "house"),
+    "senate_communications": ("communications", "senate"),
+    "nominations": ("nominations", "senate"),
+}
+"""The ``Committee`` attribute counting the records of each feed, and the only chamber it applies to"""
+
+_DATE_FILTERED = ("bills", "reports")
+"""The feeds accepting ``fromDateTime``"""
+
+
+@define
+class CommitteeActivity:
+    """A committee with the records of every feed
+
+    Feeds that ``committee_details`` reports as empty, or that do not apply to the committee's chamber, are not
+    requested and are left as empty lists.
+
+    Attributes:
+        chamber: The chamber, e.g. ``house``
+        committee_code: The committee's system code, e.g. ``hspw00``
+        committee: The ``committee_details`` record, possibly served from a ``CommitteeMetadataCache``
+        bills: Records of ``committee_bills_list``
+        reports: Records of ``committee_reports_by_committee``
+        house_communications: Records of ``house_communications_by_committee``, for House committees
+        senate_communications: Records of ``senate_communications_by_committee``, for Senate committees
+        nominations: Records of ``nomination_by_committee``, for Senate committees
+    """
+
+    chamber: str
+    committee_code: str
+    committee: Committee
+    bills: list[Any] = field(factory=list)
+    reports: list[Any] = field(factory=list)
+    house_communications: list[Any] = field(factory=list)
+    senate_communications: list[Any] = field(factory=list)
+    nominations: list[Any] = field(factory=list)
+
+
+@define
+class CommitteeMetadataCache:
+    """Keeps ``committee_details`` records for ``ttl`` seconds, shared by every aggregation given it
+
+    Committees change rarely, so a dashboard refreshed every few minutes need not request their details each time.
+    The counts in a cached record may be stale; aggregation follows any pages beyond them.
+
+    Attributes:
+        ttl: Seconds a record is served from the cache
+    """
+
+    ttl: float = 24 * 60 * 60
+    _entries: dict[tuple[str, str], tuple[float, Committee]] = field(init=False, factory=dict)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def get(self, chamber: str, committee_code: str) -> Optional[Committee]:
+        """The cached record of a committee, or ``None`` if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get((chamber.lower(), committee_code.lower()))
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def put(self, chamber: str, committee_code: str, committee: Committee) -> None:
+        with self._lock:
+            self._entries[chamber.lower(), committee_code.lower()] = (time.monotonic(), committee)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _committee(response: Response[Any]) -> Committee:
+    if response.status_code != HTTPStatus.OK or response.parsed is None or isinstance(response.parsed.committee, Unset):
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return response.parsed.committee
+
+
+def _count(reference: Union[Unset, ResourceCount, None]) -> int:
+    if not isinstance(reference, ResourceCount) or isinstance(reference.count, Unset):
+        return 0
+    return reference.count
+
+
+def _filters(congress: Optional[int]) -> dict[str, dict[str, str]]:
+    """The arguments narrowing each feed to records that can belong to ``congress``
+
+    A record of a congress was last updated no earlier than the congress began, so the feeds accepting
+    ``fromDateTime`` are asked only for records updated since; records of earlier congresses updated since are left
+    out by ``_keep``.
+    """
+    if congress is None:
+        return {}
+    began = datetime.datetime(1789 + 2 * (congress - 1), 1, 1, tzinfo=datetime.timezone.utc)
+    return {name: {"from_date_time": format_datetime(began)} for name in _DATE_FILTERED}
+
+
+def _plan(chamber: str, committee: Committee, filters: dict[str, dict[str, str]]) -> list[tuple[str, int]]:
+    """The ``(feed, offset)`` of every page to request, skipping empty feeds and those of the other chamber
+
+    Filtered feeds are planned one page at a time, as ``committee_details`` only counts every record.
+    """
+    plan = []
+    for name, (attribute, only) in _COUNTS.items():
+        if only is not None and only != chamber.lower():
+            continue
+        count = _count(getattr(committee, attribute))
+        if name in filters:
+            count = min(count, 1)
+        plan.extend((name, offset) for offset in range(0, count, MAX_LIMIT))
+    return plan
+
+
+def _continue(pages: dict[tuple[str, int], Page], plan: list[tuple[str, int]]) -> list[tuple[str, int]]:
+    """The pages to request after ``plan``: all pages a feed's ``pagination.count`` gives beyond its last page"""
+    last = {name: offset for name, offset in sorted(plan)}
+    following = []
+    for name, offset in last.items():
+        page = pages[name, offset]
+        if page.items and page.next_offset is not None:
+            end = max(page.count or 0, page.next_offset + 1)
+            following.extend((name, offset) for offset in range(page.next_offset, end, MAX_LIMIT))
+    return following
+
+
+def _keep(congress: Optional[int], records: list[Any]) -> list[Any]:
+    if congress is None:
+        return records
+    return [record for record in records if str(record_field(record, "congress")) == str(congress)]
+
+
+def _assemble(
+    args: tuple[str, str], committee: Committee, pages: dict[tuple[str, int], Page], congress: Optional[int]
+) -> CommitteeActivity:
+    activity = CommitteeActivity(*args, committee=committee)
+    for (name, _), page in sorted(pages.items()):
+        getattr(activity, name).extend(_keep(congress, page.items))
+    return activity
+
+
+def _fetch_page(
+    endpoint: ModuleType, args: tuple[str, str], client: AuthenticatedClient, offset: int, kwargs: dict[str, str]
+) -> Page:
+    return Page.from_response(endpoint.sync_detailed(*args, client=client, offset=offset, limit=MAX_LIMIT, **kwargs))
+
+
+def aggregate_committee(
+    chamber: str,
+    committee_code: str,
+    *,
+    client: AuthenticatedClient,
+    congress: Optional[int] = None,
+    metadata: Optional[CommitteeMetadataCache] = None,
+    concurrency: int = 8,
+    executor: Optional[Executor] = None,
+) -> CommitteeActivity:
+    """Fetch a committee and every page of its feeds
+
+    ``committee_details`` is requested first, unless ``metadata`` holds it; its counts give the number of pages of
+    each feed, so every page of every non-empty feed is then requested concurrently. Should a feed have more pages
+    than planned, as when the counts are stale or the feed is filtered, the ``pagination.count`` of its last page
+    plans another round.
+
+    Args:
+        chamber: The chamber, e.g. ``house``
+        committee_code: The committee's system code, e.g. ``hspw00``
+        client: The client to make requests with
+        congress: Keep only the feed records of this congress; the feeds span every congress, and bills and reports
+            are requested only if updated since the congress began
+        metadata: A cache of ``committee_details`` records to read and fill
+        concurrency: The maximum number of requests in flight
+        executor: An executor to run the requests in, shared with other aggregations; by default one with
+            ``concurrency`` threads is created for this committee
+
+    Raises:
+        errors.UnexpectedStatus: If any request is not answered successfully.
+        httpx.TimeoutException: If a request takes longer than Client.timeout.
+
+    Returns:
+        CommitteeActivity
+    """
+    args = (chamber, committee_code)
+    filters = _filters(congress)
+    owned = executor is None
+    pool = ThreadPoolExecutor(max_workers=concurrency) if executor is None else executor
+    try:
+        committee = None if metadata is None else metadata.get(*args)
+        if committee is None:
+            committee = _committee(pool.submit(committee_details.sync_detailed, *args, client=client).result())
+            if metadata is not None:
+                metadata.put(*args, committee)
+        pages: dict[tuple[str, int], Page] = {}
+        plan = _plan(chamber, committee, filters)
+        while plan:
+            futures: dict[tuple[str, int], Future[Page]] = {
+                (name, offset): pool.submit(_fetch_page, FEEDS[name], args, client, offset, filters.get(name, {}))
+                for name, offset in plan
+            }
+            pages.update((key, future.result()) for key, future in futures.items())
+            plan = _continue(pages, plan)
+    finally:
+        if owned:
+            pool.shutdown(cancel_futures=True)
+    return _assemble(args, committee, pages, congress)
+
+
+async def aaggregate_committee(
+    chamber: str,
+    committee_code: str,
+    *,
+    client: AuthenticatedClient,
+    congress: Optional[int] = None,
+    metadata: Optional[CommitteeMetadataCache] = None,
+    concurrency: int = 8,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> CommitteeActivity:
+    """The async counterpart of ``aggregate_committee``
+
+    Args:
+        semaphore: A semaphore limiting requests in flight, shared with other aggregations; by default one allowing
+            ``concurrency`` requests is created for this committee
+
+    Returns:
+        CommitteeActivity
+    """
+    limit = asyncio.Semaphore(concurrency) if semaphore is None else semaphore
+    args = (chamber, committee_code)
+    filters = _filters(congress)
+
+    async def fetch_page(name: str, offset: int) -> Page:
+        async with limit:
+            response = await FEEDS[name].asyncio_detailed(
+                *args, client=client, offset=offset, limit=MAX_LIMIT, **filters.get(name, {})
+            )
+        return Page.from_response(response)
+
+    committee = None if metadata is None else metadata.get(*args)
+    if committee is None:
+        async with limit:
+            committee = _committee(await committee_details.asyncio_detailed(*args, client=client))
+        if metadata is not None:
+            metadata.put(*args, committee)
+    pages: dict[tuple[str, int], Page] = {}
+    plan = _plan(chamber, committee, filters)
+    while plan:
+        tasks = [asyncio.ensure_future(fetch_page(name, offset)) for name, offset in plan]
+        try:
+            pages.update(zip(plan, await asyncio.gather(*tasks)))
+        finally:
+            for task in tasks:
+                task.cancel()
+        plan = _continue(pages, plan)
+    return _assemble(args, committee, pages, congress)
+
+
+def _committee_keys(record: Any, subcommittees: bool) -> list[tuple[str, str]]:
+    """The ``(chamber, system code)`` of a listed committee and, if asked for, of its subcommittees"""
+    chamber = str(record_field(record, "chamber") or "").lower()
+    keys = [(chamber, str(record_field(record, "systemCode")))]
+    nested = record_field(record, "subcommittees") if subcommittees else None
+    for subcommittee in nested if isinstance(nested, list) else []:
+        if isinstance(subcommittee, dict) and subcommittee.get("systemCode"):
+            keys.append((chamber, str(subcommittee["systemCode"])))
+    return keys
+
+
+def _listing(congress: int, chamber: Optional[str]) -> tuple[ModuleType, tuple[Any, ...]]:
+    if chamber is None:
+        return committee_list_by_congress, (congress,)
+    return committee_list_by_congress_chamber, (congress, chamber)
+
+
+def aggregate_congress(
+    congress: int,
+    *,
+    client: AuthenticatedClient,
+    chamber: Optional[str] = None,
+    subcommittees: bool = False,
+    metadata: Optional[CommitteeMetadataCache] = None,
+    workers: int = 4,
+    concurrency: int = 16,
+) -> Iterator[CommitteeActivity]:
+    """Aggregate every committee of a congress, yielding committees in listing order
+
+    Committees are listed with ``committee_list_by_congress``, or ``committee_list_by_congress_chamber`` given a
+    ``chamber``, and aggregated by ``workers`` threads with the feed records of other congresses left out. At most
+    ``2 * workers`` committees are held ahead of the caller, and every request shares one pool of ``concurrency``
+    threads.
+
+    Args:
+        congress: The congress number, e.g. 118
+        client: The client to make requests with
+        chamber: Only the committees of this chamber, e.g. ``senate``
+        subcommittees: Whether to aggregate the subcommittees of each listed committee as well
+        metadata: A cache of ``committee_details`` records, so that refreshes skip the details of known committees
+        workers: The number of committees aggregated at once
+        concurrency: The maximum number of requests in flight across all committees
+
+    Returns:
+        Iterator[CommitteeActivity]
+    """
+    requests = ThreadPoolExecutor(max_workers=concurrency)
+    committees = ThreadPoolExecutor(max_workers=workers)
+    window: deque[Future[CommitteeActivity]] = deque()
+    endpoint, args = _listing(congress, chamber)
+    try:
+        for record in paginate(endpoint, *args, client=client):
+            for key in _committee_keys(record, subcommittees):
+                window.append(
+                    committees.submit(
+                        aggregate_committee,
+                        *key,
+                        client=client,
+                        congress=congress,
+                        metadata=metadata,
+                        executor=requests,
+                    )
+                )
+                if len(window) >= 2 * workers:
+                    yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+    finally:
+        committees.shutdown(cancel_futures=True)
+        requests.shutdown(cancel_futures=True)
+
+
+async def aaggregate_congress(
+    congress: int,
+    *,
+    client: AuthenticatedClient,
+    chamber: Optional[str] = None,
+    subcommittees: bool = False,
+    metadata: Optional[CommitteeMetadataCache] = None,
+    workers: int = 4,
+    concurrency: int = 16,
+) -> AsyncIterator[CommitteeActivity]:
+    """The async counterpart of ``aggregate_congress``
+
+    Committees are listed into a queue holding at most ``workers`` committees, which ``workers`` tasks take from.
+    Aggregated committees wait in a queue of at most ``workers`` as well, so the tasks stop when the consumer falls
+    behind, and every request shares one semaphore of ``concurrency``. Committees are yielded as they complete.
+
+    Returns:
+        AsyncIterator[CommitteeActivity]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    keys: asyncio.Queue[Optional[tuple[str, str]]] = asyncio.Queue(maxsize=workers)
+    results: asyncio.Queue[Union[CommitteeActivity, BaseException, None]] = asyncio.Queue(maxsize=workers)
+    endpoint, args = _listing(congress, chamber)
+
+    async def produce() -> None:
+        async for record in apaginate(endpoint, *args, client=client):
+            for key in _committee_keys(record, subcommittees):
+                await keys.put(key)
+        for _ in range(workers):
+            await keys.put(None)
+
+    async def work() -> None:
+        while (key := await keys.get()) is not None:
+            activity = await aaggregate_committee(
+                *key, client=client, congress=congress, metadata=metadata, semaphore=semaphore
+            )
+            await results.put(activity)
+        await results.put(None)
+
+    async def run(task: "asyncio.Task[None]") -> None:
+        try:
+            await task
+        except BaseException as error:
+            await results.put(error)
+
+    tasks = [asyncio.ensure_future(produce())] + [asyncio.ensure_future(work()) for _ in range(workers)]
+    watchers = [asyncio.ensure_future(run(task)) for task in tasks]
+    try:
+        finished = 0
+        while finished < workers:
+            result = await results.get()
+            if result is None:
+                finished += 1
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                yield result
+    finally:
+        for task in tasks + watchers:
+            task.cancel()
+
+
+__all__ = [
+    "FEEDS",
+    "CommitteeActivity",
+    "CommitteeMetadataCache",
+    "aaggregate_committee",
+    "aaggregate_congress",
+    "aggregate_committee",
+    "aggregate_congress",
+]
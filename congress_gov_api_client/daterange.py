@@ -0,0 +1,328 @@
+"""Contains date-range iterators for the Congressional Record endpoints that are addressed by calendar date
+
+Asking for every day of a range wastes most requests on days without a session. These iterators list whole years,
+or the months of partial years, first, and only request the days that listing shows to have content. Requests run
+concurrently and results are yielded as they arrive.
+"""
+
+import asyncio
+import datetime
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Optional
+
+from attrs import define, field
+from dateutil.parser import isoparse
+
+from .api.bound_congressional_record import (
+    bound_congressional_record_list_by_year,
+    bound_congressional_record_list_by_year_and_month,
+    bound_congressional_record_list_by_year_and_month_and_day,
+)
+from .api.congressional_record import congressional_record_list
+from .client import AuthenticatedClient
+from .decoding import decode_json
+from .errors import UnexpectedStatus
+from .incremental import record_field
+from .pagination import MAX_LIMIT, apaginate, paginate
+from .types import Response
+
+
+@define(frozen=True)
+class Window:
+    """A year, or a month of a year, listed in one go
+
+    Attributes:
+        year: The year
+        month: The month, or ``None`` for the whole year
+    """
+
+    year: int
+    month: Optional[int] = None
+
+
+@define
+class RecordDay:
+    """The bound Congressional Record of one day
+
+    Attributes:
+        date: The day
+        records: The records listed for the day, e.g. one per section with its pages
+    """
+
+    date: datetime.date
+    records: list[Any] = field(factory=list)
+
+
+def plan_windows(start: datetime.date, end: datetime.date) -> list[Window]:
+    """The coarsest listings covering ``start`` to ``end`` inclusive: whole years, and months for partial years"""
+    if end < start:
+        return []
+    windows = []
+    for year in range(start.year, end.year + 1):
+        first = datetime.date(year, 1, 1)
+        last = datetime.date(year, 12, 31)
+        if start <= first and last <= end:
+            windows.append(Window(year))
+            continue
+        first_month = start.month if year == start.year else 1
+        last_month = end.month if year == end.year else 12
+        windows.extend(Window(year, month) for month in range(first_month, last_month + 1))
+    return windows
+
+
+def _date(record: Any) -> Optional[datetime.date]:
+    value = record_field(record, "date") or record_field(record, "issueDate") or record_field(record, "PublishDate")
+    try:
+        return isoparse(str(value)).date()
+    except ValueError:
+        return None
+
+
+def _bound_listing(window: Window) -> tuple[Any, tuple[str, ...]]:
+    if window.month is None:
+        return bound_congressional_record_list_by_year, (str(window.year),)
+    return bound_congressional_record_list_by_year_and_month, (str(window.year), str(window.month))
+
+
+def _day_args(day: datetime.date) -> tuple[str, str, str]:
+    return str(day.year), str(day.month), str(day.day)
+
+
+def _fetch_day(day: datetime.date, client: AuthenticatedClient) -> RecordDay:
+    endpoint = bound_congressional_record_list_by_year_and_month_and_day
+    return RecordDay(day, list(paginate(endpoint, *_day_args(day), client=client)))
+
+
+def bound_record_range(
+    start: datetime.date,
+    end: datetime.date,
+    *,
+    client: AuthenticatedClient,
+    concurrency: int = 8,
+    details: bool = True,
+) -> Iterator[RecordDay]:
+    """Yield the bound Congressional Record of every day from ``start`` to ``end`` that has one
+
+    Years inside the range are listed with ``bound_congressional_record_list_by_year`` and the months of partial
+    years with ``bound_congressional_record_list_by_year_and_month``. Only the days those listings show are requested
+    with ``bound_congressional_record_list_by_year_and_month_and_day``, as soon as their listing arrives. Days are
+    yielded as they complete, not in date order.
+
+    Args:
+        start: The first day, inclusive
+        end: The last day, inclusive
+        client: The client to make requests with
+        concurrency: The maximum number of requests in flight
+        details: Whether to request each day; without, days hold the records of the coarse listing and no day is
+            requested
+
+    Raises:
+        errors.UnexpectedStatus: If any page is not returned successfully.
+
+    Returns:
+        Iterator[RecordDay]
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        listings = {pool.submit(_list_window, window, client, start, end) for window in plan_windows(start, end)}
+        days: set[Future[RecordDay]] = set()
+        seen: set[datetime.date] = set()
+        try:
+            while listings or days:
+                done, _ = wait(listings | days, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in days:
+                        days.discard(future)
+                        yield future.result()
+                        continue
+                    listings.discard(future)
+                    for record_day in future.result():
+                        if record_day.date in seen:
+                            continue
+                        seen.add(record_day.date)
+                        if details:
+                            days.add(pool.submit(_fetch_day, record_day.date, client))
+                        else:
+                            yield record_day
+        finally:
+            for future in listings | days:
+                future.cancel()
+
+
+def _list_window(
+    window: Window, client: AuthenticatedClient, start: datetime.date, end: datetime.date
+) -> list[RecordDay]:
+    endpoint, args = _bound_listing(window)
+    return _group(paginate(endpoint, *args, client=client), start, end)
+
+
+def _group(records: Iterable[Any], start: datetime.date, end: datetime.date) -> list[RecordDay]:
+    by_day: dict[datetime.date, RecordDay] = {}
+    for record in records:
+        day = _date(record)
+        if day is not None and start <= day <= end:
+            by_day.setdefault(day, RecordDay(day)).records.append(record)
+    return [by_day[day] for day in sorted(by_day)]
+
+
+async def abound_record_range(
+    start: datetime.date,
+    end: datetime.date,
+    *,
+    client: AuthenticatedClient,
+    concurrency: int = 8,
+    details: bool = True,
+) -> AsyncIterator[RecordDay]:
+    """The async counterpart of ``bound_record_range``, with at most ``concurrency`` requests in flight
+
+    Returns:
+        AsyncIterator[RecordDay]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def collect(endpoint: Any, args: tuple[str, ...]) -> list[Any]:
+        async with semaphore:
+            return [record async for record in apaginate(endpoint, *args, client=client)]
+
+    async def list_window(window: Window) -> list[RecordDay]:
+        return _group(await collect(*_bound_listing(window)), start, end)
+
+    async def fetch_day(day: datetime.date) -> RecordDay:
+        endpoint = bound_congressional_record_list_by_year_and_month_and_day
+        return RecordDay(day, await collect(endpoint, _day_args(day)))
+
+    listings = {asyncio.ensure_future(list_window(window)) for window in plan_windows(start, end)}
+    days: set[asyncio.Future[RecordDay]] = set()
+    seen: set[datetime.date] = set()
+    try:
+        while listings or days:
+            done, _ = await asyncio.wait(listings | days, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task in days:
+                    days.discard(task)
+                    yield task.result()
+                    continue
+                listings.discard(task)
+                for record_day in task.result():
+                    if record_day.date in seen:
+                        continue
+                    seen.add(record_day.date)
+                    if details:
+                        days.add(asyncio.ensure_future(fetch_day(record_day.date)))
+                    else:
+                        yield record_day
+    finally:
+        for task in listings | days:
+            task.cancel()
+
+
+def _record_params(window: Window) -> dict[str, int]:
+    return {"y": window.year} if window.month is None else {"y": window.year, "m": window.month}
+
+
+def _issues(response: Response[Any]) -> list[Any]:
+    """The issues of a ``congressional_record_list`` page, which nests them in ``Results.Issues``"""
+    data = decode_json(response.content)
+    if response.status_code != 200 or not isinstance(data, dict):
+        raise UnexpectedStatus(response.status_code, response.content)
+    return (data.get("Results") or {}).get("Issues") or []
+
+
+def _list_issues(window: Window, client: AuthenticatedClient, start: datetime.date, end: datetime.date) -> list[Any]:
+    # The endpoint reports no ``pagination.next``, so pages are requested until one comes back short
+    issues: list[Any] = []
+    offset = 0
+    while True:
+        page = _issues(
+            congressional_record_list.sync_detailed(
+                client=client, offset=offset, limit=MAX_LIMIT, **_record_params(window)
+            )
+        )
+        issues.extend(issue for issue in page if (day := _date(issue)) is not None and start <= day <= end)
+        if len(page) < MAX_LIMIT:
+            return issues
+        offset += len(page)
+
+
+def congressional_record_range(
+    start: datetime.date,
+    end: datetime.date,
+    *,
+    client: AuthenticatedClient,
+    concurrency: int = 8,
+) -> Iterator[Any]:
+    """Yield the issues of the daily Congressional Record published from ``start`` to ``end``
+
+    ``congressional_record_list`` is queried with ``y`` for years inside the range and ``y`` and ``m`` for the months
+    of partial years. Its listings already hold each issue with its links, so no day needs a request of its own.
+    Windows are listed concurrently and their issues yielded as each completes.
+
+    Args:
+        start: The first day, inclusive
+        end: The last day, inclusive
+        client: The client to make requests with
+        concurrency: The maximum number of requests in flight
+
+    Raises:
+        errors.UnexpectedStatus: If any page is not returned successfully.
+
+    Returns:
+        Iterator[Any]
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        listings = [pool.submit(_list_issues, window, client, start, end) for window in plan_windows(start, end)]
+        try:
+            for listing in as_completed(listings):
+                yield from listing.result()
+        finally:
+            for listing in listings:
+                listing.cancel()
+
+
+async def acongressional_record_range(
+    start: datetime.date,
+    end: datetime.date,
+    *,
+    client: AuthenticatedClient,
+    concurrency: int = 8,
+) -> AsyncIterator[Any]:
+    """The async counterpart of ``congressional_record_range``, with at most ``concurrency`` requests in flight
+
+    Returns:
+        AsyncIterator[Any]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def list_issues(window: Window) -> list[Any]:
+        issues: list[Any] = []
+        offset = 0
+        while True:
+            async with semaphore:
+                response = await congressional_record_list.asyncio_detailed(
+                    client=client, offset=offset, limit=MAX_LIMIT, **_record_params(window)
+                )
+            page = _issues(response)
+            issues.extend(issue for issue in page if (day := _date(issue)) is not None and start <= day <= end)
+            if len(page) < MAX_LIMIT:
+                return issues
+            offset += len(page)
+
+    tasks = [asyncio.ensure_future(list_issues(window)) for window in plan_windows(start, end)]
+    try:
+        for task in asyncio.as_completed(tasks):
+            for issue in await task:
+                yield issue
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+__all__ = [
+    "RecordDay",
+    "Window",
+    "abound_record_range",
+    "acongressional_record_range",
+    "bound_record_range",
+    "congressional_record_range",
+    "plan_windows",
+]
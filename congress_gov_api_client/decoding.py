@@ -0,0 +1,30 @@
+"""Contains the JSON decoding used to parse response bodies into models"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON document, using the compiled ``orjson`` decoder when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def decode_json(content: bytes) -> Optional[Any]:
+    """Decode the body of a response exactly once
+
+    Returns ``None`` for bodies that are not JSON documents (e.g. when the endpoint was called with ``format_="xml"``),
+    so that ``Response.parsed`` is only ever populated from JSON payloads.
+    """
+    if content[:64].lstrip()[:1] not in (b"{", b"["):
+        return None
+    return loads(content)
+
+
+__all__ = ["decode_json", "loads"]
@@ -0,0 +1,524 @@
+"""Contains an in-memory directory of members indexed by bioguide ID, state, district and congress
+
+The directory is filled once from ``member_list`` and then kept current with ``fromDateTime``, so resolving a member
+no longer costs a request. It can be saved as a snapshot file that later opens memory-mapped: only the index keys are
+decoded at startup, and each member is decoded from the mapping the first time it is looked up.
+"""
+
+import datetime
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from attrs import define, evolve, field
+from dateutil.parser import isoparse
+
+from .api.member import member_list
+from .client import AuthenticatedClient
+from .decoding import loads
+from .incremental import format_datetime, record_field
+from .pagination import MAX_LIMIT, apaginate, paginate
+
+STATE_CODES: dict[str, str] = {
+    "Alabama": "AL",
+    "Alaska": "AK",
+    "American Samoa": "AS",
+    "Arizona": "AZ",
+    "Arkansas": "AR",
+    "California": "CA",
+    "Colorado": "CO",
+    "Connecticut": "CT",
+    "Delaware": "DE",
+    "District of Columbia": "DC",
+    "Florida": "FL",
+    "Georgia": "GA",
+    "Guam": "GU",
+    "Hawaii": "HI",
+    "Idaho": "ID",
+    "Illinois": "IL",
+    "Indiana": "IN",
+    "Iowa": "IA",
+    "Kansas": "KS",
+    "Kentucky": "KY",
+    "Louisiana": "LA",
+    "Maine": "ME",
+    "Maryland": "MD",
+    "Massachusetts": "MA",
+    "Michigan": "MI",
+    "Minnesota": "MN",
+    "Mississippi": "MS",
+    "Missouri": "MO",
+    "Montana": "MT",
+    "Nebraska": "NE",
+    "Nevada": "NV",
+    "New Hampshire": "NH",
+    "New Jersey": "NJ",
+    "New Mexico": "NM",
+    "New York": "NY",
+    "North Carolina": "NC",
+    "North Dakota": "ND",
+    "Northern Mariana Islands": "MP",
+    "Ohio": "OH",
+    "Oklahoma": "OK",
+    "Oregon": "OR",
+    "Pennsylvania": "PA",
+    "Puerto Rico": "PR",
+    "Rhode Island": "RI",
+    "South Carolina": "SC",
+    "South Dakota": "SD",
+    "Tennessee": "TN",
+    "Texas": "TX",
+    "Utah": "UT",
+    "Vermont": "VT",
+    "Virgin Islands": "VI",
+    "Virginia": "VA",
+    "Washington": "WA",
+    "West Virginia": "WV",
+    "Wisconsin": "WI",
+    "Wyoming": "WY",
+}
+
+_MAGIC = b"CGMDIR01"
+_HEADER = struct.Struct("<8sQ")
+
+
+def state_code(state: str) -> str:
+    """The two-letter code of a state given by name or code, e.g. ``VT`` for ``Vermont``; unknown names pass through"""
+    if len(state) == 2:
+        return state.upper()
+    return STATE_CODES.get(state, state)
+
+
+def congress_of_year(year: int) -> int:
+    """The congress sitting for most of ``year``, e.g. 118 for 2023 and 2024"""
+    return (year - 1789) // 2 + 1
+
+
+@define(frozen=True)
+class Term:
+    """A term of a member as listed by ``member_list``
+
+    Attributes:
+        chamber: The chamber, e.g. ``Senate``
+        start_year: The year the term began
+        end_year: The year the term ended, or ``None`` if it has not
+    """
+
+    chamber: str
+    start_year: int
+    end_year: Optional[int] = None
+
+    def congresses(self, current: int) -> range:
+        """The congresses the term spans, ending at ``current`` for a term that has not ended"""
+        first = congress_of_year(self.start_year)
+        if self.end_year is None:
+            return range(first, max(first, current) + 1)
+        # A term ending in an odd year ends on January 3, before the congress of that year does any business
+        last = congress_of_year(self.end_year - 1) if self.end_year > self.start_year else first
+        return range(first, max(first, last) + 1)
+
+
+@define(frozen=True)
+class MemberRecord:
+    """A member of Congress as kept by ``MemberDirectory``; attrs gives it ``__slots__``, so it carries no ``__dict__``
+
+    Attributes:
+        bioguide_id: The bioguide ID, e.g. ``L000174``
+        name: The inverted name, e.g. ``Leahy, Patrick J.``
+        party: The party name
+        state: The two-letter state code
+        district: The congressional district, or ``None`` for senators and at-large members
+        current: Whether the member is serving
+        terms: The terms, oldest first
+        update_date: The ``updateDate`` of the listing
+        url: The ``member_details`` URL
+    """
+
+    bioguide_id: str
+    name: str = ""
+    party: str = ""
+    state: str = ""
+    district: Optional[int] = None
+    current: bool = False
+    terms: tuple[Term, ...] = ()
+    update_date: str = ""
+    url: str = ""
+
+    def congresses(self, current: int) -> set[int]:
+        """The congresses the member served in, counting terms that have not ended up to ``current``"""
+        return {congress for term in self.terms for congress in term.congresses(current)}
+
+    def _row(self) -> list[Any]:
+        terms = [[term.chamber, term.start_year, term.end_year] for term in self.terms]
+        return [
+            self.bioguide_id,
+            self.name,
+            self.party,
+            self.state,
+            self.district,
+            self.current,
+            terms,
+            self.update_date,
+            self.url,
+        ]
+
+    @classmethod
+    def _from_row(cls, row: list[Any]) -> "MemberRecord":
+        bioguide_id, name, party, state, district, current, terms, update_date, url = row
+        return cls(
+            bioguide_id, name, party, state, district, current, tuple(Term(*term) for term in terms), update_date, url
+        )
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _terms(record: Any) -> tuple[Term, ...]:
+    terms = record_field(record, "terms")
+    items = terms.get("item") if isinstance(terms, dict) else terms
+    parsed = []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        start = _int(item.get("startYear", item.get("start")))
+        if start is not None:
+            parsed.append(Term(str(item.get("chamber") or ""), start, _int(item.get("endYear", item.get("end")))))
+    return tuple(sorted(parsed, key=lambda term: term.start_year))
+
+
+def member_record(record: Any, current: Optional[bool] = None) -> MemberRecord:
+    """Convert a ``member_list`` record, a model or dict, to a ``MemberRecord``
+
+    Args:
+        record: The record
+        current: Whether the member is serving; by default the record's ``currentMember``, else whether its last term
+            is open
+    """
+    terms = _terms(record)
+    if current is None:
+        listed = record_field(record, "currentMember")
+        current = bool(listed) if listed is not None else bool(terms) and terms[-1].end_year is None
+    return MemberRecord(
+        bioguide_id=str(record_field(record, "bioguideId")),
+        name=str(record_field(record, "name") or ""),
+        party=str(record_field(record, "partyName") or ""),
+        state=state_code(str(record_field(record, "state") or "")),
+        district=_int(record_field(record, "district")),
+        current=current,
+        terms=terms,
+        update_date=str(record_field(record, "updateDate") or ""),
+        url=str(record_field(record, "url") or ""),
+    )
+
+
+@define(frozen=True)
+class _Keys:
+    """What a member is indexed under"""
+
+    state: str
+    district: Optional[int]
+    current: bool
+    congresses: frozenset[int]
+
+    @classmethod
+    def of(cls, member: MemberRecord, current_congress: int) -> "_Keys":
+        return cls(member.state, member.district, member.current, frozenset(member.congresses(current_congress)))
+
+
+@define
+class MemberDirectory:
+    """Members of Congress held in memory with hash indexes, answering lookups without requests
+
+    ``refresh`` lists every member on its first run and only those updated since on later runs, and re-lists the
+    serving members to keep ``current`` accurate. Lookups take a lock shared with ``refresh`` so they never see an
+    index half updated.
+
+    Attributes:
+        overlap: How far before the previous refresh each refresh starts, to tolerate clock skew between the API's
+            servers; repeated records are simply replaced
+        watermark: When the last refresh started, or ``None`` before the first
+    """
+
+    overlap: datetime.timedelta = datetime.timedelta(minutes=15)
+    watermark: Optional[datetime.datetime] = None
+    _members: dict[str, MemberRecord] = field(init=False, factory=dict)
+    _keys: dict[str, _Keys] = field(init=False, factory=dict)
+    _by_state: dict[str, set[str]] = field(init=False, factory=dict)
+    _by_district: dict[tuple[str, int], set[str]] = field(init=False, factory=dict)
+    _by_congress: dict[int, set[str]] = field(init=False, factory=dict)
+    _current: set[str] = field(init=False, factory=set)
+    _lock: threading.RLock = field(init=False, factory=threading.RLock)
+    _mapping: Optional[mmap.mmap] = field(init=False, default=None)
+    _rows: dict[str, tuple[int, int]] = field(init=False, factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, bioguide_id: object) -> bool:
+        return bioguide_id in self._keys
+
+    def _index(self, bioguide_id: str, keys: _Keys) -> None:
+        self._keys[bioguide_id] = keys
+        self._by_state.setdefault(keys.state, set()).add(bioguide_id)
+        if keys.district is not None:
+            self._by_district.setdefault((keys.state, keys.district), set()).add(bioguide_id)
+        for congress in keys.congresses:
+            self._by_congress.setdefault(congress, set()).add(bioguide_id)
+        if keys.current:
+            self._current.add(bioguide_id)
+
+    def _unindex(self, bioguide_id: str) -> None:
+        keys = self._keys.pop(bioguide_id, None)
+        if keys is None:
+            return
+        self._by_state[keys.state].discard(bioguide_id)
+        if keys.district is not None:
+            self._by_district[keys.state, keys.district].discard(bioguide_id)
+        for congress in keys.congresses:
+            self._by_congress[congress].discard(bioguide_id)
+        self._current.discard(bioguide_id)
+
+    def _put(self, member: MemberRecord, current_congress: int) -> None:
+        self._unindex(member.bioguide_id)
+        self._rows.pop(member.bioguide_id, None)
+        self._members[member.bioguide_id] = member
+        self._index(member.bioguide_id, _Keys.of(member, current_congress))
+
+    def upsert(self, records: Iterable[Any]) -> int:
+        """Add or replace members from ``member_list`` records, models or dicts, or ``MemberRecord`` instances
+
+        Returns:
+            int: The number of records applied
+        """
+        current_congress = congress_of_year(datetime.date.today().year)
+        count = 0
+        with self._lock:
+            for record in records:
+                self._put(record if isinstance(record, MemberRecord) else member_record(record), current_congress)
+                count += 1
+        return count
+
+    def _set_current(self, serving: set[str]) -> None:
+        with self._lock:
+            for bioguide_id in (self._current - serving) | (serving - self._current):
+                member = self._get(bioguide_id)
+                if member is not None:
+                    self._put(
+                        evolve(member, current=bioguide_id in serving), congress_of_year(datetime.date.today().year)
+                    )
+
+    def _window(self) -> tuple[datetime.datetime, dict[str, str]]:
+        until = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        window = {"to_date_time": format_datetime(until)}
+        if self.watermark is not None:
+            window["from_date_time"] = format_datetime(self.watermark - self.overlap)
+        return until, window
+
+    def refresh(self, *, client: AuthenticatedClient, current: bool = True) -> int:
+        """List the members updated since the last refresh, or every member on the first, and apply them
+
+        Args:
+            client: The client to make requests with
+            current: Whether to also list the serving members with ``currentMember=true`` and update ``current``
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+
+        Returns:
+            int: The number of member records applied
+        """
+        until, window = self._window()
+        batch: list[Any] = []
+        count = 0
+        for record in paginate(member_list, client=client, limit=MAX_LIMIT, **window):
+            batch.append(record)
+            if len(batch) >= MAX_LIMIT:
+                count += self.upsert(batch)
+                batch = []
+        count += self.upsert(batch)
+        if current:
+            serving = paginate(member_list, client=client, limit=MAX_LIMIT, current_member="true")
+            self._set_current({str(record_field(record, "bioguideId")) for record in serving})
+        self.watermark = until
+        return count
+
+    async def arefresh(self, *, client: AuthenticatedClient, current: bool = True, concurrency: int = 4) -> int:
+        """The async counterpart of ``refresh``, fetching up to ``concurrency`` pages at once
+
+        Returns:
+            int: The number of member records applied
+        """
+        until, window = self._window()
+        records = [
+            record
+            async for record in apaginate(
+                member_list, client=client, limit=MAX_LIMIT, concurrency=concurrency, ordered=False, **window
+            )
+        ]
+        count = self.upsert(records)
+        if current:
+            serving = apaginate(
+                member_list, client=client, limit=MAX_LIMIT, concurrency=concurrency, current_member="true"
+            )
+            self._set_current({str(record_field(record, "bioguideId")) async for record in serving})
+        self.watermark = until
+        return count
+
+    def _get(self, bioguide_id: str) -> Optional[MemberRecord]:
+        member = self._members.get(bioguide_id)
+        if member is None and bioguide_id in self._rows and self._mapping is not None:
+            offset, length = self._rows[bioguide_id]
+            member = MemberRecord._from_row(loads(self._mapping[offset : offset + length]))
+            self._members[bioguide_id] = member
+        return member
+
+    def _select(self, ids: Iterable[str]) -> list[MemberRecord]:
+        members = (self._get(bioguide_id) for bioguide_id in sorted(ids))
+        return [member for member in members if member is not None]
+
+    def member(self, bioguide_id: str) -> Optional[MemberRecord]:
+        """A member by bioguide ID, the counterpart of ``member_details``"""
+        with self._lock:
+            return self._get(bioguide_id)
+
+    def by_state(self, state: str, *, current: Optional[bool] = None) -> list[MemberRecord]:
+        """The members from a state, by name or code, the counterpart of ``member_list_by_state``
+
+        Args:
+            state: The state, e.g. ``VT`` or ``Vermont``
+            current: Only serving members if true, only former members if false
+        """
+        with self._lock:
+            return self._filter(self._by_state.get(state_code(state), set()), current)
+
+    def by_district(self, state: str, district: int, *, current: Optional[bool] = None) -> list[MemberRecord]:
+        """The members whose latest seat is a House district, the counterpart of ``member_list_by_state_and_district``"""
+        with self._lock:
+            return self._filter(self._by_district.get((state_code(state), district), set()), current)
+
+    def by_congress(
+        self, congress: int, *, state: Optional[str] = None, district: Optional[int] = None
+    ) -> list[MemberRecord]:
+        """The members who served in a congress, optionally from one state and district
+
+        The counterpart of ``congress_list`` and ``member_list_by_congress_state_district``. Districts are those of
+        each member's latest seat, as ``member_list`` reports no district per term.
+        """
+        with self._lock:
+            ids = self._by_congress.get(congress, set())
+            if state is not None and district is None:
+                ids = ids & self._by_state.get(state_code(state), set())
+            elif state is not None and district is not None:
+                ids = ids & self._by_district.get((state_code(state), district), set())
+            return self._select(ids)
+
+    def current(self) -> list[MemberRecord]:
+        """The serving members"""
+        with self._lock:
+            return self._select(self._current)
+
+    def _filter(self, ids: set[str], current: Optional[bool]) -> list[MemberRecord]:
+        if current is not None:
+            ids = ids & self._current if current else ids - self._current
+        return self._select(ids)
+
+    def save(self, path: str) -> None:
+        """Write a snapshot that ``open`` maps back without decoding the members; the file is replaced atomically
+
+        The snapshot holds an 8-byte magic number and the length of a JSON header with the watermark and the index
+        keys of each member, then each member as a JSON row at the offset the header gives.
+        """
+        with self._lock:
+            ids = sorted(self._keys)
+            rows = [self._raw_row(bioguide_id) for bioguide_id in ids]
+            offsets = []
+            position = 0
+            for row in rows:
+                offsets.append([position, len(row)])
+                position += len(row)
+            header = {
+                "watermark": None if self.watermark is None else self.watermark.isoformat(timespec="seconds"),
+                "members": [
+                    [
+                        bioguide_id,
+                        keys.state,
+                        keys.district,
+                        keys.current,
+                        sorted(keys.congresses),
+                        *offset,
+                    ]
+                    for bioguide_id, keys, offset in zip(ids, (self._keys[i] for i in ids), offsets)
+                ],
+            }
+        encoded = json.dumps(header, separators=(",", ":")).encode()
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(encoded)))
+            file.write(encoded)
+            for row in rows:
+                file.write(row)
+        os.replace(temporary, path)
+
+    def _raw_row(self, bioguide_id: str) -> bytes:
+        if bioguide_id in self._rows and self._mapping is not None:
+            offset, length = self._rows[bioguide_id]
+            return self._mapping[offset : offset + length]
+        return json.dumps(self._members[bioguide_id]._row(), separators=(",", ":")).encode()
+
+    @classmethod
+    def open(cls, path: str, **kwargs: Any) -> "MemberDirectory":
+        """Map a snapshot written by ``save``; members are decoded from the file as they are first looked up
+
+        Args:
+            path: The snapshot file
+            **kwargs: Additional arguments for ``MemberDirectory``, e.g. ``overlap``
+
+        Raises:
+            ValueError: If the file is not a snapshot.
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapping) < _HEADER.size or mapping[: len(_MAGIC)] != _MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a member directory snapshot")
+        _, header_length = _HEADER.unpack_from(mapping)
+        header = loads(mapping[_HEADER.size : _HEADER.size + header_length])
+        start = _HEADER.size + header_length
+        directory = cls(**kwargs)
+        if header["watermark"] is not None and "watermark" not in kwargs:
+            directory.watermark = isoparse(header["watermark"])
+        directory._mapping = mapping
+        for bioguide_id, state, district, current, congresses, offset, length in header["members"]:
+            directory._rows[bioguide_id] = (start + offset, length)
+            directory._index(bioguide_id, _Keys(state, district, current, frozenset(congresses)))
+        return directory
+
+    def close(self) -> None:
+        """Decode every member still in the snapshot and unmap it"""
+        with self._lock:
+            if self._mapping is None:
+                return
+            for bioguide_id in list(self._rows):
+                self._get(bioguide_id)
+            self._rows.clear()
+            self._mapping.close()
+            self._mapping = None
+
+
+__all__ = [
+    "STATE_CODES",
+    "MemberDirectory",
+    "MemberRecord",
+    "Term",
+    "congress_of_year",
+    "member_record",
+    "state_code",
+]
@@ -0,0 +1,465 @@
+"""Contains a streaming downloader for the text documents linked from the ``formats[].url`` of text endpoints
+
+``bill_text``, ``amendments_text``, ``committee_report_id_text`` and ``committee_print_text`` link to PDF, XML and
+HTML documents on www.congress.gov. Those are not API requests: they need no API key and are not subject to its rate
+limit, so they are fetched with a plain ``httpx.Client`` rather than through ``AuthenticatedClient``.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import posixpath
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from .incremental import record_field
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT,
+    downloaded_at REAL NOT NULL
+)
+"""
+
+_HASH_CHUNK = 1024 * 1024
+
+
+class _PartialMismatch(errors.UnexpectedStatus):
+    """Raised when a resumed download is answered with bytes that do not continue the partial file, which is discarded
+    so that the next attempt starts over
+    """
+
+
+@define
+class TextArtifact:
+    """One downloadable format of a text version
+
+    Attributes:
+        url: The document URL
+        format_type: The format, e.g. ``PDF`` or ``Formatted XML``
+        version_type: The text version, e.g. ``Enrolled Bill``, if the endpoint reports one
+        date: The date of the text version, if the endpoint reports one
+    """
+
+    url: str
+    format_type: Optional[str] = None
+    version_type: Optional[str] = None
+    date: Optional[str] = None
+
+
+def text_artifacts(records: Iterable[Any], format_types: Optional[Iterable[str]] = None) -> Iterator[TextArtifact]:
+    """Yield the documents linked from the records of a text endpoint, e.g. ``paginate(bill_text, 117, "hr", 3076)``
+
+    Handles both records holding a ``formats`` list (bill, amendment and committee report text) and records that are
+    formats themselves (committee print text).
+
+    Args:
+        records: The records of a text endpoint, as models or dicts
+        format_types: Only yield these formats, e.g. ``{"PDF"}``; by default every format is yielded
+    """
+    wanted = None if format_types is None else set(format_types)
+    for record in records:
+        formats = record_field(record, "formats")
+        if formats is None:
+            formats = [record]
+        for text_format in formats:
+            url = record_field(text_format, "url")
+            format_type = record_field(text_format, "type")
+            if not url or (wanted is not None and format_type not in wanted):
+                continue
+            yield TextArtifact(
+                url=url,
+                format_type=format_type,
+                version_type=record_field(record, "type") if text_format is not record else None,
+                date=record_field(record, "date"),
+            )
+
+
+@define
+class StoredText:
+    """A downloaded document
+
+    Attributes:
+        url: The document URL
+        digest: The SHA-256 of the document
+        path: Where the document is stored
+        size: The size of the document in bytes
+        reused: Whether the document was already stored, under this URL or another one with identical content
+    """
+
+    url: str
+    digest: str
+    path: str
+    size: int
+    reused: bool = False
+
+
+@define
+class TextStore:
+    """Stores documents under ``root`` by the SHA-256 of their content, e.g. ``root/objects/3f/3f2a...9c.pdf``
+
+    Identical documents published under several URLs, such as unchanged text versions, are stored once. An index in
+    ``root/index.db`` maps each URL to its content, and partial downloads are kept in ``root/partial``, with the
+    ``ETag`` or ``Last-Modified`` of the version they hold, so that they can be resumed.
+
+    Attributes:
+        root: The directory documents are stored under
+    """
+
+    root: str
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        os.makedirs(os.path.join(self.root, "partial"), exist_ok=True)
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+        self._connection = sqlite3.connect(os.path.join(self.root, "index.db"), check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def object_path(self, digest: str, url: str) -> str:
+        """Where a document with this digest is stored, keeping the extension of ``url``"""
+        extension = posixpath.splitext(urlsplit(url).path)[1].lower()
+        return os.path.join(self.root, "objects", digest[:2], digest + extension)
+
+    def partial_path(self, url: str) -> str:
+        """Where a download of ``url`` is kept until it is complete"""
+        return os.path.join(self.root, "partial", hashlib.sha256(url.encode()).hexdigest())
+
+    def validator(self, url: str) -> Optional[str]:
+        """The ``ETag`` or ``Last-Modified`` of the partial download of ``url``, or ``None`` if it has none"""
+        try:
+            with open(self.partial_path(url) + ".validator", encoding="utf-8") as file:
+                return file.read() or None
+        except FileNotFoundError:
+            return None
+
+    def save_validator(self, url: str, validator: Optional[str]) -> None:
+        """Record the version a partial download of ``url`` is started from, or that it has no validator"""
+        path = self.partial_path(url) + ".validator"
+        if validator is None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(validator)
+
+    def discard_partial(self, url: str) -> None:
+        """Delete the partial download of ``url``, so that the next attempt starts over"""
+        for path in (self.partial_path(url), self.partial_path(url) + ".validator"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    def lookup(self, url: str) -> Optional[StoredText]:
+        """The stored document for ``url``, or ``None`` if it has not been downloaded"""
+        with self._lock:
+            row = self._connection.execute("SELECT digest, size FROM texts WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        digest, size = row
+        path = self.object_path(digest, url)
+        if not os.path.exists(path):
+            return None
+        return StoredText(url=url, digest=digest, path=path, size=size, reused=True)
+
+    def commit(self, url: str, partial: str, digest: str, content_type: Optional[str]) -> StoredText:
+        """Move a complete download into place, discarding it if identical content is already stored"""
+        path = self.object_path(digest, url)
+        size = os.path.getsize(partial)
+        reused = os.path.exists(path)
+        if reused:
+            os.remove(partial)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(partial, path)
+        self.save_validator(url, None)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?, ?)", (url, digest, size, content_type, time.time())
+            )
+        return StoredText(url=url, digest=digest, path=path, size=size, reused=reused)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _resume_offset(partial: str) -> int:
+    try:
+        return os.path.getsize(partial)
+    except FileNotFoundError:
+        return 0
+
+
+def _request_headers(offset: int, validator: Optional[str]) -> dict[str, str]:
+    # Ask for the stored bytes exactly, so Range offsets and Content-Length count the same bytes. If-Range makes a
+    # server whose document changed since the partial was written send the new version whole instead of its tail.
+    headers = {"Accept-Encoding": "identity"}
+    if offset and validator is not None:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    return headers
+
+
+def _validator(response: httpx.Response) -> Optional[str]:
+    # If-Range only accepts strong entity tags
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _content_range_total(response: httpx.Response) -> Optional[int]:
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _plan_write(
+    store: TextStore, url: str, response: httpx.Response, offset: int
+) -> tuple[Optional[str], Optional[int]]:
+    """The mode to open the partial file with (``None`` if it is already complete) and the expected final size
+
+    Raises:
+        errors.UnexpectedStatus: If the server refuses the download.
+        _PartialMismatch: If the server answers a resumed download with bytes that do not continue the partial file.
+    """
+    if response.status_code == 206:
+        start = response.headers.get("Content-Range", "").removeprefix("bytes ").partition("-")[0]
+        if start.isdigit() and int(start) == offset:
+            return "ab", _content_range_total(response)
+        store.discard_partial(url)
+        raise _PartialMismatch(response.status_code, b"")
+    elif response.status_code == 200:
+        store.save_validator(url, _validator(response))
+        length = response.headers.get("Content-Length")
+        return "wb", int(length) if length and length.isdigit() else None
+    elif response.status_code == 416 and offset:
+        if _content_range_total(response) == offset:
+            return None, offset
+        store.discard_partial(url)
+        raise _PartialMismatch(response.status_code, b"")
+    raise errors.UnexpectedStatus(response.status_code, b"")
+
+
+def _resume_point(store: TextStore, url: str) -> tuple[int, Optional[str]]:
+    """The offset to resume a download from and the validator to send with it; a partial file without a validator
+    cannot be checked against the current document, so it is downloaded again from the start
+    """
+    offset = _resume_offset(store.partial_path(url))
+    validator = store.validator(url) if offset else None
+    return (offset, validator) if validator is not None else (0, None)
+
+
+def _hash_partial(partial: str, mode: Optional[str]) -> "hashlib._Hash":
+    digest = hashlib.sha256()
+    if mode != "wb" and os.path.exists(partial):
+        with open(partial, "rb") as file:
+            while chunk := file.read(_HASH_CHUNK):
+                digest.update(chunk)
+    return digest
+
+
+def _write_chunk(file: Any, digest: "hashlib._Hash", chunk: bytes) -> None:
+    file.write(chunk)
+    digest.update(chunk)
+
+
+def _check_size(url: str, partial: str, expected: Optional[int]) -> None:
+    received = _resume_offset(partial)
+    if expected is not None and received != expected:
+        raise errors.IncompleteDownload(url, received, expected)
+
+
+def _url(artifact: Union[TextArtifact, str]) -> str:
+    return artifact.url if isinstance(artifact, TextArtifact) else artifact
+
+
+def _unique(artifacts: Iterable[Union[TextArtifact, str]]) -> Iterator[Union[TextArtifact, str]]:
+    # Two downloads of one URL would write to the same partial file
+    seen: set[str] = set()
+    for artifact in artifacts:
+        url = _url(artifact)
+        if url not in seen:
+            seen.add(url)
+            yield artifact
+
+
+def _default_client() -> httpx.Client:
+    return httpx.Client(follow_redirects=True, timeout=httpx.Timeout(30.0, read=120.0))
+
+
+def _default_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(follow_redirects=True, timeout=httpx.Timeout(30.0, read=120.0))
+
+
+@define
+class TextDownloader:
+    """Streams documents into a ``TextStore`` in chunks, resuming interrupted downloads with HTTP ``Range`` requests
+
+    Resumed requests carry ``If-Range`` with the ``ETag`` or ``Last-Modified`` of the partial download, so a document
+    that changed in between is downloaded whole again rather than spliced from two versions. Every download is checked
+    against the size announced by ``Content-Length`` (or ``Content-Range`` when resuming) and retried from where it
+    stopped on a connection error or a short body, or from the start if the server's answer does not continue it.
+
+    Attributes:
+        store: Where documents are stored
+        client: The ``httpx.Client`` to download with; by default one that follows redirects
+        chunk_size: The number of bytes read and written at a time
+        concurrency: The maximum number of downloads at once in ``download_all``
+        max_attempts: The number of attempts at each download
+    """
+
+    store: TextStore
+    client: httpx.Client = field(factory=_default_client)
+    chunk_size: int = 1024 * 1024
+    concurrency: int = 4
+    max_attempts: int = 3
+
+    def download(self, artifact: Union[TextArtifact, str], refresh: bool = False) -> StoredText:
+        """Download a document unless it is already stored
+
+        Args:
+            artifact: A ``TextArtifact`` or a document URL
+            refresh: Download the document even if it is already stored
+
+        Raises:
+            errors.UnexpectedStatus: If the server refuses the download.
+            errors.IncompleteDownload: If every attempt ended early.
+            httpx.TransportError: If every attempt failed to connect or timed out.
+
+        Returns:
+            StoredText
+        """
+        url = _url(artifact)
+        stored = None if refresh else self.store.lookup(url)
+        if stored is not None:
+            return stored
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return self._attempt(url)
+            except (httpx.TransportError, errors.IncompleteDownload, _PartialMismatch):
+                if attempt == self.max_attempts:
+                    raise
+        raise AssertionError("unreachable")
+
+    def _attempt(self, url: str) -> StoredText:
+        partial = self.store.partial_path(url)
+        offset, validator = _resume_point(self.store, url)
+        with self.client.stream("GET", url, headers=_request_headers(offset, validator)) as response:
+            mode, expected = _plan_write(self.store, url, response, offset)
+            digest = _hash_partial(partial, mode)
+            if mode is not None:
+                with open(partial, mode) as file:
+                    for chunk in response.iter_raw(self.chunk_size):
+                        file.write(chunk)
+                        digest.update(chunk)
+            content_type = response.headers.get("Content-Type")
+        _check_size(url, partial, expected)
+        return self.store.commit(url, partial, digest.hexdigest(), content_type)
+
+    def download_all(self, artifacts: Iterable[Union[TextArtifact, str]]) -> Iterator[StoredText]:
+        """Download each distinct URL with at most ``concurrency`` downloads at once, yielding them in the order given
+
+        Returns:
+            Iterator[StoredText]
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            yield from pool.map(self.download, _unique(artifacts))
+
+    def close(self) -> None:
+        self.client.close()
+
+
+@define
+class AsyncTextDownloader:
+    """The async counterpart of ``TextDownloader``
+
+    Attributes:
+        store: Where documents are stored
+        client: The ``httpx.AsyncClient`` to download with; by default one that follows redirects
+        chunk_size: The number of bytes read and written at a time
+        concurrency: The maximum number of downloads at once in ``download_all``
+        max_attempts: The number of attempts at each download
+    """
+
+    store: TextStore
+    client: httpx.AsyncClient = field(factory=_default_async_client)
+    chunk_size: int = 1024 * 1024
+    concurrency: int = 4
+    max_attempts: int = 3
+
+    async def download(self, artifact: Union[TextArtifact, str], refresh: bool = False) -> StoredText:
+        """Download a document unless it is already stored; see ``TextDownloader.download``
+
+        Returns:
+            StoredText
+        """
+        url = _url(artifact)
+        stored = None if refresh else await asyncio.to_thread(self.store.lookup, url)
+        if stored is not None:
+            return stored
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await self._attempt(url)
+            except (httpx.TransportError, errors.IncompleteDownload, _PartialMismatch):
+                if attempt == self.max_attempts:
+                    raise
+        raise AssertionError("unreachable")
+
+    async def _attempt(self, url: str) -> StoredText:
+        partial = self.store.partial_path(url)
+        offset, validator = await asyncio.to_thread(_resume_point, self.store, url)
+        async with self.client.stream("GET", url, headers=_request_headers(offset, validator)) as response:
+            mode, expected = await asyncio.to_thread(_plan_write, self.store, url, response, offset)
+            digest = await asyncio.to_thread(_hash_partial, partial, mode)
+            if mode is not None:
+                # File I/O and hashing run in a thread so that a slow disk does not stall the event loop
+                file = await asyncio.to_thread(open, partial, mode)
+                try:
+                    async for chunk in response.aiter_raw(self.chunk_size):
+                        await asyncio.to_thread(_write_chunk, file, digest, chunk)
+                finally:
+                    await asyncio.to_thread(file.close)
+            content_type = response.headers.get("Content-Type")
+        await asyncio.to_thread(_check_size, url, partial, expected)
+        return await asyncio.to_thread(self.store.commit, url, partial, digest.hexdigest(), content_type)
+
+    async def download_all(self, artifacts: Iterable[Union[TextArtifact, str]]) -> AsyncIterator[StoredText]:
+        """Download each distinct URL with at most ``concurrency`` downloads at once, yielding each as it is stored
+
+        Returns:
+            AsyncIterator[StoredText]
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(artifact: Union[TextArtifact, str]) -> StoredText:
+            async with semaphore:
+                return await self.download(artifact)
+
+        tasks = [asyncio.ensure_future(bounded(artifact)) for artifact in _unique(artifacts)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+__all__ = ["AsyncTextDownloader", "StoredText", "TextArtifact", "TextDownloader", "TextStore", "text_artifacts"]
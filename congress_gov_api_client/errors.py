@@ -13,4 +13,15 @@ class UnexpectedStatus(Exception):
         )
 
 
-__all__ = ["UnexpectedStatus"]
+class IncompleteDownload(Exception):
+    """Raised when a download ends before the number of bytes announced by the server has been received"""
+
+    def __init__(self, url: str, received: int, expected: int):
+        self.url = url
+        self.received = received
+        self.expected = expected
+
+        super().__init__(f"Incomplete download of {url}: received {received} of {expected} bytes")
+
+
+__all__ = ["IncompleteDownload", "UnexpectedStatus"]
@@ -0,0 +1,448 @@
+"""Contains a streaming exporter that writes list endpoint records to Parquet files partitioned by congress
+
+Requires the optional ``pyarrow`` dependency, installed with the ``parquet`` extra.
+"""
+
+import asyncio
+import os
+import uuid
+from collections.abc import Iterable, Mapping
+from types import ModuleType
+from typing import Any, Optional
+
+from attrs import define, field
+
+from .client import AuthenticatedClient
+from .incremental import attribute_name
+from .pagination import MAX_LIMIT, apaginate, paginate
+from .types import Unset
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore[assignment]
+
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+"""The directory name of the partition holding records without a partition value, as Hive and Spark name it"""
+
+
+def _require_pyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError("Parquet export requires pyarrow: pip install 'congress_gov_api_client[parquet]'")
+
+
+def _arrow_type(kind: str) -> Any:
+    return {
+        "int": pyarrow.int32(),
+        "str": pyarrow.string(),
+        "bool": pyarrow.bool_(),
+        "date": pyarrow.date32(),
+        "timestamp": pyarrow.timestamp("s", tz="UTC"),
+    }[kind]
+
+
+@define
+class Column:
+    """One column of an export
+
+    Attributes:
+        name: The column name
+        path: The JSON names leading to the value inside a record, e.g. ``("latestAction", "actionDate")``. An empty
+            path means the value only comes from the ``constants`` of the export, e.g. the congress of a bill's actions.
+        kind: The column type: ``"int"``, ``"str"``, ``"bool"``, ``"date"`` (``YYYY-MM-DD``) or ``"timestamp"``
+            (ISO 8601 in UTC, or a date, read as midnight UTC)
+    """
+
+    name: str
+    path: tuple[str, ...]
+    kind: str = "str"
+    _steps: tuple[tuple[str, str], ...] = field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._steps = tuple((name, attribute_name(name)) for name in self.path)
+
+    def value(self, record: Any) -> Any:
+        """Read this column from a record, which may be a model or a dict; ``None`` if the path is empty"""
+        if not self._steps:
+            return None
+        value = record
+        for name, attribute in self._steps:
+            if value is None:
+                return None
+            if isinstance(value, dict):
+                value = value.get(name)
+            else:
+                value = getattr(value, attribute, None)
+                if isinstance(value, Unset):
+                    value = None
+        return value
+
+
+@define(frozen=True)
+class ResourceSchema:
+    """The columns exported for one kind of record
+
+    Attributes:
+        name: The name of the export, used as its directory name
+        columns: The columns, in file order
+        partition: The column the files are partitioned by, or ``None`` to write a single partition
+    """
+
+    name: str
+    columns: tuple[Column, ...]
+    partition: Optional[str] = "congress"
+
+    def arrow_schema(self) -> Any:
+        """The ``pyarrow.Schema`` of the files, without the partition column, which is encoded in the directory name"""
+        _require_pyarrow()
+        return pyarrow.schema(
+            [(column.name, _arrow_type(column.kind)) for column in self.columns if column.name != self.partition]
+        )
+
+
+def _bill_columns() -> tuple[Column, ...]:
+    return (
+        Column("congress", ("congress",), "int"),
+        Column("type", ("type",)),
+        Column("number", ("number",)),
+    )
+
+
+BILLS = ResourceSchema(
+    name="bills",
+    columns=(
+        *_bill_columns(),
+        Column("title", ("title",)),
+        Column("origin_chamber", ("originChamber",)),
+        Column("introduced_date", ("introducedDate",), "date"),
+        Column("latest_action_date", ("latestAction", "actionDate"), "date"),
+        Column("latest_action_text", ("latestAction", "text")),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("update_date_including_text", ("updateDateIncludingText",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+)
+"""Records of ``bill_list_all``, ``bill_list_by_congress``, ``bill_list_by_type`` and ``bill_details``"""
+
+BILL_ACTIONS = ResourceSchema(
+    name="bill_actions",
+    columns=(
+        Column("congress", (), "int"),
+        Column("bill_type", ()),
+        Column("bill_number", ()),
+        Column("action_date", ("actionDate",), "date"),
+        Column("action_code", ("actionCode",)),
+        Column("type", ("type",)),
+        Column("text", ("text",)),
+        Column("source_system", ("sourceSystem", "name")),
+    ),
+)
+"""Records of ``bill_actions``; pass ``congress``, ``bill_type`` and ``bill_number`` as constants"""
+
+BILL_COSPONSORS = ResourceSchema(
+    name="bill_cosponsors",
+    columns=(
+        Column("congress", (), "int"),
+        Column("bill_type", ()),
+        Column("bill_number", ()),
+        Column("bioguide_id", ("bioguideId",)),
+        Column("full_name", ("fullName",)),
+        Column("party", ("party",)),
+        Column("state", ("state",)),
+        Column("district", ("district",), "int"),
+        Column("sponsorship_date", ("sponsorshipDate",), "date"),
+        Column("is_original_cosponsor", ("isOriginalCosponsor",), "bool"),
+    ),
+)
+"""Records of ``bill_cosponsors``; pass ``congress``, ``bill_type`` and ``bill_number`` as constants"""
+
+AMENDMENTS = ResourceSchema(
+    name="amendments",
+    columns=(
+        *_bill_columns(),
+        Column("description", ("description",)),
+        Column("purpose", ("purpose",)),
+        Column("latest_action_date", ("latestAction", "actionDate"), "date"),
+        Column("latest_action_text", ("latestAction", "text")),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+)
+"""Records of the amendment list endpoints and ``bill_amendments``"""
+
+MEMBERS = ResourceSchema(
+    name="members",
+    columns=(
+        Column("congress", (), "int"),
+        Column("bioguide_id", ("bioguideId",)),
+        Column("name", ("name",)),
+        Column("party_name", ("partyName",)),
+        Column("state", ("state",)),
+        Column("district", ("district",), "int"),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+)
+"""Records of the member list endpoints; pass ``congress`` as a constant for ``member/congress_list``"""
+
+SUMMARIES = ResourceSchema(
+    name="summaries",
+    columns=(
+        Column("congress", ("bill", "congress"), "int"),
+        Column("bill_type", ("bill", "type")),
+        Column("bill_number", ("bill", "number")),
+        Column("version_code", ("versionCode",)),
+        Column("action_date", ("actionDate",), "date"),
+        Column("action_desc", ("actionDesc",)),
+        Column("current_chamber", ("currentChamber",)),
+        Column("text", ("text",)),
+        Column("update_date", ("updateDate",), "timestamp"),
+    ),
+)
+"""Records of ``bill_summaries`` and the ``summaries`` list endpoints"""
+
+
+@define
+class ExportStats:
+    """What an export wrote
+
+    Attributes:
+        rows: The number of records written
+        row_groups: The number of row groups written
+        files: The paths of the files written
+    """
+
+    rows: int = 0
+    row_groups: int = 0
+    files: list[str] = field(factory=list)
+
+
+@define
+class _Partition:
+    path: str
+    writer: Any = None
+    columns: list[list[Any]] = field(factory=list)
+    rows: int = 0
+
+
+@define
+class ParquetExporter:
+    """Writes records to Parquet, one directory per partition value, e.g. ``root/bills/congress=117/``
+
+    Records are buffered per partition in columnar lists and written out as a row group every ``row_group_size``
+    records, so memory stays bounded however many records are exported. When more than ``max_buffered_rows`` records
+    are buffered across all partitions, the largest buffer is written out early as a smaller row group.
+
+    Each exporter writes its own files, named after a random run id, so several exports into the same ``root`` do not
+    overwrite each other. Call ``close`` (or use the exporter as a context manager) to finish the files.
+
+    Attributes:
+        root: The directory the export is written under
+        schema: The ``ResourceSchema`` of the records
+        row_group_size: The number of records per row group
+        max_buffered_rows: The number of records buffered across all partitions before one is written out early
+        compression: The Parquet compression codec
+    """
+
+    root: str
+    schema: ResourceSchema
+    row_group_size: int = 50_000
+    max_buffered_rows: int = 100_000
+    compression: str = "zstd"
+    _stats: ExportStats = field(init=False, factory=ExportStats)
+    _partitions: dict[Any, _Partition] = field(init=False, factory=dict)
+    _buffered: int = field(init=False, default=0)
+    _run_id: str = field(init=False, factory=lambda: uuid.uuid4().hex)
+    _arrow_schema: Any = field(init=False)
+    _columns: tuple[Column, ...] = field(init=False)
+    _partition_column: Optional[Column] = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._arrow_schema = self.schema.arrow_schema()
+        self._columns = tuple(column for column in self.schema.columns if column.name != self.schema.partition)
+        self._partition_column = next(
+            (column for column in self.schema.columns if column.name == self.schema.partition), None
+        )
+
+    def write(self, records: Iterable[Any], constants: Optional[Mapping[str, Any]] = None) -> None:
+        """Buffer records, writing out row groups as they fill up
+
+        Args:
+            records: Models or dicts, e.g. from ``paginate``
+            constants: Values for columns not read from the records, e.g. ``{"congress": 117, "bill_type": "hr"}``
+        """
+        for record in records:
+            self.add(record, constants)
+
+    def add(self, record: Any, constants: Optional[Mapping[str, Any]] = None) -> None:
+        """Buffer one record, writing out row groups as they fill up"""
+        partition = self._partition(self._value(self._partition_column, record, constants))
+        if not partition.columns:
+            partition.columns = [[] for _ in self._columns]
+        if constants:
+            for values, column in zip(partition.columns, self._columns):
+                values.append(constants[column.name] if column.name in constants else column.value(record))
+        else:
+            for values, column in zip(partition.columns, self._columns):
+                values.append(column.value(record))
+        partition.rows += 1
+        self._buffered += 1
+        if partition.rows >= self.row_group_size:
+            self._flush(partition)
+        elif self._buffered > self.max_buffered_rows:
+            self._flush(max(self._partitions.values(), key=lambda candidate: candidate.rows))
+
+    @staticmethod
+    def _value(column: Optional[Column], record: Any, constants: Optional[Mapping[str, Any]]) -> Any:
+        if column is None:
+            return None
+        if constants is not None and column.name in constants:
+            return constants[column.name]
+        return column.value(record)
+
+    def _partition(self, value: Any) -> _Partition:
+        partition = self._partitions.get(value)
+        if partition is None:
+            directory = os.path.join(self.root, self.schema.name)
+            if self.schema.partition is not None:
+                name = NULL_PARTITION if value is None else str(value)
+                directory = os.path.join(directory, f"{self.schema.partition}={name}")
+            partition = self._partitions[value] = _Partition(path=os.path.join(directory, f"{self._run_id}.parquet"))
+        return partition
+
+    def _flush(self, partition: _Partition) -> None:
+        if not partition.rows:
+            return
+        # The buffer is taken before encoding, so rows that fail to encode are not encoded again by ``close``
+        columns, rows = partition.columns, partition.rows
+        partition.columns = []
+        partition.rows = 0
+        self._buffered -= rows
+        arrays = [
+            _to_array(values, column.kind, field_.type)
+            for values, column, field_ in zip(columns, self._columns, self._arrow_schema)
+        ]
+        batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self._arrow_schema)
+        if partition.writer is None:
+            os.makedirs(os.path.dirname(partition.path), exist_ok=True)
+            partition.writer = pyarrow.parquet.ParquetWriter(
+                partition.path, self._arrow_schema, compression=self.compression
+            )
+            self._stats.files.append(partition.path)
+        partition.writer.write_batch(batch, row_group_size=self.row_group_size)
+        self._stats.rows += rows
+        self._stats.row_groups += 1
+
+    def close(self) -> ExportStats:
+        """Write out every buffer and finish the files, returning what was written"""
+        for partition in self._partitions.values():
+            self._flush(partition)
+            if partition.writer is not None:
+                partition.writer.close()
+                partition.writer = None
+        return self._stats
+
+    def __enter__(self) -> "ParquetExporter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _timestamp(value: Any) -> Any:
+    # Some timestamp fields, e.g. ``updateDateIncludingText``, hold only a date in older records; those are midnight UTC
+    if isinstance(value, str) and len(value) == 10:
+        return f"{value}T00:00:00Z"
+    return value
+
+
+def _to_array(values: list[Any], kind: str, type_: Any) -> Any:
+    if kind == "timestamp":
+        values = [_timestamp(value) for value in values]
+    if kind in ("date", "timestamp"):
+        return pyarrow.array(values, pyarrow.string()).cast(type_)
+    return pyarrow.array(values, type_)
+
+
+def export(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient,
+    root: str,
+    schema: ResourceSchema,
+    constants: Optional[Mapping[str, Any]] = None,
+    row_group_size: int = 50_000,
+    **kwargs: Any,
+) -> ExportStats:
+    """Export every record of a list endpoint to Parquet under ``root``
+
+    Args:
+        endpoint: A list endpoint module, e.g. ``congress_gov_api_client.api.bill.bill_list_all``
+        *args: Path parameters for the endpoint
+        client: The client to make requests with
+        root: The directory the export is written under
+        schema: The ``ResourceSchema`` of the records, e.g. ``BILLS``
+        constants: Values for columns not read from the records
+        row_group_size: The number of records per row group
+        **kwargs: Additional arguments for ``paginate``
+
+    Returns:
+        ExportStats
+    """
+    exporter = ParquetExporter(root, schema, row_group_size=row_group_size)
+    try:
+        exporter.write(paginate(endpoint, *args, client=client, **kwargs), constants)
+    finally:
+        stats = exporter.close()
+    return stats
+
+
+async def aexport(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient,
+    root: str,
+    schema: ResourceSchema,
+    constants: Optional[Mapping[str, Any]] = None,
+    row_group_size: int = 50_000,
+    **kwargs: Any,
+) -> ExportStats:
+    """The async counterpart of ``export``; ``kwargs`` may include the fan-out arguments of ``apaginate``
+
+    Records are buffered on the event loop and each page is written out in a worker thread, so encoding and file I/O
+    overlap with the requests still in flight.
+
+    Returns:
+        ExportStats
+    """
+    exporter = ParquetExporter(root, schema, row_group_size=row_group_size)
+    limit = kwargs.get("limit", MAX_LIMIT)
+    try:
+        pending: list[Any] = []
+        async for record in apaginate(endpoint, *args, client=client, **kwargs):
+            pending.append(record)
+            if len(pending) >= limit:
+                await asyncio.to_thread(exporter.write, pending, constants)
+                pending = []
+        await asyncio.to_thread(exporter.write, pending, constants)
+    finally:
+        stats = await asyncio.to_thread(exporter.close)
+    return stats
+
+
+__all__ = [
+    "AMENDMENTS",
+    "BILLS",
+    "BILL_ACTIONS",
+    "BILL_COSPONSORS",
+    "MEMBERS",
+    "NULL_PARTITION",
+    "SUMMARIES",
+    "Column",
+    "ExportStats",
+    "ParquetExporter",
+    "ResourceSchema",
+    "aexport",
+    "export",
+]
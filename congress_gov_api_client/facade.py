@@ -0,0 +1,418 @@
+"""Contains ``CongressAPI``, a resource-oriented facade over the endpoint modules, and the request planner behind it"""
+
+import asyncio
+import importlib
+import inspect
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from attrs import define, field
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .decoding import decode_json
+from .pagination import apaginate, paginate
+from .types import UNSET, Response
+
+RESOURCES: dict[str, dict[str, tuple[str, ...]]] = {
+    "amendments": {
+        "list": ("amendments.amendment", "amendments.amendmentcongress", "amendments.amendmentlist"),
+        "get": ("amendments.amendmentdetails",),
+        "actions": ("amendments.amendmentactions",),
+        "amendments": ("amendments.amendmentamendments",),
+        "cosponsors": ("amendments.amendmentcosponsors",),
+        "text": ("amendments.amendments_text",),
+    },
+    "bills": {
+        "list": ("bill.bill_list_all", "bill.bill_list_by_congress", "bill.bill_list_by_type"),
+        "get": ("bill.bill_details",),
+        "actions": ("bill.bill_actions",),
+        "amendments": ("bill.bill_amendments",),
+        "committees": ("bill.bill_committees",),
+        "cosponsors": ("bill.bill_cosponsors",),
+        "related_bills": ("bill.bill_relatedbills",),
+        "subjects": ("bill.bill_subjects",),
+        "summaries": ("bill.bill_summaries",),
+        "text": ("bill.bill_text",),
+        "titles": ("bill.bill_titles",),
+    },
+    "bound_congressional_record": {
+        "list": (
+            "bound_congressional_record.bound_congressional_record_list",
+            "bound_congressional_record.bound_congressional_record_list_by_year",
+            "bound_congressional_record.bound_congressional_record_list_by_year_and_month",
+            "bound_congressional_record.bound_congressional_record_list_by_year_and_month_and_day",
+        ),
+    },
+    "committee_meetings": {
+        "list": (
+            "committee_meeting.committee_meeting_list",
+            "committee_meeting.committee_meeting_congress",
+            "committee_meeting.committee_meeting_congress_chamber",
+        ),
+        "get": ("committee_meeting.committee_meeting_detail",),
+    },
+    "committee_prints": {
+        "list": (
+            "committee_print.committee_print_list",
+            "committee_print.committee_prints_by_congress",
+            "committee_print.committee_prints_by_congress_chamber",
+        ),
+        "get": ("committee_print.committee_print_detail",),
+        "text": ("committee_print.committee_print_text",),
+    },
+    "committee_reports": {
+        "list": (
+            "committee_report.committee_reports",
+            "committee_report.committee_reports_by_congress",
+            "committee_report.committee_reports_by_congress_rpt_type",
+        ),
+        "get": ("committee_report.committee_report_details",),
+        "text": ("committee_report.committee_report_id_text",),
+    },
+    "committees": {
+        "list": (
+            "committee.committee_list",
+            "committee.committee_list_by_congress",
+            "committee.committee_list_by_congress_chamber",
+        ),
+        "list_by_chamber": ("committee.committee_list_by_chamber",),
+        "get": ("committee.committee_details",),
+        "bills": ("committee.committee_bills_list",),
+        "reports": ("committee.committee_reports_by_committee",),
+        "nominations": ("committee.nomination_by_committee",),
+        "house_communications": ("committee.house_communications_by_committee",),
+        "senate_communications": ("committee.senate_communications_by_committee",),
+    },
+    "congresses": {
+        "list": ("congress.congress_list",),
+        "get": ("congress.congress_details",),
+        "current": ("congress.congress_current_list",),
+    },
+    "congressional_record": {
+        "list": ("congressional_record.congressional_record_list",),
+    },
+    "crs_reports": {
+        "list": ("crsreport.crsreport",),
+        "get": ("crsreport.crsreport_details",),
+    },
+    "daily_congressional_record": {
+        "list": (
+            "daily_congressional_record.daily_congressional_record_list",
+            "daily_congressional_record.daily_congressional_record_list_by_volume",
+            "daily_congressional_record.daily_congressional_record_list_by_volume_and_issue",
+        ),
+        "articles": ("daily_congressional_record.daily_congressional_record_list_by_article",),
+    },
+    "hearings": {
+        "list": (
+            "hearing.hearing_list",
+            "hearing.hearing_list_by_congress",
+            "hearing.hearing_list_by_congress_chamber",
+        ),
+        "get": ("hearing.hearing_detail",),
+    },
+    "house_communications": {
+        "list": (
+            "house_communication.house_communication",
+            "house_communication.house_communication_congress",
+            "house_communication.house_communication_list",
+        ),
+        "get": ("house_communication.house_communication_detail",),
+    },
+    "house_requirements": {
+        "list": ("house_requirement.house_requirement",),
+        "get": ("house_requirement.house_requirement_detail",),
+        "communications": ("house_requirement.house_requirement_communication_list",),
+    },
+    "laws": {
+        "list": ("bill.law_list_by_congress", "bill.law_list_by_congress_and_law_type"),
+        "get": ("bill.law_list_by_congress_law_type_and_law_number",),
+    },
+    "members": {
+        "list": ("member.member_list",),
+        "get": ("member.member_details",),
+        "sponsored": ("member.sponsorship_list",),
+        "cosponsored": ("member.cosponsorship_list",),
+        "list_by_congress": ("member.congress_list", "member.member_list_by_congress_state_district"),
+        "list_by_state": ("member.member_list_by_state", "member.member_list_by_state_and_district"),
+    },
+    "nominations": {
+        "list": ("nomination.nomination_list", "nomination.nomination_list_by_congress"),
+        "get": ("nomination.nomination_detail",),
+        "nominees": ("nomination.nominees",),
+        "actions": ("nomination.nomination_actions",),
+        "committees": ("nomination.nomination_committees",),
+        "hearings": ("nomination.nomination_hearings",),
+    },
+    "senate_communications": {
+        "list": (
+            "senate_communication.senate_communication",
+            "senate_communication.senate_communication_congress",
+            "senate_communication.senate_communication_list",
+        ),
+        "get": ("senate_communication.senate_communication_detail",),
+    },
+    "summaries": {
+        "list": (
+            "summaries.bill_summaries_all",
+            "summaries.bill_summaries_by_congress",
+            "summaries.bill_summaries_by_type",
+        ),
+    },
+    "treaties": {
+        "list": ("treaty.treaty_list", "treaty.treaty_list_by_congress"),
+        "get": ("treaty.treaty_detail", "treaty.treaty_details"),
+        "actions": ("treaty.treaty_action", "treaty.treaty_actions"),
+        "committees": ("treaty.treaty_committee",),
+    },
+}
+"""The methods of each ``CongressAPI`` resource and the endpoint modules behind them, relative to
+``congress_gov_api_client.api``; a method with several endpoints picks the one whose path parameters are given"""
+
+
+@define(frozen=True)
+class RequestPlan:
+    """How to build the request of one endpoint, compiled once from its ``_get_kwargs``
+
+    Attributes:
+        endpoint: The endpoint module
+        method: The HTTP method
+        url: The URL path as a format string of the path parameters, e.g. ``/bill/{0}/{1}/{2}``
+        path_parameters: The names of the path parameters, in order
+        query_parameters: The query parameter of each keyword argument, e.g. ``from_date_time``: ``fromDateTime``
+    """
+
+    endpoint: ModuleType
+    method: str
+    url: str
+    path_parameters: tuple[str, ...]
+    query_parameters: dict[str, str]
+
+    @classmethod
+    def compile(cls, endpoint: ModuleType) -> "RequestPlan":
+        """Build the plan of an endpoint module by calling its ``_get_kwargs`` once with placeholder arguments"""
+        parameters = inspect.signature(endpoint._get_kwargs).parameters.values()
+        path = tuple(parameter.name for parameter in parameters if parameter.kind is parameter.POSITIONAL_OR_KEYWORD)
+        query = [parameter.name for parameter in parameters if parameter.kind is parameter.KEYWORD_ONLY]
+        kwargs = endpoint._get_kwargs(
+            *(f"\0{index}\0" for index in range(len(path))), **{name: f"\0{name}\0" for name in query}
+        )
+        url = kwargs["url"].replace("{", "{{").replace("}", "}}")
+        for index in range(len(path)):
+            url = url.replace(f"\0{index}\0", f"{{{index}}}")
+        query_parameters = {value.strip("\0"): name for name, value in kwargs["params"].items()}
+        return cls(endpoint, kwargs["method"], url, path, query_parameters)
+
+    def request(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """The arguments of ``httpx.Client.request`` for a call of the endpoint; only the given query parameters are
+        looked up, and path parameters may be given by keyword
+
+        Raises:
+            TypeError: If a path parameter is missing or an argument is unknown
+        """
+        if len(args) != len(self.path_parameters):
+            args, kwargs = self._bind_path(args, kwargs)
+        names = self.query_parameters
+        try:
+            params = {names[name]: value for name, value in kwargs.items() if value is not UNSET and value is not None}
+        except KeyError as error:
+            raise TypeError(f"{self.endpoint.__name__} got an unexpected argument {error.args[0]!r}") from None
+        return {"method": self.method, "url": self.url.format(*args), "params": params}
+
+    def _bind_path(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        if len(args) > len(self.path_parameters):
+            raise TypeError(f"{self.endpoint.__name__} takes {len(self.path_parameters)} path parameters")
+        missing = [name for name in self.path_parameters[len(args) :] if name not in kwargs]
+        if missing:
+            raise TypeError(f"{self.endpoint.__name__} missing path parameters: {', '.join(missing)}")
+        kwargs = dict(kwargs)
+        return args + tuple(kwargs.pop(name) for name in self.path_parameters[len(args) :]), kwargs
+
+    def arity(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> int:
+        """The number of path parameters given by a call"""
+        return len(args) + sum(1 for name in self.path_parameters[len(args) :] if name in kwargs)
+
+
+@define
+class RequestPlanner:
+    """Sends the requests of every ``CongressAPI`` call, compiling the plan of each endpoint once
+
+    Every call goes through ``send`` or ``asend``, so this is the one place requests are built, batched and sent.
+    Caching, rate limiting and retries are configured on the client and apply to every call alike.
+
+    Attributes:
+        client: The client to make requests with
+    """
+
+    client: Union[AuthenticatedClient, Client]
+    _plans: dict[str, RequestPlan] = field(init=False, factory=dict)
+
+    def plan(self, endpoint: str) -> RequestPlan:
+        """The plan of an endpoint module, given relative to ``congress_gov_api_client.api``, e.g. ``bill.bill_details``"""
+        plan = self._plans.get(endpoint)
+        if plan is None:
+            module = importlib.import_module(f"{__package__}.api.{endpoint}")
+            plan = self._plans[endpoint] = RequestPlan.compile(module)
+        return plan
+
+    def send(self, plan: RequestPlan, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Response[Any]:
+        """Make the request of a call and parse its response"""
+        response = self.client.get_httpx_client().request(**plan.request(args, kwargs))
+        return plan.endpoint._build_response(client=self.client, response=response)
+
+    async def asend(self, plan: RequestPlan, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Response[Any]:
+        """The async counterpart of ``send``"""
+        response = await self.client.get_async_httpx_client().request(**plan.request(args, kwargs))
+        return plan.endpoint._build_response(client=self.client, response=response)
+
+
+def _parsed(response: Response[Any]) -> Any:
+    # Endpoints without a response model leave ``parsed`` as ``None``, so their body is decoded here instead
+    if response.status_code != HTTPStatus.OK:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    if response.parsed is not None:
+        return response.parsed
+    return decode_json(response.content)
+
+
+@define
+class Operation:
+    """A method of a ``CongressAPI`` resource
+
+    Calling it returns the parsed response, ``detailed`` the full ``Response``, and ``iterate`` every record of a list
+    endpoint across pages. Path parameters are positional or keyword; with several endpoints, the one taking as many
+    path parameters as are given is called, e.g. ``api.bills.list()``, ``api.bills.list(117)`` and
+    ``api.bills.list(117, "hr")``.
+
+    Attributes:
+        planner: The planner sending the requests
+        endpoints: The endpoint modules, relative to ``congress_gov_api_client.api``
+    """
+
+    planner: RequestPlanner
+    endpoints: tuple[str, ...]
+
+    def _plan(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> RequestPlan:
+        plans = [self.planner.plan(endpoint) for endpoint in self.endpoints]
+        if len(plans) == 1:
+            return plans[0]
+        for plan in reversed(plans):
+            if plan.arity(args, kwargs) == len(plan.path_parameters):
+                return plan
+        accepted = " or ".join(", ".join(plan.path_parameters) or "none" for plan in plans)
+        raise TypeError(f"Expected path parameters {accepted}")
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the endpoint and return its parsed response, or its decoded JSON body if the endpoint has no model
+
+        Raises:
+            errors.UnexpectedStatus: If the response is not a 200.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+        """
+        return _parsed(self.detailed(*args, **kwargs))
+
+    def detailed(self, *args: Any, **kwargs: Any) -> Response[Any]:
+        """Call the endpoint and return the full ``Response``"""
+        return self.planner.send(self._plan(args, kwargs), args, kwargs)
+
+    async def asyncio(self, *args: Any, **kwargs: Any) -> Any:
+        """The async counterpart of calling the operation"""
+        return _parsed(await self.asyncio_detailed(*args, **kwargs))
+
+    async def asyncio_detailed(self, *args: Any, client: Any = None, **kwargs: Any) -> Response[Any]:
+        """The async counterpart of ``detailed``; like ``sync_detailed``, it ignores ``client``"""
+        return await self.planner.asend(self._plan(args, kwargs), args, kwargs)
+
+    def sync_detailed(self, *args: Any, client: Any = None, **kwargs: Any) -> Response[Any]:
+        """Same as ``detailed``, with the signature of an endpoint module so the operation can be passed to
+        ``pagination.paginate``; ``client`` is ignored in favor of the planner's"""
+        return self.detailed(*args, **kwargs)
+
+    def iterate(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """Lazily yield every record of a list endpoint; accepts the arguments of ``pagination.paginate``"""
+        return paginate(self, *args, client=self.planner.client, **kwargs)  # type: ignore[arg-type]
+
+    def aiterate(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """The async counterpart of ``iterate``; accepts the arguments of ``pagination.apaginate``"""
+        return apaginate(self, *args, client=self.planner.client, **kwargs)  # type: ignore[arg-type]
+
+    def map(self, calls: Iterable[tuple[Any, ...]], concurrency: int = 8, **kwargs: Any) -> Iterator[Any]:
+        """Call the endpoint once per tuple of path parameters with at most ``concurrency`` requests in flight,
+        yielding parsed responses in order
+
+        Args:
+            calls: The path parameters of each call, e.g. ``[(117, "hr", 1), (117, "hr", 2)]``
+            concurrency: The maximum number of requests in flight
+            **kwargs: Query parameters for every call
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            yield from pool.map(lambda args: self(*args, **kwargs), calls)
+
+    async def amap(self, calls: Iterable[tuple[Any, ...]], concurrency: int = 8, **kwargs: Any) -> list[Any]:
+        """The async counterpart of ``map``, returning the parsed responses in order"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(args: tuple[Any, ...]) -> Any:
+            async with semaphore:
+                return await self.asyncio(*args, **kwargs)
+
+        return list(await asyncio.gather(*(call(args) for args in calls)))
+
+
+class Resource:
+    """A group of operations of ``CongressAPI``, e.g. ``bills``; see ``RESOURCES`` for the methods of each"""
+
+    def __init__(self, name: str, planner: RequestPlanner) -> None:
+        self.name = name
+        for method, endpoints in RESOURCES[name].items():
+            setattr(self, method, Operation(planner, endpoints))
+
+    def __repr__(self) -> str:
+        return f"Resource({self.name!r}, methods={list(RESOURCES[self.name])})"
+
+
+class CongressAPI:
+    """A resource-oriented facade over every endpoint, e.g. ``api.bills.get(117, "hr", 3076)`` or
+    ``api.members.list.iterate(current_member="true")``
+
+    Every call is sent through one ``RequestPlanner``. The request of each endpoint is compiled once, so repeated calls
+    only build the query parameters they are given.
+
+    Args:
+        client: The client to make requests with
+        planner: A planner to share with other facades; by default one is created for ``client``
+    """
+
+    amendments: Resource
+    bills: Resource
+    bound_congressional_record: Resource
+    committee_meetings: Resource
+    committee_prints: Resource
+    committee_reports: Resource
+    committees: Resource
+    congresses: Resource
+    congressional_record: Resource
+    crs_reports: Resource
+    daily_congressional_record: Resource
+    hearings: Resource
+    house_communications: Resource
+    house_requirements: Resource
+    laws: Resource
+    members: Resource
+    nominations: Resource
+    senate_communications: Resource
+    summaries: Resource
+    treaties: Resource
+
+    def __init__(self, client: Union[AuthenticatedClient, Client], *, planner: Optional[RequestPlanner] = None) -> None:
+        self.client = client
+        self.planner = RequestPlanner(client) if planner is None else planner
+        for name in RESOURCES:
+            setattr(self, name, Resource(name, self.planner))
+
+
+__all__ = ["RESOURCES", "CongressAPI", "Operation", "RequestPlan", "RequestPlanner", "Resource"]
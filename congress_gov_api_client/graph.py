@@ -0,0 +1,531 @@
+"""Contains a compact sponsorship graph of members and bills, built by streaming the sponsorship endpoints
+
+Members and bills are interned to integers and the edges kept as CSR arrays, in both directions, of 4-byte entries
+holding the neighbor and the edge kind. Updates go to a buffer that is merged into the arrays once it holds
+``COMPACT_AFTER`` additions, or when the arrays themselves are asked for.
+Exporting to Parquet requires the optional ``pyarrow`` dependency, installed with the ``parquet`` extra.
+"""
+
+import asyncio
+import heapq
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+
+from attrs import define, field
+
+from .api.bill import bill_cosponsors
+from .api.member import cosponsorship_list, sponsorship_list
+from .client import AuthenticatedClient
+from .incremental import record_field
+from .pagination import MAX_LIMIT, apaginate, paginate
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore[assignment]
+
+SPONSOR = 0
+COSPONSOR = 1
+KINDS = ("sponsor", "cosponsor")
+
+COMPACT_AFTER = 1 << 18
+
+_KIND_BITS = 1
+_NODE_BITS = 31
+
+
+def bill_key(congress: Any, bill_type: Any, number: Any) -> str:
+    """The key of a bill in the graph, e.g. ``117-hr-3076``"""
+    return f"{congress}-{str(bill_type).lower()}-{number}"
+
+
+def _legislation_key(record: Any) -> Optional[str]:
+    """The key of a sponsored or cosponsored bill, or amendment, e.g. ``117-samdt-2137``"""
+    congress = record_field(record, "congress")
+    number = record_field(record, "number")
+    if congress is None:
+        return None
+    if number is not None and record_field(record, "type"):
+        return bill_key(congress, record_field(record, "type"), number)
+    amendment = record_field(record, "amendmentNumber")
+    if amendment is not None:
+        return bill_key(congress, record_field(record, "type") or "amdt", amendment)
+    return None
+
+
+@define
+class _Interner:
+    """Assigns consecutive integers to keys"""
+
+    ids: dict[str, int] = field(factory=dict)
+    keys: list[str] = field(factory=list)
+
+    def intern(self, key: str) -> int:
+        index = self.ids.get(key)
+        if index is None:
+            index = self.ids[key] = len(self.keys)
+            if index >> _NODE_BITS:
+                raise OverflowError("The graph holds at most 2**31 members and 2**31 bills")
+            self.keys.append(key)
+        return index
+
+
+@define
+class CSR:
+    """One direction of the graph in compressed sparse row form
+
+    The neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``, sorted, with the kind of each edge at the
+    same position of ``kinds``. The arrays support the buffer protocol, so ``numpy.frombuffer`` views them without copying.
+
+    Attributes:
+        indptr: ``len(nodes) + 1`` offsets into ``indices``
+        indices: The interned neighbors
+        kinds: ``SPONSOR`` or ``COSPONSOR`` for each edge
+    """
+
+    indptr: array
+    indices: array
+    kinds: array
+
+
+def _pack(member: int, bill: int, kind: int) -> int:
+    return (member << (_NODE_BITS + _KIND_BITS)) | (bill << _KIND_BITS) | kind
+
+
+def _build(edges: Iterable[int], nodes: int) -> tuple[array, array]:
+    """Member CSR arrays from sorted packed edges; entries hold the bill and the kind"""
+    shift = _NODE_BITS + _KIND_BITS
+    mask = (1 << shift) - 1
+    indptr = array("Q", bytes(8 * (nodes + 1)))
+    entries = array("I")
+    for edge in edges:
+        indptr[(edge >> shift) + 1] += 1
+        entries.append(edge & mask)
+    for node in range(nodes):
+        indptr[node + 1] += indptr[node]
+    return indptr, entries
+
+
+def _transpose(indptr: array, entries: array, nodes: int) -> tuple[array, array]:
+    """The reverse direction of CSR arrays by counting sort, with neighbors again sorted within each row"""
+    counts = array("Q", bytes(8 * (nodes + 1)))
+    for entry in entries:
+        counts[(entry >> _KIND_BITS) + 1] += 1
+    for node in range(nodes):
+        counts[node + 1] += counts[node]
+    cursor = array("Q", counts)
+    transposed = array("I", bytes(4 * len(entries)))
+    for source in range(len(indptr) - 1):
+        for position in range(indptr[source], indptr[source + 1]):
+            entry = entries[position]
+            target = entry >> _KIND_BITS
+            transposed[cursor[target]] = (source << _KIND_BITS) | (entry & 1)
+            cursor[target] += 1
+    return counts, transposed
+
+
+def _neighbors(row: Sequence[int], kind: Optional[int]) -> list[int]:
+    """The distinct neighbors in sorted entries, linked by edges of ``kind`` or of either kind"""
+    neighbors: list[int] = []
+    for entry in row:
+        if kind is None or (entry & 1) == kind:
+            neighbor = entry >> _KIND_BITS
+            if not neighbors or neighbors[-1] != neighbor:
+                neighbors.append(neighbor)
+    return neighbors
+
+
+def _degree(row: Sequence[int], kind: Optional[int]) -> int:
+    if kind is None:
+        return len({entry >> _KIND_BITS for entry in row})
+    return sum(1 for entry in row if (entry & 1) == kind)
+
+
+@define
+class SponsorshipGraph:
+    """A bipartite graph of members and the bills they sponsor or cosponsor
+
+    Edges are added by ``add`` and the ``ingest_*`` methods, which may be called again at any time to bring a member
+    or bill up to date: each replaces the edges of that member or bill that its endpoint lists. ``build`` and
+    ``abuild`` stream many of them concurrently.
+    """
+
+    _members: _Interner = field(init=False, factory=_Interner)
+    _bills: _Interner = field(init=False, factory=_Interner)
+    _member_ptr: array = field(init=False, factory=lambda: array("Q", [0]))
+    _member_adj: array = field(init=False, factory=lambda: array("I"))
+    _bill_ptr: array = field(init=False, factory=lambda: array("Q", [0]))
+    _bill_adj: array = field(init=False, factory=lambda: array("I"))
+    _added_by_member: dict[int, set[int]] = field(init=False, factory=dict)
+    _added_by_bill: dict[int, set[int]] = field(init=False, factory=dict)
+    _added: int = field(init=False, default=0)
+    _removed: set[int] = field(init=False, factory=set)
+
+    @property
+    def member_count(self) -> int:
+        return len(self._members.keys)
+
+    @property
+    def bill_count(self) -> int:
+        return len(self._bills.keys)
+
+    @property
+    def edge_count(self) -> int:
+        self._compact()
+        return len(self._member_adj)
+
+    def add(self, bioguide_id: str, bill: str, kind: int = COSPONSOR) -> None:
+        """Add an edge; adding one that exists has no effect
+
+        Args:
+            bioguide_id: The member
+            bill: The bill key, see ``bill_key``
+            kind: ``SPONSOR`` or ``COSPONSOR``
+        """
+        member = self._members.intern(bioguide_id)
+        index = self._bills.intern(bill)
+        self._removed.discard(_pack(member, index, kind))
+        self._added_by_member.setdefault(member, set()).add((index << _KIND_BITS) | kind)
+        self._added_by_bill.setdefault(index, set()).add((member << _KIND_BITS) | kind)
+        self._added += 1
+        if self._added >= COMPACT_AFTER:
+            self._compact()
+
+    def remove(self, bioguide_id: str, bill: str, kind: int = COSPONSOR) -> None:
+        """Remove an edge if it exists"""
+        member = self._members.ids.get(bioguide_id)
+        index = self._bills.ids.get(bill)
+        if member is None or index is None:
+            return
+        self._removed.add(_pack(member, index, kind))
+        self._added_by_member.get(member, set()).discard((index << _KIND_BITS) | kind)
+        self._added_by_bill.get(index, set()).discard((member << _KIND_BITS) | kind)
+
+    def replace_member(self, bioguide_id: str, kind: int, bills: Iterable[str]) -> None:
+        """Make ``bills`` the only bills the member is linked to by edges of ``kind``"""
+        keep = set(bills)
+        for bill in self.bills_of(bioguide_id, kind):
+            if bill not in keep:
+                self.remove(bioguide_id, bill, kind)
+        for bill in keep:
+            self.add(bioguide_id, bill, kind)
+
+    def replace_bill(self, bill: str, kind: int, members: Iterable[str]) -> None:
+        """Make ``members`` the only members linked to the bill by edges of ``kind``"""
+        keep = set(members)
+        for bioguide_id in self.members_of(bill, kind):
+            if bioguide_id not in keep:
+                self.remove(bioguide_id, bill, kind)
+        for bioguide_id in keep:
+            self.add(bioguide_id, bill, kind)
+
+    def _compact(self) -> None:
+        """Merge the buffered updates into the CSR arrays"""
+        if not self._added and not self._removed:
+            return
+        self._member_ptr, self._member_adj = _build(self._merged(), self.member_count)
+        self._bill_ptr, self._bill_adj = _transpose(self._member_ptr, self._member_adj, self.bill_count)
+        self._added_by_member.clear()
+        self._added_by_bill.clear()
+        self._added = 0
+        self._removed.clear()
+
+    def _merged(self) -> Iterator[int]:
+        """The packed edges of the CSR arrays and the buffer, sorted and without duplicates or removed edges"""
+        shift = _NODE_BITS + _KIND_BITS
+        existing = (
+            (member << shift) | entry
+            for member in range(len(self._member_ptr) - 1)
+            for entry in self._member_adj[self._member_ptr[member] : self._member_ptr[member + 1]]
+        )
+        added = sorted((member << shift) | entry for member, row in self._added_by_member.items() for entry in row)
+        previous = None
+        for edge in heapq.merge(existing, added):
+            if edge != previous and edge not in self._removed:
+                yield edge
+            previous = edge
+
+    def csr(self, by: str = "member") -> CSR:
+        """The graph as CSR arrays, rows being members and columns bills, or the reverse for ``by="bill"``
+
+        Row ``i`` is the node ``members()[i]`` or ``bills()[i]``.
+        """
+        self._compact()
+        indptr, entries = (self._member_ptr, self._member_adj) if by == "member" else (self._bill_ptr, self._bill_adj)
+        return CSR(
+            indptr=array("Q", indptr),
+            indices=array("I", (entry >> _KIND_BITS for entry in entries)),
+            kinds=array("B", (entry & 1 for entry in entries)),
+        )
+
+    def members(self) -> list[str]:
+        """The bioguide IDs of all members, in interned order"""
+        return list(self._members.keys)
+
+    def bills(self) -> list[str]:
+        """The keys of all bills, in interned order"""
+        return list(self._bills.keys)
+
+    def _member_row(self, member: int) -> Sequence[int]:
+        """The entries of a member, from the CSR arrays and the buffer, without compacting"""
+        row: Sequence[int] = ()
+        if member + 1 < len(self._member_ptr):
+            row = self._member_adj[self._member_ptr[member] : self._member_ptr[member + 1]]
+        added = self._added_by_member.get(member)
+        if not added and not self._removed:
+            return row
+        base = member << (_NODE_BITS + _KIND_BITS)
+        kept = {entry for entry in row if base | entry not in self._removed}
+        return sorted(kept.union(added or ()))
+
+    def _bill_row(self, bill: int) -> Sequence[int]:
+        """The entries of a bill, from the CSR arrays and the buffer, without compacting"""
+        row: Sequence[int] = ()
+        if bill + 1 < len(self._bill_ptr):
+            row = self._bill_adj[self._bill_ptr[bill] : self._bill_ptr[bill + 1]]
+        added = self._added_by_bill.get(bill)
+        if not added and not self._removed:
+            return row
+        kept = {entry for entry in row if _pack(entry >> _KIND_BITS, bill, entry & 1) not in self._removed}
+        return sorted(kept.union(added or ()))
+
+    def _row(self, interner: _Interner, key: str, by_member: bool) -> Sequence[int]:
+        index = interner.ids.get(key)
+        if index is None:
+            return ()
+        return self._member_row(index) if by_member else self._bill_row(index)
+
+    def member_degree(self, bioguide_id: str, kind: Optional[int] = None) -> int:
+        """The number of bills a member sponsored or cosponsored, or only those of ``kind``"""
+        return _degree(self._row(self._members, bioguide_id, True), kind)
+
+    def bill_degree(self, bill: str, kind: Optional[int] = None) -> int:
+        """The number of sponsors and cosponsors of a bill, or only those of ``kind``"""
+        return _degree(self._row(self._bills, bill, False), kind)
+
+    def bills_of(self, bioguide_id: str, kind: Optional[int] = None) -> list[str]:
+        """The bills a member sponsored or cosponsored, or only those of ``kind``"""
+        keys = self._bills.keys
+        return [keys[index] for index in _neighbors(self._row(self._members, bioguide_id, True), kind)]
+
+    def members_of(self, bill: str, kind: Optional[int] = None) -> list[str]:
+        """The sponsors and cosponsors of a bill, or only those of ``kind``"""
+        keys = self._members.keys
+        return [keys[index] for index in _neighbors(self._row(self._bills, bill, False), kind)]
+
+    def collaborators(self, bioguide_id: str, limit: Optional[int] = None) -> list[tuple[str, int]]:
+        """The members sharing bills with a member and how many edges they share, most first
+
+        Args:
+            bioguide_id: The member
+            limit: Return only this many, e.g. 10 for the closest collaborators
+        """
+        member = self._members.ids.get(bioguide_id)
+        if member is None:
+            return []
+        self._compact()
+        shared: Counter[int] = Counter()
+        for entry in self._member_adj[self._member_ptr[member] : self._member_ptr[member + 1]]:
+            bill = entry >> _KIND_BITS
+            for other in self._bill_adj[self._bill_ptr[bill] : self._bill_ptr[bill + 1]]:
+                shared[other >> _KIND_BITS] += 1
+        shared.pop(member, None)
+        keys = self._members.keys
+        ranked = heapq.nlargest(limit, shared.items(), key=lambda item: item[1]) if limit else shared.most_common()
+        return [(keys[other], count) for other, count in ranked]
+
+    def ingest_member(self, bioguide_id: str, *, client: AuthenticatedClient) -> None:
+        """Fetch a member's sponsored and cosponsored legislation and replace their edges with it
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+        """
+        self._apply(_fetch_member(bioguide_id, client))
+
+    def ingest_bill(self, congress: int, bill_type: str, bill_number: int, *, client: AuthenticatedClient) -> None:
+        """Fetch a bill's cosponsors and replace its cosponsor edges with them
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+        """
+        self._apply(_fetch_bill((congress, bill_type, bill_number), client))
+
+    def _apply(self, update: "_Update") -> None:
+        if update.bioguide_id is not None:
+            for kind, bills in update.lists.items():
+                self.replace_member(update.bioguide_id, kind, bills)
+        else:
+            for kind, members in update.lists.items():
+                self.replace_bill(update.bill, kind, members)
+
+    def build(
+        self,
+        *,
+        client: AuthenticatedClient,
+        members: Iterable[str] = (),
+        bills: Iterable[tuple[int, str, int]] = (),
+        workers: int = 8,
+    ) -> int:
+        """Ingest many members and bills, with up to ``workers`` of them fetched at once
+
+        Each result is applied as it arrives, and at most ``2 * workers`` are held in memory.
+
+        Args:
+            client: The client to make requests with
+            members: Bioguide IDs of members whose sponsored and cosponsored legislation to ingest
+            bills: ``(congress, bill_type, bill_number)`` of bills whose cosponsors to ingest
+            workers: The maximum number of members and bills fetched at once
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+
+        Returns:
+            int: The number of members and bills ingested
+        """
+        jobs = iter([*((_fetch_member, member) for member in members), *((_fetch_bill, bill) for bill in bills)])
+        count = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: set[Future[_Update]] = set()
+            try:
+                for fetch, target in jobs:
+                    pending.add(pool.submit(fetch, target, client))
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._apply(future.result())
+                            count += 1
+                for future in pending:
+                    self._apply(future.result())
+                    count += 1
+            finally:
+                for future in pending:
+                    future.cancel()
+        return count
+
+    async def abuild(
+        self,
+        *,
+        client: AuthenticatedClient,
+        members: Iterable[str] = (),
+        bills: Iterable[tuple[int, str, int]] = (),
+        workers: int = 8,
+    ) -> int:
+        """The async counterpart of ``build``
+
+        Returns:
+            int: The number of members and bills ingested
+        """
+        jobs = iter([*((_afetch_member, member) for member in members), *((_afetch_bill, bill) for bill in bills)])
+        count = 0
+
+        async def worker() -> None:
+            nonlocal count
+            for fetch, target in jobs:
+                self._apply(await fetch(target, client))
+                count += 1
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return count
+
+    def to_parquet(self, path: str, *, row_group_size: int = 1 << 20) -> int:
+        """Write the edges to a Parquet file with columns ``bioguide_id``, ``bill`` and ``kind``
+
+        The string columns are dictionary-encoded with the interned keys, so the file stays close to the size of the
+        arrays.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        Returns:
+            int: The number of edges written
+        """
+        if pyarrow is None:
+            raise ImportError("Parquet export requires pyarrow: pip install 'congress_gov_api_client[parquet]'")
+        self._compact()
+        members = pyarrow.array(self._members.keys, pyarrow.string())
+        bills = pyarrow.array(self._bills.keys, pyarrow.string())
+        kinds = pyarrow.array(KINDS, pyarrow.string())
+        schema = pyarrow.schema(
+            [
+                ("bioguide_id", pyarrow.dictionary(pyarrow.int32(), pyarrow.string())),
+                ("bill", pyarrow.dictionary(pyarrow.int32(), pyarrow.string())),
+                ("kind", pyarrow.dictionary(pyarrow.int8(), pyarrow.string())),
+            ]
+        )
+        with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+            member = 0
+            for start in range(0, len(self._member_adj), row_group_size):
+                stop = min(start + row_group_size, len(self._member_adj))
+                sources = array("i")
+                for position in range(start, stop):
+                    while self._member_ptr[member + 1] <= position:
+                        member += 1
+                    sources.append(member)
+                entries = self._member_adj[start:stop]
+                batch = pyarrow.RecordBatch.from_arrays(
+                    [
+                        pyarrow.DictionaryArray.from_arrays(pyarrow.array(sources, pyarrow.int32()), members),
+                        pyarrow.DictionaryArray.from_arrays(
+                            pyarrow.array((entry >> _KIND_BITS for entry in entries), pyarrow.int32()), bills
+                        ),
+                        pyarrow.DictionaryArray.from_arrays(
+                            pyarrow.array((entry & 1 for entry in entries), pyarrow.int8()), kinds
+                        ),
+                    ],
+                    schema=schema,
+                )
+                writer.write_batch(batch)
+        return len(self._member_adj)
+
+
+@define
+class _Update:
+    """The edges a member's or bill's endpoints list, by kind"""
+
+    lists: dict[int, list[str]]
+    bioguide_id: Optional[str] = None
+    bill: str = ""
+
+
+def _keys(records: Iterable[Any]) -> list[str]:
+    return [key for key in map(_legislation_key, records) if key is not None]
+
+
+def _member_ids(records: Iterable[Any]) -> list[str]:
+    return [
+        str(bioguide_id) for bioguide_id in (record_field(record, "bioguideId") for record in records) if bioguide_id
+    ]
+
+
+def _fetch_member(bioguide_id: str, client: AuthenticatedClient) -> _Update:
+    sponsored = _keys(paginate(sponsorship_list, bioguide_id, client=client, limit=MAX_LIMIT))
+    cosponsored = _keys(paginate(cosponsorship_list, bioguide_id, client=client, limit=MAX_LIMIT))
+    return _Update({SPONSOR: sponsored, COSPONSOR: cosponsored}, bioguide_id=bioguide_id)
+
+
+def _fetch_bill(bill: tuple[int, str, int], client: AuthenticatedClient) -> _Update:
+    cosponsors = _member_ids(paginate(bill_cosponsors, *bill, client=client, limit=MAX_LIMIT))
+    return _Update({COSPONSOR: cosponsors}, bill=bill_key(*bill))
+
+
+async def _afetch_member(bioguide_id: str, client: AuthenticatedClient) -> _Update:
+    sponsored, cosponsored = await asyncio.gather(
+        _acollect(sponsorship_list, (bioguide_id,), client), _acollect(cosponsorship_list, (bioguide_id,), client)
+    )
+    return _Update({SPONSOR: _keys(sponsored), COSPONSOR: _keys(cosponsored)}, bioguide_id=bioguide_id)
+
+
+async def _afetch_bill(bill: tuple[int, str, int], client: AuthenticatedClient) -> _Update:
+    cosponsors = await _acollect(bill_cosponsors, bill, client)
+    return _Update({COSPONSOR: _member_ids(cosponsors)}, bill=bill_key(*bill))
+
+
+async def _acollect(endpoint: Any, args: tuple[Any, ...], client: AuthenticatedClient) -> list[Any]:
+    return [record async for record in apaginate(endpoint, *args, client=client, limit=MAX_LIMIT)]
+
+
+__all__ = ["COMPACT_AFTER", "COSPONSOR", "CSR", "KINDS", "SPONSOR", "SponsorshipGraph", "bill_key"]
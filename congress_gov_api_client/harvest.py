@@ -0,0 +1,482 @@
+"""Contains a resumable harvester of the daily Congressional Record: volumes, their issues and the issues' articles
+
+The API exposes the record as a tree: ``daily_congressional_record_list`` lists issues across volumes,
+``daily_congressional_record_list_by_volume`` the issues of a volume, ``daily_congressional_record_list_by_volume_and_issue``
+one issue and ``daily_congressional_record_list_by_article`` its articles. The harvester walks it as a pipeline in
+which volumes feed issues and issues feed articles, so listing the next volume overlaps fetching the articles of the
+previous one.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional, Union
+
+from attrs import define, field
+
+from .api.daily_congressional_record import (
+    daily_congressional_record_list,
+    daily_congressional_record_list_by_article,
+    daily_congressional_record_list_by_volume,
+    daily_congressional_record_list_by_volume_and_issue,
+)
+from .client import AuthenticatedClient
+from .download import AsyncTextDownloader, StoredText, TextArtifact, TextDownloader
+from .incremental import record_field
+from .pagination import apaginate, paginate
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS harvested_volumes (
+    volume INTEGER PRIMARY KEY,
+    issues INTEGER NOT NULL,
+    completed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS harvested_issues (
+    volume INTEGER NOT NULL,
+    issue INTEGER NOT NULL,
+    update_date TEXT,
+    articles INTEGER NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (volume, issue)
+);
+"""
+
+DEFAULT_TEXT_TYPES = frozenset({"Formatted Text"})
+"""The text formats downloaded by default: the HTML of each article, rather than its PDF"""
+
+
+@define
+class RecordArticle:
+    """One article of a daily issue
+
+    Attributes:
+        section: The section of the issue, e.g. ``Senate Section``
+        title: The article title
+        start_page: The first page, e.g. ``S4941``
+        end_page: The last page
+        text: The documents of the article, one per part and format
+    """
+
+    section: Optional[str]
+    title: Optional[str]
+    start_page: Optional[str]
+    end_page: Optional[str]
+    text: list[TextArtifact]
+
+
+@define
+class RecordIssue:
+    """One daily issue with its articles
+
+    Attributes:
+        volume: The volume number
+        issue: The issue number
+        congress: The congress the issue belongs to
+        session: The session of that congress
+        issue_date: The date of the issue
+        update_date: When the API last updated the issue
+        entire_issue: The documents holding the entire issue, one per part and format
+        articles: Every article of the issue, in section order
+        downloads: The article documents stored on disk, when the harvester downloads them
+    """
+
+    volume: int
+    issue: int
+    congress: Optional[int] = None
+    session: Optional[int] = None
+    issue_date: Optional[str] = None
+    update_date: Optional[str] = None
+    entire_issue: list[TextArtifact] = field(factory=list)
+    articles: list[RecordArticle] = field(factory=list)
+    downloads: list[StoredText] = field(factory=list)
+
+    def text_artifacts(self, format_types: Optional[Iterable[str]] = None) -> list[TextArtifact]:
+        """The documents of every article, optionally only those of some formats, e.g. ``{"PDF"}``"""
+        wanted = None if format_types is None else set(format_types)
+        return [
+            artifact
+            for article in self.articles
+            for artifact in article.text
+            if wanted is None or artifact.format_type in wanted
+        ]
+
+
+@define
+class _Listed:
+    """An issue found while listing a volume"""
+
+    volume: int
+    issue: int
+    update_date: Optional[str]
+
+
+@define
+class HarvestCheckpoints:
+    """Remembers which volumes and issues a harvest has completed, in a SQLite database
+
+    An issue is complete once it has been handed to the caller; it is fetched again if the API reports a different
+    ``updateDate`` for it. A volume is complete once all of its issues are.
+
+    Attributes:
+        path: The path of the database file
+    """
+
+    path: str
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def completed_volumes(self) -> set[int]:
+        """The volumes whose issues have all been harvested"""
+        with self._lock:
+            return {volume for (volume,) in self._connection.execute("SELECT volume FROM harvested_volumes")}
+
+    def completed_issues(self, volume: int) -> dict[int, Optional[str]]:
+        """The ``updateDate`` of every harvested issue of a volume, by issue number"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT issue, update_date FROM harvested_issues WHERE volume = ?", (volume,)
+            )
+            return dict(rows)
+
+    def complete_issue(self, issue: RecordIssue) -> None:
+        """Record that an issue has been harvested"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO harvested_issues VALUES (?, ?, ?, ?, ?)",
+                (issue.volume, issue.issue, issue.update_date, len(issue.articles), time.time()),
+            )
+
+    def complete_volume(self, volume: int, issues: int) -> None:
+        """Record that every issue of a volume has been harvested"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO harvested_volumes VALUES (?, ?, ?)", (volume, issues, time.time())
+            )
+
+    def reset(self, volume: Optional[int] = None) -> None:
+        """Forget the progress of one volume, or of the whole harvest"""
+        with self._lock, self._connection:
+            if volume is None:
+                self._connection.execute("DELETE FROM harvested_volumes")
+                self._connection.execute("DELETE FROM harvested_issues")
+            else:
+                self._connection.execute("DELETE FROM harvested_volumes WHERE volume = ?", (volume,))
+                self._connection.execute("DELETE FROM harvested_issues WHERE volume = ?", (volume,))
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _artifacts(links: Any) -> list[TextArtifact]:
+    return [
+        TextArtifact(url=link["url"], format_type=link.get("type"))
+        for link in links or ()
+        if isinstance(link, dict) and link.get("url")
+    ]
+
+
+def _articles(sections: Iterable[Any]) -> list[RecordArticle]:
+    return [
+        RecordArticle(
+            section=record_field(section, "name"),
+            title=article.get("title"),
+            start_page=article.get("startPage"),
+            end_page=article.get("endPage"),
+            text=_artifacts(article.get("text")),
+        )
+        for section in sections
+        for article in record_field(section, "sectionArticles") or ()
+    ]
+
+
+def _completed(pending: "set[Future[RecordIssue]]", block: bool) -> "set[Future[RecordIssue]]":
+    """The futures of ``pending`` that are done, waiting for the first of them if ``block``"""
+    if block:
+        return wait(pending, return_when=FIRST_COMPLETED).done
+    return {future for future in pending if future.done()}
+
+
+def _issue(listed: _Listed, details: list[Any], sections: Iterable[Any]) -> RecordIssue:
+    detail = details[0] if details else {}
+    return RecordIssue(
+        volume=listed.volume,
+        issue=listed.issue,
+        congress=_int(record_field(detail, "congress")),
+        session=_int(record_field(detail, "sessionNumber")),
+        issue_date=record_field(detail, "issueDate") or record_field(detail, "fullIssue"),
+        update_date=listed.update_date,
+        entire_issue=_artifacts(record_field(detail, "entireIssue")),
+        articles=_articles(sections),
+    )
+
+
+@define
+class _Progress:
+    """Counts the issues of each volume not yet handed to the caller, to tell when a volume is complete"""
+
+    pending: dict[int, int] = field(factory=dict)
+    listed: dict[int, int] = field(factory=dict)
+    listing: set[int] = field(factory=set)
+
+    def start_volume(self, volume: int) -> None:
+        self.listing.add(volume)
+        self.pending.setdefault(volume, 0)
+        self.listed[volume] = 0
+
+    def add_issue(self, volume: int, skipped: bool) -> None:
+        self.listed[volume] += 1
+        if not skipped:
+            self.pending[volume] += 1
+
+    def finish_listing(self, volume: int) -> Optional[tuple[int, int]]:
+        """The volume and its number of issues if it is now complete"""
+        self.listing.discard(volume)
+        return self._completed(volume)
+
+    def complete_issue(self, issue: RecordIssue) -> Optional[tuple[int, int]]:
+        """The volume of the issue and its number of issues if it is now complete"""
+        self.pending[issue.volume] -= 1
+        return self._completed(issue.volume)
+
+    def _completed(self, volume: int) -> Optional[tuple[int, int]]:
+        if volume in self.listing or self.pending.get(volume) != 0:
+            return None
+        del self.pending[volume]
+        return volume, self.listed.pop(volume)
+
+
+@define
+class DailyRecordHarvester:
+    """Harvests daily issues of the Congressional Record with their articles, resuming where a previous run stopped
+
+    Issues are yielded as soon as their articles are fetched, not in listing order, and checkpointed once the caller
+    asks for the next one, so an interrupted harvest repeats at most the issues in flight. Completed volumes are
+    skipped, except the newest volume of the record, which may have gained issues. ``harvest`` stops listing while
+    ``2 * workers`` issues are being fetched or waiting to be yielded, and in ``aharvest`` each stage feeds the next
+    through a queue holding at most ``workers`` items, so memory stays bounded over a multi-year backfill.
+
+    Attributes:
+        client: The client to make API requests with
+        checkpoints: Where progress is kept between runs
+        workers: The number of issues fetched at once, each with its own requests
+        downloader: A ``TextDownloader`` (for ``harvest``) or ``AsyncTextDownloader`` (for ``aharvest``) to stream
+            the article documents to disk as issues are fetched; by default nothing is downloaded
+        text_types: The formats of the article documents to download
+    """
+
+    client: AuthenticatedClient
+    checkpoints: HarvestCheckpoints
+    workers: int = 8
+    downloader: Union[TextDownloader, AsyncTextDownloader, None] = None
+    text_types: frozenset[str] = DEFAULT_TEXT_TYPES
+
+    def _volumes(self, volumes: Optional[Iterable[int]]) -> Iterator[int]:
+        """The volumes to harvest, newest first; the newest is harvested even if complete, as it may gain issues"""
+        completed = self.checkpoints.completed_volumes()
+        if volumes is not None:
+            yield from (volume for volume in volumes if volume not in completed)
+            return
+        seen: set[int] = set()
+        for record in paginate(daily_congressional_record_list, client=self.client):
+            volume = _int(record_field(record, "volumeNumber"))
+            if volume is None or volume in seen:
+                continue
+            if not seen or volume not in completed:
+                yield volume
+            seen.add(volume)
+
+    async def _avolumes(self, volumes: Optional[Iterable[int]]) -> AsyncIterator[int]:
+        completed = await asyncio.to_thread(self.checkpoints.completed_volumes)
+        if volumes is not None:
+            for volume in volumes:
+                if volume not in completed:
+                    yield volume
+            return
+        seen: set[int] = set()
+        async for record in apaginate(daily_congressional_record_list, client=self.client):
+            volume = _int(record_field(record, "volumeNumber"))
+            if volume is None or volume in seen:
+                continue
+            if not seen or volume not in completed:
+                yield volume
+            seen.add(volume)
+
+    def _listed(self, volume: int, record: Any, seen: set[int]) -> Optional[_Listed]:
+        """The issue of a record listed for a volume, or ``None`` if it has no number or was already listed"""
+        issue = _int(record_field(record, "issueNumber"))
+        if issue is None or issue in seen:
+            return None
+        seen.add(issue)
+        return _Listed(volume, issue, record_field(record, "updateDate"))
+
+    def _fetch_issue(self, listed: _Listed) -> RecordIssue:
+        args = (str(listed.volume), str(listed.issue))
+        details = list(paginate(daily_congressional_record_list_by_volume_and_issue, *args, client=self.client))
+        sections = paginate(daily_congressional_record_list_by_article, *args, client=self.client)
+        issue = _issue(listed, details, sections)
+        if isinstance(self.downloader, TextDownloader):
+            issue.downloads = list(self.downloader.download_all(issue.text_artifacts(self.text_types)))
+        return issue
+
+    async def _afetch_issue(self, listed: _Listed) -> RecordIssue:
+        args = (str(listed.volume), str(listed.issue))
+        details = [
+            record
+            async for record in apaginate(
+                daily_congressional_record_list_by_volume_and_issue, *args, client=self.client
+            )
+        ]
+        sections = [
+            record async for record in apaginate(daily_congressional_record_list_by_article, *args, client=self.client)
+        ]
+        issue = _issue(listed, details, sections)
+        if isinstance(self.downloader, AsyncTextDownloader):
+            artifacts = issue.text_artifacts(self.text_types)
+            issue.downloads = [stored async for stored in self.downloader.download_all(artifacts)]
+        return issue
+
+    def _complete_volume(self, completed: Optional[tuple[int, int]]) -> None:
+        if completed is not None:
+            self.checkpoints.complete_volume(*completed)
+
+    def harvest(self, volumes: Optional[Iterable[int]] = None) -> Iterator[RecordIssue]:
+        """Yield every issue not harvested yet, with its articles, fetching ``workers`` issues at once in threads
+
+        Args:
+            volumes: The volume numbers to harvest, e.g. ``range(160, 170)``; by default every volume listed by
+                ``daily_congressional_record_list``
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+
+        Returns:
+            Iterator[RecordIssue]
+        """
+        progress = _Progress()
+        pending: set[Future[RecordIssue]] = set()
+
+        def drain(block: bool) -> Iterator[RecordIssue]:
+            for future in _completed(pending, block):
+                pending.remove(future)
+                issue = future.result()
+                yield issue
+                self.checkpoints.complete_issue(issue)
+                self._complete_volume(progress.complete_issue(issue))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                for volume in self._volumes(volumes):
+                    done = self.checkpoints.completed_issues(volume)
+                    seen: set[int] = set()
+                    progress.start_volume(volume)
+                    for record in paginate(daily_congressional_record_list_by_volume, str(volume), client=self.client):
+                        listed = self._listed(volume, record, seen)
+                        if listed is None:
+                            continue
+                        skipped = listed.issue in done and done[listed.issue] == listed.update_date
+                        progress.add_issue(volume, skipped)
+                        if skipped:
+                            continue
+                        pending.add(pool.submit(self._fetch_issue, listed))
+                        yield from drain(len(pending) >= 2 * self.workers)
+                    self._complete_volume(progress.finish_listing(volume))
+                while pending:
+                    yield from drain(True)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def aharvest(self, volumes: Optional[Iterable[int]] = None) -> AsyncIterator[RecordIssue]:
+        """The async counterpart of ``harvest``, with ``workers`` tasks fetching issues as they are listed
+
+        Returns:
+            AsyncIterator[RecordIssue]
+        """
+        progress = _Progress()
+        volume_queue: asyncio.Queue[Optional[int]] = asyncio.Queue(maxsize=self.workers)
+        issue_queue: asyncio.Queue[Union[_Listed, int, None]] = asyncio.Queue(maxsize=self.workers)
+        results: asyncio.Queue[Union[RecordIssue, int, BaseException, None]] = asyncio.Queue(maxsize=self.workers)
+
+        async def list_volumes() -> None:
+            async for volume in self._avolumes(volumes):
+                await volume_queue.put(volume)
+            await volume_queue.put(None)
+
+        async def list_issues() -> None:
+            while (volume := await volume_queue.get()) is not None:
+                done = await asyncio.to_thread(self.checkpoints.completed_issues, volume)
+                seen: set[int] = set()
+                progress.start_volume(volume)
+                async for record in apaginate(
+                    daily_congressional_record_list_by_volume, str(volume), client=self.client
+                ):
+                    listed = self._listed(volume, record, seen)
+                    if listed is None:
+                        continue
+                    skipped = listed.issue in done and done[listed.issue] == listed.update_date
+                    progress.add_issue(volume, skipped)
+                    if not skipped:
+                        await issue_queue.put(listed)
+                # The volume number marks the end of its issues; the volume is complete once none of them is pending
+                await issue_queue.put(volume)
+            for _ in range(self.workers):
+                await issue_queue.put(None)
+
+        async def fetch_issues() -> None:
+            while (item := await issue_queue.get()) is not None:
+                await results.put(item if isinstance(item, int) else await self._afetch_issue(item))
+            await results.put(None)
+
+        async def run(task: "asyncio.Task[None]") -> None:
+            try:
+                await task
+            except BaseException as error:
+                await results.put(error)
+
+        tasks = [asyncio.ensure_future(list_volumes()), asyncio.ensure_future(list_issues())]
+        tasks += [asyncio.ensure_future(fetch_issues()) for _ in range(self.workers)]
+        watchers = [asyncio.ensure_future(run(task)) for task in tasks]
+        try:
+            finished = 0
+            while finished < self.workers:
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                elif isinstance(result, BaseException):
+                    raise result
+                elif isinstance(result, int):
+                    await asyncio.to_thread(self._complete_volume, progress.finish_listing(result))
+                else:
+                    yield result
+                    await asyncio.to_thread(self.checkpoints.complete_issue, result)
+                    await asyncio.to_thread(self._complete_volume, progress.complete_issue(result))
+        finally:
+            for task in tasks + watchers:
+                task.cancel()
+
+
+__all__ = [
+    "DEFAULT_TEXT_TYPES",
+    "DailyRecordHarvester",
+    "HarvestCheckpoints",
+    "RecordArticle",
+    "RecordIssue",
+]
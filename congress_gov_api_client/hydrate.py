@@ -0,0 +1,336 @@
+"""Contains functions that assemble a complete bill from ``bill_details`` and every bill sub-resource"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from attrs import define, field
+
+from . import errors
+from .api.bill import (
+    bill_actions,
+    bill_amendments,
+    bill_committees,
+    bill_cosponsors,
+    bill_details,
+    bill_list_by_congress,
+    bill_relatedbills,
+    bill_subjects,
+    bill_summaries,
+    bill_text,
+    bill_titles,
+)
+from .client import AuthenticatedClient
+from .models import Bill, ResourceCount
+from .pagination import MAX_LIMIT, Page, apaginate, paginate
+from .types import Response, Unset
+
+SUB_RESOURCES: dict[str, ModuleType] = {
+    "actions": bill_actions,
+    "amendments": bill_amendments,
+    "committees": bill_committees,
+    "cosponsors": bill_cosponsors,
+    "related_bills": bill_relatedbills,
+    "subjects": bill_subjects,
+    "summaries": bill_summaries,
+    "text_versions": bill_text,
+    "titles": bill_titles,
+}
+"""The list endpoint of each bill sub-resource, keyed by the ``Bill`` attribute holding its count"""
+
+
+@define
+class HydratedBill:
+    """A bill with the records of every sub-resource
+
+    Sub-resources that ``bill_details`` reports as empty are not requested and are left as empty lists.
+
+    Attributes:
+        congress: The congress number
+        bill_type: The bill type, e.g. ``hr``
+        bill_number: The bill number
+        bill: The ``bill_details`` record
+        actions: Records of ``bill_actions``
+        amendments: Records of ``bill_amendments``
+        committees: Records of ``bill_committees``
+        cosponsors: Records of ``bill_cosponsors``
+        related_bills: Records of ``bill_relatedbills``
+        subjects: The legislative subjects from ``bill_subjects``; the policy area is on ``bill``
+        summaries: Records of ``bill_summaries``
+        text_versions: Records of ``bill_text``
+        titles: Records of ``bill_titles``
+    """
+
+    congress: int
+    bill_type: str
+    bill_number: int
+    bill: Bill
+    actions: list[Any] = field(factory=list)
+    amendments: list[Any] = field(factory=list)
+    committees: list[Any] = field(factory=list)
+    cosponsors: list[Any] = field(factory=list)
+    related_bills: list[Any] = field(factory=list)
+    subjects: list[Any] = field(factory=list)
+    summaries: list[Any] = field(factory=list)
+    text_versions: list[Any] = field(factory=list)
+    titles: list[Any] = field(factory=list)
+
+
+def _bill(response: Response[Any]) -> Bill:
+    if response.status_code != HTTPStatus.OK or response.parsed is None or isinstance(response.parsed.bill, Unset):
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return response.parsed.bill
+
+
+def _count(reference: Union[Unset, ResourceCount]) -> int:
+    if isinstance(reference, Unset):
+        return 0
+    counts = (reference.count, reference.count_including_withdrawn_cosponsors)
+    return max((count for count in counts if isinstance(count, int)), default=0)
+
+
+def _plan(bill: Bill) -> list[tuple[str, int]]:
+    """The ``(sub-resource, offset)`` of every page to request, skipping sub-resources reported as empty"""
+    return [(name, offset) for name in SUB_RESOURCES for offset in range(0, _count(getattr(bill, name)), MAX_LIMIT)]
+
+
+def _extend(hydrated: HydratedBill, pages: dict[tuple[str, int], Page]) -> dict[str, int]:
+    """Add the records of ``pages``, returning the offsets to continue from where the last page has a next page"""
+    remaining: dict[str, int] = {}
+    for (name, _), page in sorted(pages.items()):
+        getattr(hydrated, name).extend(page.items)
+        if page.items and page.next_offset is not None:
+            remaining[name] = page.next_offset
+        else:
+            remaining.pop(name, None)
+    return remaining
+
+
+def _assemble(
+    args: tuple[int, str, int], bill: Bill, pages: dict[tuple[str, int], Page]
+) -> tuple[HydratedBill, dict[str, int]]:
+    """Build the hydrated bill, returning the offsets to continue from where the last planned page has a next page"""
+    hydrated = HydratedBill(*args, bill=bill)
+    return hydrated, _extend(hydrated, pages)
+
+
+def _plan_rest(pages: dict[tuple[str, int], Page]) -> list[tuple[str, int]]:
+    """The ``(sub-resource, offset)`` of the pages after each of ``pages``, up to the ``pagination.count`` it reports"""
+    return [
+        (name, offset)
+        for (name, _), page in pages.items()
+        if page.items and page.next_offset is not None and page.count is not None
+        for offset in range(page.next_offset, page.count, MAX_LIMIT)
+    ]
+
+
+def _fetch_page(endpoint: ModuleType, args: tuple[Any, ...], client: AuthenticatedClient, offset: int) -> Page:
+    return Page.from_response(endpoint.sync_detailed(*args, client=client, offset=offset, limit=MAX_LIMIT))
+
+
+def hydrate_bill(
+    congress: int,
+    bill_type: str,
+    bill_number: int,
+    *,
+    client: AuthenticatedClient,
+    concurrency: int = 8,
+    executor: Optional[Executor] = None,
+) -> HydratedBill:
+    """Fetch a bill and every page of its sub-resources
+
+    ``bill_details`` is requested first; its counts give the number of pages of each sub-resource, so every page of
+    every non-empty sub-resource is then requested concurrently. Should a sub-resource have grown since
+    ``bill_details`` was served, its remaining pages are followed one after another.
+
+    Args:
+        congress: The congress number, e.g. 117
+        bill_type: The bill type, e.g. ``hr``
+        bill_number: The bill number, e.g. 3076
+        client: The client to make requests with
+        concurrency: The maximum number of requests in flight
+        executor: An executor to run the requests in, shared with other hydrations; by default one with
+            ``concurrency`` threads is created for this bill
+
+    Raises:
+        errors.UnexpectedStatus: If any request is not answered successfully.
+        httpx.TimeoutException: If a request takes longer than Client.timeout.
+
+    Returns:
+        HydratedBill
+    """
+    args = (congress, bill_type, bill_number)
+    owned = executor is None
+    pool = ThreadPoolExecutor(max_workers=concurrency) if executor is None else executor
+    try:
+        bill = _bill(pool.submit(bill_details.sync_detailed, *args, client=client).result())
+        futures: dict[tuple[str, int], Future[Page]] = {
+            (name, offset): pool.submit(_fetch_page, SUB_RESOURCES[name], args, client, offset)
+            for name, offset in _plan(bill)
+        }
+        pages = {key: future.result() for key, future in futures.items()}
+    finally:
+        if owned:
+            pool.shutdown(cancel_futures=True)
+    hydrated, remaining = _assemble(args, bill, pages)
+    for name, offset in remaining.items():
+        getattr(hydrated, name).extend(paginate(SUB_RESOURCES[name], *args, client=client, offset=offset))
+    return hydrated
+
+
+async def ahydrate_bill(
+    congress: int,
+    bill_type: str,
+    bill_number: int,
+    *,
+    client: AuthenticatedClient,
+    concurrency: int = 8,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> HydratedBill:
+    """The async counterpart of ``hydrate_bill``
+
+    Every request is made under ``semaphore``, including those for a sub-resource that grew since ``bill_details`` was
+    served: its next page is requested first, and the pages after it, up to the count that page reports, concurrently.
+
+    Args:
+        semaphore: A semaphore limiting requests in flight, shared with other hydrations; by default one allowing
+            ``concurrency`` requests is created for this bill
+
+    Returns:
+        HydratedBill
+    """
+    limit = asyncio.Semaphore(concurrency) if semaphore is None else semaphore
+    args = (congress, bill_type, bill_number)
+
+    async def fetch_page(name: str, offset: int) -> Page:
+        async with limit:
+            response = await SUB_RESOURCES[name].asyncio_detailed(*args, client=client, offset=offset, limit=MAX_LIMIT)
+        return Page.from_response(response)
+
+    async def fetch_pages(plan: list[tuple[str, int]]) -> dict[tuple[str, int], Page]:
+        tasks = [asyncio.ensure_future(fetch_page(name, offset)) for name, offset in plan]
+        try:
+            return dict(zip(plan, await asyncio.gather(*tasks)))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async with limit:
+        bill = _bill(await bill_details.asyncio_detailed(*args, client=client))
+    hydrated, remaining = _assemble(args, bill, await fetch_pages(_plan(bill)))
+    while remaining:
+        pages = await fetch_pages(list(remaining.items()))
+        pages.update(await fetch_pages(_plan_rest(pages)))
+        remaining = _extend(hydrated, pages)
+    return hydrated
+
+
+def _bill_key(record: Any) -> tuple[str, int]:
+    if isinstance(record, dict):
+        return str(record["type"]).lower(), int(record["number"])
+    return str(record.type_).lower(), int(record.number)
+
+
+def hydrate_congress(
+    congress: int,
+    *,
+    client: AuthenticatedClient,
+    workers: int = 4,
+    concurrency: int = 16,
+    **kwargs: Any,
+) -> Iterator[HydratedBill]:
+    """Hydrate every bill of a congress, yielding bills in listing order
+
+    Bills are listed with ``bill_list_by_congress`` and hydrated by ``workers`` threads. At most ``2 * workers`` bills
+    are being hydrated or waiting to be yielded at a time, so memory stays bounded however large the congress is, and
+    every request shares one pool of ``concurrency`` threads.
+
+    Args:
+        congress: The congress number, e.g. 117
+        client: The client to make requests with
+        workers: The number of bills hydrated at once
+        concurrency: The maximum number of requests in flight across all bills
+        **kwargs: Additional arguments for ``bill_list_by_congress``, e.g. ``from_date_time``
+
+    Returns:
+        Iterator[HydratedBill]
+    """
+    requests = ThreadPoolExecutor(max_workers=concurrency)
+    bills = ThreadPoolExecutor(max_workers=workers)
+    window: deque[Future[HydratedBill]] = deque()
+    try:
+        for record in paginate(bill_list_by_congress, congress, client=client, **kwargs):
+            bill_type, bill_number = _bill_key(record)
+            window.append(
+                bills.submit(hydrate_bill, congress, bill_type, bill_number, client=client, executor=requests)
+            )
+            if len(window) >= 2 * workers:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+    finally:
+        bills.shutdown(cancel_futures=True)
+        requests.shutdown(cancel_futures=True)
+
+
+async def ahydrate_congress(
+    congress: int,
+    *,
+    client: AuthenticatedClient,
+    workers: int = 4,
+    concurrency: int = 16,
+    **kwargs: Any,
+) -> AsyncIterator[HydratedBill]:
+    """The async counterpart of ``hydrate_congress``
+
+    Bills are listed into a queue holding at most ``workers`` bills, which ``workers`` tasks take from. Hydrated bills
+    wait in a queue of at most ``workers`` as well, so the tasks stop when the consumer falls behind, and every request
+    shares one semaphore of ``concurrency``.
+
+    Returns:
+        AsyncIterator[HydratedBill]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    bills: asyncio.Queue[Optional[tuple[str, int]]] = asyncio.Queue(maxsize=workers)
+    results: asyncio.Queue[Union[HydratedBill, BaseException, None]] = asyncio.Queue(maxsize=workers)
+
+    async def produce() -> None:
+        async for record in apaginate(bill_list_by_congress, congress, client=client, **kwargs):
+            await bills.put(_bill_key(record))
+        for _ in range(workers):
+            await bills.put(None)
+
+    async def work() -> None:
+        while (key := await bills.get()) is not None:
+            bill_type, bill_number = key
+            await results.put(await ahydrate_bill(congress, bill_type, bill_number, client=client, semaphore=semaphore))
+        await results.put(None)
+
+    async def run(task: "asyncio.Task[None]") -> None:
+        try:
+            await task
+        except BaseException as error:
+            await results.put(error)
+
+    tasks = [asyncio.ensure_future(produce())] + [asyncio.ensure_future(work()) for _ in range(workers)]
+    watchers = [asyncio.ensure_future(run(task)) for task in tasks]
+    try:
+        finished = 0
+        while finished < workers:
+            result = await results.get()
+            if result is None:
+                finished += 1
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                yield result
+    finally:
+        for task in tasks + watchers:
+            task.cancel()
+
+
+__all__ = ["SUB_RESOURCES", "HydratedBill", "ahydrate_bill", "ahydrate_congress", "hydrate_bill", "hydrate_congress"]
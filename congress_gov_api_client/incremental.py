@@ -0,0 +1,340 @@
+"""Contains an incremental sync engine driven by the ``fromDateTime``/``toDateTime`` filters of the list endpoints"""
+
+import datetime
+import functools
+import sqlite3
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from types import ModuleType
+from typing import Any, Optional
+
+from attrs import define, field
+from dateutil.parser import isoparse
+
+from .client import AuthenticatedClient
+from .pagination import MAX_LIMIT, apaginate, paginate
+from .types import Unset
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    name TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen (
+    name TEXT NOT NULL,
+    record_key TEXT NOT NULL,
+    update_date TEXT NOT NULL,
+    PRIMARY KEY (name, record_key, update_date)
+);
+"""
+
+
+def format_datetime(value: datetime.datetime) -> str:
+    """Format a datetime the way the ``fromDateTime``/``toDateTime`` parameters expect, e.g. 2022-04-01T00:00:00Z"""
+    return value.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@functools.cache
+def attribute_name(name: str) -> str:
+    """The model attribute holding the field with JSON name ``name``, e.g. ``update_date`` for ``updateDate``"""
+    attribute = "".join(f"_{char.lower()}" if char.isupper() else char for char in name)
+    if attribute in ("type", "next", "format"):
+        attribute += "_"
+    return attribute
+
+
+def record_field(record: Any, name: str) -> Any:
+    """Read a field of a record by its JSON name, whether the record is a model or a dict"""
+    if isinstance(record, dict):
+        return record.get(name)
+    value = getattr(record, attribute_name(name), None)
+    return None if isinstance(value, Unset) else value
+
+
+def record_url(record: Any) -> str:
+    """The default record key: the ``url`` of the record, which is unique across the API
+
+    Raises:
+        ValueError: If the record has no ``url``, e.g. a bill summary; pass a ``key`` for such endpoints, as otherwise
+            every record would share one key and all but one of those updated together would be dropped.
+    """
+    url = record_field(record, "url")
+    if not url:
+        raise ValueError("Record has no url to identify it by; pass a key for the records of this endpoint")
+    return str(url)
+
+
+@define(frozen=True)
+class Checkpoint:
+    """Where a sync run ended; committing it advances the sync past every record of the run
+
+    Attributes:
+        name: The name of the sync
+        watermark: The ``toDateTime`` of the run, where the next run starts
+        seen: The ``(record key, updateDate)`` pairs the next run skips inside its overlap window
+    """
+
+    name: str
+    watermark: datetime.datetime
+    seen: frozenset[tuple[str, str]]
+
+
+@define
+class WatermarkStore:
+    """Keeps sync watermarks, and the records seen inside the overlap window, in a SQLite database
+
+    Attributes:
+        path: The path of the database file
+    """
+
+    path: str
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def get(self, name: str) -> Optional[datetime.datetime]:
+        """The watermark of a sync, or ``None`` if it has never completed"""
+        with self._lock:
+            row = self._connection.execute("SELECT watermark FROM watermarks WHERE name = ?", (name,)).fetchone()
+        return None if row is None else isoparse(row[0])
+
+    def seen(self, name: str) -> set[tuple[str, str]]:
+        """The ``(record key, updateDate)`` pairs already delivered inside the overlap window of a sync"""
+        with self._lock:
+            rows = self._connection.execute("SELECT record_key, update_date FROM seen WHERE name = ?", (name,))
+            return {(record_key, update_date) for record_key, update_date in rows}
+
+    def commit(self, name: str, watermark: datetime.datetime, seen: Iterable[tuple[str, str]]) -> None:
+        """Atomically advance a sync to ``watermark`` and replace its seen records"""
+        with self._lock, self._connection:
+            self.write(self._connection, Checkpoint(name, watermark, frozenset(seen)))
+
+    @staticmethod
+    def write(connection: sqlite3.Connection, checkpoint: Checkpoint) -> None:
+        """Write a checkpoint through another connection to the same database, without committing
+
+        This lets the owner of the data commit the checkpoint in the same transaction as the last records of the run.
+        """
+        connection.execute(
+            "INSERT OR REPLACE INTO watermarks VALUES (?, ?)",
+            (checkpoint.name, checkpoint.watermark.isoformat(timespec="seconds")),
+        )
+        connection.execute("DELETE FROM seen WHERE name = ?", (checkpoint.name,))
+        connection.executemany(
+            "INSERT OR IGNORE INTO seen VALUES (?, ?, ?)", ((checkpoint.name, *pair) for pair in checkpoint.seen)
+        )
+
+    def reset(self, name: str) -> None:
+        """Forget a sync so that its next run starts from scratch"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM watermarks WHERE name = ?", (name,))
+            self._connection.execute("DELETE FROM seen WHERE name = ?", (name,))
+
+
+@define
+class _Run:
+    """The state of one sync run: the window being fetched and the records delivered so far"""
+
+    name: str
+    until: datetime.datetime
+    overlap_start: datetime.datetime
+    key: Callable[[Any], str]
+    previously_seen: set[tuple[str, str]]
+    seen: set[tuple[str, str]] = field(factory=set)
+
+    def accept(self, record: Any) -> bool:
+        """Whether a record is new, remembering it if it falls inside the next run's overlap window"""
+        update_date = str(record_field(record, "updateDate") or "")
+        pair = (self.key(record), update_date)
+        if pair in self.previously_seen or pair in self.seen:
+            return False
+        if self.in_overlap(update_date):
+            self.seen.add(pair)
+        return True
+
+    def in_overlap(self, update_date: str) -> bool:
+        """Whether a record with this ``updateDate`` will be fetched again by the next run"""
+        try:
+            updated = isoparse(update_date)
+        except ValueError:
+            return True
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=datetime.timezone.utc)
+        return updated >= self.overlap_start
+
+
+@define
+class IncrementalSync:
+    """Fetches only the records updated since the previous run of each named sync
+
+    Every run requests ``fromDateTime`` = previous watermark - ``overlap`` up to ``toDateTime`` = now, so records
+    stamped late by clock skew between the API's servers are not missed. Records delivered by the previous run inside
+    the overlap window are skipped, and the watermark only advances once a run has been iterated to the end, so an
+    interrupted run is repeated rather than losing records.
+
+    Attributes:
+        store: Where watermarks are kept between runs
+        overlap: How far before the previous watermark each run starts
+    """
+
+    store: WatermarkStore
+    overlap: datetime.timedelta = datetime.timedelta(minutes=15)
+
+    def _start(
+        self, name: str, since: Optional[datetime.datetime], key: Callable[[Any], str]
+    ) -> tuple[_Run, dict[str, str]]:
+        watermark = self.store.get(name) or since
+        until = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        run = _Run(
+            name=name,
+            until=until,
+            overlap_start=until - self.overlap,
+            key=key,
+            previously_seen=self.store.seen(name) if watermark is not None else set(),
+        )
+        window = {"to_date_time": format_datetime(until)}
+        if watermark is not None:
+            window["from_date_time"] = format_datetime(watermark - self.overlap)
+        return run, window
+
+    def _checkpoint(self, run: _Run) -> Checkpoint:
+        carried = {pair for pair in run.previously_seen if run.in_overlap(pair[1])}
+        return Checkpoint(run.name, run.until, frozenset(run.seen | carried))
+
+    def _finish(self, run: _Run) -> None:
+        checkpoint = self._checkpoint(run)
+        self.store.commit(checkpoint.name, checkpoint.watermark, checkpoint.seen)
+
+    def run(
+        self,
+        name: str,
+        endpoint: ModuleType,
+        *args: Any,
+        client: AuthenticatedClient,
+        since: Optional[datetime.datetime] = None,
+        key: Callable[[Any], str] = record_url,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Yield the records of ``endpoint`` updated since the last completed run of the sync called ``name``
+
+        Args:
+            name: The name the watermark is stored under, e.g. ``"bills"``
+            endpoint: A list endpoint module accepting ``from_date_time``/``to_date_time``
+            *args: Path parameters for the endpoint
+            client: The client to make requests with
+            since: Where the first run starts; by default the first run fetches everything
+            key: Returns the identity of a record, used to skip duplicates; by default its ``url``, so endpoints whose
+                records have none, e.g. the summaries endpoints, need a key of their own
+            **kwargs: Additional arguments for ``paginate``
+
+        Returns:
+            Iterator[Any]
+        """
+        run, window = self._start(name, since, key)
+        for record in paginate(endpoint, *args, client=client, **window, **kwargs):
+            if run.accept(record):
+                yield record
+        self._finish(run)
+
+    async def arun(
+        self,
+        name: str,
+        endpoint: ModuleType,
+        *args: Any,
+        client: AuthenticatedClient,
+        since: Optional[datetime.datetime] = None,
+        key: Callable[[Any], str] = record_url,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """The async counterpart of ``run``; ``kwargs`` may include the fan-out arguments of ``apaginate``
+
+        Returns:
+            AsyncIterator[Any]
+        """
+        run, window = self._start(name, since, key)
+        async for record in apaginate(endpoint, *args, client=client, **window, **kwargs):
+            if run.accept(record):
+                yield record
+        self._finish(run)
+
+    def pages(
+        self,
+        name: str,
+        endpoint: ModuleType,
+        *args: Any,
+        client: AuthenticatedClient,
+        size: int = MAX_LIMIT,
+        since: Optional[datetime.datetime] = None,
+        key: Callable[[Any], str] = record_url,
+        **kwargs: Any,
+    ) -> Iterator[tuple[list[Any], Optional[Checkpoint]]]:
+        """Like ``run``, but yield the new records in pages and leave advancing the watermark to the caller
+
+        Every page comes with ``None`` except the last, which comes with the ``Checkpoint`` of the run and may be
+        empty. Store each page before asking for the next, and commit the checkpoint with the last page, e.g. with
+        ``WatermarkStore.write`` in the same transaction, so the watermark never passes records that were not stored.
+
+        Args:
+            name: The name the watermark is stored under, e.g. ``"bills"``
+            endpoint: A list endpoint module accepting ``from_date_time``/``to_date_time``
+            *args: Path parameters for the endpoint
+            client: The client to make requests with
+            size: The number of records per page
+            since: Where the first run starts; by default the first run fetches everything
+            key: Returns the identity of a record, used to skip duplicates; by default its ``url``, so endpoints whose
+                records have none, e.g. the summaries endpoints, need a key of their own
+            **kwargs: Additional arguments for ``paginate``
+
+        Returns:
+            Iterator[tuple[list[Any], Optional[Checkpoint]]]
+        """
+        run, window = self._start(name, since, key)
+        page: list[Any] = []
+        for record in paginate(endpoint, *args, client=client, **window, **kwargs):
+            if run.accept(record):
+                page.append(record)
+                if len(page) >= size:
+                    yield page, None
+                    page = []
+        yield page, self._checkpoint(run)
+
+    async def apages(
+        self,
+        name: str,
+        endpoint: ModuleType,
+        *args: Any,
+        client: AuthenticatedClient,
+        size: int = MAX_LIMIT,
+        since: Optional[datetime.datetime] = None,
+        key: Callable[[Any], str] = record_url,
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[list[Any], Optional[Checkpoint]]]:
+        """The async counterpart of ``pages``; ``kwargs`` may include the fan-out arguments of ``apaginate``
+
+        Returns:
+            AsyncIterator[tuple[list[Any], Optional[Checkpoint]]]
+        """
+        run, window = self._start(name, since, key)
+        page: list[Any] = []
+        async for record in apaginate(endpoint, *args, client=client, **window, **kwargs):
+            if run.accept(record):
+                page.append(record)
+                if len(page) >= size:
+                    yield page, None
+                    page = []
+        yield page, self._checkpoint(run)
+
+
+__all__ = [
+    "Checkpoint",
+    "IncrementalSync",
+    "WatermarkStore",
+    "attribute_name",
+    "format_datetime",
+    "record_field",
+    "record_url",
+]
@@ -0,0 +1,461 @@
+"""Contains per-operation request metrics and the transports that collect them
+
+Pass an ``Instrumentation`` as the ``instrumentation`` argument of a client. Without one no transport is added, so
+uninstrumented clients pay nothing.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, Optional
+
+import httpx
+from attrs import define, evolve, field
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""The upper bounds of the latency histogram buckets, in seconds"""
+
+UNKNOWN_OPERATION = "unknown"
+"""The operation of requests whose path matches no route of the API"""
+
+_ATTEMPTS = "congress_gov_api_client.attempts"
+
+
+@functools.lru_cache(maxsize=4096)
+def operation_id(path: str) -> str:
+    """The ``operationId`` of a URL path, or ``UNKNOWN_OPERATION``"""
+    # Imported on first use: building the route table compiles a pattern per endpoint
+    from .routes import match_route
+
+    found = match_route(path)
+    return UNKNOWN_OPERATION if found is None else found[0].operation_id
+
+
+@define
+class RequestEvent:
+    """One request as seen by the client, including the layers that may have answered it without the network
+
+    Attributes:
+        operation_id: The ``operationId`` of the request
+        method: The HTTP method
+        url: The request URL
+        status: The status code returned to the caller, or ``None`` if the request failed
+        error: The name of the exception the request failed with, if any
+        start_time_ns: When the request started, in nanoseconds since the epoch
+        duration: Seconds from the request being sent until its body was read
+        bytes_sent: The size of the request body
+        bytes_received: The size of the response body
+        attempts: The number of times the request went to the network; 0 when a cache answered it
+        network_status: The status of the last network attempt, e.g. 304 for a revalidated cache entry
+    """
+
+    operation_id: str
+    method: str
+    url: str
+    status: Optional[int]
+    error: Optional[str]
+    start_time_ns: int
+    duration: float
+    bytes_sent: int
+    bytes_received: int
+    attempts: int
+    network_status: Optional[int] = None
+
+    @property
+    def retries(self) -> int:
+        """The number of attempts after the first"""
+        return max(0, self.attempts - 1)
+
+    @property
+    def cache_hit(self) -> bool:
+        """Whether the response came from a cache, or from an identical request already in flight"""
+        return self.attempts == 0 and self.error is None
+
+
+@define
+class OperationMetrics:
+    """Aggregated metrics of one operation
+
+    Attributes:
+        buckets: The upper bounds of the latency histogram buckets, in seconds
+        bucket_counts: The number of requests in each bucket, not cumulative, plus one for slower requests
+        latency_sum: The total latency, in seconds
+        requests: The number of requests
+        statuses: The number of responses by status code
+        errors: The number of failed requests by exception name
+        bytes_sent: The total size of request bodies
+        bytes_received: The total size of response bodies
+        retries: The total number of retries
+        cache_hits: The number of requests answered without the network
+        revalidations: The number of requests answered from a cache after a 304 Not Modified
+    """
+
+    buckets: tuple[float, ...]
+    bucket_counts: list[int] = field()
+    latency_sum: float = 0.0
+    requests: int = 0
+    statuses: dict[int, int] = field(factory=dict)
+    errors: dict[str, int] = field(factory=dict)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    revalidations: int = 0
+
+    @bucket_counts.default
+    def _bucket_counts(self) -> list[int]:
+        return [0] * (len(self.buckets) + 1)
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """The share of requests answered without the network"""
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+    def quantile(self, q: float) -> float:
+        """An estimate of a latency quantile, e.g. ``0.99``, interpolated within its histogram bucket"""
+        rank = q * self.requests
+        seen = 0
+        for index, count in enumerate(self.bucket_counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return 0.0
+
+    def add(self, event: RequestEvent) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, event.duration)] += 1
+        self.latency_sum += event.duration
+        self.requests += 1
+        if event.status is not None:
+            self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+        if event.error is not None:
+            self.errors[event.error] = self.errors.get(event.error, 0) + 1
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.retries += event.retries
+        if event.cache_hit:
+            self.cache_hits += 1
+        elif event.network_status == 304 and event.status == 200:
+            self.revalidations += 1
+
+    def copy(self) -> "OperationMetrics":
+        return evolve(
+            self, bucket_counts=list(self.bucket_counts), statuses=dict(self.statuses), errors=dict(self.errors)
+        )
+
+
+@define
+class Instrumentation:
+    """Collects the metrics of every request sent by the clients it is passed to, by ``operationId``
+
+    Attributes:
+        buckets: The upper bounds of the latency histogram buckets, in seconds
+        exporters: Called with every ``RequestEvent``, after it has been aggregated, e.g. an
+            ``OpenTelemetryExporter``. Exporters run on the thread or event loop that sent the request, so they
+            should not block.
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    exporters: list[Callable[[RequestEvent], None]] = field(factory=list)
+    _operations: dict[str, OperationMetrics] = field(init=False, factory=dict)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def record(self, event: RequestEvent) -> None:
+        """Aggregate a request and pass it on to the exporters"""
+        with self._lock:
+            metrics = self._operations.get(event.operation_id)
+            if metrics is None:
+                metrics = self._operations[event.operation_id] = OperationMetrics(self.buckets)
+            metrics.add(event)
+        for exporter in self.exporters:
+            exporter(event)
+
+    def snapshot(self) -> dict[str, OperationMetrics]:
+        """A copy of the metrics of every operation that has been requested"""
+        with self._lock:
+            return {name: metrics.copy() for name, metrics in self._operations.items()}
+
+    def reset(self) -> None:
+        """Forget every request recorded so far"""
+        with self._lock:
+            self._operations.clear()
+
+    def prometheus(self, prefix: str = "congress_gov") -> str:
+        """The metrics in the Prometheus text exposition format, labeled by ``operation``"""
+        snapshot = sorted(self.snapshot().items())
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Time from sending a request until its body was read.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for name, metrics in snapshot:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), metrics.bucket_counts):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{operation="{name}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{prefix}_request_duration_seconds_sum{{operation="{name}"}} {metrics.latency_sum}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{operation="{name}"}} {metrics.requests}')
+        counters = [
+            ("responses_total", "Responses by status code.", lambda metrics: metrics.statuses, "status"),
+            ("errors_total", "Requests that raised, by exception.", lambda metrics: metrics.errors, "error"),
+        ]
+        for metric, help_, values, label in counters:
+            lines += [f"# HELP {prefix}_{metric} {help_}", f"# TYPE {prefix}_{metric} counter"]
+            for name, metrics in snapshot:
+                for value, count in sorted(values(metrics).items()):
+                    lines.append(f'{prefix}_{metric}{{operation="{name}",{label}="{value}"}} {count}')
+        totals = [
+            ("sent_bytes_total", "Request body bytes.", "bytes_sent"),
+            ("received_bytes_total", "Response body bytes.", "bytes_received"),
+            ("retries_total", "Requests sent again after a failure.", "retries"),
+            ("cache_hits_total", "Requests answered without the network.", "cache_hits"),
+            ("cache_revalidations_total", "Requests answered from a cache after a 304.", "revalidations"),
+        ]
+        for metric, help_, attribute in totals:
+            lines += [f"# HELP {prefix}_{metric} {help_}", f"# TYPE {prefix}_{metric} counter"]
+            for name, metrics in snapshot:
+                lines.append(f'{prefix}_{metric}{{operation="{name}"}} {getattr(metrics, attribute)}')
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryExporter:
+    """Turns every request into an OpenTelemetry span named after its ``operationId``
+
+    Spans are created when a request completes, with its start time, as children of the span current at that point.
+    Requires the optional ``opentelemetry-api`` dependency, installed with the ``otel`` extra.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetry export requires opentelemetry-api: pip install 'congress_gov_api_client[otel]'"
+            )
+        self._tracer = trace.get_tracer(__name__) if tracer is None else tracer
+
+    def __call__(self, event: RequestEvent) -> None:
+        attributes: dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "congress_gov.operation_id": event.operation_id,
+            "congress_gov.attempts": event.attempts,
+            "congress_gov.cache_hit": event.cache_hit,
+            "http.response.body.size": event.bytes_received,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.error is not None:
+            attributes["error.type"] = event.error
+        span = self._tracer.start_span(
+            event.operation_id, kind=trace.SpanKind.CLIENT, attributes=attributes, start_time=event.start_time_ns
+        )
+        if event.error is not None or (event.status is not None and event.status >= 500):
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end(end_time=event.start_time_ns + int(event.duration * 1e9))
+
+
+@define
+class _Request:
+    """The state of a request between being sent and its body being read"""
+
+    instrumentation: Instrumentation
+    request: httpx.Request
+    start: float = field(factory=time.perf_counter)
+    start_time_ns: int = field(factory=time.time_ns)
+    attempts: list[Optional[int]] = field(factory=list)
+    recorded: bool = False
+
+    def __attrs_post_init__(self) -> None:
+        self.request.extensions = {**self.request.extensions, _ATTEMPTS: self.attempts}
+
+    def finish(self, status: Optional[int], bytes_received: int, error: Optional[BaseException] = None) -> None:
+        if self.recorded:
+            return
+        self.recorded = True
+        request = self.request
+        self.instrumentation.record(
+            RequestEvent(
+                operation_id=operation_id(request.url.path),
+                method=request.method,
+                url=str(request.url),
+                status=status,
+                error=None if error is None else type(error).__name__,
+                start_time_ns=self.start_time_ns,
+                duration=time.perf_counter() - self.start,
+                bytes_sent=int(request.headers.get("Content-Length") or 0),
+                bytes_received=bytes_received,
+                attempts=len(self.attempts),
+                network_status=self.attempts[-1] if self.attempts else None,
+            )
+        )
+
+
+class _ObservedStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, state: _Request, status: int) -> None:
+        self._stream = stream
+        self._state = state
+        self._status = status
+        self._bytes = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._stream:
+                self._bytes += len(chunk)
+                yield chunk
+        except BaseException as error:
+            self._state.finish(self._status, self._bytes, error)
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._state.finish(self._status, self._bytes)
+
+
+class _AsyncObservedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, state: _Request, status: int) -> None:
+        self._stream = stream
+        self._state = state
+        self._status = status
+        self._bytes = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                self._bytes += len(chunk)
+                yield chunk
+        except BaseException as error:
+            self._state.finish(self._status, self._bytes, error)
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._state.finish(self._status, self._bytes)
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """Wraps the outermost ``httpx.BaseTransport`` of a client and records every request in ``instrumentation``
+
+    A request is recorded once its body has been read, so its latency includes the transfer.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, instrumentation: Instrumentation) -> None:
+        self._transport = transport
+        self._instrumentation = instrumentation
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        state = _Request(self._instrumentation, request)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException as error:
+            state.finish(None, 0, error)
+            raise
+        if response.is_closed:
+            state.finish(response.status_code, len(response.content))
+        else:
+            response.stream = _ObservedStream(response.stream, state, response.status_code)  # type: ignore[arg-type]
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps the outermost ``httpx.AsyncBaseTransport`` of a client and records every request in ``instrumentation``
+
+    A request is recorded once its body has been read, so its latency includes the transfer.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, instrumentation: Instrumentation) -> None:
+        self._transport = transport
+        self._instrumentation = instrumentation
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = _Request(self._instrumentation, request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as error:
+            state.finish(None, 0, error)
+            raise
+        if response.is_closed:
+            state.finish(response.status_code, len(response.content))
+        else:
+            response.stream = _AsyncObservedStream(response.stream, state, response.status_code)  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class AttemptTransport(httpx.BaseTransport):
+    """Wraps the innermost ``httpx.BaseTransport`` of an instrumented client and counts the requests that reach the
+    network, from which retries and cache hits are derived
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = request.extensions.get(_ATTEMPTS)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            if attempts is not None:
+                attempts.append(None)
+            raise
+        if attempts is not None:
+            attempts.append(response.status_code)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncAttemptTransport(httpx.AsyncBaseTransport):
+    """Wraps the innermost ``httpx.AsyncBaseTransport`` of an instrumented client and counts the requests that reach
+    the network, from which retries and cache hits are derived
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = request.extensions.get(_ATTEMPTS)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            if attempts is not None:
+                attempts.append(None)
+            raise
+        if attempts is not None:
+            attempts.append(response.status_code)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "UNKNOWN_OPERATION",
+    "AsyncAttemptTransport",
+    "AsyncInstrumentedTransport",
+    "AttemptTransport",
+    "Instrumentation",
+    "InstrumentedTransport",
+    "OpenTelemetryExporter",
+    "OperationMetrics",
+    "RequestEvent",
+    "operation_id",
+]
@@ -0,0 +1,51 @@
+"""Contains helpers that make packages import their modules on first use (PEP 562)"""
+
+import importlib
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_submodules(package: str, names: Iterable[str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """The module ``__getattr__`` and ``__dir__`` of a package whose submodules are imported on first access
+
+    Once imported, a submodule is an attribute of its package, so ``__getattr__`` is only called once per submodule.
+
+    Args:
+        package: The ``__name__`` of the package
+        names: The names of the submodules
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]
+    """
+    return lazy_attributes(package, {name: name for name in names})
+
+
+def lazy_attributes(package: str, modules: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """The module ``__getattr__`` and ``__dir__`` of a package re-exporting names from submodules imported on first
+    access
+
+    Args:
+        package: The ``__name__`` of the package
+        modules: The submodule each name is defined in; a name mapped to itself is the submodule
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        imported = importlib.import_module(f"{package}.{module}")
+        value = imported if module == name else getattr(imported, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *modules})
+
+    return __getattr__, __dir__
+
+
+__all__ = ["lazy_attributes", "lazy_submodules"]
@@ -0,0 +1,203 @@
+"""Contains a bounded in-memory response cache that coalesces identical in-flight requests"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+from .cache import CacheEntry, cache_key
+
+
+@define
+class LRUStats:
+    """Counters of an ``LRUCache``
+
+    Attributes:
+        hits: Requests answered from memory
+        misses: Requests that went to the network
+        coalesced: Requests that shared the round-trip of an identical request already in flight
+        evictions: Entries dropped to stay within the size limits
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+@define
+class LRUCache:
+    """Keeps the most recently used successful GET responses in memory, bounded by entry count and total body size
+
+    Attributes:
+        max_entries: The maximum number of responses kept
+        max_bytes: The maximum total size of the kept response bodies
+        ttl: Seconds a response is served from memory, or ``None`` to keep it until it is evicted
+    """
+
+    max_entries: int = 1024
+    max_bytes: int = 64 * 1024 * 1024
+    ttl: Optional[float] = 300.0
+    _entries: "OrderedDict[str, CacheEntry]" = field(init=False, factory=OrderedDict)
+    _bytes: int = field(init=False, default=0)
+    _stats: LRUStats = field(init=False, factory=LRUStats)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_fresh:
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        size = len(entry.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+                self._stats.evictions += 1
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.content)
+
+    def record_coalesced(self) -> None:
+        with self._lock:
+            self._stats.misses -= 1
+            self._stats.coalesced += 1
+
+    def stats(self) -> LRUStats:
+        """A snapshot of the hit, miss, coalesced and eviction counters"""
+        with self._lock:
+            return LRUStats(self._stats.hits, self._stats.misses, self._stats.coalesced, self._stats.evictions)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+@define
+class _Flight:
+    done: threading.Event = field(factory=threading.Event)
+    entry: Optional[CacheEntry] = None
+    error: Optional[BaseException] = None
+
+
+class CoalescingTransport(httpx.BaseTransport):
+    """Wraps an ``httpx.BaseTransport``, answering GET requests from ``cache`` and letting concurrent identical
+    requests from other threads share a single round-trip
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, cache: LRUCache) -> None:
+        self._transport = transport
+        self._cache = cache
+        self._in_flight: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return self._transport.handle_request(request)
+        key = cache_key(request)
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry.to_response(request)
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._in_flight[key] = _Flight()
+        if not leader:
+            self._cache.record_coalesced()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.entry is not None
+            return flight.entry.to_response(request)
+        try:
+            response = self._transport.handle_request(request)
+            response.read()
+            response.close()
+            flight.entry = CacheEntry.from_response(response, self._cache.ttl)
+            if response.status_code == 200:
+                self._cache.put(key, flight.entry)
+            return response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCoalescingTransport(httpx.AsyncBaseTransport):
+    """Wraps an ``httpx.AsyncBaseTransport``, answering GET requests from ``cache`` and letting concurrent identical
+    requests from other tasks share a single round-trip
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: LRUCache) -> None:
+        self._transport = transport
+        self._cache = cache
+        self._in_flight: dict[str, asyncio.Future[tuple[CacheEntry, httpx.Response]]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+        key = cache_key(request)
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry.to_response(request)
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self._cache.record_coalesced()
+            entry, _ = await asyncio.shield(flight)
+            return entry.to_response(request)
+        # The round-trip runs in a task of its own, so cancelling the request that started it leaves it running for the
+        # requests waiting on it
+        flight = self._in_flight[key] = asyncio.ensure_future(self._fetch(key, request))
+        flight.add_done_callback(_consume_exception)
+        _, response = await asyncio.shield(flight)
+        return response
+
+    async def _fetch(self, key: str, request: httpx.Request) -> tuple[CacheEntry, httpx.Response]:
+        try:
+            response = await self._transport.handle_async_request(request)
+            await response.aread()
+            await response.aclose()
+            entry = CacheEntry.from_response(response, self._cache.ttl)
+            if response.status_code == 200:
+                self._cache.put(key, entry)
+            return entry, response
+        finally:
+            del self._in_flight[key]
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _consume_exception(future: "asyncio.Future[tuple[CacheEntry, httpx.Response]]") -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+__all__ = ["AsyncCoalescingTransport", "CoalescingTransport", "LRUCache", "LRUStats"]
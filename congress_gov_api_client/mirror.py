@@ -0,0 +1,469 @@
+"""Contains a local SQLite mirror of bills, amendments, members, committees and nominations
+
+Each table is filled from a list endpoint by an ``IncrementalSync``, so after the first run only records updated since
+the previous one are requested. Records are upserted a page at a time, each page in one transaction.
+"""
+
+import asyncio
+import datetime
+import importlib
+import sqlite3
+import threading
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from attrs import define, field
+
+from .client import AuthenticatedClient
+from .export import Column
+from .incremental import Checkpoint, IncrementalSync, WatermarkStore
+
+
+@define(frozen=True)
+class ChildTable:
+    """Rows nested in a record, e.g. the terms of a member, stored in their own table keyed by the parent's key
+
+    Attributes:
+        name: The table name
+        path: The JSON names leading to the list of rows inside a parent record, e.g. ``("terms", "item")``
+        columns: The columns read from each row; the parent's key columns come first and are not listed
+        key: The columns that, with the parent's key, identify a row
+    """
+
+    name: str
+    path: Column
+    columns: tuple[Column, ...]
+    key: tuple[str, ...]
+
+
+@define(frozen=True)
+class Table:
+    """A mirrored table and the list endpoint it is synced from
+
+    Attributes:
+        name: The table name
+        endpoint: The list endpoint accepting ``fromDateTime``, relative to ``congress_gov_api_client.api``
+        columns: The columns, in table order
+        key: The primary key columns
+        children: Tables of rows nested in each record, replaced whenever the record is
+    """
+
+    name: str
+    endpoint: str
+    columns: tuple[Column, ...]
+    key: tuple[str, ...]
+    children: tuple[ChildTable, ...] = ()
+
+
+def _latest_action() -> tuple[Column, ...]:
+    return (
+        Column("latest_action_date", ("latestAction", "actionDate"), "date"),
+        Column("latest_action_text", ("latestAction", "text")),
+    )
+
+
+BILLS = Table(
+    name="bills",
+    endpoint="bill.bill_list_all",
+    columns=(
+        Column("congress", ("congress",), "int"),
+        Column("type", ("type",)),
+        Column("number", ("number",)),
+        Column("title", ("title",)),
+        Column("origin_chamber", ("originChamber",)),
+        Column("origin_chamber_code", ("originChamberCode",)),
+        *_latest_action(),
+        Column("update_date", ("updateDate",)),
+        Column("update_date_including_text", ("updateDateIncludingText",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+    key=("congress", "type", "number"),
+)
+
+AMENDMENTS = Table(
+    name="amendments",
+    endpoint="amendments.amendment",
+    columns=(
+        Column("congress", ("congress",), "int"),
+        Column("type", ("type",)),
+        Column("number", ("number",)),
+        Column("description", ("description",)),
+        Column("purpose", ("purpose",)),
+        *_latest_action(),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+    key=("congress", "type", "number"),
+)
+
+MEMBERS = Table(
+    name="members",
+    endpoint="member.member_list",
+    columns=(
+        Column("bioguide_id", ("bioguideId",)),
+        Column("name", ("name",)),
+        Column("party_name", ("partyName",)),
+        Column("state", ("state",)),
+        Column("district", ("district",), "int"),
+        Column("image_url", ("depiction", "imageUrl")),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+    key=("bioguide_id",),
+    children=(
+        ChildTable(
+            name="member_terms",
+            path=Column("terms", ("terms", "item")),
+            columns=(
+                Column("chamber", ("chamber",)),
+                Column("start_year", ("startYear",), "int"),
+                Column("end_year", ("endYear",), "int"),
+            ),
+            key=("chamber", "start_year"),
+        ),
+    ),
+)
+
+COMMITTEES = Table(
+    name="committees",
+    endpoint="committee.committee_list",
+    columns=(
+        Column("system_code", ("systemCode",)),
+        Column("name", ("name",)),
+        Column("chamber", ("chamber",)),
+        Column("committee_type_code", ("committeeTypeCode",)),
+        Column("parent_system_code", ("parent", "systemCode")),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+    key=("system_code",),
+)
+
+NOMINATIONS = Table(
+    name="nominations",
+    endpoint="nomination.nomination_list",
+    columns=(
+        Column("congress", ("congress",), "int"),
+        Column("number", ("number",), "int"),
+        Column("part_number", ("partNumber",)),
+        Column("citation", ("citation",)),
+        Column("description", ("description",)),
+        Column("organization", ("organization",)),
+        Column("received_date", ("receivedDate",), "date"),
+        Column("is_civilian", ("nominationType", "isCivilian"), "bool"),
+        Column("is_military", ("nominationType", "isMilitary"), "bool"),
+        *_latest_action(),
+        Column("update_date", ("updateDate",), "timestamp"),
+        Column("url", ("url",)),
+    ),
+    key=("congress", "number", "part_number"),
+)
+
+TABLES: dict[str, Table] = {table.name: table for table in (BILLS, AMENDMENTS, MEMBERS, COMMITTEES, NOMINATIONS)}
+"""Every mirrored table by name"""
+
+_SQL_TYPES = {"int": "INTEGER", "bool": "INTEGER"}
+
+
+def _create(name: str, columns: Iterable[Column], key: Iterable[str]) -> str:
+    definitions = ", ".join(f"{column.name} {_SQL_TYPES.get(column.kind, 'TEXT')}" for column in columns)
+    return f"CREATE TABLE IF NOT EXISTS {name} ({definitions}, PRIMARY KEY ({', '.join(key)}))"
+
+
+def _sql_value(column: Column, record: Any) -> Any:
+    value = column.value(record)
+    if value is None:
+        return None
+    if column.kind == "int":
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    if column.kind == "bool":
+        return int(bool(value))
+    return value if isinstance(value, (str, int, float)) else str(value)
+
+
+@define
+class _Statements:
+    """The SQL of one table, built once"""
+
+    upsert: str
+    delete_children: list[str]
+    insert_children: list[str]
+
+    @classmethod
+    def build(cls, table: Table) -> "_Statements":
+        names = [column.name for column in table.columns]
+        updates = ", ".join(f"{name} = excluded.{name}" for name in names if name not in table.key)
+        upsert = (
+            f"INSERT INTO {table.name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT ({', '.join(table.key)}) DO UPDATE SET {updates}"
+        )
+        parent_key = " AND ".join(f"{name} = ?" for name in table.key)
+        delete = [f"DELETE FROM {child.name} WHERE {parent_key}" for child in table.children]
+        insert = [
+            f"INSERT OR REPLACE INTO {child.name} VALUES ({', '.join('?' * (len(table.key) + len(child.columns)))})"
+            for child in table.children
+        ]
+        return cls(upsert, delete, insert)
+
+
+@define
+class SyncStats:
+    """The outcome of syncing one table
+
+    Attributes:
+        table: The table name
+        rows: The number of records upserted
+        pages: The number of transactions committed
+        watermark: The watermark the sync advanced to
+    """
+
+    table: str
+    rows: int = 0
+    pages: int = 0
+    watermark: Optional[datetime.datetime] = None
+
+
+@define
+class Mirror:
+    """A local SQLite mirror of Congress.gov
+
+    The database is opened in WAL mode, so queries can run while a sync writes. Sync watermarks are kept in the same
+    file, in the tables of ``incremental.WatermarkStore``, and committed in the same transaction as the last page of a
+    sync: a sync that is interrupted repeats its window on the next run, which is harmless as every write is an upsert.
+
+    Attributes:
+        path: The path of the database file
+    """
+
+    path: str
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+    _statements: dict[str, _Statements] = field(init=False, factory=dict)
+    _sync: IncrementalSync = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for table in TABLES.values():
+                self._connection.execute(_create(table.name, table.columns, table.key))
+                for child in table.children:
+                    columns = (*(Column(name, (), _column(table, name).kind) for name in table.key), *child.columns)
+                    self._connection.execute(_create(child.name, columns, (*table.key, *child.key)))
+                self._statements[table.name] = _Statements.build(table)
+            self._connection.execute("CREATE INDEX IF NOT EXISTS members_state ON members (state, district)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS committees_parent ON committees (parent_system_code)")
+        self._sync = IncrementalSync(WatermarkStore(self.path))
+
+    def upsert(self, table: str, records: Iterable[Any]) -> int:
+        """Insert or update records of a table in one transaction, replacing their child rows
+
+        When several records share a key, the last one wins.
+
+        Args:
+            table: The table name, e.g. ``bills``
+            records: Records of the table's endpoint, as models or dicts
+
+        Returns:
+            int: The number of records written
+        """
+        return self._upsert(table, records)
+
+    def _upsert(self, table: str, records: Iterable[Any], checkpoint: Optional[Checkpoint] = None) -> int:
+        spec = TABLES[table]
+        statements = self._statements[table]
+        key_indexes = [index for index, column in enumerate(spec.columns) if column.name in spec.key]
+        latest: dict[tuple[Any, ...], tuple[tuple[Any, ...], Any]] = {}
+        for record in records:
+            row = tuple(_sql_value(column, record) for column in spec.columns)
+            latest[tuple(row[index] for index in key_indexes)] = (row, record)
+        with self._lock, self._connection:
+            self._connection.executemany(statements.upsert, [row for row, _ in latest.values()])
+            for child, delete, insert in zip(spec.children, statements.delete_children, statements.insert_children):
+                self._connection.executemany(delete, latest)
+                self._connection.executemany(insert, _child_rows(child, latest))
+            if checkpoint is not None:
+                WatermarkStore.write(self._connection, checkpoint)
+        return len(latest)
+
+    def sync(
+        self,
+        table: str,
+        *,
+        client: AuthenticatedClient,
+        since: Optional[datetime.datetime] = None,
+        **kwargs: Any,
+    ) -> SyncStats:
+        """Fetch the records of a table updated since its last sync and upsert them, a page per transaction
+
+        Args:
+            table: The table name, e.g. ``bills``
+            client: The client to make requests with
+            since: Where the first sync starts; by default it fetches everything
+            **kwargs: Additional arguments for ``IncrementalSync.pages``
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+
+        Returns:
+            SyncStats
+        """
+        stats = SyncStats(table)
+        endpoint = _endpoint(table)
+        for page, checkpoint in self._sync.pages(f"mirror.{table}", endpoint, client=client, since=since, **kwargs):
+            stats.rows += self._upsert(table, page, checkpoint)
+            stats.pages += 1
+        stats.watermark = self.watermark(table)
+        return stats
+
+    async def async_sync(
+        self,
+        table: str,
+        *,
+        client: AuthenticatedClient,
+        since: Optional[datetime.datetime] = None,
+        **kwargs: Any,
+    ) -> SyncStats:
+        """The async counterpart of ``sync``; ``kwargs`` may include the fan-out arguments of ``apaginate``, and
+        writes run in a worker thread so they do not block the event loop
+
+        Returns:
+            SyncStats
+        """
+        stats = SyncStats(table)
+        endpoint = _endpoint(table)
+        pages = self._sync.apages(f"mirror.{table}", endpoint, client=client, since=since, **kwargs)
+        async for page, checkpoint in pages:
+            stats.rows += await asyncio.to_thread(self._upsert, table, page, checkpoint)
+            stats.pages += 1
+        stats.watermark = self.watermark(table)
+        return stats
+
+    def sync_all(self, *, client: AuthenticatedClient, **kwargs: Any) -> list[SyncStats]:
+        """Sync every table in turn, then checkpoint the write-ahead log
+
+        Returns:
+            list[SyncStats]
+        """
+        results = [self.sync(table, client=client, **kwargs) for table in TABLES]
+        self.checkpoint()
+        return results
+
+    def watermark(self, table: str) -> Optional[datetime.datetime]:
+        """When the last completed sync of a table started, or ``None`` if it has never completed"""
+        return self._sync.store.get(f"mirror.{table}")
+
+    def reset(self, table: str) -> None:
+        """Forget the watermark of a table so that its next sync fetches everything again; rows are kept"""
+        self._sync.store.reset(f"mirror.{table}")
+
+    def checkpoint(self) -> None:
+        """Copy the write-ahead log into the database file and truncate it"""
+        with self._lock:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def query(self, sql: str, parameters: Iterable[Any] = ()) -> list[dict[str, Any]]:
+        """Run a read-only query, returning rows as dicts"""
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, tuple(parameters))]
+
+    def _one(self, sql: str, parameters: tuple[Any, ...]) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(sql, parameters).fetchone()
+        return None if row is None else dict(row)
+
+    def count(self, table: str) -> int:
+        """The number of rows of a table"""
+        if table not in TABLES and table not in {child.name for spec in TABLES.values() for child in spec.children}:
+            raise KeyError(table)
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def bill(self, congress: int, bill_type: str, bill_number: int) -> Optional[dict[str, Any]]:
+        """A bill by its congress, type (e.g. ``hr``) and number"""
+        return self._one(
+            "SELECT * FROM bills WHERE congress = ? AND type = ? AND number = ?",
+            (congress, bill_type.upper(), str(bill_number)),
+        )
+
+    def amendment(self, congress: int, amendment_type: str, amendment_number: int) -> Optional[dict[str, Any]]:
+        """An amendment by its congress, type (e.g. ``samdt``) and number"""
+        return self._one(
+            "SELECT * FROM amendments WHERE congress = ? AND type = ? AND number = ?",
+            (congress, amendment_type.upper(), str(amendment_number)),
+        )
+
+    def member(self, bioguide_id: str) -> Optional[dict[str, Any]]:
+        """A member by bioguide ID, with their terms under ``terms``"""
+        member = self._one("SELECT * FROM members WHERE bioguide_id = ?", (bioguide_id,))
+        if member is not None:
+            member["terms"] = self.query(
+                "SELECT chamber, start_year, end_year FROM member_terms WHERE bioguide_id = ? ORDER BY start_year",
+                (bioguide_id,),
+            )
+        return member
+
+    def members_by_state(self, state: str, district: Optional[int] = None) -> list[dict[str, Any]]:
+        """The members of a state (its full name, e.g. ``Michigan``), optionally of one district"""
+        if district is None:
+            return self.query("SELECT * FROM members WHERE state = ? ORDER BY name", (state,))
+        return self.query("SELECT * FROM members WHERE state = ? AND district = ? ORDER BY name", (state, district))
+
+    def committee(self, system_code: str) -> Optional[dict[str, Any]]:
+        """A committee by system code, e.g. ``hspw00``"""
+        return self._one("SELECT * FROM committees WHERE system_code = ?", (system_code.lower(),))
+
+    def subcommittees(self, system_code: str) -> list[dict[str, Any]]:
+        """The subcommittees of a committee"""
+        return self.query("SELECT * FROM committees WHERE parent_system_code = ? ORDER BY name", (system_code.lower(),))
+
+    def nomination(self, congress: int, number: int, part_number: str = "00") -> Optional[dict[str, Any]]:
+        """A nomination, or one part of a partitioned nomination, by congress and number"""
+        return self._one(
+            "SELECT * FROM nominations WHERE congress = ? AND number = ? AND part_number = ?",
+            (congress, number, part_number),
+        )
+
+    def updated_since(self, table: str, since: str) -> list[dict[str, Any]]:
+        """The rows of a table whose ``update_date`` is at or after ``since`` (ISO 8601), newest first"""
+        if table not in TABLES:
+            raise KeyError(table)
+        return self.query(f"SELECT * FROM {table} WHERE update_date >= ? ORDER BY update_date DESC", (since,))
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
+
+
+def _column(table: Table, name: str) -> Column:
+    return next(column for column in table.columns if column.name == name)
+
+
+def _endpoint(table: str) -> Any:
+    return importlib.import_module(f"{__package__}.api.{TABLES[table].endpoint}")
+
+
+def _child_rows(child: ChildTable, latest: dict[tuple[Any, ...], tuple[Any, Any]]) -> Iterable[tuple[Any, ...]]:
+    for key, (_, record) in latest.items():
+        for item in child.path.value(record) or ():
+            yield (*key, *(_sql_value(column, item) for column in child.columns))
+
+
+__all__ = [
+    "AMENDMENTS",
+    "BILLS",
+    "COMMITTEES",
+    "MEMBERS",
+    "NOMINATIONS",
+    "TABLES",
+    "ChildTable",
+    "Mirror",
+    "SyncStats",
+    "Table",
+]
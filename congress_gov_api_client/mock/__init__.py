@@ -0,0 +1,15 @@
+"""A local mock of the Congress.gov API for offline tests and benchmarks"""
+
+from .http import MockServer
+from .server import BASE_URL, MockAPI, MockAPITransport, MockResponse, MockStats, load_examples, mock_client
+
+__all__ = (
+    "BASE_URL",
+    "MockAPI",
+    "MockAPITransport",
+    "MockResponse",
+    "MockServer",
+    "MockStats",
+    "load_examples",
+    "mock_client",
+)
@@ -0,0 +1,139 @@
+"""Extracts the example responses embedded in the descriptions of ``openapi.yml`` into ``examples.json``
+
+Run with ``python -m congress_gov_api_client.mock.extract openapi.yml``; requires PyYAML. The examples are written by
+hand and many are not valid JSON, so each is repaired: trailing commas are dropped, missing commas and quotes are added,
+a few mangled examples are patched, and truncated examples are closed.
+"""
+
+import json
+import os
+import re
+import sys
+from typing import Any, Optional
+
+EXAMPLES_PATH = os.path.join(os.path.dirname(__file__), "examples.json")
+
+_PATCHES: dict[str, list[tuple[str, str]]] = {
+    "member_details": [('"URL": "url": ', '"url": ')],
+    "daily_congressional_record_list": [
+        ('"volumeNumber": "169"\n\n                },', '"volumeNumber": "169"\n},\n{')
+    ],
+    "daily_congressional_record_list_by_volume_and_issue": [("}\n                          {", "},\n{")],
+    "bound_congressional_record_list": [("{\n", '{"boundCongressionalRecord": [{\n', 1)],  # type: ignore[list-item]
+    "bound_congressional_record_list_by_year_and_month_and_day": [
+        ('},\n                {\n                "request"', '},\n"request"')
+    ],
+    "house_communication_detail": [("hsgo00\n", 'hsgo00"\n'), ("{ {", "{")],
+    "treaty_detail": [('"relatedDocs":\n', '"relatedDocs": [\n')],
+}
+
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+_MISSING_COMMA = re.compile(r'("|\d|true|false|null|[}\]])(\s*\n\s*)("|\{)')
+_ELLIPSIS_LINE = re.compile(r"^[ \t]*\.\.\.,?[ \t]*\n", re.MULTILINE)
+_MARKUP_VALUE = re.compile(r'^([ \t]*"[^"]+":[ \t]*)"(<.*)"(,?)[ \t]*$', re.MULTILINE)
+_UNQUOTED_VALUE = re.compile(
+    r'^([ \t]*"[^"]+":[ \t]*)(?=\S)(?!true\b|false\b|null\b|-?\d|"|\{|\[)([^\n]*?)"?(,?)[ \t]*$', re.MULTILINE
+)
+
+
+def example_block(description: str) -> Optional[str]:
+    """The example response in an operation description: the first line opening a JSON object, up to its end"""
+    lines = description.split("\n")
+    start = next((index for index, line in enumerate(lines) if line.strip().startswith("{")), None)
+    if start is None:
+        return None
+    return "\n".join(lines[start:]).strip()
+
+
+def _close(text: str) -> str:
+    """Fix mismatched closing brackets, cut the text where its brackets balance, and close any left open at its end"""
+    stack: list[str] = []
+    out: list[str] = []
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not stack:
+                break
+            char = stack.pop()
+            if not stack:
+                out.append(char)
+                break
+        out.append(char)
+    closed = "".join(out)
+    return closed.rstrip().rstrip(",") + "".join(reversed(stack))
+
+
+def _escape_markup(match: "re.Match[str]") -> str:
+    value = re.sub(r'(?<!\\)"', r'\\"', match.group(2))
+    return f'{match.group(1)}"{value}"{match.group(3)}'
+
+
+def repair(text: str) -> str:
+    """Make an example as written in ``openapi.yml`` valid JSON, as far as can be done mechanically"""
+    text = _ELLIPSIS_LINE.sub("", text)
+    text = _MARKUP_VALUE.sub(_escape_markup, text)
+    text = _UNQUOTED_VALUE.sub(r'\1"\2"\3', text)
+    text = _MISSING_COMMA.sub(r"\1,\2\3", text)
+    text = _close(text)
+    return _TRAILING_COMMA.sub(r"\1", text)
+
+
+def parse_example(operation_id: str, description: str) -> Optional[Any]:
+    """The example response of an operation, or ``None`` if it has none or it cannot be repaired"""
+    text = example_block(description)
+    if text is None:
+        return None
+    for patch in _PATCHES.get(operation_id, []):
+        text = text.replace(*patch)
+    for candidate in (text, repair(text)):
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def extract(spec: dict[str, Any]) -> list[dict[str, Any]]:
+    """The operations of an OpenAPI document with their example responses, in document order"""
+    operations = []
+    for path, methods in spec["paths"].items():
+        for method, operation in methods.items():
+            operations.append(
+                {
+                    "operation_id": operation["operationId"],
+                    "method": method.upper(),
+                    "path": path,
+                    "tag": (operation.get("tags") or [""])[0],
+                    "example": parse_example(operation["operationId"], operation.get("description", "")),
+                }
+            )
+    return operations
+
+
+def main() -> None:
+    import yaml
+
+    with open(sys.argv[1] if len(sys.argv) > 1 else "openapi.yml") as file:
+        operations = extract(yaml.safe_load(file))
+    with open(EXAMPLES_PATH, "w") as file:
+        json.dump(operations, file, indent=1, sort_keys=False)
+        file.write("\n")
+    missing = [operation["operation_id"] for operation in operations if operation["example"] is None]
+    print(f"Extracted {len(operations) - len(missing)} of {len(operations)} examples to {EXAMPLES_PATH}")
+    for operation_id in missing:
+        print(f"  no usable example: {operation_id}")
+
+
+if __name__ == "__main__":
+    main()
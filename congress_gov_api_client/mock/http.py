@@ -0,0 +1,125 @@
+"""Contains an HTTP/1.1 server for ``MockAPI``, for measuring what happens on real connections"""
+
+import asyncio
+import threading
+from typing import Any, Optional
+
+import h11
+from attrs import define, field
+
+from .server import MockAPI
+
+
+@define
+class MockServer:
+    """Serves a ``MockAPI`` over HTTP/1.1 with keep-alive on a background thread
+
+    Unlike ``MockAPITransport``, requests go through sockets and the client's connection pool, so the number of
+    connections opened shows how well connections are reused. Use it as a context manager.
+
+    Attributes:
+        api: The mock to serve
+        host: The address to listen on
+        port: The port to listen on; 0 picks a free port, see ``url`` once started
+        connections: The number of connections accepted
+        requests: The number of requests answered
+    """
+
+    api: MockAPI = field(factory=MockAPI)
+    host: str = "127.0.0.1"
+    port: int = 0
+    connections: int = field(init=False, default=0)
+    requests: int = field(init=False, default=0)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(init=False, default=None)
+    _server: Optional[asyncio.AbstractServer] = field(init=False, default=None)
+    _thread: Optional[threading.Thread] = field(init=False, default=None)
+    _writers: set[asyncio.StreamWriter] = field(init=False, factory=set)
+
+    @property
+    def url(self) -> str:
+        """The base URL of the mock API, to use as ``base_url``"""
+        return f"http://{self.host}:{self.port}/v3"
+
+    def start(self) -> "MockServer":
+        """Start listening; returns once the server accepts connections"""
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            assert self._loop is not None
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="mock-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        """Close the server and its connections"""
+        if self._loop is None or self._thread is None:
+            return
+
+        async def close() -> None:
+            assert self._server is not None
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = self._server = None
+
+    def reset(self) -> None:
+        """Clear the connection and request counters, and those of the mock"""
+        self.connections = self.requests = 0
+        self.api.reset()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        connection = h11.Connection(h11.SERVER)
+        try:
+            while True:
+                event = connection.next_event()
+                if event is h11.NEED_DATA:
+                    connection.receive_data(await reader.read(65536))
+                elif isinstance(event, h11.Request):
+                    await self._respond(connection, writer, event)
+                elif isinstance(event, h11.ConnectionClosed) or connection.our_state is h11.MUST_CLOSE:
+                    break
+                elif connection.our_state is h11.DONE and connection.their_state is h11.DONE:
+                    connection.start_next_cycle()
+        except (ConnectionError, h11.RemoteProtocolError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(self, connection: h11.Connection, writer: asyncio.StreamWriter, request: h11.Request) -> None:
+        path, _, query = request.target.decode().partition("?")
+        headers = {name.decode().lower(): value.decode() for name, value in request.headers}
+        response = self.api.respond(request.method.decode(), path, query, headers)
+        if response.delay:
+            await asyncio.sleep(response.delay)
+        self.requests += 1
+        response_headers = [*response.headers, ("Content-Length", str(len(response.body)))]
+        writer.write(connection.send(h11.Response(status_code=response.status, headers=response_headers)))
+        writer.write(connection.send(h11.Data(data=response.body)))
+        writer.write(connection.send(h11.EndOfMessage()))
+        await writer.drain()
+
+
+__all__ = ["MockServer"]
@@ -0,0 +1,304 @@
+"""Contains a local mock of the Congress.gov API serving the example responses of ``openapi.yml``"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+from attrs import define, field
+
+from ..client import AuthenticatedClient
+from ..routes import Route, match_route
+from .extract import EXAMPLES_PATH
+
+BASE_URL = "https://api.congress.gov/v3"
+
+_JSON_HEADERS = [("Content-Type", "application/json")]
+
+
+def load_examples(path: str = EXAMPLES_PATH) -> dict[str, Any]:
+    """The example response of each operation, keyed by path template"""
+    with open(path) as file:
+        return {operation["path"]: operation["example"] for operation in json.load(file)}
+
+
+def _list_key(example: Any) -> Optional[str]:
+    if not isinstance(example, dict):
+        return None
+    return next((key for key, value in example.items() if isinstance(value, list) and value), None)
+
+
+def _synthesize(template: dict[str, Any], index: int) -> dict[str, Any]:
+    """A copy of an example record made unique by ``index``"""
+    record = dict(template)
+    if "number" in record:
+        record["number"] = str(index + 1)
+    if isinstance(record.get("url"), str):
+        record["url"] = record["url"].partition("?")[0] + f"?format=json&mock={index}"
+    return record
+
+
+@define
+class MockResponse:
+    """What the mock answers to a request, before any latency is applied
+
+    Attributes:
+        status: The HTTP status code
+        headers: The response headers
+        body: The response body
+        delay: Seconds to wait before answering
+        operation_id: The ``operationId`` of the route, or ``None`` for unknown paths
+    """
+
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    delay: float = 0.0
+    operation_id: Optional[str] = None
+
+
+@define
+class MockStats:
+    """Counters of a ``MockAPI``
+
+    Attributes:
+        requests: The number of requests answered
+        by_operation: Requests by ``operationId``
+        by_status: Responses by status code
+    """
+
+    requests: int = 0
+    by_operation: Counter[str] = field(factory=Counter)
+    by_status: Counter[int] = field(factory=Counter)
+
+
+@define
+class MockAPI:
+    """A mock of the Congress.gov API built from the example responses of ``openapi.yml``
+
+    List endpoints serve ``dataset_size`` records, made by repeating the records of their example with unique
+    ``number`` and ``url`` fields, with ``pagination`` honoring ``offset`` and ``limit``. Detail endpoints serve their
+    example as is. Faults are drawn from a seeded random generator so runs are reproducible.
+
+    The mock is an ASGI application, so it can be served with ``uvicorn`` or used through ``httpx.ASGITransport``; for
+    hermetic tests and benchmarks, ``transport()`` returns an ``httpx.MockTransport`` that skips the network stack
+    altogether.
+
+    Attributes:
+        dataset_size: The number of records of every list endpoint
+        dataset_sizes: Overrides of ``dataset_size`` by ``operationId``
+        latency: Seconds every response is delayed by
+        jitter: Up to this many seconds are added to ``latency`` at random
+        error_rate: The share of requests answered with a random status from ``error_statuses``
+        error_statuses: The server errors injected by ``error_rate``
+        throttle_rate: The share of requests answered with a 429 at random, regardless of ``rate_limit``
+        rate_limit: The number of requests each API key may send per ``rate_window``, or ``None`` for no limit
+        rate_window: The length of a rate limit window in seconds; the API's is one hour
+        retry_after: The ``Retry-After`` seconds sent with injected 429s and 503s
+        seed: The seed of the fault generator
+    """
+
+    dataset_size: int = 1000
+    dataset_sizes: dict[str, int] = field(factory=dict)
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    throttle_rate: float = 0.0
+    rate_limit: Optional[int] = None
+    rate_window: float = 3600.0
+    retry_after: float = 1.0
+    seed: Optional[int] = 0
+    _examples: dict[str, Any] = field(init=False, factory=load_examples)
+    _random: random.Random = field(init=False)
+    _windows: dict[str, tuple[float, int]] = field(init=False, factory=dict)
+    _stats: MockStats = field(init=False, factory=MockStats)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    def respond(
+        self, method: str, path: str, query: str = "", headers: Optional[Mapping[str, str]] = None
+    ) -> MockResponse:
+        """Answer a request; the ASGI application and the transport are thin wrappers around this
+
+        Args:
+            method: The request method
+            path: The URL path, e.g. ``/v3/bill/117``
+            query: The URL query string
+            headers: The request headers, with lower-case names; the API key is read from the ``api_key`` query
+                parameter, or else the ``x-api-key`` or ``authorization`` header
+        """
+        params = dict(parse_qsl(query))
+        found = match_route(path) if method == "GET" else None
+        if found is None:
+            return self._record(MockResponse(404, _JSON_HEADERS, b'{"error": "Not found"}'))
+        route, _ = found
+        headers = headers or {}
+        api_key = params.get("api_key") or headers.get("x-api-key") or headers.get("authorization", "")
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            draw = self._random.random()
+        response = self._fault(draw, api_key)
+        if response is None:
+            try:
+                body = json.dumps(self._body(route, params, path)).encode()
+            except ValueError:
+                response = MockResponse(400, _JSON_HEADERS, b'{"error": "Invalid offset or limit"}')
+            else:
+                response = MockResponse(200, _JSON_HEADERS + self._quota_headers(api_key), body)
+        response.delay, response.operation_id = delay, route.operation_id
+        return self._record(response)
+
+    def _fault(self, draw: float, api_key: str) -> Optional[MockResponse]:
+        retry_after = [("Retry-After", f"{self.retry_after:g}")]
+        if draw < self.throttle_rate:
+            return MockResponse(429, _JSON_HEADERS + retry_after, b'{"error": "Too many requests"}')
+        if draw < self.throttle_rate + self.error_rate:
+            with self._lock:
+                status = self._random.choice(self.error_statuses)
+            headers = _JSON_HEADERS + (retry_after if status == 503 else [])
+            return MockResponse(status, headers, b'{"error": "Injected fault"}')
+        if self.rate_limit is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            start, used = self._windows.get(api_key, (now, 0))
+            if now - start >= self.rate_window:
+                start, used = now, 0
+            if used >= self.rate_limit:
+                wait = f"{max(1, round(start + self.rate_window - now))}"
+                headers = [*_JSON_HEADERS, ("Retry-After", wait), *self._quota_headers(api_key, remaining=0)]
+                return MockResponse(429, headers, b'{"error": "Rate limit exceeded"}')
+            self._windows[api_key] = (start, used + 1)
+        return None
+
+    def _quota_headers(self, api_key: str, remaining: Optional[int] = None) -> list[tuple[str, str]]:
+        if self.rate_limit is None:
+            return []
+        if remaining is None:
+            with self._lock:
+                remaining = self.rate_limit - self._windows.get(api_key, (0.0, 0))[1]
+        return [("X-RateLimit-Limit", str(self.rate_limit)), ("X-RateLimit-Remaining", str(remaining))]
+
+    def _body(self, route: Route, params: dict[str, str], path: str) -> Any:
+        example = self._examples.get(route.template)
+        key = _list_key(example)
+        if key is None:
+            return example
+        templates = example[key]
+        total = self.dataset_sizes.get(route.operation_id, self.dataset_size)
+        offset = max(0, int(params.get("offset", 0)))
+        limit = min(250, max(1, int(params.get("limit", 20))))
+        body = {name: value for name, value in example.items() if name not in (key, "pagination", "request")}
+        body[key] = [
+            _synthesize(templates[index % len(templates)], index) for index in range(offset, min(total, offset + limit))
+        ]
+        pagination: dict[str, Any] = {"count": total}
+        if offset + limit < total:
+            pagination["next"] = self._page_url(path, params, offset + limit, limit)
+        if offset > 0:
+            pagination["prev"] = self._page_url(path, params, max(0, offset - limit), limit)
+        body["pagination"] = pagination
+        return body
+
+    @staticmethod
+    def _page_url(path: str, params: dict[str, str], offset: int, limit: int) -> str:
+        query = {name: value for name, value in params.items() if name != "api_key"}
+        query.update(offset=str(offset), limit=str(limit))
+        return f"{BASE_URL}{path.removeprefix('/v3')}?{urlencode(query)}"
+
+    def _record(self, response: MockResponse) -> MockResponse:
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.by_status[response.status] += 1
+            if response.operation_id is not None:
+                self._stats.by_operation[response.operation_id] += 1
+        return response
+
+    def stats(self) -> MockStats:
+        """A snapshot of the request counters"""
+        with self._lock:
+            return MockStats(self._stats.requests, Counter(self._stats.by_operation), Counter(self._stats.by_status))
+
+    def reset(self) -> None:
+        """Clear the counters and rate limit windows and reseed the fault generator"""
+        with self._lock:
+            self._stats = MockStats()
+            self._windows.clear()
+            self._random = random.Random(self.seed)
+
+    def transport(self) -> "MockAPITransport":
+        """An ``httpx.MockTransport`` answering from this mock, for both synchronous and asynchronous clients"""
+        return MockAPITransport(self)
+
+    async def __call__(
+        self, scope: dict[str, Any], receive: Callable[[], Any], send: Callable[[dict[str, Any]], Any]
+    ) -> None:
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        request_headers = {name.decode().lower(): value.decode() for name, value in scope.get("headers", [])}
+        response = self.respond(
+            scope["method"], scope["path"], scope.get("query_string", b"").decode(), request_headers
+        )
+        if response.delay:
+            await asyncio.sleep(response.delay)
+        headers = [(name.lower().encode(), value.encode()) for name, value in response.headers]
+        headers.append((b"content-length", str(len(response.body)).encode()))
+        await send({"type": "http.response.start", "status": response.status, "headers": headers})
+        await send({"type": "http.response.body", "body": response.body})
+
+
+class MockAPITransport(httpx.MockTransport):
+    """Answers requests from a ``MockAPI`` without a network stack; latency is applied with ``time.sleep`` for
+    synchronous clients and ``asyncio.sleep`` for asynchronous ones
+    """
+
+    def __init__(self, api: MockAPI) -> None:
+        super().__init__(self._respond)
+        self.api = api
+
+    def _respond(self, request: httpx.Request) -> MockResponse:
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        return self.api.respond(request.method, request.url.path, request.url.query.decode(), headers)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._respond(request)
+        if response.delay:
+            time.sleep(response.delay)
+        return httpx.Response(response.status, headers=response.headers, content=response.body, request=request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._respond(request)
+        if response.delay:
+            await asyncio.sleep(response.delay)
+        return httpx.Response(response.status, headers=response.headers, content=response.body, request=request)
+
+
+def mock_client(api: Optional[MockAPI] = None, **kwargs: Any) -> AuthenticatedClient:
+    """An ``AuthenticatedClient`` that talks to ``api`` (by default a new ``MockAPI``) through a ``MockAPITransport``
+
+    Args:
+        api: The mock to talk to
+        **kwargs: Additional arguments for ``AuthenticatedClient``, e.g. ``retry`` or ``rate_limiter``
+
+    Returns:
+        AuthenticatedClient
+    """
+    api = MockAPI() if api is None else api
+    httpx_args = {**kwargs.pop("httpx_args", {}), "transport": api.transport()}
+    kwargs.setdefault("token", "mock")
+    return AuthenticatedClient(base_url=BASE_URL, httpx_args=httpx_args, **kwargs)
+
+
+__all__ = ["BASE_URL", "MockAPI", "MockAPITransport", "MockResponse", "MockStats", "load_examples", "mock_client"]
@@ -1 +1,97 @@
 """Contains all the data models used in inputs/outputs"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .amendment import Amendment
+    from .amendment_list_response import AmendmentListResponse
+    from .amendment_response import AmendmentResponse
+    from .bill import Bill
+    from .bill_list_response import BillListResponse
+    from .bill_response import BillResponse
+    from .committee import Committee
+    from .committee_list_response import CommitteeListResponse
+    from .committee_response import CommitteeResponse
+    from .latest_action import LatestAction
+    from .law import Law
+    from .member import Member
+    from .member_depiction import MemberDepiction
+    from .member_list_response import MemberListResponse
+    from .member_response import MemberResponse
+    from .nomination import Nomination
+    from .nomination_list_response import NominationListResponse
+    from .nomination_response import NominationResponse
+    from .pagination import Pagination
+    from .policy_area import PolicyArea
+    from .resource_count import ResourceCount
+    from .sponsor import Sponsor
+    from .summary import Summary
+    from .summary_list_response import SummaryListResponse
+    from .treaty import Treaty
+    from .treaty_list_response import TreatyListResponse
+    from .treaty_response import TreatyResponse
+
+__all__ = (
+    "Amendment",
+    "AmendmentListResponse",
+    "AmendmentResponse",
+    "Bill",
+    "BillListResponse",
+    "BillResponse",
+    "Committee",
+    "CommitteeListResponse",
+    "CommitteeResponse",
+    "LatestAction",
+    "Law",
+    "Member",
+    "MemberDepiction",
+    "MemberListResponse",
+    "MemberResponse",
+    "Nomination",
+    "NominationListResponse",
+    "NominationResponse",
+    "Pagination",
+    "PolicyArea",
+    "ResourceCount",
+    "Sponsor",
+    "Summary",
+    "SummaryListResponse",
+    "Treaty",
+    "TreatyListResponse",
+    "TreatyResponse",
+)
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Amendment": "amendment",
+        "AmendmentListResponse": "amendment_list_response",
+        "AmendmentResponse": "amendment_response",
+        "Bill": "bill",
+        "BillListResponse": "bill_list_response",
+        "BillResponse": "bill_response",
+        "Committee": "committee",
+        "CommitteeListResponse": "committee_list_response",
+        "CommitteeResponse": "committee_response",
+        "LatestAction": "latest_action",
+        "Law": "law",
+        "Member": "member",
+        "MemberDepiction": "member_depiction",
+        "MemberListResponse": "member_list_response",
+        "MemberResponse": "member_response",
+        "Nomination": "nomination",
+        "NominationListResponse": "nomination_list_response",
+        "NominationResponse": "nomination_response",
+        "Pagination": "pagination",
+        "PolicyArea": "policy_area",
+        "ResourceCount": "resource_count",
+        "Sponsor": "sponsor",
+        "Summary": "summary",
+        "SummaryListResponse": "summary_list_response",
+        "Treaty": "treaty",
+        "TreatyListResponse": "treaty_list_response",
+        "TreatyResponse": "treaty_response",
+    },
+)
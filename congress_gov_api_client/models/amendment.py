@@ -0,0 +1,259 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .bill import Bill
+from .latest_action import LatestAction
+from .resource_count import ResourceCount
+from .sponsor import Sponsor
+
+T = TypeVar("T", bound="Amendment")
+
+
+@_attrs_define
+class Amendment:
+    """An amendment, as returned by the amendment list and amendment details endpoints
+
+    Attributes:
+        actions (Union[Unset, ResourceCount]):
+        amended_bill (Union[Unset, Bill]):
+        amendments_to_amendment (Union[Unset, ResourceCount]):
+        chamber (Union[Unset, str]):
+        congress (Union[Unset, int]):
+        cosponsors (Union[Unset, ResourceCount]):
+        description (Union[Unset, str]):
+        latest_action (Union[Unset, LatestAction]):
+        number (Union[Unset, str]):
+        proposed_date (Union[Unset, str]):
+        purpose (Union[Unset, str]):
+        sponsors (Union[Unset, list[Sponsor]]):
+        submitted_date (Union[Unset, str]):
+        text_versions (Union[Unset, ResourceCount]):
+        type_ (Union[Unset, str]):
+        update_date (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    actions: Union[Unset, ResourceCount] = UNSET
+    amended_bill: Union[Unset, Bill] = UNSET
+    amendments_to_amendment: Union[Unset, ResourceCount] = UNSET
+    chamber: Union[Unset, str] = UNSET
+    congress: Union[Unset, int] = UNSET
+    cosponsors: Union[Unset, ResourceCount] = UNSET
+    description: Union[Unset, str] = UNSET
+    latest_action: Union[Unset, LatestAction] = UNSET
+    number: Union[Unset, str] = UNSET
+    proposed_date: Union[Unset, str] = UNSET
+    purpose: Union[Unset, str] = UNSET
+    sponsors: Union[Unset, list[Sponsor]] = UNSET
+    submitted_date: Union[Unset, str] = UNSET
+    text_versions: Union[Unset, ResourceCount] = UNSET
+    type_: Union[Unset, str] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        actions: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.actions, Unset):
+            actions = self.actions.to_dict()
+
+        amended_bill: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.amended_bill, Unset):
+            amended_bill = self.amended_bill.to_dict()
+
+        amendments_to_amendment: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.amendments_to_amendment, Unset):
+            amendments_to_amendment = self.amendments_to_amendment.to_dict()
+
+        chamber = self.chamber
+
+        congress = self.congress
+
+        cosponsors: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.cosponsors, Unset):
+            cosponsors = self.cosponsors.to_dict()
+
+        description = self.description
+
+        latest_action: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.latest_action, Unset):
+            latest_action = self.latest_action.to_dict()
+
+        number = self.number
+
+        proposed_date = self.proposed_date
+
+        purpose = self.purpose
+
+        sponsors: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.sponsors, Unset):
+            sponsors = []
+            for sponsors_item_data in self.sponsors:
+                sponsors_item = sponsors_item_data.to_dict()
+                sponsors.append(sponsors_item)
+
+        submitted_date = self.submitted_date
+
+        text_versions: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.text_versions, Unset):
+            text_versions = self.text_versions.to_dict()
+
+        type_ = self.type_
+
+        update_date = self.update_date
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if actions is not UNSET:
+            field_dict["actions"] = actions
+        if amended_bill is not UNSET:
+            field_dict["amendedBill"] = amended_bill
+        if amendments_to_amendment is not UNSET:
+            field_dict["amendmentsToAmendment"] = amendments_to_amendment
+        if chamber is not UNSET:
+            field_dict["chamber"] = chamber
+        if congress is not UNSET:
+            field_dict["congress"] = congress
+        if cosponsors is not UNSET:
+            field_dict["cosponsors"] = cosponsors
+        if description is not UNSET:
+            field_dict["description"] = description
+        if latest_action is not UNSET:
+            field_dict["latestAction"] = latest_action
+        if number is not UNSET:
+            field_dict["number"] = number
+        if proposed_date is not UNSET:
+            field_dict["proposedDate"] = proposed_date
+        if purpose is not UNSET:
+            field_dict["purpose"] = purpose
+        if sponsors is not UNSET:
+            field_dict["sponsors"] = sponsors
+        if submitted_date is not UNSET:
+            field_dict["submittedDate"] = submitted_date
+        if text_versions is not UNSET:
+            field_dict["textVersions"] = text_versions
+        if type_ is not UNSET:
+            field_dict["type"] = type_
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _actions = d.pop("actions", UNSET)
+        actions: Union[Unset, ResourceCount]
+        if isinstance(_actions, Unset) or _actions is None:
+            actions = UNSET
+        else:
+            actions = ResourceCount.from_dict(_actions)
+
+        _amended_bill = d.pop("amendedBill", UNSET)
+        amended_bill: Union[Unset, Bill]
+        if isinstance(_amended_bill, Unset) or _amended_bill is None:
+            amended_bill = UNSET
+        else:
+            amended_bill = Bill.from_dict(_amended_bill)
+
+        _amendments_to_amendment = d.pop("amendmentsToAmendment", UNSET)
+        amendments_to_amendment: Union[Unset, ResourceCount]
+        if isinstance(_amendments_to_amendment, Unset) or _amendments_to_amendment is None:
+            amendments_to_amendment = UNSET
+        else:
+            amendments_to_amendment = ResourceCount.from_dict(_amendments_to_amendment)
+
+        chamber = d.pop("chamber", UNSET)
+
+        congress = d.pop("congress", UNSET)
+
+        _cosponsors = d.pop("cosponsors", UNSET)
+        cosponsors: Union[Unset, ResourceCount]
+        if isinstance(_cosponsors, Unset) or _cosponsors is None:
+            cosponsors = UNSET
+        else:
+            cosponsors = ResourceCount.from_dict(_cosponsors)
+
+        description = d.pop("description", UNSET)
+
+        _latest_action = d.pop("latestAction", UNSET)
+        latest_action: Union[Unset, LatestAction]
+        if isinstance(_latest_action, Unset) or _latest_action is None:
+            latest_action = UNSET
+        else:
+            latest_action = LatestAction.from_dict(_latest_action)
+
+        number = d.pop("number", UNSET)
+
+        proposed_date = d.pop("proposedDate", UNSET)
+
+        purpose = d.pop("purpose", UNSET)
+
+        _sponsors = d.pop("sponsors", UNSET)
+        sponsors: Union[Unset, list[Sponsor]]
+        if isinstance(_sponsors, Unset) or _sponsors is None:
+            sponsors = UNSET
+        else:
+            sponsors = [Sponsor.from_dict(sponsors_item_data) for sponsors_item_data in _sponsors]
+
+        submitted_date = d.pop("submittedDate", UNSET)
+
+        _text_versions = d.pop("textVersions", UNSET)
+        text_versions: Union[Unset, ResourceCount]
+        if isinstance(_text_versions, Unset) or _text_versions is None:
+            text_versions = UNSET
+        else:
+            text_versions = ResourceCount.from_dict(_text_versions)
+
+        type_ = d.pop("type", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        amendment = cls(
+            actions=actions,
+            amended_bill=amended_bill,
+            amendments_to_amendment=amendments_to_amendment,
+            chamber=chamber,
+            congress=congress,
+            cosponsors=cosponsors,
+            description=description,
+            latest_action=latest_action,
+            number=number,
+            proposed_date=proposed_date,
+            purpose=purpose,
+            sponsors=sponsors,
+            submitted_date=submitted_date,
+            text_versions=text_versions,
+            type_=type_,
+            update_date=update_date,
+            url=url,
+        )
+
+        amendment.additional_properties = d
+        return amendment
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
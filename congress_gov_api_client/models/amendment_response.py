@@ -0,0 +1,76 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .amendment import Amendment
+
+T = TypeVar("T", bound="AmendmentResponse")
+
+
+@_attrs_define
+class AmendmentResponse:
+    """A single amendment
+
+    Attributes:
+        amendment (Union[Unset, Amendment]):
+        request (Union[Unset, Any]):
+    """
+
+    amendment: Union[Unset, Amendment] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        amendment: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.amendment, Unset):
+            amendment = self.amendment.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if amendment is not UNSET:
+            field_dict["amendment"] = amendment
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _amendment = d.pop("amendment", UNSET)
+        amendment: Union[Unset, Amendment]
+        if isinstance(_amendment, Unset) or _amendment is None:
+            amendment = UNSET
+        else:
+            amendment = Amendment.from_dict(_amendment)
+
+        request = d.pop("request", UNSET)
+
+        amendment_response = cls(
+            amendment=amendment,
+            request=request,
+        )
+
+        amendment_response.additional_properties = d
+        return amendment_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,386 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .latest_action import LatestAction
+from .law import Law
+from .policy_area import PolicyArea
+from .resource_count import ResourceCount
+from .sponsor import Sponsor
+
+T = TypeVar("T", bound="Bill")
+
+
+@_attrs_define
+class Bill:
+    """A bill, as returned by the bill list and bill details endpoints
+
+    Attributes:
+        actions (Union[Unset, ResourceCount]):
+        amendments (Union[Unset, ResourceCount]):
+        cbo_cost_estimates (Union[Unset, Any]):
+        committee_reports (Union[Unset, Any]):
+        committees (Union[Unset, ResourceCount]):
+        congress (Union[Unset, int]):
+        constitutional_authority_statement_text (Union[Unset, str]):
+        cosponsors (Union[Unset, ResourceCount]):
+        introduced_date (Union[Unset, str]):
+        latest_action (Union[Unset, LatestAction]):
+        laws (Union[Unset, list[Law]]):
+        number (Union[Unset, str]):
+        origin_chamber (Union[Unset, str]):
+        origin_chamber_code (Union[Unset, str]):
+        policy_area (Union[Unset, PolicyArea]):
+        related_bills (Union[Unset, ResourceCount]):
+        sponsors (Union[Unset, list[Sponsor]]):
+        subjects (Union[Unset, ResourceCount]):
+        summaries (Union[Unset, ResourceCount]):
+        text_versions (Union[Unset, ResourceCount]):
+        title (Union[Unset, str]):
+        titles (Union[Unset, ResourceCount]):
+        type_ (Union[Unset, str]):
+        update_date (Union[Unset, str]):
+        update_date_including_text (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    actions: Union[Unset, ResourceCount] = UNSET
+    amendments: Union[Unset, ResourceCount] = UNSET
+    cbo_cost_estimates: Union[Unset, Any] = UNSET
+    committee_reports: Union[Unset, Any] = UNSET
+    committees: Union[Unset, ResourceCount] = UNSET
+    congress: Union[Unset, int] = UNSET
+    constitutional_authority_statement_text: Union[Unset, str] = UNSET
+    cosponsors: Union[Unset, ResourceCount] = UNSET
+    introduced_date: Union[Unset, str] = UNSET
+    latest_action: Union[Unset, LatestAction] = UNSET
+    laws: Union[Unset, list[Law]] = UNSET
+    number: Union[Unset, str] = UNSET
+    origin_chamber: Union[Unset, str] = UNSET
+    origin_chamber_code: Union[Unset, str] = UNSET
+    policy_area: Union[Unset, PolicyArea] = UNSET
+    related_bills: Union[Unset, ResourceCount] = UNSET
+    sponsors: Union[Unset, list[Sponsor]] = UNSET
+    subjects: Union[Unset, ResourceCount] = UNSET
+    summaries: Union[Unset, ResourceCount] = UNSET
+    text_versions: Union[Unset, ResourceCount] = UNSET
+    title: Union[Unset, str] = UNSET
+    titles: Union[Unset, ResourceCount] = UNSET
+    type_: Union[Unset, str] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    update_date_including_text: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        actions: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.actions, Unset):
+            actions = self.actions.to_dict()
+
+        amendments: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.amendments, Unset):
+            amendments = self.amendments.to_dict()
+
+        cbo_cost_estimates = self.cbo_cost_estimates
+
+        committee_reports = self.committee_reports
+
+        committees: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.committees, Unset):
+            committees = self.committees.to_dict()
+
+        congress = self.congress
+
+        constitutional_authority_statement_text = self.constitutional_authority_statement_text
+
+        cosponsors: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.cosponsors, Unset):
+            cosponsors = self.cosponsors.to_dict()
+
+        introduced_date = self.introduced_date
+
+        latest_action: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.latest_action, Unset):
+            latest_action = self.latest_action.to_dict()
+
+        laws: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.laws, Unset):
+            laws = []
+            for laws_item_data in self.laws:
+                laws_item = laws_item_data.to_dict()
+                laws.append(laws_item)
+
+        number = self.number
+
+        origin_chamber = self.origin_chamber
+
+        origin_chamber_code = self.origin_chamber_code
+
+        policy_area: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.policy_area, Unset):
+            policy_area = self.policy_area.to_dict()
+
+        related_bills: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.related_bills, Unset):
+            related_bills = self.related_bills.to_dict()
+
+        sponsors: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.sponsors, Unset):
+            sponsors = []
+            for sponsors_item_data in self.sponsors:
+                sponsors_item = sponsors_item_data.to_dict()
+                sponsors.append(sponsors_item)
+
+        subjects: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.subjects, Unset):
+            subjects = self.subjects.to_dict()
+
+        summaries: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.summaries, Unset):
+            summaries = self.summaries.to_dict()
+
+        text_versions: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.text_versions, Unset):
+            text_versions = self.text_versions.to_dict()
+
+        title = self.title
+
+        titles: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.titles, Unset):
+            titles = self.titles.to_dict()
+
+        type_ = self.type_
+
+        update_date = self.update_date
+
+        update_date_including_text = self.update_date_including_text
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if actions is not UNSET:
+            field_dict["actions"] = actions
+        if amendments is not UNSET:
+            field_dict["amendments"] = amendments
+        if cbo_cost_estimates is not UNSET:
+            field_dict["cboCostEstimates"] = cbo_cost_estimates
+        if committee_reports is not UNSET:
+            field_dict["committeeReports"] = committee_reports
+        if committees is not UNSET:
+            field_dict["committees"] = committees
+        if congress is not UNSET:
+            field_dict["congress"] = congress
+        if constitutional_authority_statement_text is not UNSET:
+            field_dict["constitutionalAuthorityStatementText"] = constitutional_authority_statement_text
+        if cosponsors is not UNSET:
+            field_dict["cosponsors"] = cosponsors
+        if introduced_date is not UNSET:
+            field_dict["introducedDate"] = introduced_date
+        if latest_action is not UNSET:
+            field_dict["latestAction"] = latest_action
+        if laws is not UNSET:
+            field_dict["laws"] = laws
+        if number is not UNSET:
+            field_dict["number"] = number
+        if origin_chamber is not UNSET:
+            field_dict["originChamber"] = origin_chamber
+        if origin_chamber_code is not UNSET:
+            field_dict["originChamberCode"] = origin_chamber_code
+        if policy_area is not UNSET:
+            field_dict["policyArea"] = policy_area
+        if related_bills is not UNSET:
+            field_dict["relatedBills"] = related_bills
+        if sponsors is not UNSET:
+            field_dict["sponsors"] = sponsors
+        if subjects is not UNSET:
+            field_dict["subjects"] = subjects
+        if summaries is not UNSET:
+            field_dict["summaries"] = summaries
+        if text_versions is not UNSET:
+            field_dict["textVersions"] = text_versions
+        if title is not UNSET:
+            field_dict["title"] = title
+        if titles is not UNSET:
+            field_dict["titles"] = titles
+        if type_ is not UNSET:
+            field_dict["type"] = type_
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if update_date_including_text is not UNSET:
+            field_dict["updateDateIncludingText"] = update_date_including_text
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _actions = d.pop("actions", UNSET)
+        actions: Union[Unset, ResourceCount]
+        if isinstance(_actions, Unset) or _actions is None:
+            actions = UNSET
+        else:
+            actions = ResourceCount.from_dict(_actions)
+
+        _amendments = d.pop("amendments", UNSET)
+        amendments: Union[Unset, ResourceCount]
+        if isinstance(_amendments, Unset) or _amendments is None:
+            amendments = UNSET
+        else:
+            amendments = ResourceCount.from_dict(_amendments)
+
+        cbo_cost_estimates = d.pop("cboCostEstimates", UNSET)
+
+        committee_reports = d.pop("committeeReports", UNSET)
+
+        _committees = d.pop("committees", UNSET)
+        committees: Union[Unset, ResourceCount]
+        if isinstance(_committees, Unset) or _committees is None:
+            committees = UNSET
+        else:
+            committees = ResourceCount.from_dict(_committees)
+
+        congress = d.pop("congress", UNSET)
+
+        constitutional_authority_statement_text = d.pop("constitutionalAuthorityStatementText", UNSET)
+
+        _cosponsors = d.pop("cosponsors", UNSET)
+        cosponsors: Union[Unset, ResourceCount]
+        if isinstance(_cosponsors, Unset) or _cosponsors is None:
+            cosponsors = UNSET
+        else:
+            cosponsors = ResourceCount.from_dict(_cosponsors)
+
+        introduced_date = d.pop("introducedDate", UNSET)
+
+        _latest_action = d.pop("latestAction", UNSET)
+        latest_action: Union[Unset, LatestAction]
+        if isinstance(_latest_action, Unset) or _latest_action is None:
+            latest_action = UNSET
+        else:
+            latest_action = LatestAction.from_dict(_latest_action)
+
+        _laws = d.pop("laws", UNSET)
+        laws: Union[Unset, list[Law]]
+        if isinstance(_laws, Unset) or _laws is None:
+            laws = UNSET
+        else:
+            laws = [Law.from_dict(laws_item_data) for laws_item_data in _laws]
+
+        number = d.pop("number", UNSET)
+
+        origin_chamber = d.pop("originChamber", UNSET)
+
+        origin_chamber_code = d.pop("originChamberCode", UNSET)
+
+        _policy_area = d.pop("policyArea", UNSET)
+        policy_area: Union[Unset, PolicyArea]
+        if isinstance(_policy_area, Unset) or _policy_area is None:
+            policy_area = UNSET
+        else:
+            policy_area = PolicyArea.from_dict(_policy_area)
+
+        _related_bills = d.pop("relatedBills", UNSET)
+        related_bills: Union[Unset, ResourceCount]
+        if isinstance(_related_bills, Unset) or _related_bills is None:
+            related_bills = UNSET
+        else:
+            related_bills = ResourceCount.from_dict(_related_bills)
+
+        _sponsors = d.pop("sponsors", UNSET)
+        sponsors: Union[Unset, list[Sponsor]]
+        if isinstance(_sponsors, Unset) or _sponsors is None:
+            sponsors = UNSET
+        else:
+            sponsors = [Sponsor.from_dict(sponsors_item_data) for sponsors_item_data in _sponsors]
+
+        _subjects = d.pop("subjects", UNSET)
+        subjects: Union[Unset, ResourceCount]
+        if isinstance(_subjects, Unset) or _subjects is None:
+            subjects = UNSET
+        else:
+            subjects = ResourceCount.from_dict(_subjects)
+
+        _summaries = d.pop("summaries", UNSET)
+        summaries: Union[Unset, ResourceCount]
+        if isinstance(_summaries, Unset) or _summaries is None:
+            summaries = UNSET
+        else:
+            summaries = ResourceCount.from_dict(_summaries)
+
+        _text_versions = d.pop("textVersions", UNSET)
+        text_versions: Union[Unset, ResourceCount]
+        if isinstance(_text_versions, Unset) or _text_versions is None:
+            text_versions = UNSET
+        else:
+            text_versions = ResourceCount.from_dict(_text_versions)
+
+        title = d.pop("title", UNSET)
+
+        _titles = d.pop("titles", UNSET)
+        titles: Union[Unset, ResourceCount]
+        if isinstance(_titles, Unset) or _titles is None:
+            titles = UNSET
+        else:
+            titles = ResourceCount.from_dict(_titles)
+
+        type_ = d.pop("type", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        update_date_including_text = d.pop("updateDateIncludingText", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        bill = cls(
+            actions=actions,
+            amendments=amendments,
+            cbo_cost_estimates=cbo_cost_estimates,
+            committee_reports=committee_reports,
+            committees=committees,
+            congress=congress,
+            constitutional_authority_statement_text=constitutional_authority_statement_text,
+            cosponsors=cosponsors,
+            introduced_date=introduced_date,
+            latest_action=latest_action,
+            laws=laws,
+            number=number,
+            origin_chamber=origin_chamber,
+            origin_chamber_code=origin_chamber_code,
+            policy_area=policy_area,
+            related_bills=related_bills,
+            sponsors=sponsors,
+            subjects=subjects,
+            summaries=summaries,
+            text_versions=text_versions,
+            title=title,
+            titles=titles,
+            type_=type_,
+            update_date=update_date,
+            update_date_including_text=update_date_including_text,
+            url=url,
+        )
+
+        bill.additional_properties = d
+        return bill
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,96 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .bill import Bill
+from .pagination import Pagination
+
+T = TypeVar("T", bound="BillListResponse")
+
+
+@_attrs_define
+class BillListResponse:
+    """A page of bills
+
+    Attributes:
+        bills (Union[Unset, list[Bill]]):
+        pagination (Union[Unset, Pagination]):
+        request (Union[Unset, Any]):
+    """
+
+    bills: Union[Unset, list[Bill]] = UNSET
+    pagination: Union[Unset, Pagination] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        bills: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.bills, Unset):
+            bills = []
+            for bills_item_data in self.bills:
+                bills_item = bills_item_data.to_dict()
+                bills.append(bills_item)
+
+        pagination: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.pagination, Unset):
+            pagination = self.pagination.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if bills is not UNSET:
+            field_dict["bills"] = bills
+        if pagination is not UNSET:
+            field_dict["pagination"] = pagination
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _bills = d.pop("bills", UNSET)
+        bills: Union[Unset, list[Bill]]
+        if isinstance(_bills, Unset) or _bills is None:
+            bills = UNSET
+        else:
+            bills = [Bill.from_dict(bills_item_data) for bills_item_data in _bills]
+
+        _pagination = d.pop("pagination", UNSET)
+        pagination: Union[Unset, Pagination]
+        if isinstance(_pagination, Unset) or _pagination is None:
+            pagination = UNSET
+        else:
+            pagination = Pagination.from_dict(_pagination)
+
+        request = d.pop("request", UNSET)
+
+        bill_list_response = cls(
+            bills=bills,
+            pagination=pagination,
+            request=request,
+        )
+
+        bill_list_response.additional_properties = d
+        return bill_list_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,76 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .bill import Bill
+
+T = TypeVar("T", bound="BillResponse")
+
+
+@_attrs_define
+class BillResponse:
+    """A single bill
+
+    Attributes:
+        bill (Union[Unset, Bill]):
+        request (Union[Unset, Any]):
+    """
+
+    bill: Union[Unset, Bill] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        bill: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.bill, Unset):
+            bill = self.bill.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if bill is not UNSET:
+            field_dict["bill"] = bill
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _bill = d.pop("bill", UNSET)
+        bill: Union[Unset, Bill]
+        if isinstance(_bill, Unset) or _bill is None:
+            bill = UNSET
+        else:
+            bill = Bill.from_dict(_bill)
+
+        request = d.pop("request", UNSET)
+
+        bill_response = cls(
+            bill=bill,
+            request=request,
+        )
+
+        bill_response.additional_properties = d
+        return bill_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,214 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .resource_count import ResourceCount
+
+T = TypeVar("T", bound="Committee")
+
+
+@_attrs_define
+class Committee:
+    """A committee, as returned by the committee list and committee details endpoints
+
+    Attributes:
+        bills (Union[Unset, ResourceCount]):
+        chamber (Union[Unset, str]):
+        committee_type_code (Union[Unset, str]):
+        communications (Union[Unset, ResourceCount]):
+        history (Union[Unset, Any]):
+        is_current (Union[Unset, bool]):
+        name (Union[Unset, str]):
+        nominations (Union[Unset, ResourceCount]):
+        parent (Union[Unset, Any]):
+        reports (Union[Unset, ResourceCount]):
+        subcommittees (Union[Unset, Any]):
+        system_code (Union[Unset, str]):
+        type_ (Union[Unset, str]):
+        update_date (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    bills: Union[Unset, ResourceCount] = UNSET
+    chamber: Union[Unset, str] = UNSET
+    committee_type_code: Union[Unset, str] = UNSET
+    communications: Union[Unset, ResourceCount] = UNSET
+    history: Union[Unset, Any] = UNSET
+    is_current: Union[Unset, bool] = UNSET
+    name: Union[Unset, str] = UNSET
+    nominations: Union[Unset, ResourceCount] = UNSET
+    parent: Union[Unset, Any] = UNSET
+    reports: Union[Unset, ResourceCount] = UNSET
+    subcommittees: Union[Unset, Any] = UNSET
+    system_code: Union[Unset, str] = UNSET
+    type_: Union[Unset, str] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        bills: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.bills, Unset):
+            bills = self.bills.to_dict()
+
+        chamber = self.chamber
+
+        committee_type_code = self.committee_type_code
+
+        communications: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.communications, Unset):
+            communications = self.communications.to_dict()
+
+        history = self.history
+
+        is_current = self.is_current
+
+        name = self.name
+
+        nominations: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.nominations, Unset):
+            nominations = self.nominations.to_dict()
+
+        parent = self.parent
+
+        reports: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.reports, Unset):
+            reports = self.reports.to_dict()
+
+        subcommittees = self.subcommittees
+
+        system_code = self.system_code
+
+        type_ = self.type_
+
+        update_date = self.update_date
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if bills is not UNSET:
+            field_dict["bills"] = bills
+        if chamber is not UNSET:
+            field_dict["chamber"] = chamber
+        if committee_type_code is not UNSET:
+            field_dict["committeeTypeCode"] = committee_type_code
+        if communications is not UNSET:
+            field_dict["communications"] = communications
+        if history is not UNSET:
+            field_dict["history"] = history
+        if is_current is not UNSET:
+            field_dict["isCurrent"] = is_current
+        if name is not UNSET:
+            field_dict["name"] = name
+        if nominations is not UNSET:
+            field_dict["nominations"] = nominations
+        if parent is not UNSET:
+            field_dict["parent"] = parent
+        if reports is not UNSET:
+            field_dict["reports"] = reports
+        if subcommittees is not UNSET:
+            field_dict["subcommittees"] = subcommittees
+        if system_code is not UNSET:
+            field_dict["systemCode"] = system_code
+        if type_ is not UNSET:
+            field_dict["type"] = type_
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _bills = d.pop("bills", UNSET)
+        bills: Union[Unset, ResourceCount]
+        if isinstance(_bills, Unset) or _bills is None:
+            bills = UNSET
+        else:
+            bills = ResourceCount.from_dict(_bills)
+
+        chamber = d.pop("chamber", UNSET)
+
+        committee_type_code = d.pop("committeeTypeCode", UNSET)
+
+        _communications = d.pop("communications", UNSET)
+        communications: Union[Unset, ResourceCount]
+        if isinstance(_communications, Unset) or _communications is None:
+            communications = UNSET
+        else:
+            communications = ResourceCount.from_dict(_communications)
+
+        history = d.pop("history", UNSET)
+
+        is_current = d.pop("isCurrent", UNSET)
+
+        name = d.pop("name", UNSET)
+
+        _nominations = d.pop("nominations", UNSET)
+        nominations: Union[Unset, ResourceCount]
+        if isinstance(_nominations, Unset) or _nominations is None:
+            nominations = UNSET
+        else:
+            nominations = ResourceCount.from_dict(_nominations)
+
+        parent = d.pop("parent", UNSET)
+
+        _reports = d.pop("reports", UNSET)
+        reports: Union[Unset, ResourceCount]
+        if isinstance(_reports, Unset) or _reports is None:
+            reports = UNSET
+        else:
+            reports = ResourceCount.from_dict(_reports)
+
+        subcommittees = d.pop("subcommittees", UNSET)
+
+        system_code = d.pop("systemCode", UNSET)
+
+        type_ = d.pop("type", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        committee = cls(
+            bills=bills,
+            chamber=chamber,
+            committee_type_code=committee_type_code,
+            communications=communications,
+            history=history,
+            is_current=is_current,
+            name=name,
+            nominations=nominations,
+            parent=parent,
+            reports=reports,
+            subcommittees=subcommittees,
+            system_code=system_code,
+            type_=type_,
+            update_date=update_date,
+            url=url,
+        )
+
+        committee.additional_properties = d
+        return committee
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
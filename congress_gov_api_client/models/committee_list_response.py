@@ -0,0 +1,96 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .committee import Committee
+from .pagination import Pagination
+
+T = TypeVar("T", bound="CommitteeListResponse")
+
+
+@_attrs_define
+class CommitteeListResponse:
+    """A page of committees
+
+    Attributes:
+        committees (Union[Unset, list[Committee]]):
+        pagination (Union[Unset, Pagination]):
+        request (Union[Unset, Any]):
+    """
+
+    committees: Union[Unset, list[Committee]] = UNSET
+    pagination: Union[Unset, Pagination] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        committees: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.committees, Unset):
+            committees = []
+            for committees_item_data in self.committees:
+                committees_item = committees_item_data.to_dict()
+                committees.append(committees_item)
+
+        pagination: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.pagination, Unset):
+            pagination = self.pagination.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if committees is not UNSET:
+            field_dict["committees"] = committees
+        if pagination is not UNSET:
+            field_dict["pagination"] = pagination
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _committees = d.pop("committees", UNSET)
+        committees: Union[Unset, list[Committee]]
+        if isinstance(_committees, Unset) or _committees is None:
+            committees = UNSET
+        else:
+            committees = [Committee.from_dict(committees_item_data) for committees_item_data in _committees]
+
+        _pagination = d.pop("pagination", UNSET)
+        pagination: Union[Unset, Pagination]
+        if isinstance(_pagination, Unset) or _pagination is None:
+            pagination = UNSET
+        else:
+            pagination = Pagination.from_dict(_pagination)
+
+        request = d.pop("request", UNSET)
+
+        committee_list_response = cls(
+            committees=committees,
+            pagination=pagination,
+            request=request,
+        )
+
+        committee_list_response.additional_properties = d
+        return committee_list_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,76 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .committee import Committee
+
+T = TypeVar("T", bound="CommitteeResponse")
+
+
+@_attrs_define
+class CommitteeResponse:
+    """A single committee
+
+    Attributes:
+        committee (Union[Unset, Committee]):
+        request (Union[Unset, Any]):
+    """
+
+    committee: Union[Unset, Committee] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        committee: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.committee, Unset):
+            committee = self.committee.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if committee is not UNSET:
+            field_dict["committee"] = committee
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _committee = d.pop("committee", UNSET)
+        committee: Union[Unset, Committee]
+        if isinstance(_committee, Unset) or _committee is None:
+            committee = UNSET
+        else:
+            committee = Committee.from_dict(_committee)
+
+        request = d.pop("request", UNSET)
+
+        committee_response = cls(
+            committee=committee,
+            request=request,
+        )
+
+        committee_response.additional_properties = d
+        return committee_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+T = TypeVar("T", bound="LatestAction")
+
+
+@_attrs_define
+class LatestAction:
+    """The most recent action taken on a bill, amendment, nomination or treaty
+
+    Attributes:
+        action_date (Union[Unset, str]):
+        action_time (Union[Unset, str]):
+        text (Union[Unset, str]):
+    """
+
+    action_date: Union[Unset, str] = UNSET
+    action_time: Union[Unset, str] = UNSET
+    text: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        action_date = self.action_date
+
+        action_time = self.action_time
+
+        text = self.text
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if action_date is not UNSET:
+            field_dict["actionDate"] = action_date
+        if action_time is not UNSET:
+            field_dict["actionTime"] = action_time
+        if text is not UNSET:
+            field_dict["text"] = text
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        action_date = d.pop("actionDate", UNSET)
+
+        action_time = d.pop("actionTime", UNSET)
+
+        text = d.pop("text", UNSET)
+
+        latest_action = cls(
+            action_date=action_date,
+            action_time=action_time,
+            text=text,
+        )
+
+        latest_action.additional_properties = d
+        return latest_action
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,289 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .member_depiction import MemberDepiction
+from .resource_count import ResourceCount
+
+T = TypeVar("T", bound="Member")
+
+
+@_attrs_define
+class Member:
+    """A member of Congress, as returned by the member list and member details endpoints
+
+    Attributes:
+        address_information (Union[Unset, Any]):
+        bioguide_id (Union[Unset, str]):
+        birth_year (Union[Unset, str]):
+        cosponsored_legislation (Union[Unset, ResourceCount]):
+        current_member (Union[Unset, bool]):
+        death_year (Union[Unset, str]):
+        depiction (Union[Unset, MemberDepiction]):
+        direct_order_name (Union[Unset, str]):
+        district (Union[None, Unset, int]):
+        first_name (Union[Unset, str]):
+        honorific_name (Union[Unset, str]):
+        inverted_order_name (Union[Unset, str]):
+        last_name (Union[Unset, str]):
+        leadership (Union[Unset, Any]):
+        middle_name (Union[Unset, str]):
+        name (Union[Unset, str]):
+        official_website_url (Union[Unset, str]):
+        party_history (Union[Unset, Any]):
+        party_name (Union[Unset, str]):
+        sponsored_legislation (Union[Unset, ResourceCount]):
+        state (Union[Unset, str]):
+        terms (Union[Unset, Any]):
+        update_date (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    address_information: Union[Unset, Any] = UNSET
+    bioguide_id: Union[Unset, str] = UNSET
+    birth_year: Union[Unset, str] = UNSET
+    cosponsored_legislation: Union[Unset, ResourceCount] = UNSET
+    current_member: Union[Unset, bool] = UNSET
+    death_year: Union[Unset, str] = UNSET
+    depiction: Union[Unset, MemberDepiction] = UNSET
+    direct_order_name: Union[Unset, str] = UNSET
+    district: Union[None, Unset, int] = UNSET
+    first_name: Union[Unset, str] = UNSET
+    honorific_name: Union[Unset, str] = UNSET
+    inverted_order_name: Union[Unset, str] = UNSET
+    last_name: Union[Unset, str] = UNSET
+    leadership: Union[Unset, Any] = UNSET
+    middle_name: Union[Unset, str] = UNSET
+    name: Union[Unset, str] = UNSET
+    official_website_url: Union[Unset, str] = UNSET
+    party_history: Union[Unset, Any] = UNSET
+    party_name: Union[Unset, str] = UNSET
+    sponsored_legislation: Union[Unset, ResourceCount] = UNSET
+    state: Union[Unset, str] = UNSET
+    terms: Union[Unset, Any] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        address_information = self.address_information
+
+        bioguide_id = self.bioguide_id
+
+        birth_year = self.birth_year
+
+        cosponsored_legislation: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.cosponsored_legislation, Unset):
+            cosponsored_legislation = self.cosponsored_legislation.to_dict()
+
+        current_member = self.current_member
+
+        death_year = self.death_year
+
+        depiction: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.depiction, Unset):
+            depiction = self.depiction.to_dict()
+
+        direct_order_name = self.direct_order_name
+
+        district = self.district
+
+        first_name = self.first_name
+
+        honorific_name = self.honorific_name
+
+        inverted_order_name = self.inverted_order_name
+
+        last_name = self.last_name
+
+        leadership = self.leadership
+
+        middle_name = self.middle_name
+
+        name = self.name
+
+        official_website_url = self.official_website_url
+
+        party_history = self.party_history
+
+        party_name = self.party_name
+
+        sponsored_legislation: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.sponsored_legislation, Unset):
+            sponsored_legislation = self.sponsored_legislation.to_dict()
+
+        state = self.state
+
+        terms = self.terms
+
+        update_date = self.update_date
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if address_information is not UNSET:
+            field_dict["addressInformation"] = address_information
+        if bioguide_id is not UNSET:
+            field_dict["bioguideId"] = bioguide_id
+        if birth_year is not UNSET:
+            field_dict["birthYear"] = birth_year
+        if cosponsored_legislation is not UNSET:
+            field_dict["cosponsoredLegislation"] = cosponsored_legislation
+        if current_member is not UNSET:
+            field_dict["currentMember"] = current_member
+        if death_year is not UNSET:
+            field_dict["deathYear"] = death_year
+        if depiction is not UNSET:
+            field_dict["depiction"] = depiction
+        if direct_order_name is not UNSET:
+            field_dict["directOrderName"] = direct_order_name
+        if district is not UNSET:
+            field_dict["district"] = district
+        if first_name is not UNSET:
+            field_dict["firstName"] = first_name
+        if honorific_name is not UNSET:
+            field_dict["honorificName"] = honorific_name
+        if inverted_order_name is not UNSET:
+            field_dict["invertedOrderName"] = inverted_order_name
+        if last_name is not UNSET:
+            field_dict["lastName"] = last_name
+        if leadership is not UNSET:
+            field_dict["leadership"] = leadership
+        if middle_name is not UNSET:
+            field_dict["middleName"] = middle_name
+        if name is not UNSET:
+            field_dict["name"] = name
+        if official_website_url is not UNSET:
+            field_dict["officialWebsiteUrl"] = official_website_url
+        if party_history is not UNSET:
+            field_dict["partyHistory"] = party_history
+        if party_name is not UNSET:
+            field_dict["partyName"] = party_name
+        if sponsored_legislation is not UNSET:
+            field_dict["sponsoredLegislation"] = sponsored_legislation
+        if state is not UNSET:
+            field_dict["state"] = state
+        if terms is not UNSET:
+            field_dict["terms"] = terms
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        address_information = d.pop("addressInformation", UNSET)
+
+        bioguide_id = d.pop("bioguideId", UNSET)
+
+        birth_year = d.pop("birthYear", UNSET)
+
+        _cosponsored_legislation = d.pop("cosponsoredLegislation", UNSET)
+        cosponsored_legislation: Union[Unset, ResourceCount]
+        if isinstance(_cosponsored_legislation, Unset) or _cosponsored_legislation is None:
+            cosponsored_legislation = UNSET
+        else:
+            cosponsored_legislation = ResourceCount.from_dict(_cosponsored_legislation)
+
+        current_member = d.pop("currentMember", UNSET)
+
+        death_year = d.pop("deathYear", UNSET)
+
+        _depiction = d.pop("depiction", UNSET)
+        depiction: Union[Unset, MemberDepiction]
+        if isinstance(_depiction, Unset) or _depiction is None:
+            depiction = UNSET
+        else:
+            depiction = MemberDepiction.from_dict(_depiction)
+
+        direct_order_name = d.pop("directOrderName", UNSET)
+
+        district = d.pop("district", UNSET)
+
+        first_name = d.pop("firstName", UNSET)
+
+        honorific_name = d.pop("honorificName", UNSET)
+
+        inverted_order_name = d.pop("invertedOrderName", UNSET)
+
+        last_name = d.pop("lastName", UNSET)
+
+        leadership = d.pop("leadership", UNSET)
+
+        middle_name = d.pop("middleName", UNSET)
+
+        name = d.pop("name", UNSET)
+
+        official_website_url = d.pop("officialWebsiteUrl", UNSET)
+
+        party_history = d.pop("partyHistory", UNSET)
+
+        party_name = d.pop("partyName", UNSET)
+
+        _sponsored_legislation = d.pop("sponsoredLegislation", UNSET)
+        sponsored_legislation: Union[Unset, ResourceCount]
+        if isinstance(_sponsored_legislation, Unset) or _sponsored_legislation is None:
+            sponsored_legislation = UNSET
+        else:
+            sponsored_legislation = ResourceCount.from_dict(_sponsored_legislation)
+
+        state = d.pop("state", UNSET)
+
+        terms = d.pop("terms", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        member = cls(
+            address_information=address_information,
+            bioguide_id=bioguide_id,
+            birth_year=birth_year,
+            cosponsored_legislation=cosponsored_legislation,
+            current_member=current_member,
+            death_year=death_year,
+            depiction=depiction,
+            direct_order_name=direct_order_name,
+            district=district,
+            first_name=first_name,
+            honorific_name=honorific_name,
+            inverted_order_name=inverted_order_name,
+            last_name=last_name,
+            leadership=leadership,
+            middle_name=middle_name,
+            name=name,
+            official_website_url=official_website_url,
+            party_history=party_history,
+            party_name=party_name,
+            sponsored_legislation=sponsored_legislation,
+            state=state,
+            terms=terms,
+            update_date=update_date,
+            url=url,
+        )
+
+        member.additional_properties = d
+        return member
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,96 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .member import Member
+from .pagination import Pagination
+
+T = TypeVar("T", bound="MemberListResponse")
+
+
+@_attrs_define
+class MemberListResponse:
+    """A page of members
+
+    Attributes:
+        members (Union[Unset, list[Member]]):
+        pagination (Union[Unset, Pagination]):
+        request (Union[Unset, Any]):
+    """
+
+    members: Union[Unset, list[Member]] = UNSET
+    pagination: Union[Unset, Pagination] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        members: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.members, Unset):
+            members = []
+            for members_item_data in self.members:
+                members_item = members_item_data.to_dict()
+                members.append(members_item)
+
+        pagination: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.pagination, Unset):
+            pagination = self.pagination.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if members is not UNSET:
+            field_dict["members"] = members
+        if pagination is not UNSET:
+            field_dict["pagination"] = pagination
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _members = d.pop("members", UNSET)
+        members: Union[Unset, list[Member]]
+        if isinstance(_members, Unset) or _members is None:
+            members = UNSET
+        else:
+            members = [Member.from_dict(members_item_data) for members_item_data in _members]
+
+        _pagination = d.pop("pagination", UNSET)
+        pagination: Union[Unset, Pagination]
+        if isinstance(_pagination, Unset) or _pagination is None:
+            pagination = UNSET
+        else:
+            pagination = Pagination.from_dict(_pagination)
+
+        request = d.pop("request", UNSET)
+
+        member_list_response = cls(
+            members=members,
+            pagination=pagination,
+            request=request,
+        )
+
+        member_list_response.additional_properties = d
+        return member_list_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
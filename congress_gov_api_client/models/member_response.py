@@ -0,0 +1,76 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .member import Member
+
+T = TypeVar("T", bound="MemberResponse")
+
+
+@_attrs_define
+class MemberResponse:
+    """A single member
+
+    Attributes:
+        member (Union[Unset, Member]):
+        request (Union[Unset, Any]):
+    """
+
+    member: Union[Unset, Member] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        member: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.member, Unset):
+            member = self.member.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if member is not UNSET:
+            field_dict["member"] = member
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _member = d.pop("member", UNSET)
+        member: Union[Unset, Member]
+        if isinstance(_member, Unset) or _member is None:
+            member = UNSET
+        else:
+            member = Member.from_dict(_member)
+
+        request = d.pop("request", UNSET)
+
+        member_response = cls(
+            member=member,
+            request=request,
+        )
+
+        member_response.additional_properties = d
+        return member_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,233 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .latest_action import LatestAction
+from .resource_count import ResourceCount
+
+T = TypeVar("T", bound="Nomination")
+
+
+@_attrs_define
+class Nomination:
+    """A nomination, as returned by the nomination list and nomination details endpoints
+
+    Attributes:
+        actions (Union[Unset, ResourceCount]):
+        authority_date (Union[Unset, str]):
+        citation (Union[Unset, str]):
+        committees (Union[Unset, ResourceCount]):
+        congress (Union[Unset, int]):
+        description (Union[Unset, str]):
+        hearings (Union[Unset, ResourceCount]):
+        is_list (Union[Unset, bool]):
+        latest_action (Union[Unset, LatestAction]):
+        nomination_type (Union[Unset, Any]):
+        nominees (Union[Unset, Any]):
+        number (Union[Unset, int]):
+        organization (Union[Unset, str]):
+        part_number (Union[Unset, str]):
+        received_date (Union[Unset, str]):
+        update_date (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    actions: Union[Unset, ResourceCount] = UNSET
+    authority_date: Union[Unset, str] = UNSET
+    citation: Union[Unset, str] = UNSET
+    committees: Union[Unset, ResourceCount] = UNSET
+    congress: Union[Unset, int] = UNSET
+    description: Union[Unset, str] = UNSET
+    hearings: Union[Unset, ResourceCount] = UNSET
+    is_list: Union[Unset, bool] = UNSET
+    latest_action: Union[Unset, LatestAction] = UNSET
+    nomination_type: Union[Unset, Any] = UNSET
+    nominees: Union[Unset, Any] = UNSET
+    number: Union[Unset, int] = UNSET
+    organization: Union[Unset, str] = UNSET
+    part_number: Union[Unset, str] = UNSET
+    received_date: Union[Unset, str] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        actions: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.actions, Unset):
+            actions = self.actions.to_dict()
+
+        authority_date = self.authority_date
+
+        citation = self.citation
+
+        committees: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.committees, Unset):
+            committees = self.committees.to_dict()
+
+        congress = self.congress
+
+        description = self.description
+
+        hearings: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.hearings, Unset):
+            hearings = self.hearings.to_dict()
+
+        is_list = self.is_list
+
+        latest_action: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.latest_action, Unset):
+            latest_action = self.latest_action.to_dict()
+
+        nomination_type = self.nomination_type
+
+        nominees = self.nominees
+
+        number = self.number
+
+        organization = self.organization
+
+        part_number = self.part_number
+
+        received_date = self.received_date
+
+        update_date = self.update_date
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if actions is not UNSET:
+            field_dict["actions"] = actions
+        if authority_date is not UNSET:
+            field_dict["authorityDate"] = authority_date
+        if citation is not UNSET:
+            field_dict["citation"] = citation
+        if committees is not UNSET:
+            field_dict["committees"] = committees
+        if congress is not UNSET:
+            field_dict["congress"] = congress
+        if description is not UNSET:
+            field_dict["description"] = description
+        if hearings is not UNSET:
+            field_dict["hearings"] = hearings
+        if is_list is not UNSET:
+            field_dict["isList"] = is_list
+        if latest_action is not UNSET:
+            field_dict["latestAction"] = latest_action
+        if nomination_type is not UNSET:
+            field_dict["nominationType"] = nomination_type
+        if nominees is not UNSET:
+            field_dict["nominees"] = nominees
+        if number is not UNSET:
+            field_dict["number"] = number
+        if organization is not UNSET:
+            field_dict["organization"] = organization
+        if part_number is not UNSET:
+            field_dict["partNumber"] = part_number
+        if received_date is not UNSET:
+            field_dict["receivedDate"] = received_date
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _actions = d.pop("actions", UNSET)
+        actions: Union[Unset, ResourceCount]
+        if isinstance(_actions, Unset) or _actions is None:
+            actions = UNSET
+        else:
+            actions = ResourceCount.from_dict(_actions)
+
+        authority_date = d.pop("authorityDate", UNSET)
+
+        citation = d.pop("citation", UNSET)
+
+        _committees = d.pop("committees", UNSET)
+        committees: Union[Unset, ResourceCount]
+        if isinstance(_committees, Unset) or _committees is None:
+            committees = UNSET
+        else:
+            committees = ResourceCount.from_dict(_committees)
+
+        congress = d.pop("congress", UNSET)
+
+        description = d.pop("description", UNSET)
+
+        _hearings = d.pop("hearings", UNSET)
+        hearings: Union[Unset, ResourceCount]
+        if isinstance(_hearings, Unset) or _hearings is None:
+            hearings = UNSET
+        else:
+            hearings = ResourceCount.from_dict(_hearings)
+
+        is_list = d.pop("isList", UNSET)
+
+        _latest_action = d.pop("latestAction", UNSET)
+        latest_action: Union[Unset, LatestAction]
+        if isinstance(_latest_action, Unset) or _latest_action is None:
+            latest_action = UNSET
+        else:
+            latest_action = LatestAction.from_dict(_latest_action)
+
+        nomination_type = d.pop("nominationType", UNSET)
+
+        nominees = d.pop("nominees", UNSET)
+
+        number = d.pop("number", UNSET)
+
+        organization = d.pop("organization", UNSET)
+
+        part_number = d.pop("partNumber", UNSET)
+
+        received_date = d.pop("receivedDate", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        nomination = cls(
+            actions=actions,
+            authority_date=authority_date,
+            citation=citation,
+            committees=committees,
+            congress=congress,
+            description=description,
+            hearings=hearings,
+            is_list=is_list,
+            latest_action=latest_action,
+            nomination_type=nomination_type,
+            nominees=nominees,
+            number=number,
+            organization=organization,
+            part_number=part_number,
+            received_date=received_date,
+            update_date=update_date,
+            url=url,
+        )
+
+        nomination.additional_properties = d
+        return nomination
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,76 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .nomination import Nomination
+
+T = TypeVar("T", bound="NominationResponse")
+
+
+@_attrs_define
+class NominationResponse:
+    """A single nomination
+
+    Attributes:
+        nomination (Union[Unset, Nomination]):
+        request (Union[Unset, Any]):
+    """
+
+    nomination: Union[Unset, Nomination] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        nomination: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.nomination, Unset):
+            nomination = self.nomination.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if nomination is not UNSET:
+            field_dict["nomination"] = nomination
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _nomination = d.pop("nomination", UNSET)
+        nomination: Union[Unset, Nomination]
+        if isinstance(_nomination, Unset) or _nomination is None:
+            nomination = UNSET
+        else:
+            nomination = Nomination.from_dict(_nomination)
+
+        request = d.pop("request", UNSET)
+
+        nomination_response = cls(
+            nomination=nomination,
+            request=request,
+        )
+
+        nomination_response.additional_properties = d
+        return nomination_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
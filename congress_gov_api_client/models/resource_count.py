@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+T = TypeVar("T", bound="ResourceCount")
+
+
+@_attrs_define
+class ResourceCount:
+    """A reference to a sub-resource, with the number of items it contains
+
+    Attributes:
+        count (Union[Unset, int]):
+        count_including_withdrawn_cosponsors (Union[Unset, int]):
+        url (Union[Unset, str]):
+    """
+
+    count: Union[Unset, int] = UNSET
+    count_including_withdrawn_cosponsors: Union[Unset, int] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        count = self.count
+
+        count_including_withdrawn_cosponsors = self.count_including_withdrawn_cosponsors
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if count is not UNSET:
+            field_dict["count"] = count
+        if count_including_withdrawn_cosponsors is not UNSET:
+            field_dict["countIncludingWithdrawnCosponsors"] = count_including_withdrawn_cosponsors
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        count = d.pop("count", UNSET)
+
+        count_including_withdrawn_cosponsors = d.pop("countIncludingWithdrawnCosponsors", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        resource_count = cls(
+            count=count,
+            count_including_withdrawn_cosponsors=count_including_withdrawn_cosponsors,
+            url=url,
+        )
+
+        resource_count.additional_properties = d
+        return resource_count
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,140 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+T = TypeVar("T", bound="Sponsor")
+
+
+@_attrs_define
+class Sponsor:
+    """A member sponsoring a bill or an amendment
+
+    Attributes:
+        bioguide_id (Union[Unset, str]):
+        district (Union[None, Unset, int]):
+        first_name (Union[Unset, str]):
+        full_name (Union[Unset, str]):
+        is_by_request (Union[Unset, str]):
+        last_name (Union[Unset, str]):
+        middle_name (Union[Unset, str]):
+        party (Union[Unset, str]):
+        state (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    bioguide_id: Union[Unset, str] = UNSET
+    district: Union[None, Unset, int] = UNSET
+    first_name: Union[Unset, str] = UNSET
+    full_name: Union[Unset, str] = UNSET
+    is_by_request: Union[Unset, str] = UNSET
+    last_name: Union[Unset, str] = UNSET
+    middle_name: Union[Unset, str] = UNSET
+    party: Union[Unset, str] = UNSET
+    state: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        bioguide_id = self.bioguide_id
+
+        district = self.district
+
+        first_name = self.first_name
+
+        full_name = self.full_name
+
+        is_by_request = self.is_by_request
+
+        last_name = self.last_name
+
+        middle_name = self.middle_name
+
+        party = self.party
+
+        state = self.state
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if bioguide_id is not UNSET:
+            field_dict["bioguideId"] = bioguide_id
+        if district is not UNSET:
+            field_dict["district"] = district
+        if first_name is not UNSET:
+            field_dict["firstName"] = first_name
+        if full_name is not UNSET:
+            field_dict["fullName"] = full_name
+        if is_by_request is not UNSET:
+            field_dict["isByRequest"] = is_by_request
+        if last_name is not UNSET:
+            field_dict["lastName"] = last_name
+        if middle_name is not UNSET:
+            field_dict["middleName"] = middle_name
+        if party is not UNSET:
+            field_dict["party"] = party
+        if state is not UNSET:
+            field_dict["state"] = state
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        bioguide_id = d.pop("bioguideId", UNSET)
+
+        district = d.pop("district", UNSET)
+
+        first_name = d.pop("firstName", UNSET)
+
+        full_name = d.pop("fullName", UNSET)
+
+        is_by_request = d.pop("isByRequest", UNSET)
+
+        last_name = d.pop("lastName", UNSET)
+
+        middle_name = d.pop("middleName", UNSET)
+
+        party = d.pop("party", UNSET)
+
+        state = d.pop("state", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        sponsor = cls(
+            bioguide_id=bioguide_id,
+            district=district,
+            first_name=first_name,
+            full_name=full_name,
+            is_by_request=is_by_request,
+            last_name=last_name,
+            middle_name=middle_name,
+            party=party,
+            state=state,
+            url=url,
+        )
+
+        sponsor.additional_properties = d
+        return sponsor
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
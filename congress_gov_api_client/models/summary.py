@@ -0,0 +1,139 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .bill import Bill
+
+T = TypeVar("T", bound="Summary")
+
+
+@_attrs_define
+class Summary:
+    """A bill summary, as returned by the summaries endpoints
+
+    Attributes:
+        action_date (Union[Unset, str]):
+        action_desc (Union[Unset, str]):
+        bill (Union[Unset, Bill]):
+        current_chamber (Union[Unset, str]):
+        current_chamber_code (Union[Unset, str]):
+        last_summary_update_date (Union[Unset, str]):
+        text (Union[Unset, str]):
+        update_date (Union[Unset, str]):
+        version_code (Union[Unset, str]):
+    """
+
+    action_date: Union[Unset, str] = UNSET
+    action_desc: Union[Unset, str] = UNSET
+    bill: Union[Unset, Bill] = UNSET
+    current_chamber: Union[Unset, str] = UNSET
+    current_chamber_code: Union[Unset, str] = UNSET
+    last_summary_update_date: Union[Unset, str] = UNSET
+    text: Union[Unset, str] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    version_code: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        action_date = self.action_date
+
+        action_desc = self.action_desc
+
+        bill: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.bill, Unset):
+            bill = self.bill.to_dict()
+
+        current_chamber = self.current_chamber
+
+        current_chamber_code = self.current_chamber_code
+
+        last_summary_update_date = self.last_summary_update_date
+
+        text = self.text
+
+        update_date = self.update_date
+
+        version_code = self.version_code
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if action_date is not UNSET:
+            field_dict["actionDate"] = action_date
+        if action_desc is not UNSET:
+            field_dict["actionDesc"] = action_desc
+        if bill is not UNSET:
+            field_dict["bill"] = bill
+        if current_chamber is not UNSET:
+            field_dict["currentChamber"] = current_chamber
+        if current_chamber_code is not UNSET:
+            field_dict["currentChamberCode"] = current_chamber_code
+        if last_summary_update_date is not UNSET:
+            field_dict["lastSummaryUpdateDate"] = last_summary_update_date
+        if text is not UNSET:
+            field_dict["text"] = text
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if version_code is not UNSET:
+            field_dict["versionCode"] = version_code
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        action_date = d.pop("actionDate", UNSET)
+
+        action_desc = d.pop("actionDesc", UNSET)
+
+        _bill = d.pop("bill", UNSET)
+        bill: Union[Unset, Bill]
+        if isinstance(_bill, Unset) or _bill is None:
+            bill = UNSET
+        else:
+            bill = Bill.from_dict(_bill)
+
+        current_chamber = d.pop("currentChamber", UNSET)
+
+        current_chamber_code = d.pop("currentChamberCode", UNSET)
+
+        last_summary_update_date = d.pop("lastSummaryUpdateDate", UNSET)
+
+        text = d.pop("text", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        version_code = d.pop("versionCode", UNSET)
+
+        summary = cls(
+            action_date=action_date,
+            action_desc=action_desc,
+            bill=bill,
+            current_chamber=current_chamber,
+            current_chamber_code=current_chamber_code,
+            last_summary_update_date=last_summary_update_date,
+            text=text,
+            update_date=update_date,
+            version_code=version_code,
+        )
+
+        summary.additional_properties = d
+        return summary
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,220 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .resource_count import ResourceCount
+
+T = TypeVar("T", bound="Treaty")
+
+
+@_attrs_define
+class Treaty:
+    """A treaty, as returned by the treaty list and treaty details endpoints
+
+    Attributes:
+        actions (Union[Unset, ResourceCount]):
+        congress_considered (Union[Unset, int]):
+        congress_received (Union[Unset, int]):
+        countries_parties (Union[Unset, Any]):
+        in_force_date (Union[None, Unset, str]):
+        index_terms (Union[Unset, Any]):
+        number (Union[Unset, int]):
+        old_number (Union[None, Unset, str]):
+        old_number_display_name (Union[None, Unset, str]):
+        parts (Union[Unset, Any]):
+        related_docs (Union[Unset, Any]):
+        resolution_text (Union[Unset, str]):
+        suffix (Union[Unset, str]):
+        titles (Union[Unset, Any]):
+        topic (Union[Unset, str]):
+        transmitted_date (Union[Unset, str]):
+        update_date (Union[Unset, str]):
+        url (Union[Unset, str]):
+    """
+
+    actions: Union[Unset, ResourceCount] = UNSET
+    congress_considered: Union[Unset, int] = UNSET
+    congress_received: Union[Unset, int] = UNSET
+    countries_parties: Union[Unset, Any] = UNSET
+    in_force_date: Union[None, Unset, str] = UNSET
+    index_terms: Union[Unset, Any] = UNSET
+    number: Union[Unset, int] = UNSET
+    old_number: Union[None, Unset, str] = UNSET
+    old_number_display_name: Union[None, Unset, str] = UNSET
+    parts: Union[Unset, Any] = UNSET
+    related_docs: Union[Unset, Any] = UNSET
+    resolution_text: Union[Unset, str] = UNSET
+    suffix: Union[Unset, str] = UNSET
+    titles: Union[Unset, Any] = UNSET
+    topic: Union[Unset, str] = UNSET
+    transmitted_date: Union[Unset, str] = UNSET
+    update_date: Union[Unset, str] = UNSET
+    url: Union[Unset, str] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        actions: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.actions, Unset):
+            actions = self.actions.to_dict()
+
+        congress_considered = self.congress_considered
+
+        congress_received = self.congress_received
+
+        countries_parties = self.countries_parties
+
+        in_force_date = self.in_force_date
+
+        index_terms = self.index_terms
+
+        number = self.number
+
+        old_number = self.old_number
+
+        old_number_display_name = self.old_number_display_name
+
+        parts = self.parts
+
+        related_docs = self.related_docs
+
+        resolution_text = self.resolution_text
+
+        suffix = self.suffix
+
+        titles = self.titles
+
+        topic = self.topic
+
+        transmitted_date = self.transmitted_date
+
+        update_date = self.update_date
+
+        url = self.url
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if actions is not UNSET:
+            field_dict["actions"] = actions
+        if congress_considered is not UNSET:
+            field_dict["congressConsidered"] = congress_considered
+        if congress_received is not UNSET:
+            field_dict["congressReceived"] = congress_received
+        if countries_parties is not UNSET:
+            field_dict["countriesParties"] = countries_parties
+        if in_force_date is not UNSET:
+            field_dict["inForceDate"] = in_force_date
+        if index_terms is not UNSET:
+            field_dict["indexTerms"] = index_terms
+        if number is not UNSET:
+            field_dict["number"] = number
+        if old_number is not UNSET:
+            field_dict["oldNumber"] = old_number
+        if old_number_display_name is not UNSET:
+            field_dict["oldNumberDisplayName"] = old_number_display_name
+        if parts is not UNSET:
+            field_dict["parts"] = parts
+        if related_docs is not UNSET:
+            field_dict["relatedDocs"] = related_docs
+        if resolution_text is not UNSET:
+            field_dict["resolutionText"] = resolution_text
+        if suffix is not UNSET:
+            field_dict["suffix"] = suffix
+        if titles is not UNSET:
+            field_dict["titles"] = titles
+        if topic is not UNSET:
+            field_dict["topic"] = topic
+        if transmitted_date is not UNSET:
+            field_dict["transmittedDate"] = transmitted_date
+        if update_date is not UNSET:
+            field_dict["updateDate"] = update_date
+        if url is not UNSET:
+            field_dict["url"] = url
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _actions = d.pop("actions", UNSET)
+        actions: Union[Unset, ResourceCount]
+        if isinstance(_actions, Unset) or _actions is None:
+            actions = UNSET
+        else:
+            actions = ResourceCount.from_dict(_actions)
+
+        congress_considered = d.pop("congressConsidered", UNSET)
+
+        congress_received = d.pop("congressReceived", UNSET)
+
+        countries_parties = d.pop("countriesParties", UNSET)
+
+        in_force_date = d.pop("inForceDate", UNSET)
+
+        index_terms = d.pop("indexTerms", UNSET)
+
+        number = d.pop("number", UNSET)
+
+        old_number = d.pop("oldNumber", UNSET)
+
+        old_number_display_name = d.pop("oldNumberDisplayName", UNSET)
+
+        parts = d.pop("parts", UNSET)
+
+        related_docs = d.pop("relatedDocs", UNSET)
+
+        resolution_text = d.pop("resolutionText", UNSET)
+
+        suffix = d.pop("suffix", UNSET)
+
+        titles = d.pop("titles", UNSET)
+
+        topic = d.pop("topic", UNSET)
+
+        transmitted_date = d.pop("transmittedDate", UNSET)
+
+        update_date = d.pop("updateDate", UNSET)
+
+        url = d.pop("url", UNSET)
+
+        treaty = cls(
+            actions=actions,
+            congress_considered=congress_considered,
+            congress_received=congress_received,
+            countries_parties=countries_parties,
+            in_force_date=in_force_date,
+            index_terms=index_terms,
+            number=number,
+            old_number=old_number,
+            old_number_display_name=old_number_display_name,
+            parts=parts,
+            related_docs=related_docs,
+            resolution_text=resolution_text,
+            suffix=suffix,
+            titles=titles,
+            topic=topic,
+            transmitted_date=transmitted_date,
+            update_date=update_date,
+            url=url,
+        )
+
+        treaty.additional_properties = d
+        return treaty
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
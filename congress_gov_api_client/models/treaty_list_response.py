@@ -0,0 +1,96 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .pagination import Pagination
+from .treaty import Treaty
+
+T = TypeVar("T", bound="TreatyListResponse")
+
+
+@_attrs_define
+class TreatyListResponse:
+    """A page of treaties
+
+    Attributes:
+        treaties (Union[Unset, list[Treaty]]):
+        pagination (Union[Unset, Pagination]):
+        request (Union[Unset, Any]):
+    """
+
+    treaties: Union[Unset, list[Treaty]] = UNSET
+    pagination: Union[Unset, Pagination] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        treaties: Union[Unset, list[dict[str, Any]]] = UNSET
+        if not isinstance(self.treaties, Unset):
+            treaties = []
+            for treaties_item_data in self.treaties:
+                treaties_item = treaties_item_data.to_dict()
+                treaties.append(treaties_item)
+
+        pagination: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.pagination, Unset):
+            pagination = self.pagination.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if treaties is not UNSET:
+            field_dict["treaties"] = treaties
+        if pagination is not UNSET:
+            field_dict["pagination"] = pagination
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _treaties = d.pop("treaties", UNSET)
+        treaties: Union[Unset, list[Treaty]]
+        if isinstance(_treaties, Unset) or _treaties is None:
+            treaties = UNSET
+        else:
+            treaties = [Treaty.from_dict(treaties_item_data) for treaties_item_data in _treaties]
+
+        _pagination = d.pop("pagination", UNSET)
+        pagination: Union[Unset, Pagination]
+        if isinstance(_pagination, Unset) or _pagination is None:
+            pagination = UNSET
+        else:
+            pagination = Pagination.from_dict(_pagination)
+
+        request = d.pop("request", UNSET)
+
+        treaty_list_response = cls(
+            treaties=treaties,
+            pagination=pagination,
+            request=request,
+        )
+
+        treaty_list_response.additional_properties = d
+        return treaty_list_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,76 @@
+from collections.abc import Mapping
+from typing import Any, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+from .treaty import Treaty
+
+T = TypeVar("T", bound="TreatyResponse")
+
+
+@_attrs_define
+class TreatyResponse:
+    """A single treaty
+
+    Attributes:
+        treaty (Union[Unset, Treaty]):
+        request (Union[Unset, Any]):
+    """
+
+    treaty: Union[Unset, Treaty] = UNSET
+    request: Union[Unset, Any] = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        treaty: Union[Unset, dict[str, Any]] = UNSET
+        if not isinstance(self.treaty, Unset):
+            treaty = self.treaty.to_dict()
+
+        request = self.request
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        if treaty is not UNSET:
+            field_dict["treaty"] = treaty
+        if request is not UNSET:
+            field_dict["request"] = request
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        _treaty = d.pop("treaty", UNSET)
+        treaty: Union[Unset, Treaty]
+        if isinstance(_treaty, Unset) or _treaty is None:
+            treaty = UNSET
+        else:
+            treaty = Treaty.from_dict(_treaty)
+
+        request = d.pop("request", UNSET)
+
+        treaty_response = cls(
+            treaty=treaty,
+            request=request,
+        )
+
+        treaty_response.additional_properties = d
+        return treaty_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
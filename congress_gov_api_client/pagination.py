@@ -0,0 +1,234 @@
+"""Contains generators for walking every page of the offset/limit list endpoints"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from http import HTTPStatus
+from itertools import islice
+from types import ModuleType
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import attrs
+from attrs import define
+
+from . import errors
+from .client import AuthenticatedClient
+from .decoding import decode_json
+from .types import Response, Unset
+
+MAX_LIMIT = 250
+"""The largest page size accepted by the API"""
+
+
+@define
+class Page:
+    """A single page of a list endpoint
+
+    Attributes:
+        items: The records on this page, as models for typed endpoints and as dicts otherwise
+        count: The total number of records across all pages, from ``pagination.count``
+        next_url: The ``pagination.next`` link, or ``None`` on the last page
+    """
+
+    items: list[Any]
+    count: Optional[int] = None
+    next_url: Optional[str] = None
+
+    @property
+    def next_offset(self) -> Optional[int]:
+        """The ``offset`` query parameter of ``next_url``, or ``None`` on the last page"""
+        if not self.next_url:
+            return None
+        values = parse_qs(urlsplit(self.next_url).query).get("offset")
+        return int(values[0]) if values else None
+
+    @classmethod
+    def from_response(cls, response: Response[Any]) -> "Page":
+        """Build a page from an endpoint response, reusing ``Response.parsed`` when the endpoint is typed
+
+        Raises:
+            errors.UnexpectedStatus: If the response is not a successful JSON page.
+        """
+        if response.status_code != HTTPStatus.OK:
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+        if response.parsed is not None:
+            return cls._from_model(response.parsed)
+        data = decode_json(response.content)
+        if not isinstance(data, dict):
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+        return cls._from_dict(data)
+
+    @classmethod
+    def _from_model(cls, parsed: Any) -> "Page":
+        items: list[Any] = []
+        for attribute in attrs.fields(type(parsed)):
+            value = getattr(parsed, attribute.name)
+            if isinstance(value, list):
+                items = value
+                break
+        pagination = getattr(parsed, "pagination", None)
+        if pagination is None or isinstance(pagination, Unset):
+            return cls(items=items)
+        count = None if isinstance(pagination.count, Unset) else pagination.count
+        next_url = None if isinstance(pagination.next_, Unset) else pagination.next_
+        return cls(items=items, count=count, next_url=next_url)
+
+    @classmethod
+    def _from_dict(cls, data: dict[str, Any]) -> "Page":
+        items: list[Any] = []
+        for key, value in data.items():
+            if key != "pagination" and isinstance(value, list):
+                items = value
+                break
+        else:
+            # Some endpoints nest the list one level down, e.g. ``subjects.legislativeSubjects`` of bill subjects
+            for key, value in data.items():
+                if key != "pagination" and isinstance(value, dict):
+                    items = next((nested for nested in value.values() if isinstance(nested, list)), [])
+                    if items:
+                        break
+        pagination = data.get("pagination") or {}
+        return cls(items=items, count=pagination.get("count"), next_url=pagination.get("next"))
+
+
+def paginate(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Lazily yield every record of a list endpoint, following ``pagination.next`` from page to page
+
+    Only one page is held in memory at a time, so walking the full ``/bill`` collection uses constant memory.
+
+    Args:
+        endpoint: An endpoint module taking ``offset``/``limit``, e.g. ``congress_gov_api_client.api.bill.bill_list_all``
+        *args: Path parameters for the endpoint, e.g. ``congress`` and ``bill_type``
+        client: The client to make requests with
+        limit: The page size, at most 250
+        offset: The offset of the first record to yield
+        **kwargs: Additional query parameters for the endpoint, e.g. ``from_date_time``
+
+    Raises:
+        errors.UnexpectedStatus: If any page is not returned successfully.
+        httpx.TimeoutException: If a request takes longer than Client.timeout.
+
+    Returns:
+        Iterator[Any]
+    """
+    next_offset: Optional[int] = offset
+    while next_offset is not None:
+        response = endpoint.sync_detailed(*args, client=client, offset=next_offset, limit=limit, **kwargs)
+        page = Page.from_response(response)
+        yield from page.items
+        next_offset = page.next_offset if page.items else None
+
+
+async def apaginate(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient,
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Lazily yield every record of a list endpoint, following ``pagination.next`` from page to page
+
+    The async counterpart of ``paginate``; accepts the same arguments. With ``concurrency`` above 1 the offsets of all
+    remaining pages are computed from ``pagination.count`` on the first page and fetched concurrently, with at most
+    ``concurrency`` requests in flight and at most that many pages held in memory.
+
+    Args:
+        concurrency: The maximum number of pages requested at once
+        ordered: Whether to yield records in offset order, or page by page as soon as each page arrives
+
+    Returns:
+        AsyncIterator[Any]
+    """
+    next_offset: Optional[int] = offset
+    while next_offset is not None:
+        page = await _afetch_page(endpoint, args, client, next_offset, limit, kwargs)
+        for item in page.items:
+            yield item
+        next_offset = page.next_offset if page.items else None
+        if concurrency > 1 and next_offset is not None and page.count is not None:
+            offsets = iter(range(next_offset, page.count, limit))
+            fan_out = _afan_out_ordered if ordered else _afan_out_unordered
+            pages = fan_out(endpoint, args, client, offsets, limit, concurrency, kwargs)
+            try:
+                async for item in pages:
+                    yield item
+            finally:
+                # Closing this generator does not close the fan-out, whose cleanup would otherwise wait for the GC
+                await pages.aclose()
+            return
+
+
+async def _afetch_page(
+    endpoint: ModuleType, args: tuple[Any, ...], client: AuthenticatedClient, offset: int, limit: int, kwargs: Any
+) -> Page:
+    response = await endpoint.asyncio_detailed(*args, client=client, offset=offset, limit=limit, **kwargs)
+    return Page.from_response(response)
+
+
+async def _afan_out_ordered(
+    endpoint: ModuleType,
+    args: tuple[Any, ...],
+    client: AuthenticatedClient,
+    offsets: Iterator[int],
+    limit: int,
+    concurrency: int,
+    kwargs: Any,
+) -> AsyncIterator[Any]:
+    window: deque[asyncio.Task[Page]] = deque(
+        asyncio.ensure_future(_afetch_page(endpoint, args, client, page_offset, limit, kwargs))
+        for page_offset in islice(offsets, concurrency)
+    )
+    try:
+        while window:
+            page = await window.popleft()
+            for page_offset in islice(offsets, 1):
+                window.append(asyncio.ensure_future(_afetch_page(endpoint, args, client, page_offset, limit, kwargs)))
+            for item in page.items:
+                yield item
+    finally:
+        # Wait for the cancelled pages, so none is still running, or holds an unretrieved error, once the caller stops
+        for task in window:
+            task.cancel()
+        await asyncio.gather(*window, return_exceptions=True)
+
+
+async def _afan_out_unordered(
+    endpoint: ModuleType,
+    args: tuple[Any, ...],
+    client: AuthenticatedClient,
+    offsets: Iterator[int],
+    limit: int,
+    concurrency: int,
+    kwargs: Any,
+) -> AsyncIterator[Any]:
+    in_flight = {
+        asyncio.ensure_future(_afetch_page(endpoint, args, client, page_offset, limit, kwargs))
+        for page_offset in islice(offsets, concurrency)
+    }
+    done: set[asyncio.Task[Page]] = set()
+    try:
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for page_offset in islice(offsets, len(done)):
+                in_flight.add(asyncio.ensure_future(_afetch_page(endpoint, args, client, page_offset, limit, kwargs)))
+            for task in done:
+                for item in task.result().items:
+                    yield item
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, *done, return_exceptions=True)
+
+
+__all__ = ["MAX_LIMIT", "Page", "apaginate", "paginate"]
@@ -0,0 +1,124 @@
+"""Contains a client-side rate limiter shared by sync and async requests"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+HOURLY_QUOTA = 5000
+"""The number of requests api.data.gov allows per key per hour"""
+
+REMAINING_HEADER = "X-RateLimit-Remaining"
+
+
+@define
+class TokenBucket:
+    """A token bucket that spaces requests out evenly instead of letting them burst into 429s
+
+    Each request reserves a token; when the bucket is empty the caller waits for its reserved slot, so throughput
+    settles at ``rate`` requests per second. The same bucket can be shared by any number of sync and async clients.
+
+    Attributes:
+        rate: The number of tokens added per second
+        capacity: The maximum number of tokens, i.e. the largest burst allowed after an idle period
+    """
+
+    rate: float
+    capacity: float = 10.0
+    _tokens: float = field(init=False)
+    _updated: float = field(init=False, factory=time.monotonic)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        self._tokens = self.capacity
+
+    @classmethod
+    def per_hour(cls, requests: int = HOURLY_QUOTA, capacity: float = 10.0) -> "TokenBucket":
+        """Build a bucket that allows ``requests`` per hour, e.g. the api.data.gov quota of one key"""
+        return cls(rate=requests / 3600, capacity=capacity)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait until a request may be sent without blocking the event loop"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def observe(self, response: httpx.Response) -> None:
+        """Align the bucket with the quota the server reports
+
+        When ``X-RateLimit-Remaining`` is present the bucket never holds more tokens than the server has left, and a
+        429 empties it so that the following requests are spaced out at ``rate``.
+        """
+        remaining = _remaining(response)
+        if remaining is None and response.status_code != 429:
+            return
+        with self._lock:
+            if response.status_code == 429:
+                self._tokens = min(self._tokens, 0.0)
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+
+
+def _remaining(response: httpx.Response) -> Optional[int]:
+    value = response.headers.get(REMAINING_HEADER)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Wraps an ``httpx.BaseTransport`` so that every request first acquires a token from ``limiter``"""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: TokenBucket) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._limiter.acquire()
+        response = self._transport.handle_request(request)
+        self._limiter.observe(response)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Wraps an ``httpx.AsyncBaseTransport`` so that every request first acquires a token from ``limiter``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: TokenBucket) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._limiter.aacquire()
+        response = await self._transport.handle_async_request(request)
+        self._limiter.observe(response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = ["HOURLY_QUOTA", "AsyncRateLimitedTransport", "RateLimitedTransport", "TokenBucket"]
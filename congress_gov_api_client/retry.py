@@ -0,0 +1,181 @@
+"""Contains transports that retry failed requests with exponential backoff"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _default_statuses() -> dict[int, int]:
+    return {429: 8, 500: 3, 502: 5, 503: 5, 504: 5}
+
+
+@define
+class RetryBudget:
+    """Caps retries across every request sent through a transport
+
+    Each request deposits ``ratio`` tokens and each retry withdraws one, so retries can never exceed roughly ``ratio``
+    of the traffic once the initial ``min_retries`` are spent. This keeps an outage from multiplying the request rate.
+
+    Attributes:
+        ratio: The number of retries earned by each request
+        min_retries: The number of retries available before any request has been sent
+    """
+
+    ratio: float = 0.2
+    min_retries: int = 10
+    _tokens: float = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self) -> None:
+        self._tokens = float(self.min_retries)
+
+    def deposit(self) -> None:
+        """Record that a request was sent"""
+        with self._lock:
+            self._tokens += self.ratio
+
+    def withdraw(self) -> bool:
+        """Take one retry from the budget, returning ``False`` when it is spent"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+@define
+class RetryPolicy:
+    """Decides which failures are retried and how long to wait between attempts
+
+    Attributes:
+        statuses: The maximum number of retries for each retryable status code
+        max_transport_retries: The maximum number of retries after a timeout or connection error
+        base_delay: The smallest delay between attempts, in seconds
+        max_delay: The largest delay between attempts, in seconds; also caps ``Retry-After``
+        respect_retry_after: Whether to wait for as long as the ``Retry-After`` header asks
+        budget: An optional ``RetryBudget`` shared by every request
+    """
+
+    statuses: dict[int, int] = field(factory=_default_statuses)
+    max_transport_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 60.0
+    respect_retry_after: bool = True
+    budget: Optional[RetryBudget] = None
+
+    def next_delay(self, previous: float, response: Optional[httpx.Response] = None) -> float:
+        """The delay before the next attempt, using decorrelated jitter unless the server sent ``Retry-After``"""
+        if response is not None and self.respect_retry_after:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return min(self.max_delay, retry_after)
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    def should_retry(self, request: httpx.Request, retries: int, response: Optional[httpx.Response] = None) -> bool:
+        """Whether a request that has already been retried ``retries`` times may be sent again"""
+        if request.method not in IDEMPOTENT_METHODS:
+            return False
+        if response is None:
+            limit = self.max_transport_retries
+        else:
+            limit = self.statuses.get(response.status_code, 0)
+        if retries >= limit:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Wraps an ``httpx.BaseTransport`` and retries failed requests according to ``policy``
+
+    Retries go through the wrapped transport, so they reuse its pooled connections.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy) -> None:
+        self._transport = transport
+        self._policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self._policy
+        if policy.budget is not None:
+            policy.budget.deposit()
+        retries = 0
+        delay = policy.base_delay
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError:
+                if not policy.should_retry(request, retries):
+                    raise
+                delay = policy.next_delay(delay)
+            else:
+                if not policy.should_retry(request, retries, response):
+                    return response
+                delay = policy.next_delay(delay, response)
+                response.read()
+                response.close()
+            retries += 1
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Wraps an ``httpx.AsyncBaseTransport`` and retries failed requests according to ``policy``
+
+    Retries go through the wrapped transport, so they reuse its pooled connections.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy) -> None:
+        self._transport = transport
+        self._policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self._policy
+        if policy.budget is not None:
+            policy.budget.deposit()
+        retries = 0
+        delay = policy.base_delay
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if not policy.should_retry(request, retries):
+                    raise
+                delay = policy.next_delay(delay)
+            else:
+                if not policy.should_retry(request, retries, response):
+                    return response
+                delay = policy.next_delay(delay, response)
+                await response.aread()
+                await response.aclose()
+            retries += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = ["AsyncRetryTransport", "RetryBudget", "RetryPolicy", "RetryTransport"]
@@ -0,0 +1,189 @@
+"""Contains the route table of the API: the ``operationId`` and path template of every operation in ``openapi.yml``"""
+
+import functools
+import re
+from typing import Optional
+
+from attrs import define, field
+
+OPERATIONS: tuple[tuple[str, str], ...] = (
+    ("Amendment", "/amendment"),
+    ("Amendmentcongress", "/amendment/{congress}"),
+    ("Amendmentlist", "/amendment/{congress}/{amendmentType}"),
+    ("Amendmentdetails", "/amendment/{congress}/{amendmentType}/{amendmentNumber}"),
+    ("Amendmentactions", "/amendment/{congress}/{amendmentType}/{amendmentNumber}/actions"),
+    ("Amendmentcosponsors", "/amendment/{congress}/{amendmentType}/{amendmentNumber}/cosponsors"),
+    ("Amendmentamendments", "/amendment/{congress}/{amendmentType}/{amendmentNumber}/amendments"),
+    ("amendmentsText", "/amendment/{congress}/{amendmentType}/{amendmentNumber}/text"),
+    ("bill_list_all", "/bill"),
+    ("bill_list_by_congress", "/bill/{congress}"),
+    ("bill_list_by_type", "/bill/{congress}/{billType}"),
+    ("bill_details", "/bill/{congress}/{billType}/{billNumber}"),
+    ("bill_actions", "/bill/{congress}/{billType}/{billNumber}/actions"),
+    ("bill_amendments", "/bill/{congress}/{billType}/{billNumber}/amendments"),
+    ("bill_committees", "/bill/{congress}/{billType}/{billNumber}/committees"),
+    ("bill_cosponsors", "/bill/{congress}/{billType}/{billNumber}/cosponsors"),
+    ("bill_relatedbills", "/bill/{congress}/{billType}/{billNumber}/relatedbills"),
+    ("bill_subjects", "/bill/{congress}/{billType}/{billNumber}/subjects"),
+    ("bill_summaries", "/bill/{congress}/{billType}/{billNumber}/summaries"),
+    ("bill_text", "/bill/{congress}/{billType}/{billNumber}/text"),
+    ("bill_titles", "/bill/{congress}/{billType}/{billNumber}/titles"),
+    ("bill_summaries_all", "/summaries"),
+    ("bill_summaries_by_congress", "/summaries/{congress}"),
+    ("bill_summaries_by_type", "/summaries/{congress}/{billType}"),
+    ("law_list_by_congress", "/law/{congress}"),
+    ("law_list_by_congress_and_lawType", "/law/{congress}/{lawType}"),
+    ("law_list_by_congress_lawType_and_lawNumber", "/law/{congress}/{lawType}/{lawNumber}"),
+    ("congress_list", "/congress"),
+    ("congress_details", "/congress/{congress}"),
+    ("congress_current_list", "/congress/current"),
+    ("member_list", "/member"),
+    ("member_details", "/member/{bioguideId}"),
+    ("sponsorship_list", "/member/{bioguideId}/sponsored-legislation"),
+    ("cosponsorship_list", "/member/{bioguideId}/cosponsored-legislation"),
+    ("congress_list", "/member/congress/{congress}"),
+    ("member_list_by_state", "/member/{stateCode}"),
+    ("member_list_by_state_and_district", "/member/{stateCode}/{district}"),
+    ("member_list_by_congress_state_district", "/member/congress/{congress}/{stateCode}/{district}"),
+    ("committee_list", "/committee"),
+    ("committee_list_by_chamber", "/committee/{chamber}"),
+    ("committee_list_by_congress", "/committee/{congress}"),
+    ("committee_list_by_congress_chamber", "/committee/{congress}/{chamber}"),
+    ("committee_details", "/committee/{chamber}/{committeeCode}"),
+    ("committee_bills_list", "/committee/{chamber}/{committeeCode}/bills"),
+    ("committee_reports_by_committee", "/committee/{chamber}/{committeeCode}/reports"),
+    ("nomination_by_committee", "/committee/{chamber}/{committeeCode}/nominations"),
+    ("house_communications_by_committee", "/committee/{chamber}/{committeeCode}/house-communication"),
+    ("senate_communications_by_committee", "/committee/{chamber}/{committeeCode}/senate-communication"),
+    ("committee_reports", "/committee-report"),
+    ("committee_reports_by_congress", "/committee-report/{congress}"),
+    ("committee_reports_by_congress_rpt_type", "/committee-report/{congress}/{reportType}"),
+    ("committee_report_details", "/committee-report/{congress}/{reportType}/{reportNumber}"),
+    ("committee_report_id_text", "/committee-report/{congress}/{reportType}/{reportNumber}/text"),
+    ("committee_print_list", "/committee-print"),
+    ("committee_prints_by_congress", "/committee-print/{congress}"),
+    ("committee_prints_by_congress_chamber", "/committee-print/{congress}/{chamber}"),
+    ("committee_print_detail", "/committee-print/{congress}/{chamber}/{jacketNumber}"),
+    ("committee_print_text", "/committee-print/{congress}/{chamber}/{jacketNumber}/text"),
+    ("committee_meeting_list", "/committee-meeting"),
+    ("committee_meeting_congress", "/committee-meeting/{congress}"),
+    ("committee_meeting_congress_chamber", "/committee-meeting/{congress}/{chamber}"),
+    ("committee_meeting_detail", "/committee-meeting/{congress}/{chamber}/{eventId}"),
+    ("hearing_list", "/hearing"),
+    ("hearing_list_by_congress", "/hearing/{congress}"),
+    ("hearing_list_by_congress_chamber", "/hearing/{congress}/{chamber}"),
+    ("hearing_detail", "/hearing/{congress}/{chamber}/{jacketNumber}"),
+    ("congressional_record_list", "/congressional-record"),
+    ("daily_congressional_record_list", "/daily-congressional-record"),
+    ("daily_congressional_record_list_by_volume", "/daily-congressional-record/{volumeNumber}"),
+    ("daily_congressional_record_list_by_volume_and_issue", "/daily-congressional-record/{volumeNumber}/{issueNumber}"),
+    ("daily_congressional_record_list_by_article", "/daily-congressional-record/{volumeNumber}/{issueNumber}/articles"),
+    ("bound_congressional_record_list", "/bound-congressional-record"),
+    ("bound_congressional_record_list_by_year", "/bound-congressional-record/{year}"),
+    ("bound_congressional_record_list_by_year_and_month", "/bound-congressional-record/{year}/{month}"),
+    ("bound_congressional_record_list_by_year_and_month_and_day", "/bound-congressional-record/{year}/{month}/{day}"),
+    ("house_communication", "/house-communication"),
+    ("house_communication_congress", "/house-communication/{congress}"),
+    ("house_communication_list", "/house-communication/{congress}/{communicationType}"),
+    ("house_communication_detail", "/house-communication/{congress}/{communicationType}/{communicationNumber}"),
+    ("house_requirement", "/house-requirement"),
+    ("house_requirement_detail", "/house-requirement/{requirementNumber}"),
+    ("house_requirement_communication_list", "/house-requirement/{requirementNumber}/matching-communications"),
+    ("senate_communication", "/senate-communication"),
+    ("senate_communication_congress", "/senate-communication/{congress}"),
+    ("senate_communication_list", "/senate-communication/{congress}/{communicationType}"),
+    ("senate_communication_detail", "/senate-communication/{congress}/{communicationType}/{communicationNumber}"),
+    ("nomination_list", "/nomination"),
+    ("nomination_list_by_congress", "/nomination/{congress}"),
+    ("nomination_detail", "/nomination/{congress}/{nominationNumber}"),
+    ("nominees", "/nomination/{congress}/{nominationNumber}/{ordinal}"),
+    ("nomination_actions", "/nomination/{congress}/{nominationNumber}/actions"),
+    ("nomination_committees", "/nomination/{congress}/{nominationNumber}/committees"),
+    ("nomination_hearings", "/nomination/{congress}/{nominationNumber}/hearings"),
+    ("treaty_list", "/treaty"),
+    ("treaty_list_by_congress", "/treaty/{congress}"),
+    ("treaty_detail", "/treaty/{congress}/{treatyNumber}"),
+    ("treaty_details", "/treaty/{congress}/{treatyNumber}/{treatySuffix}"),
+    ("treaty_action", "/treaty/{congress}/{treatyNumber}/actions"),
+    ("treaty_actions", "/treaty/{congress}/{treatyNumber}/{treatySuffix}/actions"),
+    ("treaty_committee", "/treaty/{congress}/{treatyNumber}/committees"),
+    ("crsreport", "/crsreport"),
+    ("crsreport_details", "/crsreport/{reportNumber}"),
+)
+"""The ``(operationId, path template)`` of every operation, in ``openapi.yml`` order; all of them are GET requests"""
+
+_PARAMETER = re.compile(r"\{(\w+)\}")
+
+# Constrained parameters tell apart templates of the same shape, e.g. /committee/{chamber}/{committeeCode} and
+# /committee/{congress}/{chamber}, or /member/{bioguideId} and /member/{stateCode}
+_PARAMETER_PATTERNS = {"congress": r"\d+", "stateCode": r"[A-Za-z]{2}"}
+
+
+def _parameter_pattern(match: "re.Match[str]") -> str:
+    name = match.group(1)
+    return f"(?P<{name}>{_PARAMETER_PATTERNS.get(name, '[^/]+')})"
+
+
+@define(frozen=True)
+class Route:
+    """One operation of the API
+
+    Attributes:
+        operation_id: The ``operationId`` in ``openapi.yml``
+        template: The path template, e.g. ``/bill/{congress}/{billType}``
+    """
+
+    operation_id: str
+    template: str
+    _pattern: "re.Pattern[str]" = field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        pattern = _PARAMETER.sub(_parameter_pattern, re.escape(self.template).replace(r"\{", "{").replace(r"\}", "}"))
+        object.__setattr__(self, "_pattern", re.compile(pattern + "$"))
+
+    @property
+    def specificity(self) -> tuple[int, int]:
+        """The number of literal segments and of constrained parameters; more specific routes are tried first"""
+        segments = [segment for segment in self.template.split("/") if segment]
+        parameters = [found.group(1) for found in map(_PARAMETER.fullmatch, segments) if found is not None]
+        return len(segments) - len(parameters), sum(1 for name in parameters if name in _PARAMETER_PATTERNS)
+
+    def match(self, path: str) -> Optional[dict[str, str]]:
+        """The path parameters if ``path`` (without the ``/v3`` prefix) matches this route, else ``None``"""
+        found = self._pattern.match(path)
+        return None if found is None else found.groupdict()
+
+
+ROUTES: tuple[Route, ...] = tuple(Route(operation_id, template) for operation_id, template in OPERATIONS)
+
+
+@functools.cache
+def _candidates(segments: int) -> tuple[Route, ...]:
+    routes = [route for route in ROUTES if route.template.count("/") == segments]
+    return tuple(sorted(routes, key=lambda route: route.specificity, reverse=True))
+
+
+def strip_version(path: str) -> str:
+    """Remove the ``/v3`` prefix of the API version from a URL path"""
+    head, _, rest = path.lstrip("/").partition("/")
+    if head[:1] == "v" and head[1:].isdigit():
+        return "/" + rest
+    return path
+
+
+def match_route(path: str) -> Optional[tuple[Route, dict[str, str]]]:
+    """The route of a URL path and its path parameters, or ``None`` if it is not an API path
+
+    Literal segments take precedence over parameters, so ``/congress/current`` matches ``congress_current_list``
+    rather than ``congress_details``, and constrained parameters over free ones, so ``/committee/117`` matches
+    ``committee_list_by_congress`` rather than ``committee_list_by_chamber``.
+    """
+    path = strip_version(path).rstrip("/") or "/"
+    for route in _candidates(path.count("/")):
+        parameters = route.match(path)
+        if parameters is not None:
+            return route, parameters
+    return None
+
+
+__all__ = ["OPERATIONS", "ROUTES", "Route", "match_route", "strip_version"]
@@ -0,0 +1,370 @@
+"""Contains a full-text index over bill summaries and CRS reports, kept in SQLite FTS5
+
+Summaries are fetched incrementally with ``IncrementalSync``. The CRS report list does not accept ``fromDateTime``, so
+it is listed in full and only reports whose ``updateDate`` changed are fetched again with ``crsreport_details``.
+"""
+
+import datetime
+import html
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Optional
+
+from attrs import define, field
+
+from . import errors
+from .api.crsreport import crsreport, crsreport_details
+from .api.summaries import bill_summaries_all, bill_summaries_by_congress, bill_summaries_by_type
+from .client import AuthenticatedClient
+from .decoding import decode_json
+from .export import Column
+from .incremental import Checkpoint, IncrementalSync, WatermarkStore, record_field
+from .pagination import MAX_LIMIT, paginate
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    title TEXT,
+    body TEXT,
+    congress INTEGER,
+    bill_type TEXT,
+    bill_number TEXT,
+    version TEXT,
+    action_date TEXT,
+    update_date TEXT,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_kind ON documents (kind, update_date);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, body, content='documents', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS documents_insert AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_delete AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_update AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO documents_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO documents (key, kind, title, body, congress, bill_type, bill_number, version, action_date, update_date, url)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    title = excluded.title, body = excluded.body, congress = excluded.congress, bill_type = excluded.bill_type,
+    bill_number = excluded.bill_number, version = excluded.version, action_date = excluded.action_date,
+    update_date = excluded.update_date, url = excluded.url
+WHERE excluded.update_date IS NOT documents.update_date OR excluded.body IS NOT documents.body
+"""
+
+_TITLE_WEIGHT = 10.0
+_BODY_WEIGHT = 1.0
+
+_TAG = re.compile(r"<[^>]*>")
+
+_BILL_CONGRESS = Column("congress", ("bill", "congress"), "int")
+_BILL_TYPE = Column("type", ("bill", "type"))
+_BILL_NUMBER = Column("number", ("bill", "number"))
+_BILL_TITLE = Column("title", ("bill", "title"))
+_BILL_URL = Column("url", ("bill", "url"))
+
+SUMMARY = "summary"
+"""The ``kind`` of bill summary documents"""
+
+CRS_REPORT = "crs_report"
+"""The ``kind`` of CRS report documents"""
+
+
+def strip_html(text: Optional[str]) -> str:
+    """Reduce an HTML fragment to its text: tags become spaces, entities are decoded and whitespace is collapsed"""
+    if not text:
+        return ""
+    return " ".join(html.unescape(_TAG.sub(" ", text)).split())
+
+
+def summary_key(record: Any) -> str:
+    """The identity of a bill summary: its bill and version code, as summaries have no ``url`` of their own"""
+    return (
+        f"summary:{_BILL_CONGRESS.value(record)}/{str(_BILL_TYPE.value(record)).lower()}/"
+        f"{_BILL_NUMBER.value(record)}/{record_field(record, 'versionCode')}"
+    )
+
+
+@define
+class SearchResult:
+    """One match of ``SearchIndex.search``
+
+    Attributes:
+        kind: ``"summary"`` or ``"crs_report"``
+        key: The identity of the document, e.g. ``summary:117/s/225/00`` or ``crs_report:R47175``
+        title: The bill title or report title
+        snippet: The best matching fragment of the text, with matches between ``[`` and ``]``
+        score: The BM25 score; lower is better
+        congress: The congress of the bill, for summaries
+        bill_type: The type of the bill, for summaries
+        bill_number: The number of the bill, for summaries
+        version: The summary version code, or the report version
+        action_date: The date of the action the summary describes, or the publish date of the report
+        update_date: When the API last updated the document
+        url: The API URL of the bill or report
+    """
+
+    kind: str
+    key: str
+    title: Optional[str]
+    snippet: str
+    score: float
+    congress: Optional[int] = None
+    bill_type: Optional[str] = None
+    bill_number: Optional[str] = None
+    version: Optional[str] = None
+    action_date: Optional[str] = None
+    update_date: Optional[str] = None
+    url: Optional[str] = None
+
+
+@define
+class SearchIndex:
+    """A ranked full-text index over bill summaries and CRS reports
+
+    Documents are stored once in a ``documents`` table and indexed by an external-content FTS5 table kept in step by
+    triggers, with the Porter stemmer. Matches are ranked with BM25, weighting titles above text. The database runs
+    in WAL mode so searches can run during a sync, and sync watermarks are kept in the same file.
+
+    Attributes:
+        path: The path of the database file
+    """
+
+    path: str
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+    _sync: IncrementalSync = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(
+                "INSERT INTO documents_fts (documents_fts, rank) VALUES ('rank', ?)",
+                (f"bm25({_TITLE_WEIGHT}, {_BODY_WEIGHT})",),
+            )
+        self._sync = IncrementalSync(WatermarkStore(self.path))
+
+    def add_summaries(self, records: Iterable[Any]) -> int:
+        """Index bill summaries, replacing earlier copies of the same bill and version, in one transaction
+
+        Returns:
+            int: The number of summaries given
+        """
+        return self._add_summaries(records)
+
+    def _add_summaries(self, records: Iterable[Any], checkpoint: Optional[Checkpoint] = None) -> int:
+        rows = [
+            (
+                summary_key(record),
+                SUMMARY,
+                _BILL_TITLE.value(record),
+                strip_html(record_field(record, "text")),
+                _BILL_CONGRESS.value(record),
+                _BILL_TYPE.value(record),
+                _BILL_NUMBER.value(record),
+                record_field(record, "versionCode"),
+                record_field(record, "actionDate"),
+                record_field(record, "updateDate"),
+                _BILL_URL.value(record),
+            )
+            for record in records
+        ]
+        return self._write(rows, checkpoint)
+
+    def add_crs_reports(self, reports: Iterable[dict[str, Any]]) -> int:
+        """Index CRS reports, as returned in the ``CRSReport`` object of ``crsreport_details``, in one transaction
+
+        Returns:
+            int: The number of reports given
+        """
+        rows = [
+            (
+                f"crs_report:{report.get('id')}",
+                CRS_REPORT,
+                report.get("title"),
+                strip_html(report.get("summary")),
+                None,
+                None,
+                None,
+                None if report.get("version") is None else str(report.get("version")),
+                report.get("publishDate"),
+                report.get("updateDate"),
+                report.get("url"),
+            )
+            for report in reports
+        ]
+        return self._write(rows)
+
+    def _write(self, rows: list[tuple[Any, ...]], checkpoint: Optional[Checkpoint] = None) -> int:
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, rows)
+            if checkpoint is not None:
+                WatermarkStore.write(self._connection, checkpoint)
+        return len(rows)
+
+    def sync_summaries(
+        self,
+        *,
+        client: AuthenticatedClient,
+        congress: Optional[int] = None,
+        bill_type: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        **kwargs: Any,
+    ) -> int:
+        """Index the bill summaries updated since the last sync of the same scope, a page per transaction
+
+        The watermark is committed in the transaction of the last page, so a sync that fails part way is repeated.
+
+        Args:
+            client: The client to make requests with
+            congress: Only sync the summaries of this congress, with ``bill_summaries_by_congress``
+            bill_type: Only sync the summaries of this bill type, e.g. ``hr``; requires ``congress``
+            since: Where the first sync starts; by default it fetches everything
+            **kwargs: Additional arguments for ``IncrementalSync.pages``
+
+        Raises:
+            errors.UnexpectedStatus: If any page is not returned successfully.
+
+        Returns:
+            int: The number of summaries indexed
+        """
+        if bill_type is not None and congress is None:
+            raise ValueError("bill_type requires congress")
+        if congress is None:
+            endpoint, args = bill_summaries_all, ()
+        elif bill_type is None:
+            endpoint, args = bill_summaries_by_congress, (congress,)
+        else:
+            endpoint, args = bill_summaries_by_type, (congress, bill_type)
+        name = "/".join(["search.summaries", *(str(arg) for arg in args)])
+        pages = self._sync.pages(name, endpoint, *args, client=client, since=since, key=summary_key, **kwargs)
+        return sum(self._add_summaries(page, checkpoint) for page, checkpoint in pages)
+
+    def sync_crs_reports(self, *, client: AuthenticatedClient, workers: int = 8) -> int:
+        """Index the CRS reports that are new or updated since they were last indexed
+
+        The report list carries ``updateDate`` but not the summaries, so every page of the list is read and only
+        changed reports are fetched with ``crsreport_details``, by up to ``workers`` threads.
+
+        Raises:
+            errors.UnexpectedStatus: If any request is not answered successfully.
+
+        Returns:
+            int: The number of reports indexed
+        """
+        with self._lock:
+            indexed = dict(
+                self._connection.execute("SELECT key, update_date FROM documents WHERE kind = ?", (CRS_REPORT,))
+            )
+        changed: dict[str, Any] = {}
+        for report in paginate(crsreport, client=client):
+            report_number, update_date = str(record_field(report, "id")), record_field(report, "updateDate")
+            if indexed.get(f"crs_report:{report_number}") != update_date:
+                changed[report_number] = update_date
+
+        def fetch(report_number: str) -> dict[str, Any]:
+            response = crsreport_details.sync_detailed(report_number, client=client)
+            data = decode_json(response.content)
+            if response.status_code != HTTPStatus.OK or not isinstance(data, dict):
+                raise errors.UnexpectedStatus(response.status_code, response.content)
+            # Keyed and stamped as listed, so the next sync compares like with like
+            return {**(data.get("CRSReport") or {}), "id": report_number, "updateDate": changed[report_number]}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            reports = executor.map(fetch, changed)
+            return sum(self.add_crs_reports(batch) for batch in _batches(reports, MAX_LIMIT))
+
+    def search(
+        self,
+        query: str,
+        *,
+        kind: Optional[str] = None,
+        congress: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchResult]:
+        """Find the documents matching a query, best first
+
+        Args:
+            query: An FTS5 query: words, ``"quoted phrases"``, ``prefix*``, ``AND``/``OR``/``NOT``, ``NEAR(a b)`` and
+                column filters such as ``title: antitrust``
+            kind: Only return documents of this kind, ``"summary"`` or ``"crs_report"``
+            congress: Only return summaries of bills of this congress
+            limit: The maximum number of results
+            offset: The number of results to skip, for paging through results
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax.
+
+        Returns:
+            list[SearchResult]
+        """
+        filters, parameters = ["documents_fts MATCH ?"], [query]
+        if kind is not None:
+            filters.append("documents.kind = ?")
+            parameters.append(kind)
+        if congress is not None:
+            filters.append("documents.congress = ?")
+            parameters.append(congress)
+        sql = (
+            "SELECT documents.kind, documents.key, documents.title,"
+            " snippet(documents_fts, 1, '[', ']', '…', 16), documents_fts.rank, documents.congress,"
+            " documents.bill_type, documents.bill_number, documents.version, documents.action_date,"
+            " documents.update_date, documents.url"
+            " FROM documents_fts JOIN documents ON documents.id = documents_fts.rowid"
+            f" WHERE {' AND '.join(filters)} ORDER BY documents_fts.rank LIMIT ? OFFSET ?"
+        )
+        try:
+            with self._lock:
+                rows = self._connection.execute(sql, (*parameters, limit, offset)).fetchall()
+        except sqlite3.OperationalError as error:
+            raise ValueError(f"Invalid search query {query!r}: {error}") from error
+        return [SearchResult(*row) for row in rows]
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """The number of documents indexed, optionally of one kind"""
+        with self._lock:
+            if kind is None:
+                return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            return self._connection.execute("SELECT COUNT(*) FROM documents WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def optimize(self) -> None:
+        """Merge the index segments left by incremental syncs into one, which makes searches faster"""
+        with self._lock, self._connection:
+            self._connection.execute("INSERT INTO documents_fts (documents_fts) VALUES ('optimize')")
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
+
+
+def _batches(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+__all__ = ["CRS_REPORT", "SUMMARY", "SearchIndex", "SearchResult", "strip_html", "summary_key"]
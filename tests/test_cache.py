@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+
+from congress_gov_api_client import AuthenticatedClient
+from congress_gov_api_client.api.bill import bill_list_all
+from congress_gov_api_client.cache import CachePolicy, SQLiteCache, cache_key
+from congress_gov_api_client.mock import BASE_URL, MockAPI, MockAPITransport, mock_client
+
+ETAG = '"v1"'
+
+
+class _RevalidatingTransport(MockAPITransport):
+    """Serves the mock's responses with an ``ETag``, and a 304 to requests that already hold it"""
+
+    def __init__(self, api: MockAPI) -> None:
+        super().__init__(api)
+        self.conditional = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == ETAG:
+            self.conditional += 1
+            return httpx.Response(304, headers={"ETag": ETAG}, request=request)
+        response = super().handle_request(request)
+        response.headers["ETag"] = ETAG
+        return response
+
+
+def test_fresh_entries_are_served_without_a_request(tmp_path) -> None:
+    api = MockAPI()
+    client = mock_client(api, cache=SQLiteCache(str(tmp_path / "cache.db")))
+    first = bill_list_all.sync_detailed(client=client)
+    second = bill_list_all.sync_detailed(client=client)
+    assert second.content == first.content
+    assert api.stats().requests == 1
+
+
+def test_async_fresh_entries_are_served_without_a_request(tmp_path) -> None:
+    api = MockAPI()
+    client = mock_client(api, cache=SQLiteCache(str(tmp_path / "cache.db")))
+
+    async def crawl() -> None:
+        for _ in range(3):
+            await bill_list_all.asyncio_detailed(client=client)
+
+    asyncio.run(crawl())
+    assert api.stats().requests == 1
+
+
+def test_cache_key_excludes_the_api_key() -> None:
+    def request(query: str) -> httpx.Request:
+        return httpx.Request("GET", f"{BASE_URL}/bill?{query}")
+
+    assert cache_key(request("limit=250&api_key=a")) == cache_key(request("api_key=b&limit=250"))
+    assert cache_key(request("limit=250&api_key=a")) != cache_key(request("limit=20&api_key=a"))
+
+
+def test_clients_with_different_keys_share_entries(tmp_path) -> None:
+    api = MockAPI()
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    for token in ("first-key", "second-key"):
+        bill_list_all.sync_detailed(client=mock_client(api, token=token, cache=cache))
+    assert api.stats().requests == 1
+
+
+def test_stale_entries_are_refreshed_by_a_304(tmp_path) -> None:
+    api = MockAPI()
+    transport = _RevalidatingTransport(api)
+    # Stored stale, so the next request revalidates it
+    cache = SQLiteCache(str(tmp_path / "cache.db"), policy=CachePolicy(default_ttl=0.0))
+    client = AuthenticatedClient(base_url=BASE_URL, token="mock", cache=cache, httpx_args={"transport": transport})
+    first = bill_list_all.sync_detailed(client=client)
+
+    cache.policy.default_ttl = 3600.0
+    second = bill_list_all.sync_detailed(client=client)
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert transport.conditional == 1
+
+    # The 304 made the entry fresh for the policy's TTL
+    bill_list_all.sync_detailed(client=client)
+    assert api.stats().requests == 1
+    assert transport.conditional == 1
+
+
+def test_error_responses_are_not_cached(tmp_path) -> None:
+    api = MockAPI(error_rate=1.0)
+    client = mock_client(api, cache=SQLiteCache(str(tmp_path / "cache.db")))
+    for _ in range(2):
+        assert bill_list_all.sync_detailed(client=client).status_code >= 500
+    assert api.stats().requests == 2
+
+
+def test_policy_keeps_earlier_congresses_forever() -> None:
+    policy = CachePolicy(current_ttl=60.0, historic_ttl=None, current_congress=119)
+    assert policy.ttl(httpx.URL(f"{BASE_URL}/bill/117/hr")) is None
+    assert policy.ttl(httpx.URL(f"{BASE_URL}/bill/119/hr")) == 60.0
+    assert policy.ttl(httpx.URL(f"{BASE_URL}/member/congress/118")) is None
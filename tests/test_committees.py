@@ -0,0 +1,91 @@
+import asyncio
+
+from attrs import evolve
+
+from congress_gov_api_client.api.committee import committee_details
+from congress_gov_api_client.committees import (
+    CommitteeMetadataCache,
+    _continue,
+    _filters,
+    _plan,
+    aaggregate_committee,
+    aggregate_committee,
+)
+from congress_gov_api_client.mock import MockAPI, mock_client
+from congress_gov_api_client.models import Committee, ResourceCount
+from congress_gov_api_client.pagination import Page
+
+RECORDS = 600
+
+
+def _committee(bills: int = 600, reports: int = 0, communications: int = 300, nominations: int = 10) -> Committee:
+    response = committee_details.sync_detailed("house", "hspw00", client=mock_client(MockAPI()))
+    return evolve(
+        response.parsed.committee,
+        bills=ResourceCount(count=bills),
+        reports=ResourceCount(count=reports),
+        communications=ResourceCount(count=communications),
+        nominations=ResourceCount(count=nominations),
+    )
+
+
+def test_plan_pages_the_counted_feeds_of_the_chamber() -> None:
+    committee = _committee()
+    assert _plan("house", committee, {}) == [
+        ("bills", 0),
+        ("bills", 250),
+        ("bills", 500),
+        ("house_communications", 0),
+        ("house_communications", 250),
+    ]
+    assert _plan("Senate", committee, {}) == [
+        ("bills", 0),
+        ("bills", 250),
+        ("bills", 500),
+        ("senate_communications", 0),
+        ("senate_communications", 250),
+        ("nominations", 0),
+    ]
+
+
+def test_plan_requests_one_page_of_date_filtered_feeds() -> None:
+    committee = _committee(reports=1000)
+    assert _plan("house", committee, _filters(117)) == [
+        ("bills", 0),
+        ("reports", 0),
+        ("house_communications", 0),
+        ("house_communications", 250),
+    ]
+
+
+def test_continue_plans_the_pages_the_last_page_counts() -> None:
+    plan = [("bills", 0), ("reports", 0)]
+    pages = {
+        ("bills", 0): Page(items=[{}], count=600, next_url="https://api.congress.gov/v3/x?offset=250&limit=250"),
+        ("reports", 0): Page(items=[{}], count=1),
+    }
+    assert _continue(pages, plan) == [("bills", 250), ("bills", 500)]
+
+
+def test_aggregation_follows_feeds_beyond_stale_counts() -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    metadata = CommitteeMetadataCache()
+    metadata.put("house", "hspw00", _committee(bills=0, reports=0, communications=300, nominations=0))
+    activity = aggregate_committee("house", "hspw00", client=mock_client(api), metadata=metadata)
+    assert len(activity.house_communications) == RECORDS
+    assert activity.bills == []
+    stats = api.stats().by_operation
+    assert stats["committee_details"] == 0
+    # Two planned pages, then the one the second page's count plans
+    assert stats["house_communications_by_committee"] == 3
+
+
+def test_async_aggregation_matches_the_sync_one() -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    client = mock_client(api)
+    metadata = CommitteeMetadataCache()
+    expected = aggregate_committee("house", "hspw00", client=client, metadata=metadata)
+    activity = asyncio.run(aaggregate_committee("house", "hspw00", client=client, metadata=metadata))
+    assert api.stats().by_operation["committee_details"] == 1
+    for feed in ("bills", "reports", "house_communications", "senate_communications", "nominations"):
+        assert len(getattr(activity, feed)) == len(getattr(expected, feed))
@@ -0,0 +1,115 @@
+import datetime
+
+import pytest
+
+from congress_gov_api_client.directory import MemberDirectory
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+MEMBERS = [
+    {
+        "bioguideId": "L000174",
+        "name": "Leahy, Patrick J.",
+        "partyName": "Democratic",
+        "state": "Vermont",
+        "terms": {"item": [{"chamber": "Senate", "startYear": 1975, "endYear": 2023}]},
+        "updateDate": "2023-01-06T18:12:41Z",
+    },
+    {
+        "bioguideId": "W000800",
+        "name": "Welch, Peter",
+        "partyName": "Democratic",
+        "state": "Vermont",
+        "district": 0,
+        "currentMember": True,
+        "terms": {
+            "item": [
+                {"chamber": "House of Representatives", "startYear": 2007, "endYear": 2023},
+                {"chamber": "Senate", "startYear": 2023},
+            ]
+        },
+        "updateDate": "2023-04-01T12:42:17Z",
+    },
+    {
+        "bioguideId": "O000172",
+        "name": "Ocasio-Cortez, Alexandria",
+        "partyName": "Democratic",
+        "state": "New York",
+        "district": 14,
+        "currentMember": True,
+        "terms": {"item": [{"chamber": "House of Representatives", "startYear": 2019}]},
+        "updateDate": "2023-04-01T12:42:17Z",
+    },
+]
+
+
+def _ids(members: list) -> list[str]:
+    return [member.bioguide_id for member in members]
+
+
+def _directory() -> MemberDirectory:
+    directory = MemberDirectory(watermark=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc))
+    directory.upsert(MEMBERS)
+    return directory
+
+
+def _assert_lookups(directory: MemberDirectory) -> None:
+    assert len(directory) == 3
+    assert _ids(directory.by_state("VT")) == ["L000174", "W000800"]
+    assert _ids(directory.by_state("Vermont", current=False)) == ["L000174"]
+    assert _ids(directory.by_district("NY", 14)) == ["O000172"]
+    assert _ids(directory.by_congress(117, state="VT")) == ["L000174", "W000800"]
+    assert _ids(directory.current()) == ["O000172", "W000800"]
+    leahy = directory.member("L000174")
+    assert leahy is not None
+    assert leahy.name == "Leahy, Patrick J."
+    assert leahy.terms[0].start_year == 1975
+
+
+def test_lookups_answer_from_the_indexes() -> None:
+    _assert_lookups(_directory())
+
+
+def test_replacing_a_member_moves_it_between_indexes() -> None:
+    directory = _directory()
+    directory.upsert([{**MEMBERS[2], "state": "New Jersey", "district": 5}])
+    assert _ids(directory.by_district("NY", 14)) == []
+    assert _ids(directory.by_district("NJ", 5)) == ["O000172"]
+    assert len(directory) == 3
+
+
+def test_snapshot_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "members.snapshot")
+    original = _directory()
+    original.save(path)
+
+    opened = MemberDirectory.open(path)
+    assert opened.watermark == original.watermark
+    _assert_lookups(opened)
+    assert opened.member("W000800") == original.member("W000800")
+
+    # Saving a mapped directory copies the rows it has not decoded, and keeps the members it replaced
+    opened.upsert([{**MEMBERS[0], "name": "Leahy, Patrick"}])
+    opened.save(path)
+    opened.close()
+    reopened = MemberDirectory.open(path)
+    leahy = reopened.member("L000174")
+    assert leahy is not None
+    assert leahy.name == "Leahy, Patrick"
+    assert reopened.member("O000172") == original.member("O000172")
+    reopened.close()
+
+
+def test_open_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / "members.json"
+    path.write_text("{}")
+    with pytest.raises(ValueError, match="not a member directory snapshot"):
+        MemberDirectory.open(str(path))
+
+
+def test_refresh_lists_members_and_sets_the_watermark() -> None:
+    api = MockAPI(dataset_size=300)
+    directory = MemberDirectory()
+    assert directory.refresh(client=mock_client(api)) == 300
+    assert directory.watermark is not None
+    assert len(directory) > 0
+    assert all(member.current for member in directory.current())
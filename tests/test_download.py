@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+
+from congress_gov_api_client.download import AsyncTextDownloader, TextDownloader, TextStore
+
+URL = "https://www.congress.gov/117/bills/hr3076/BILLS-117hr3076enr.htm"
+BODY = b"<html>The enrolled bill</html>"
+ETAG = '"v2"'
+
+
+def _store(tmp_path, partial: bytes, validator: str) -> TextStore:
+    store = TextStore(str(tmp_path))
+    with open(store.partial_path(URL), "wb") as file:
+        file.write(partial)
+    store.save_validator(URL, validator)
+    return store
+
+
+def _handler(requests: list[httpx.Request]):
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "Range" in request.headers:
+            # A misbehaving server: a partial answer that starts at 0 rather than at the requested offset
+            headers = {"Content-Range": f"bytes 0-{len(BODY) - 1}/{len(BODY)}", "ETag": ETAG}
+            return httpx.Response(206, stream=httpx.ByteStream(BODY), headers=headers)
+        headers = {"Content-Length": str(len(BODY)), "ETag": ETAG}
+        return httpx.Response(200, stream=httpx.ByteStream(BODY), headers=headers)
+
+    return handle
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def test_resume_continues_the_partial_file(tmp_path) -> None:
+    store = _store(tmp_path, BODY[:10], ETAG)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Range"] == "bytes=10-"
+        assert request.headers["If-Range"] == ETAG
+        headers = {"Content-Range": f"bytes 10-{len(BODY) - 1}/{len(BODY)}"}
+        return httpx.Response(206, stream=httpx.ByteStream(BODY[10:]), headers=headers)
+
+    downloader = TextDownloader(store, client=httpx.Client(transport=httpx.MockTransport(handle)))
+    assert _read(downloader.download(URL).path) == BODY
+
+
+def test_mismatched_content_range_restarts_from_the_start(tmp_path) -> None:
+    requests: list[httpx.Request] = []
+    store = _store(tmp_path, b"stale", '"v1"')
+    downloader = TextDownloader(store, client=httpx.Client(transport=httpx.MockTransport(_handler(requests))))
+    stored = downloader.download(URL)
+    assert _read(stored.path) == BODY
+    assert stored.size == len(BODY)
+    assert ["Range" in request.headers for request in requests] == [True, False]
+
+
+def test_async_mismatched_content_range_restarts_from_the_start(tmp_path) -> None:
+    requests: list[httpx.Request] = []
+    store = _store(tmp_path, b"stale", '"v1"')
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler(requests)))
+    stored = asyncio.run(AsyncTextDownloader(store, client=client).download(URL))
+    assert _read(stored.path) == BODY
+    assert ["Range" in request.headers for request in requests] == [True, False]
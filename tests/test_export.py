@@ -0,0 +1,21 @@
+import pytest
+
+pyarrow = pytest.importorskip("pyarrow")
+parquet = pytest.importorskip("pyarrow.parquet")
+
+from congress_gov_api_client.api.amendments import amendment  # noqa: E402
+from congress_gov_api_client.api.bill import bill_list_all  # noqa: E402
+from congress_gov_api_client.api.member import member_list  # noqa: E402
+from congress_gov_api_client.export import AMENDMENTS, BILLS, MEMBERS, export  # noqa: E402
+from congress_gov_api_client.mock import MockAPI, mock_client  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "schema"), [(bill_list_all, BILLS), (amendment, AMENDMENTS), (member_list, MEMBERS)]
+)
+def test_update_dates_are_exported_as_timestamps(tmp_path, endpoint, schema) -> None:
+    stats = export(endpoint, client=mock_client(MockAPI(dataset_size=30)), root=str(tmp_path), schema=schema)
+    table = parquet.read_table(stats.files[0])
+    assert table.num_rows == 30
+    # Parquet has no second unit, so the column reads back in milliseconds
+    assert table.schema.field("update_date").type == pyarrow.timestamp("ms", tz="UTC")
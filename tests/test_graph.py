@@ -0,0 +1,91 @@
+import pytest
+
+from congress_gov_api_client import graph
+from congress_gov_api_client.graph import COSPONSOR, SPONSOR, SponsorshipGraph
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+EDGES = [
+    ("A000001", "117-hr-1", SPONSOR),
+    ("B000002", "117-hr-1", COSPONSOR),
+    ("C000003", "117-hr-1", COSPONSOR),
+    ("B000002", "117-hr-2", SPONSOR),
+    ("A000001", "117-hr-2", COSPONSOR),
+    ("C000003", "117-s-5", SPONSOR),
+]
+
+
+def _graph() -> SponsorshipGraph:
+    sponsorships = SponsorshipGraph()
+    for bioguide_id, bill, kind in EDGES:
+        sponsorships.add(bioguide_id, bill, kind)
+    return sponsorships
+
+
+def _snapshot(sponsorships: SponsorshipGraph) -> tuple[dict, dict]:
+    members = {member: sorted(sponsorships.bills_of(member)) for member in sponsorships.members()}
+    bills = {bill: sorted(sponsorships.members_of(bill)) for bill in sponsorships.bills()}
+    return members, bills
+
+
+def _remove_and_readd(sponsorships: SponsorshipGraph) -> None:
+    sponsorships.remove("C000003", "117-hr-1", COSPONSOR)
+    sponsorships.remove("A000001", "117-hr-2", COSPONSOR)
+    sponsorships.add("A000001", "117-hr-2", COSPONSOR)
+    sponsorships.remove("B000002", "117-hr-2", COSPONSOR)  # Not an edge: B000002 sponsors it
+
+
+def test_buffered_and_compacted_views_agree() -> None:
+    sponsorships = _graph()
+    buffered = _snapshot(sponsorships)
+    assert sponsorships.edge_count == len(EDGES)
+    assert _snapshot(sponsorships) == buffered
+    assert sponsorships.members_of("117-hr-1", SPONSOR) == ["A000001"]
+    assert sponsorships.member_degree("A000001") == 2
+    assert sponsorships.bill_degree("117-hr-1", COSPONSOR) == 2
+
+
+@pytest.mark.parametrize("compact_first", [False, True])
+def test_removals_survive_compaction(compact_first: bool) -> None:
+    sponsorships = _graph()
+    if compact_first:
+        assert sponsorships.edge_count == len(EDGES)
+    _remove_and_readd(sponsorships)
+    buffered = _snapshot(sponsorships)
+    assert buffered[1]["117-hr-1"] == ["A000001", "B000002"]
+    assert buffered[0]["A000001"] == ["117-hr-1", "117-hr-2"]
+
+    assert sponsorships.edge_count == len(EDGES) - 1
+    assert _snapshot(sponsorships) == buffered
+    csr = sponsorships.csr()
+    assert len(csr.indices) == len(EDGES) - 1
+    by_bill = sponsorships.csr(by="bill")
+    assert sorted(by_bill.kinds) == sorted(csr.kinds)
+
+
+def test_compaction_is_triggered_by_the_buffer_size(monkeypatch) -> None:
+    monkeypatch.setattr(graph, "COMPACT_AFTER", 2)
+    sponsorships = _graph()
+    _remove_and_readd(sponsorships)
+    sponsorships.add("D000004", "117-s-5", COSPONSOR)
+    assert sponsorships.members_of("117-s-5") == ["C000003", "D000004"]
+    assert sponsorships.members_of("117-hr-1") == ["A000001", "B000002"]
+    assert sponsorships.edge_count == len(EDGES)
+
+
+def test_replace_member_removes_unlisted_edges() -> None:
+    sponsorships = _graph()
+    sponsorships.replace_member("A000001", COSPONSOR, ["117-s-5"])
+    assert sponsorships.bills_of("A000001", COSPONSOR) == ["117-s-5"]
+    assert sponsorships.bills_of("A000001", SPONSOR) == ["117-hr-1"]
+    assert sponsorships.members_of("117-hr-2") == ["B000002"]
+
+
+def test_collaborators_count_shared_bills() -> None:
+    assert _graph().collaborators("A000001") == [("B000002", 2), ("C000003", 1)]
+
+
+def test_ingest_member_against_the_mock_api() -> None:
+    sponsorships = SponsorshipGraph()
+    sponsorships.ingest_member("L000174", client=mock_client(MockAPI(dataset_size=30)))
+    assert sponsorships.member_degree("L000174") > 0
+    assert sponsorships.members() == ["L000174"]
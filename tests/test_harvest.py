@@ -0,0 +1,24 @@
+import time
+
+from attrs import define
+
+from congress_gov_api_client.harvest import DailyRecordHarvester, HarvestCheckpoints, RecordIssue
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+@define
+class _SlowFirstIssueHarvester(DailyRecordHarvester):
+    def _fetch_issue(self, listed) -> RecordIssue:
+        issue = super()._fetch_issue(listed)
+        if listed.issue == 225:
+            time.sleep(0.2)
+        return issue
+
+
+def test_harvest_yields_issues_as_they_are_fetched(tmp_path) -> None:
+    checkpoints = HarvestCheckpoints(str(tmp_path / "harvest.db"))
+    harvester = _SlowFirstIssueHarvester(mock_client(MockAPI()), checkpoints, workers=2)
+    # The mock lists issue 225 of volume 166 before issue 224
+    assert [issue.issue for issue in harvester.harvest([166])] == [224, 225]
+    assert set(checkpoints.completed_issues(166)) == {224, 225}
+    assert checkpoints.completed_volumes() == {166}
@@ -0,0 +1,46 @@
+import asyncio
+
+import httpx
+
+from congress_gov_api_client import AuthenticatedClient
+from congress_gov_api_client.hydrate import HydratedBill, ahydrate_bill
+from congress_gov_api_client.mock import BASE_URL, MockAPI, MockAPITransport
+
+RECORDS = 600
+
+
+class _CountingTransport(MockAPITransport):
+    def __init__(self, api: MockAPI) -> None:
+        super().__init__(api)
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+def test_ahydrate_bill_fetches_grown_sub_resources_under_the_semaphore() -> None:
+    # Every sub-resource lists more records than the counts of the ``bill_details`` example, as if it had grown
+    api = MockAPI(dataset_size=RECORDS)
+    transport = _CountingTransport(api)
+    client = AuthenticatedClient(base_url=BASE_URL, token="mock", httpx_args={"transport": transport})
+
+    async def hydrate_two() -> list[HydratedBill]:
+        # Shared by both bills, so one bill's follow-up pages compete with the other's planned pages
+        semaphore = asyncio.Semaphore(2)
+        bills = (ahydrate_bill(117, "hr", number, client=client, semaphore=semaphore) for number in (3076, 3077))
+        return await asyncio.gather(*bills)
+
+    hydrated, _ = asyncio.run(hydrate_two())
+
+    assert len(hydrated.actions) == RECORDS
+    assert len(hydrated.titles) == RECORDS
+    assert transport.most_in_flight == 2
+    # For each bill, the planned first page, the next page, and the last one planned from the count the next page reports
+    assert api.stats().by_operation["bill_actions"] == 6
@@ -0,0 +1,31 @@
+import json
+import subprocess
+import sys
+
+LAYERS = ("auth", "cache", "facade", "instrumentation", "lru", "ratelimit", "retry", "routes")
+
+
+def _loaded(statement: str) -> set[str]:
+    # A fresh interpreter, so that the modules other tests imported don't count
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output))
+
+
+def test_importing_the_package_leaves_optional_layers_unloaded() -> None:
+    loaded = _loaded("import congress_gov_api_client")
+    assert not {f"congress_gov_api_client.{layer}" for layer in LAYERS} & loaded
+
+
+def test_importing_one_endpoint_leaves_optional_layers_unloaded() -> None:
+    loaded = _loaded("from congress_gov_api_client.api.bill import bill_details")
+    assert not {f"congress_gov_api_client.{layer}" for layer in LAYERS} & loaded
+
+
+def test_congress_api_is_imported_on_first_access() -> None:
+    loaded = _loaded("import congress_gov_api_client as package\npackage.CongressAPI")
+    assert "congress_gov_api_client.facade" in loaded
+
+
+def test_importing_instrumentation_leaves_the_route_table_unbuilt() -> None:
+    assert "congress_gov_api_client.routes" not in _loaded("import congress_gov_api_client.instrumentation")
@@ -0,0 +1,46 @@
+import datetime
+import json
+
+import httpx
+import pytest
+
+from congress_gov_api_client import AuthenticatedClient
+from congress_gov_api_client.api.summaries import bill_summaries_all
+from congress_gov_api_client.incremental import IncrementalSync, WatermarkStore, format_datetime
+from congress_gov_api_client.search import summary_key
+
+
+def _summaries_client(count: int) -> AuthenticatedClient:
+    # Summaries have no url of their own, and these were all updated at once, inside the overlap window
+    updated = format_datetime(datetime.datetime.now(datetime.timezone.utc))
+    summaries = [
+        {
+            "bill": {"congress": 117, "type": "S", "number": str(number), "url": f"https://example.test/s/{number}"},
+            "versionCode": "00",
+            "updateDate": updated,
+            "text": "A summary",
+        }
+        for number in range(count)
+    ]
+    body = json.dumps({"summaries": summaries, "pagination": {"count": count}}).encode()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+    )
+    return AuthenticatedClient(
+        base_url="https://api.congress.gov/v3", token="test", httpx_args={"transport": transport}
+    )
+
+
+def test_pages_without_a_key_refuse_records_without_a_url(tmp_path) -> None:
+    sync = IncrementalSync(WatermarkStore(str(tmp_path / "sync.db")))
+    with pytest.raises(ValueError, match="no url"):
+        list(sync.pages("summaries", bill_summaries_all, client=_summaries_client(5)))
+
+
+def test_pages_keep_every_record_without_a_url_given_a_key(tmp_path) -> None:
+    sync = IncrementalSync(WatermarkStore(str(tmp_path / "sync.db")))
+    pages = list(sync.pages("summaries", bill_summaries_all, client=_summaries_client(5), key=summary_key))
+    assert sum(len(page) for page, _ in pages) == 5
+    checkpoint = pages[-1][1]
+    assert checkpoint is not None
+    assert len(checkpoint.seen) == 5
@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from congress_gov_api_client.api.bill import bill_details, bill_list_all
+from congress_gov_api_client.lru import LRUCache
+from congress_gov_api_client.mock import MockAPI, mock_client
+
+
+def test_repeated_requests_are_served_from_memory() -> None:
+    api = MockAPI()
+    cache = LRUCache()
+    client = mock_client(api, memory_cache=cache)
+    for _ in range(3):
+        assert bill_details.sync_detailed(117, "hr", 3076, client=client).status_code == 200
+    assert api.stats().requests == 1
+    assert cache.stats().hits == 2
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    api = MockAPI()
+    cache = LRUCache(max_entries=2)
+    client = mock_client(api, memory_cache=cache)
+    for offset in (0, 20, 40, 0):
+        bill_list_all.sync_detailed(client=client, offset=offset)
+    assert api.stats().requests == 4
+    assert cache.stats().evictions == 2
+
+
+def test_concurrent_threads_share_one_round_trip() -> None:
+    api = MockAPI(latency=0.05)
+    cache = LRUCache()
+    client = mock_client(api, memory_cache=cache)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(bill_details.sync_detailed, 117, "hr", 3076, client=client) for _ in range(8)]
+        assert {future.result().status_code for future in futures} == {200}
+    assert api.stats().requests == 1
+    assert cache.stats().coalesced == 7
+
+
+def test_concurrent_tasks_share_one_round_trip() -> None:
+    api = MockAPI(latency=0.05)
+    cache = LRUCache()
+    client = mock_client(api, memory_cache=cache)
+
+    async def crawl() -> set[int]:
+        responses = await asyncio.gather(
+            *(bill_details.asyncio_detailed(117, "hr", 3076, client=client) for _ in range(8))
+        )
+        return {response.status_code for response in responses}
+
+    assert asyncio.run(crawl()) == {200}
+    assert api.stats().requests == 1
+    assert cache.stats().coalesced == 7
+
+
+def test_cancelling_the_first_request_leaves_the_round_trip_to_the_others() -> None:
+    api = MockAPI(latency=0.05)
+    client = mock_client(api, memory_cache=LRUCache())
+
+    async def crawl() -> int:
+        first = asyncio.ensure_future(bill_details.asyncio_detailed(117, "hr", 3076, client=client))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(bill_details.asyncio_detailed(117, "hr", 3076, client=client))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return (await second).status_code
+
+    assert asyncio.run(crawl()) == 200
+    assert api.stats().requests == 1
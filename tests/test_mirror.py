@@ -0,0 +1,73 @@
+import asyncio
+import sqlite3
+
+import httpx
+import pytest
+
+from congress_gov_api_client import AuthenticatedClient, errors
+from congress_gov_api_client.incremental import WatermarkStore
+from congress_gov_api_client.mirror import Mirror
+from congress_gov_api_client.mock import BASE_URL, MockAPI, MockAPITransport, mock_client
+
+RECORDS = 600
+
+
+class _FailingPageTransport(MockAPITransport):
+    """Answers the page at ``offset`` with a 500"""
+
+    def __init__(self, api: MockAPI, offset: int) -> None:
+        super().__init__(api)
+        self.offset = str(offset)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("offset") == self.offset:
+            return httpx.Response(500, request=request)
+        return super().handle_request(request)
+
+
+def test_sync_mirrors_every_record_and_sets_the_watermark(tmp_path) -> None:
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    stats = mirror.sync("bills", client=mock_client(MockAPI(dataset_size=RECORDS)))
+    assert stats.rows == RECORDS
+    assert stats.pages == 3
+    assert mirror.count("bills") == RECORDS
+    assert stats.watermark is not None
+    assert mirror.watermark("bills") == stats.watermark
+
+
+def test_interrupted_sync_keeps_its_pages_but_not_the_watermark(tmp_path) -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    transport = _FailingPageTransport(api, offset=500)
+    client = AuthenticatedClient(base_url=BASE_URL, token="mock", httpx_args={"transport": transport})
+    with pytest.raises(errors.UnexpectedStatus):
+        mirror.sync("bills", client=client)
+    assert mirror.count("bills") == 500
+    assert mirror.watermark("bills") is None
+
+    # The next run repeats the window; every write is an upsert, so no row is duplicated
+    mirror.sync("bills", client=mock_client(api))
+    assert mirror.count("bills") == RECORDS
+    assert mirror.watermark("bills") is not None
+
+
+def test_watermark_is_committed_with_the_last_page(tmp_path, monkeypatch) -> None:
+    def fail(connection: sqlite3.Connection, checkpoint: object) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    monkeypatch.setattr(WatermarkStore, "write", staticmethod(fail))
+    with pytest.raises(sqlite3.OperationalError):
+        mirror.sync("bills", client=mock_client(MockAPI(dataset_size=RECORDS)))
+    # The last page was rolled back with its watermark, and the pages before it were kept
+    assert mirror.count("bills") == 500
+    assert mirror.watermark("bills") is None
+
+
+def test_async_sync_mirrors_every_record(tmp_path) -> None:
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    client = mock_client(MockAPI(dataset_size=RECORDS))
+    stats = asyncio.run(mirror.async_sync("bills", client=client, concurrency=4))
+    assert mirror.count("bills") == RECORDS
+    assert stats.watermark is not None
+    assert mirror.watermark("bills") == stats.watermark
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from congress_gov_api_client import errors
+from congress_gov_api_client.api.bill import bill_list_all
+from congress_gov_api_client.mock import MockAPI, mock_client
+from congress_gov_api_client.pagination import apaginate, paginate
+
+RECORDS = 600
+
+
+def _urls(records: list) -> list[str]:
+    return [record.url for record in records]
+
+
+def test_paginate_follows_every_page() -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    records = list(paginate(bill_list_all, client=mock_client(api)))
+    assert len(set(_urls(records))) == RECORDS
+    assert api.stats().by_operation["bill_list_all"] == 3
+
+
+def test_paginate_starts_at_offset_and_honors_limit() -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    records = list(paginate(bill_list_all, client=mock_client(api), limit=100, offset=450))
+    assert len(records) == RECORDS - 450
+    assert api.stats().by_operation["bill_list_all"] == 2
+
+
+def test_paginate_requests_pages_only_as_they_are_consumed() -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    records = paginate(bill_list_all, client=mock_client(api))
+    next(records)
+    assert api.stats().requests == 1
+
+
+def test_paginate_raises_on_a_failed_page() -> None:
+    with pytest.raises(errors.UnexpectedStatus):
+        list(paginate(bill_list_all, client=mock_client(MockAPI(error_rate=1.0))))
+
+
+def test_apaginate_yields_the_same_records_as_paginate() -> None:
+    api = MockAPI(dataset_size=RECORDS)
+    client = mock_client(api)
+
+    async def crawl() -> list:
+        return [record async for record in apaginate(bill_list_all, client=client)]
+
+    assert _urls(asyncio.run(crawl())) == _urls(list(paginate(bill_list_all, client=client)))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_apaginate_fans_out_over_the_pages_after_the_first(ordered: bool) -> None:
+    api = MockAPI(dataset_size=RECORDS, latency=0.01)
+    client = mock_client(api)
+
+    async def crawl() -> list:
+        return [record async for record in apaginate(bill_list_all, client=client, concurrency=4, ordered=ordered)]
+
+    records = _urls(asyncio.run(crawl()))
+    expected = _urls(list(paginate(bill_list_all, client=client)))
+    assert records == expected if ordered else sorted(records) == sorted(expected)
+    assert api.stats().by_operation["bill_list_all"] == 6
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_apaginate_leaves_no_page_running_when_stopped_early(ordered: bool) -> None:
+    client = mock_client(MockAPI(dataset_size=10 * RECORDS, latency=0.01))
+
+    async def crawl() -> set:
+        records = apaginate(bill_list_all, client=client, concurrency=4, ordered=ordered)
+        # Stop past the first page, while the fan-out has pages in flight
+        for _ in range(300):
+            await records.__anext__()
+        await records.aclose()
+        return {task for task in asyncio.all_tasks() if task is not asyncio.current_task()}
+
+    assert asyncio.run(crawl()) == set()
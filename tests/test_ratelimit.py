@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from congress_gov_api_client.api.bill import bill_list_all
+from congress_gov_api_client.mock import MockAPI, mock_client
+from congress_gov_api_client.ratelimit import TokenBucket
+
+RATE = 25.0
+REQUESTS = 50
+
+
+def _api() -> MockAPI:
+    # Each window admits a little more than the bucket sends in it: ``capacity`` plus ``RATE`` tokens a second
+    return MockAPI(rate_limit=30, rate_window=1.0)
+
+
+def _assert_sustained(api: MockAPI, elapsed: float) -> None:
+    stats = api.stats()
+    assert stats.by_status[429] == 0
+    assert stats.by_status[200] == REQUESTS
+    # The first ``capacity`` requests go out at once, the rest are paced at ``RATE``; a slow machine only takes longer
+    assert elapsed >= (REQUESTS - 2) / RATE - 0.05
+
+
+def test_mock_rejects_unpaced_requests() -> None:
+    api = _api()
+    client = mock_client(api)
+    for _ in range(REQUESTS):
+        bill_list_all.sync_detailed(client=client)
+    assert api.stats().by_status[429] == REQUESTS - 30
+
+
+def test_token_bucket_sustains_its_rate_without_429s() -> None:
+    api = _api()
+    client = mock_client(api, rate_limiter=TokenBucket(rate=RATE, capacity=2))
+    start = time.monotonic()
+    for _ in range(REQUESTS):
+        bill_list_all.sync_detailed(client=client)
+    _assert_sustained(api, time.monotonic() - start)
+
+
+def test_token_bucket_paces_concurrent_async_requests_without_429s() -> None:
+    api = _api()
+    client = mock_client(api, rate_limiter=TokenBucket(rate=RATE, capacity=2))
+
+    async def crawl() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(bill_list_all.asyncio_detailed(client=client) for _ in range(REQUESTS)))
+        return time.monotonic() - start
+
+    _assert_sustained(api, asyncio.run(crawl()))
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+
+from congress_gov_api_client.api.bill import bill_list_all
+from congress_gov_api_client.mock import MockAPI, mock_client
+from congress_gov_api_client.retry import RetryBudget, RetryPolicy
+
+REQUEST = httpx.Request("GET", "https://api.congress.gov/v3/bill")
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    # No backoff, so the tests only count attempts
+    return RetryPolicy(base_delay=0.0, max_delay=0.0, **kwargs)
+
+
+def _throttled(retry_after: str) -> httpx.Response:
+    return httpx.Response(429, headers={"Retry-After": retry_after}, request=REQUEST)
+
+
+def test_retries_server_errors_until_they_succeed() -> None:
+    api = MockAPI(error_rate=0.3)
+    client = mock_client(api, retry=_policy())
+    assert all(bill_list_all.sync_detailed(client=client).status_code == 200 for _ in range(30))
+    stats = api.stats()
+    assert stats.by_status[200] == 30
+    assert stats.requests > 30
+
+
+def test_async_retries_server_errors_until_they_succeed() -> None:
+    api = MockAPI(error_rate=0.3)
+    client = mock_client(api, retry=_policy())
+
+    async def crawl() -> list[int]:
+        responses = await asyncio.gather(*(bill_list_all.asyncio_detailed(client=client) for _ in range(30)))
+        return [response.status_code for response in responses]
+
+    assert asyncio.run(crawl()) == [200] * 30
+    assert api.stats().requests > 30
+
+
+def test_gives_up_after_the_retries_of_the_status() -> None:
+    api = MockAPI(error_rate=1.0, error_statuses=(500,))
+    client = mock_client(api, retry=_policy(statuses={500: 2}))
+    assert bill_list_all.sync_detailed(client=client).status_code == 500
+    assert api.stats().requests == 3
+
+
+def test_budget_caps_retries_across_requests() -> None:
+    api = MockAPI(error_rate=1.0, error_statuses=(500,))
+    client = mock_client(api, retry=_policy(budget=RetryBudget(ratio=0.0, min_retries=2)))
+    for _ in range(3):
+        bill_list_all.sync_detailed(client=client)
+    # Three requests, and the two retries the budget started with
+    assert api.stats().requests == 5
+
+
+def test_budget_earns_retries_from_requests() -> None:
+    budget = RetryBudget(ratio=0.5, min_retries=0)
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_waits_as_long_as_retry_after_asks() -> None:
+    policy = RetryPolicy(max_delay=60.0)
+    assert policy.next_delay(0.5, _throttled("7")) == 7.0
+    in_ten_seconds = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+    assert 8.0 <= policy.next_delay(0.5, _throttled(in_ten_seconds)) <= 10.0
+
+
+def test_retry_after_is_capped_by_max_delay() -> None:
+    assert RetryPolicy(max_delay=5.0).next_delay(0.5, _throttled("3600")) == 5.0
+
+
+def test_retry_after_can_be_ignored() -> None:
+    policy = RetryPolicy(base_delay=0.5, max_delay=60.0, respect_retry_after=False)
+    assert 0.5 <= policy.next_delay(0.5, _throttled("3600")) <= 1.5
+
+
+def test_retry_after_is_slept_before_the_retry() -> None:
+    api = MockAPI(throttle_rate=1.0, retry_after=0.2)
+    client = mock_client(api, retry=RetryPolicy(statuses={429: 1}))
+    start = time.monotonic()
+    assert bill_list_all.sync_detailed(client=client).status_code == 429
+    assert time.monotonic() - start >= 0.2
+    assert api.stats().requests == 2
+
+
+def test_only_idempotent_methods_are_retried() -> None:
+    policy = _policy()
+    response = httpx.Response(503)
+    assert policy.should_retry(REQUEST, 0, response)
+    assert not policy.should_retry(httpx.Request("POST", REQUEST.url), 0, response)
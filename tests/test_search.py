@@ -0,0 +1,88 @@
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from congress_gov_api_client import AuthenticatedClient, errors
+from congress_gov_api_client.incremental import WatermarkStore
+from congress_gov_api_client.mock import BASE_URL
+from congress_gov_api_client.search import SUMMARY, SearchIndex
+
+RECORDS = 600
+
+
+def _summary(number: int) -> dict:
+    title = "Clean Water Act" if number % 100 == 0 else f"Act number {number}"
+    return {
+        "bill": {
+            "congress": 117,
+            "type": "HR",
+            "number": str(number),
+            "title": title,
+            "url": f"{BASE_URL}/hr/{number}",
+        },
+        "versionCode": "00",
+        "actionDate": "2022-03-24",
+        "updateDate": "2022-04-01T03:31:16Z",
+        "text": f"<p>This bill amends program {number} &amp; its funding.</p>",
+    }
+
+
+def _client(fail_offset: int = -1) -> AuthenticatedClient:
+    # Summaries with distinct bills, which the mock API's repeated examples lack
+    def handle(request: httpx.Request) -> httpx.Response:
+        offset, limit = int(request.url.params.get("offset", 0)), int(request.url.params.get("limit", 20))
+        if offset == fail_offset:
+            return httpx.Response(500, request=request)
+        pagination = {"count": RECORDS}
+        if offset + limit < RECORDS:
+            pagination["next"] = str(request.url.copy_set_param("offset", offset + limit))
+        summaries = [_summary(number) for number in range(offset, min(RECORDS, offset + limit))]
+        body = json.dumps({"summaries": summaries, "pagination": pagination}).encode()
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    return AuthenticatedClient(base_url=BASE_URL, token="mock", httpx_args={"transport": httpx.MockTransport(handle)})
+
+
+def test_sync_summaries_indexes_every_summary(tmp_path) -> None:
+    index = SearchIndex(str(tmp_path / "search.db"))
+    assert index.sync_summaries(client=_client()) == RECORDS
+    assert index.count(SUMMARY) == RECORDS
+    results = index.search('"clean water"')
+    assert len(results) == RECORDS // 100
+    assert results[0].title == "Clean Water Act"
+    # The text is indexed without its markup
+    assert results[0].snippet.startswith("This bill amends program")
+    assert results[0].snippet.endswith(" & its funding.")
+
+
+def test_interrupted_sync_commits_no_watermark(tmp_path) -> None:
+    index = SearchIndex(str(tmp_path / "search.db"))
+    with pytest.raises(errors.UnexpectedStatus):
+        index.sync_summaries(client=_client(fail_offset=500))
+    assert index.count() == 500
+    assert WatermarkStore(str(tmp_path / "search.db")).get("search.summaries") is None
+
+    index.sync_summaries(client=_client())
+    assert index.count() == RECORDS
+    assert WatermarkStore(str(tmp_path / "search.db")).get("search.summaries") is not None
+
+
+def test_watermark_is_committed_with_the_last_page(tmp_path, monkeypatch) -> None:
+    def fail(connection: sqlite3.Connection, checkpoint: object) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    index = SearchIndex(str(tmp_path / "search.db"))
+    monkeypatch.setattr(WatermarkStore, "write", staticmethod(fail))
+    with pytest.raises(sqlite3.OperationalError):
+        index.sync_summaries(client=_client())
+    # The last page was rolled back with its watermark, and the pages before it were kept
+    assert index.count() == 500
+    monkeypatch.undo()
+    assert WatermarkStore(str(tmp_path / "search.db")).get("search.summaries") is None
+
+
+def test_invalid_queries_raise_value_error(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Invalid search query"):
+        SearchIndex(str(tmp_path / "search.db")).search('"unbalanced')